@@ -1,6 +1,10 @@
 from starlette.testclient import TestClient
 
-from {{cookiecutter.package_name}}.api.resources.rsrc_health import HealthModel, SettingsModel
+from {{cookiecutter.package_name}}.api.resources.rsrc_health import (
+    DependenciesHealthModel,
+    HealthModel,
+    SettingsModel,
+)
 from {{cookiecutter.package_name}}.core.settings import settings
 
 
@@ -28,6 +32,28 @@ def test_get_health_check_endpoint(client: TestClient):
     assert health_data.status == "healthy"
 
 
+def test_get_health_dependencies_endpoint(client: TestClient):
+    """
+    Tests the get_health_dependencies_endpoint function for completion. The
+    get_health_dependencies_endpoint function should return valid Dependencies
+    health data without any errors
+
+    :param client: A test client for hitting {{cookiecutter.friendly_name}} http requests
+    """
+
+    # Hits the endpoint and gets the response
+    endpoint = f"{settings.API_PREFIX}/v1/health/dependencies"
+    response = client.get(endpoint)
+
+    # Gets the dependencies health data
+    raw_data = response.json()
+    dependencies_data = DependenciesHealthModel(**raw_data)
+
+    # Checks whether the response status matches the dependencies health
+    expected_status_code = 200 if dependencies_data.status == "healthy" else 503
+    assert response.status_code == expected_status_code
+
+
 def test_get_health_settings_endpoint(client: TestClient):
     """
     Tests the get_health_settings_endpoint function for completion. The
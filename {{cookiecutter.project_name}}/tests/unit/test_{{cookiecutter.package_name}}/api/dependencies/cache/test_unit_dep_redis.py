@@ -1,7 +1,28 @@
 from unittest.mock import MagicMock
 
-from {{cookiecutter.package_name}}.api.dependencies.cache import get_redis_manager
+from {{cookiecutter.package_name}}.api.dependencies.cache import get_redis_cache, get_redis_manager
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+
+
+def test_get_redis_cache():
+    """
+    Tests the get_redis_cache function for completion. The get_redis_cache
+    function should return a TieredCache class instance without any errors
+    """
+
+    # Mocks the tiered-cache class
+    redis_cache_mock = MagicMock(spec_set=TieredCache)
+
+    # Mocks the request class
+    request_mock = MagicMock()
+    request_mock.app.state.redis_cache = redis_cache_mock
+
+    # Invokes the get_redis_cache function
+    redis_cache = get_redis_cache(request_mock)
+
+    # Checks whether the tiered-cache was retrieved correctly
+    assert redis_cache == redis_cache_mock
 
 
 def test_get_redis_manager():
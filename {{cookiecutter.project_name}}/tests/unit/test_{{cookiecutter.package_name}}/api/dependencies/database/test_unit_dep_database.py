@@ -2,8 +2,12 @@ from unittest.mock import MagicMock
 
 from fastapi import Request
 
-from {{cookiecutter.package_name}}.api.dependencies.database import get_db_manager
-from {{cookiecutter.package_name}}.core.database import DatabaseManager
+from {{cookiecutter.package_name}}.api.dependencies.database import (
+    get_db_manager,
+    get_db_registry,
+    get_named_db_manager,
+)
+from {{cookiecutter.package_name}}.core.database import DatabaseManager, DatabaseRegistry
 
 
 def test_get_db_manager():
@@ -25,3 +29,38 @@ def test_get_db_manager():
     # Checks whether the db-manager mock is retrieved correctly
     db_manager = get_db_manager(request_mock)
     assert db_manager.display_name == "Test Database Name"
+
+
+def test_get_db_registry():
+    """
+    Tests the get_db_registry function for completion. The get_db_registry
+    function should return the database registry instance
+    """
+
+    # Mocks the request and db-registry classes
+    request_mock = MagicMock(spec_set=Request)
+    db_registry_mock = MagicMock(spec_set=DatabaseRegistry)
+    request_mock.app.state.db_registry = db_registry_mock
+
+    # Checks whether the db-registry mock is retrieved correctly
+    db_registry = get_db_registry(request_mock)
+    assert db_registry == db_registry_mock
+
+
+def test_get_named_db_manager():
+    """
+    Tests the get_named_db_manager function for completion. The get_named_db_manager function
+    should create a dependency that gets the named database manager from the database registry
+    """
+
+    # Mocks the request, db-registry, and db-manager classes
+    request_mock = MagicMock(spec_set=Request)
+    db_manager_mock = MagicMock(spec_set=DatabaseManager)
+    db_registry_mock = MagicMock(spec_set=DatabaseRegistry)
+    db_registry_mock.get.return_value = db_manager_mock
+    request_mock.app.state.db_registry = db_registry_mock
+
+    # Checks whether the named db-manager mock is retrieved correctly
+    db_manager = get_named_db_manager("analytics")(request_mock)
+    assert db_manager == db_manager_mock
+    assert db_registry_mock.get.call_args.args == ("analytics",)
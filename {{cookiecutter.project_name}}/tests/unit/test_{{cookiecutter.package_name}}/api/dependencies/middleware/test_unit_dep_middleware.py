@@ -2,9 +2,12 @@ from unittest.mock import MagicMock
 from uuid import UUID
 
 from fastapi import Request, Response
+from pydantic import SecretStr
+from starlette.authentication import SimpleUser
 
 from {{cookiecutter.package_name}}.api.dependencies.middleware import (
     dep_middleware,
+    get_client_key,
     get_request_metadata,
     get_response_size,
     set_correlation_id,
@@ -13,6 +16,72 @@ from {{cookiecutter.package_name}}.api.resources.rsrc_middleware import RequestM
 from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext
 
 
+def test_get_client_key_header():
+    """
+    Tests the get_client_key function when the client header holds a known api key.
+    The get_client_key function should return the key of the client header
+    """
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+    request_mock.scope = {}
+    request_mock.headers = {"x-api-key": "test-key"}
+
+    # Checks whether the client key was retrieved from the header
+    api_keys = [SecretStr("other-key"), SecretStr("test-key")]
+    assert get_client_key(request_mock, "x-api-key", api_keys) == "key:test-key"
+
+
+def test_get_client_key_header_unknown():
+    """
+    Tests the get_client_key function when the client header holds an unknown api key.
+    The get_client_key function should return the key of the client address
+    """
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+    request_mock.scope = {}
+    request_mock.headers = {"x-api-key": "rotated-key"}
+    request_mock.client.host = "127.0.0.1"
+
+    # Checks whether the client key was retrieved from the client address
+    api_keys = [SecretStr("test-key")]
+    assert get_client_key(request_mock, "x-api-key", api_keys) == "host:127.0.0.1"
+
+
+def test_get_client_key_host():
+    """
+    Tests the get_client_key function when the client header does not exist. The
+    get_client_key function should return the key of the client address
+    """
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+    request_mock.scope = {}
+    request_mock.headers = {}
+    request_mock.client.host = "127.0.0.1"
+
+    # Checks whether the client key was retrieved from the client address
+    assert get_client_key(request_mock, "x-api-key", []) == "host:127.0.0.1"
+
+
+def test_get_client_key_user():
+    """
+    Tests the get_client_key function when the user of the request is authenticated.
+    The get_client_key function should return the key of the authenticated user
+    """
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+    request_mock.scope = {"user": SimpleUser("test-user")}
+    request_mock.user = request_mock.scope["user"]
+    request_mock.headers = {"x-api-key": "test-key"}
+
+    # Checks whether the client key was retrieved from the authenticated user
+    api_keys = [SecretStr("test-key")]
+    assert get_client_key(request_mock, "x-api-key", api_keys) == "user:test-user"
+
+
 def test_get_response_size_bad_value():
     """
     Tests the get_response_size function when a response size value cannot be cast as an integer.
@@ -1,8 +1,15 @@
 from unittest.mock import MagicMock
 
+from fastapi import Response
+
 from {{cookiecutter.package_name}}.api.resources.rsrc_health import HealthModel, SettingsModel
 from {{cookiecutter.package_name}}.api.routes import health
-from {{cookiecutter.package_name}}.api.routes.health import get_health_check_endpoint, get_health_settings_endpoint
+from {{cookiecutter.package_name}}.api.routes.health import (
+    get_health_check_endpoint,
+    get_health_dependencies_endpoint,
+    get_health_settings_endpoint,
+)
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker, CircuitState
 
 
 async def test_get_health_check_endpoint(mocker):
@@ -22,6 +29,55 @@ async def test_get_health_check_endpoint(mocker):
     assert health_model_mock.called
 
 
+async def test_get_health_dependencies_endpoint(mocker):
+    """
+    Tests the get_health_dependencies_endpoint function for completion. The
+    get_health_dependencies_endpoint function should return the state of each dependency
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the circuit-breaker class
+    circuit_breaker_mock = MagicMock(spec=CircuitBreaker)
+    circuit_breaker_mock.name = "test-database"
+    circuit_breaker_mock.state = CircuitState.CLOSED
+
+    # Overrides the get_circuit_breakers function
+    mocker.patch.object(health, "get_circuit_breakers", return_value=[circuit_breaker_mock])
+
+    # Checks whether the dependencies were healthy
+    response = Response()
+    dependencies_health = await get_health_dependencies_endpoint(response)
+    assert dependencies_health.status == "healthy"
+    assert dependencies_health.dependencies[0].name == "test-database"
+    assert dependencies_health.dependencies[0].state == "closed"
+    assert response.status_code == 200
+
+
+async def test_get_health_dependencies_endpoint_degraded(mocker):
+    """
+    Tests the get_health_dependencies_endpoint function when a circuit breaker is open.
+    The get_health_dependencies_endpoint function should respond with a 503 status
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the circuit-breaker class
+    circuit_breaker_mock = MagicMock(spec=CircuitBreaker)
+    circuit_breaker_mock.name = "test-redis"
+    circuit_breaker_mock.state = CircuitState.OPEN
+
+    # Overrides the get_circuit_breakers function
+    mocker.patch.object(health, "get_circuit_breakers", return_value=[circuit_breaker_mock])
+
+    # Checks whether the dependencies were degraded
+    response = Response()
+    dependencies_health = await get_health_dependencies_endpoint(response)
+    assert dependencies_health.status == "degraded"
+    assert dependencies_health.dependencies[0].state == "open"
+    assert response.status_code == 503
+
+
 async def test_get_health_settings_endpoint(mocker):
     """
     Tests the get_health_settings_endpoint function for completion. The get_health_settings_endpoint
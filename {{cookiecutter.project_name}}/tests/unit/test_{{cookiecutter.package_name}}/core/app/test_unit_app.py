@@ -1,8 +1,11 @@
 from inspect import unwrap
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from fastapi import FastAPI, Request, Response
 from prometheus_fastapi_instrumentator import Instrumentator
+from pydantic import SecretStr
+from starlette.background import BackgroundTask
 
 from {{cookiecutter.package_name}}.api.resources.rsrc_middleware import RequestMetadataModel
 from {{cookiecutter.package_name}}.core.app import app, handle_request
@@ -13,10 +16,13 @@ from {{cookiecutter.package_name}}.core.app.app import (
     setup_app_state,
     task_cleanup,
 )
-from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import EntityCache, FastApiContext, RetryBudget
+from {{cookiecutter.package_name}}.core.cache.rate_limiter import RateLimiter
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
-from {{cookiecutter.package_name}}.core.database import DatabaseConnection, DatabaseManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+from {{cookiecutter.package_name}}.core.database import DatabaseManager, DatabaseRegistry, QueryCache
 from {{cookiecutter.package_name}}.core.settings import Settings
+from {{cookiecutter.package_name}}.exceptions import TooManyRequestsError
 
 
 def test_setup_app():
@@ -67,15 +73,31 @@ async def test_setup_app_state(mocker):
     # Mocks and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
     settings_mock.IS_API_DB_ENABLED = True
+    settings_mock.API_DB_TYPE = "cloud"
     settings_mock.API_DB_DISPLAY_NAME = "test-db-name"
     settings_mock.API_DB_DESCRIPTION = "test-db-description"
     settings_mock.API_DB_CONN_URI = "test-db-uri"
+    settings_mock.API_DB_REPLICA_CONN_URIS = ["test-replica-db-uri"]
+    settings_mock.API_DB_NAME = "test-db"
+    settings_mock.API_DB_NAMED_CONN_URIS = {"test-named-db": "test-named-db-uri"}
     settings_mock.IS_API_REDIS_ENABLED = True
     settings_mock.API_REDIS_DISPLAY_NAME = "test-redis-name"
     settings_mock.API_REDIS_DESCRIPTION = "test-redis-description"
     settings_mock.API_REDIS_HOST = "test-redis-host"
     settings_mock.API_REDIS_PORT = "test-redis-port"
     settings_mock.API_REDIS_PASSWORD = "test-redis-password"
+    settings_mock.IS_API_QUERY_CACHE_ENABLED = True
+    settings_mock.IS_API_REDIS_LOCAL_CACHE_ENABLED = True
+    settings_mock.API_REDIS_LOCAL_CACHE_MAX_BYTES = 1024
+    settings_mock.API_REDIS_LOCAL_CACHE_TTL_SECONDS = 5.0
+    settings_mock.API_REDIS_INVALIDATION_CHANNEL = "test-channel"
+    settings_mock.IS_API_RATE_LIMIT_ENABLED = True
+    settings_mock.API_RATE_LIMIT_DEFAULT = "100/60"
+    settings_mock.API_PREFIX = "/api"
+    settings_mock.API_RATE_LIMIT_ROUTES = {"/api/v1/auth": "unlimited"}
+    settings_mock.API_RATE_LIMIT_LEASE_MAX_BYTES = 1024
+    settings_mock.API_RATE_LIMIT_LEASE_SECONDS = 1.0
+    settings_mock.API_RATE_LIMIT_LEASE_RATIO = 0.1
     mocker.patch.object(app, "settings", settings_mock)
 
     # Mocks the fast-api class
@@ -87,11 +109,15 @@ async def test_setup_app_state(mocker):
     fast_api_context_mock.return_value = fast_api_context_mock
     mocker.patch.object(app, "get_fast_api_context", fast_api_context_mock)
 
+    # Mocks and overrides the db-registry class
+    db_registry_mock = MagicMock(spec_set=DatabaseRegistry)
+    db_registry_mock.return_value = db_registry_mock
+    db_registry_mock.names = ["test-db"]
+    mocker.patch.object(app, "DatabaseRegistry", db_registry_mock)
+
     # Mocks and overrides the db-manager class
-    db_connection_mock = MagicMock(spec_set=DatabaseConnection)
     db_manager_mock = MagicMock(spec_set=DatabaseManager)
     db_manager_mock.return_value = db_manager_mock
-    db_manager_mock.connection = db_connection_mock
     mocker.patch.object(app, "DatabaseManager", db_manager_mock)
 
     # Mocks and overrides the redis-manager class
@@ -99,6 +125,17 @@ async def test_setup_app_state(mocker):
     redis_manager_mock.return_value = redis_manager_mock
     mocker.patch.object(app, "RedisManager", redis_manager_mock)
 
+    # Mocks and overrides the tiered-cache class
+    tiered_cache_mock = MagicMock(spec_set=TieredCache)
+    tiered_cache_mock.return_value = tiered_cache_mock
+    tiered_cache_mock.start = AsyncMock()
+    mocker.patch.object(app, "TieredCache", tiered_cache_mock)
+
+    # Mocks and overrides the rate-limiter class
+    rate_limiter_mock = MagicMock(spec_set=RateLimiter)
+    rate_limiter_mock.return_value = rate_limiter_mock
+    mocker.patch.object(app, "RateLimiter", rate_limiter_mock)
+
     # Invokes the setup_app_state function
     await setup_app_state(app_mock)
 
@@ -109,8 +146,28 @@ async def test_setup_app_state(mocker):
     # Checks whether the db-manager was set up correctly
     assert db_manager_mock.called
     assert app_mock.state.db_manager == db_manager_mock
-    assert db_manager_mock.call_args.args == ("test-db-name", "test-db-description", "test-db-uri")
-    assert db_connection_mock.connect.called
+    assert db_manager_mock.call_args_list[0].args == (
+        "test-db-name",
+        "test-db-description",
+        "test-db-uri",
+        ["test-replica-db-uri"],
+        True,
+    )
+
+    # Checks whether the named database connects natively to its uri instead of Cloud SQL
+    assert db_manager_mock.call_args_list[1].args == (
+        "test-named-db",
+        "The test-named-db database",
+        "test-named-db-uri",
+    )
+    assert db_manager_mock.call_args_list[1].kwargs == {}
+
+    # Checks whether the db-registry was set up correctly
+    assert app_mock.state.db_registry == db_registry_mock
+    assert db_registry_mock.add.call_count == 2
+    assert db_registry_mock.add.call_args_list[0].args == ("test-db", db_manager_mock)
+    assert db_registry_mock.add.call_args_list[1].args == ("test-named-db", db_manager_mock)
+    assert db_registry_mock.connect.called
 
     # Checks whether the redis-manager was set up correctly
     assert redis_manager_mock.called
@@ -123,6 +180,29 @@ async def test_setup_app_state(mocker):
         "test-redis-password",
     )
 
+    # Checks whether the tiered-cache was set up correctly
+    assert app_mock.state.redis_cache == tiered_cache_mock
+    assert tiered_cache_mock.call_args.args[0] == redis_manager_mock
+    assert tiered_cache_mock.call_args.args[2] == "test-channel"
+    assert tiered_cache_mock.start.called
+
+    # Checks whether the rate-limiter was set up correctly
+    assert app_mock.state.rate_limiter == rate_limiter_mock
+    default_rule = rate_limiter_mock.call_args.args[1]
+    assert rate_limiter_mock.call_args.args[0] == redis_manager_mock
+    assert (default_rule.requests, default_rule.period_seconds) == (100, 60.0)
+    assert rate_limiter_mock.call_args.args[2] == {
+        "/api/v1/health": None,
+        "/api/metrics": None,
+        "/api/v1/auth": None,
+    }
+    assert rate_limiter_mock.call_args.args[4] == 0.1
+
+    # Checks whether the query cache was set up correctly
+    row_operations = db_registry_mock.get.return_value.row_operations
+    assert db_registry_mock.get.call_args.args == ("test-db",)
+    assert isinstance(row_operations.query_cache, QueryCache)
+
 
 async def test_deconstruct_app_state(mocker):
     """
@@ -136,6 +216,7 @@ async def test_deconstruct_app_state(mocker):
     settings_mock = MagicMock(spec=Settings)
     settings_mock.IS_API_DB_ENABLED = True
     settings_mock.IS_API_REDIS_ENABLED = True
+    settings_mock.IS_API_REDIS_LOCAL_CACHE_ENABLED = True
     mocker.patch.object(app, "settings", settings_mock)
 
     # Mocks the fast-api class
@@ -145,23 +226,29 @@ async def test_deconstruct_app_state(mocker):
     # Mocks the fast-api-context class
     app_mock.state.fast_api_context = MagicMock(spec_set=FastApiContext)
 
-    # Mocks the database-manager class
-    db_manager_mock = MagicMock(spec_set=DatabaseManager)
-    db_manager_mock.connection.disconnect = AsyncMock()
-    app_mock.state.db_manager = db_manager_mock
+    # Mocks the database-registry class
+    db_registry_mock = MagicMock(spec_set=DatabaseRegistry)
+    db_registry_mock.disconnect = AsyncMock()
+    app_mock.state.db_registry = db_registry_mock
 
     # Mocks the redis-manager class
     redis_manager_mock = MagicMock(spec_set=RedisManager)
     redis_manager_mock.disconnect = AsyncMock()
     app_mock.state.redis_manager = redis_manager_mock
 
+    # Mocks the tiered-cache class
+    redis_cache_mock = MagicMock(spec_set=TieredCache)
+    redis_cache_mock.stop = AsyncMock()
+    app_mock.state.redis_cache = redis_cache_mock
+
     # Invokes the deconstruct_app_state function
     await deconstruct_app_state(app_mock)
 
     # Checks whether the required methods were called correctly
     assert app_mock.state.fast_api_context.reset.called
-    assert app_mock.state.db_manager.connection.disconnect.called
+    assert app_mock.state.db_registry.disconnect.called
     assert app_mock.state.redis_manager.disconnect.called
+    assert app_mock.state.redis_cache.stop.called
 
 
 async def test_handle_request(mocker):
@@ -183,6 +270,7 @@ async def test_handle_request(mocker):
     async def call_next_mock(*_):
         response_mock = MagicMock(spec=Response)
         response_mock.status_code = 200
+        response_mock.background = None
         return response_mock
 
     # Mocks the request-metadata model class
@@ -205,6 +293,102 @@ async def test_handle_request(mocker):
     response = await handle_request(app_mock, request_mock, call_next_mock)
     assert response.status_code == 200
 
+    # Checks whether the retry budget was set for the request
+    retry_budget = app_mock.state.fast_api_context.retry_budget_var
+    assert isinstance(retry_budget, RetryBudget)
+
+    # Checks whether the entity cache was set for the request
+    entity_cache = app_mock.state.fast_api_context.entity_cache_var
+    assert isinstance(entity_cache, EntityCache)
+
+    # Checks whether the primary pins were set for the request
+    assert app_mock.state.fast_api_context.primary_pins_var == set()
+
+    # Checks whether the context was reset only once the response body was sent
+    assert not app_mock.state.fast_api_context.reset.called
+    await response.background()
+    assert app_mock.state.fast_api_context.reset.called
+
+
+async def test_handle_request_background(mocker):
+    """
+    Tests the handle_request function when the endpoint attached a background task. The
+    handle_request function should run the endpoint task before resetting the context
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the fast-api class
+    app_mock = MagicMock(spec=FastAPI)
+    app_mock.state = MagicMock()
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+
+    # Mocks the endpoint background task that records the calls
+    calls = []
+    app_mock.state.fast_api_context.reset.side_effect = lambda: calls.append("reset")
+    endpoint_task = BackgroundTask(calls.append, "endpoint")
+
+    # Mocks the call_next function
+    async def call_next_mock(*_):
+        response_mock = MagicMock(spec=Response)
+        response_mock.status_code = 200
+        response_mock.background = endpoint_task
+        return response_mock
+
+    # Overrides the request metadata and correlation-id functions
+    mocker.patch.object(app, "get_request_metadata", MagicMock())
+    mocker.patch.object(app, "set_correlation_id", MagicMock())
+
+    # Checks whether the endpoint task ran before the context was reset
+    response = await handle_request(app_mock, request_mock, call_next_mock)
+    await response.background()
+    assert calls == ["endpoint", "reset"]
+
+
+async def test_handle_request_rate_limited(mocker):
+    """
+    Tests the handle_request function when the client exceeded the rate limit. The
+    handle_request function should raise the too-many-requests-error without handling the request
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_RETRY_BUDGET = 3
+    settings_mock.IS_API_REDIS_ENABLED = True
+    settings_mock.IS_API_RATE_LIMIT_ENABLED = True
+    settings_mock.API_RATE_LIMIT_CLIENT_HEADER = "x-api-key"
+    settings_mock.API_RATE_LIMIT_CLIENT_KEYS = [SecretStr("test-key")]
+    mocker.patch.object(app, "settings", settings_mock)
+
+    # Mocks the fast-api class with a rate-limiter that rejects the client
+    app_mock = MagicMock(spec=FastAPI)
+    app_mock.state = MagicMock()
+    app_mock.state.rate_limiter = MagicMock(spec_set=RateLimiter)
+    app_mock.state.rate_limiter.hit = AsyncMock(side_effect=TooManyRequestsError(5))
+
+    # Mocks the request class
+    request_mock = MagicMock(spec=Request)
+    request_mock.url.path = "/api/v1/test"
+    request_mock.scope = {}
+    request_mock.headers = {"x-api-key": "test-key"}
+
+    # Mocks the call_next function
+    call_next_mock = AsyncMock()
+
+    # Overrides the request metadata and correlation-id functions
+    mocker.patch.object(app, "get_request_metadata", MagicMock())
+    mocker.patch.object(app, "set_correlation_id", MagicMock())
+
+    # Checks whether the request was shed before it was handled
+    with pytest.raises(TooManyRequestsError):
+        await handle_request(app_mock, request_mock, call_next_mock)
+    assert app_mock.state.rate_limiter.hit.call_args.args == ("/api/v1/test", "key:test-key")
+    assert not call_next_mock.called
+
 
 async def test_task_cleanup(mocker):
     """
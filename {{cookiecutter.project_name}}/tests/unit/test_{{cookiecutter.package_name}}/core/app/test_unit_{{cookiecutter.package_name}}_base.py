@@ -6,6 +6,8 @@ from {{cookiecutter.package_name}}.exceptions import (
     ForbiddenError,
     InternalServerError,
     NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     UnauthenticatedError,
     ValidationError,
 )
@@ -84,6 +86,49 @@ async def test_not_found_error_handler():
     assert json_response.status_code == 404
 
 
+async def test_service_unavailable_error_handler():
+    """
+    Tests the service_unavailable_error_handler function for completion. The
+    service_unavailable_error_handler function should return a JSONResponse
+    without any errors
+    """
+
+    # Mocks the service-unavailable-error class
+    service_unavailable_error_mock = MagicMock(spec=ServiceUnavailableError)
+    service_unavailable_error_mock.detail = "Test service-unavailable-error message"
+    service_unavailable_error_mock.status_code = 503
+
+    # Checks whether a valid JSONResponse instance is created correctly
+    json_response = await {{cookiecutter.class_name}}Base.service_unavailable_error_handler(
+        None, service_unavailable_error_mock
+    )
+    assert json_response.body == (
+        b'{"message":"Service Unavailable Error: Test service-unavailable-error message"}'
+    )
+    assert json_response.status_code == 503
+
+
+async def test_too_many_requests_error_handler():
+    """
+    Tests the too_many_requests_error_handler function for completion. The
+    too_many_requests_error_handler function should return a JSONResponse
+    with the retry-after header without any errors
+    """
+
+    # Creates the too-many-requests-error
+    too_many_requests_error = TooManyRequestsError(5, "Test too-many-requests-error message")
+
+    # Checks whether a valid JSONResponse instance is created correctly
+    json_response = await {{cookiecutter.class_name}}Base.too_many_requests_error_handler(
+        None, too_many_requests_error
+    )
+    assert json_response.body == (
+        b'{"message":"Too Many Requests Error: Test too-many-requests-error message"}'
+    )
+    assert json_response.status_code == 429
+    assert json_response.headers["retry-after"] == "5"
+
+
 async def test_unauthenticated_error_handler():
     """
     Tests the unauthenticated_error_handler function for completion. The
@@ -0,0 +1,154 @@
+from asyncio import sleep
+from unittest.mock import AsyncMock, MagicMock
+
+from redis.asyncio.client import Redis
+from redis.asyncio.connection import Connection
+
+from {{cookiecutter.package_name}}.core.cache import client_cache
+from {{cookiecutter.package_name}}.core.cache.client_cache import INVALIDATE_CHANNEL, ClientCache
+from {{cookiecutter.package_name}}.core.cache.local_cache import LocalCache
+
+
+def create_client_cache(prefixes=()) -> ClientCache:
+    """
+    Function that creates a client-side cache
+    in front of a mocked redis instance
+
+    :param prefixes: The key prefixes to track
+
+    :return: The client-cache instance
+    """
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.connection_pool = MagicMock()
+    local_cache = LocalCache("test-client-cache", max_bytes=1024, ttl_seconds=60)
+    return ClientCache(redis_mock, local_cache, prefixes)
+
+
+def test_invalidate():
+    """
+    Tests the _invalidate function for completion. The _invalidate function should
+    remove the invalidated keys and clear the cache when no keys are given
+    """
+
+    # Creates the client-side cache with tracked values
+    cache = create_client_cache()
+    cache._is_tracking = True
+    cache.set("first", "value", cache.generation)
+    cache.set("second", "value", cache.generation)
+
+    # Checks whether the invalidated key was removed
+    cache._invalidate([b"first"])
+    assert cache.get("first") is None
+    assert cache.get("second") == "value"
+
+    # Checks whether every key was removed when the database was flushed
+    cache._invalidate(None)
+    assert cache.get("second") is None
+    assert cache.generation == 2
+
+
+async def test_listen(mocker):
+    """
+    Tests the _listen function for completion. The _listen function should enable tracking,
+    handle the invalidations, ping the tracker while idle, and clean up when tracking is lost
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the sleep function to stop the listener after tracking is lost
+    mocker.patch.object(client_cache, "sleep", AsyncMock(side_effect=RuntimeError("stop")))
+
+    # Mocks the listener connection
+    listener_mock = AsyncMock(spec=Connection)
+    listener_mock.read_response.side_effect = [
+        7,
+        ["subscribe", INVALIDATE_CHANNEL, 1],
+        ["message", INVALIDATE_CHANNEL, ["key"]],
+        None,
+        ConnectionError(),
+    ]
+
+    # Mocks the tracker connection
+    tracker_mock = AsyncMock(spec=Connection)
+    tracker_mock.read_response.side_effect = ["OK", "PONG"]
+
+    # Creates the client-side cache with connections created from the mocks
+    cache = create_client_cache(["config:"])
+    cache._operation.connection_pool.make_connection.side_effect = [listener_mock, tracker_mock]
+
+    # Invokes the _listen function until tracking is lost
+    try:
+        await cache._listen()
+    except RuntimeError:
+        pass
+
+    # Checks whether tracking was enabled with the invalidations redirected to the listener
+    assert listener_mock.send_command.call_args_list[1].args == ("SUBSCRIBE", INVALIDATE_CHANNEL)
+    assert tracker_mock.send_command.call_args_list[0].args == (
+        "CLIENT",
+        "TRACKING",
+        "ON",
+        "REDIRECT",
+        7,
+        "BCAST",
+        "PREFIX",
+        "config:",
+    )
+
+    # Checks whether the tracker was pinged and the connections were cleaned up
+    assert tracker_mock.send_command.call_args_list[1].args == ("PING",)
+    assert listener_mock.disconnect.called
+    assert tracker_mock.disconnect.called
+    assert not cache.is_tracking
+
+
+def test_set():
+    """
+    Tests the set function for completion. The set function should only cache
+    values of tracked keys that were not invalidated while being read
+    """
+
+    # Creates the client-side cache that tracks a prefix
+    cache = create_client_cache(["config:"])
+    generation = cache.generation
+
+    # Checks whether values are not cached while tracking is inactive
+    cache.set("config:first", "value", generation)
+    assert cache.get("config:first") is None
+
+    # Checks whether only values of tracked keys are cached
+    cache._is_tracking = True
+    cache.set("config:first", "value", generation)
+    cache.set("other:first", "value", generation)
+    assert cache.get("config:first") == "value"
+    assert cache.get("other:first") is None
+
+    # Checks whether values invalidated while being read are not cached
+    cache._invalidate(["config:second"])
+    cache.set("config:second", "value", generation)
+    assert cache.get("config:second") is None
+
+
+async def test_start_stop(mocker):
+    """
+    Tests the start and stop functions for completion. The start function should
+    start the listener and the stop function should cancel it
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the _listen function
+    async def listen_mock(_):
+        await sleep(60)
+
+    mocker.patch.object(ClientCache, "_listen", listen_mock)
+
+    # Starts the listener
+    cache = create_client_cache()
+    cache.start()
+    listener = cache._listener
+
+    # Checks whether the listener was stopped
+    await cache.stop()
+    assert listener.cancelled()
+    assert cache._listener is None
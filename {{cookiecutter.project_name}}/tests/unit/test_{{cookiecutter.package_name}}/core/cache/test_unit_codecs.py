@@ -0,0 +1,146 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+from pytest import raises
+
+from {{cookiecutter.package_name}}.core.cache import codecs
+from {{cookiecutter.package_name}}.core.cache.codecs import Codec, CodecRegistry, get_codec
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+class ExampleModel(BaseModel):
+    name: str
+    created_at: datetime
+
+
+def test_codec_compression(mocker):
+    """
+    Tests the encode and decode functions when compression is enabled. The encode function
+    should only compress payloads above the threshold and the decode function should
+    decompress them using the compression recorded in their header
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the zstd module
+    zstd_mock = MagicMock()
+    zstd_mock.compress.side_effect = lambda data: data[::-1]
+    zstd_mock.decompress.side_effect = lambda data: data[::-1]
+    mocker.patch.object(codecs, "zstd", zstd_mock)
+
+    # Encodes a payload below and above the compression threshold
+    codec = Codec("json", "zstd", compression_threshold_bytes=16)
+    small_payload = codec.encode("small")
+    large_payload = codec.encode("large" * 10)
+
+    # Checks whether only the large payload was compressed
+    assert small_payload == b'\x00"small"'
+    assert large_payload[:1] == b"\x01"
+    assert zstd_mock.compress.call_count == 1
+
+    # Checks whether both payloads were decoded correctly
+    assert codec.decode(small_payload) == "small"
+    assert codec.decode(large_payload) == "large" * 10
+
+
+def test_codec_missing_package(mocker):
+    """
+    Tests the Codec init function when the package of the serializer or compression
+    is not installed. The Codec init function should raise an InternalServerError
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the optional packages as not installed
+    mocker.patch.object(codecs, "orjson", None)
+    mocker.patch.object(codecs, "lz4", None)
+
+    # Checks whether the correct errors were raised
+    with raises(InternalServerError):
+        Codec("orjson")
+    with raises(InternalServerError):
+        Codec("json", "lz4")
+    with raises(InternalServerError):
+        Codec("unknown")
+
+
+def test_decode_unavailable_compression(mocker):
+    """
+    Tests the decode function when the payload was compressed with an unavailable
+    compression. The decode function should raise an InternalServerError
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the lz4 package as not installed
+    mocker.patch.object(codecs, "lz4", None)
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        Codec("json").decode(b'\x02"value"')
+
+
+def test_encode_decode():
+    """
+    Tests the encode and decode functions for completion. The encode and
+    decode functions should round-trip values with each serializer
+    """
+
+    # Checks whether the values were round-tripped correctly
+    value = {"name": "test", "values": [1, 2, 3]}
+    for serializer in ("json", "pickle"):
+        codec = Codec(serializer)
+        assert codec.decode(codec.encode(value)) == value
+    assert Codec("pickle").decode(Codec("pickle").encode({1, 2})) == {1, 2}
+
+
+def test_encode_decode_model(mocker):
+    """
+    Tests the encode_model and decode_model functions for completion. The encode_model
+    and decode_model functions should round-trip pydantic models with each serializer
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the msgpack module with json serialization
+    msgpack_mock = MagicMock()
+    msgpack_mock.packb.side_effect = lambda value: codecs.json.dumps(value).encode()
+    msgpack_mock.unpackb.side_effect = codecs.json.loads
+    mocker.patch.object(codecs, "msgpack", msgpack_mock)
+
+    # Checks whether the models were round-tripped correctly
+    model = ExampleModel(name="test", created_at=datetime(2024, 1, 1))
+    for serializer in ("json", "pickle", "msgpack"):
+        codec = Codec(serializer)
+        assert codec.decode_model(codec.encode_model(model), ExampleModel) == model
+
+    # Checks whether the json serializer used the native pydantic serialization
+    assert Codec("json").encode_model(model) == b"\x00" + model.model_dump_json().encode()
+
+
+def test_get_codec(mocker):
+    """
+    Tests the get_codec function and the CodecRegistry class for completion. The get_codec
+    function should parse the codec specification and the CodecRegistry class should select
+    the codec of each key by its namespace
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the zstd module
+    mocker.patch.object(codecs, "zstd", MagicMock())
+
+    # Creates the codecs from their specifications
+    default_codec = get_codec("json", 1024)
+    session_codec = get_codec("pickle+zstd", 1024)
+
+    # Checks whether the specifications were parsed correctly
+    assert (default_codec.serializer, default_codec.compression) == ("json", None)
+    assert (session_codec.serializer, session_codec.compression) == ("pickle", "zstd")
+
+    # Checks whether each key got the codec of its namespace
+    registry = CodecRegistry(default_codec, {"session": session_codec})
+    assert registry.get_codec("session:1") == session_codec
+    assert registry.get_codec("user:1") == default_codec
+    assert registry.get_codec("session") == session_codec
@@ -0,0 +1,128 @@
+from asyncio import ensure_future, gather, sleep
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest import raises
+from redis.exceptions import ResponseError
+
+from {{cookiecutter.package_name}}.core.cache.command_batcher import CommandBatcher
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def get_pipe_commands(pipeline_mock: AsyncMock, call_index: int) -> list:
+    """
+    Function that gets the commands a batch
+    added to the mocked redis pipeline
+
+    :param pipeline_mock: The mocked redis-manager pipeline function
+    :param call_index: The index of the batch
+
+    :return: The arguments of each command in the batch
+    """
+    pipe_mock = MagicMock()
+    pipeline_mock.call_args_list[call_index].args[0](pipe_mock)
+    return [call.args for call in pipe_mock.execute_command.call_args_list]
+
+
+async def test_execute():
+    """
+    Tests the execute function for completion. The execute function should send the commands
+    of concurrent coroutines in one pipeline and give each caller its own result
+    """
+
+    # Creates the command batcher
+    pipeline_mock = AsyncMock(return_value=["first-value", "second-value"])
+    batcher = CommandBatcher("test-batcher", pipeline_mock, window_seconds=0.001, max_size=10)
+
+    # Executes two commands concurrently
+    results = await gather(batcher.execute("GET", "first"), batcher.execute("GET", "second"))
+
+    # Checks whether the commands were sent in one pipeline
+    assert results == ["first-value", "second-value"]
+    assert pipeline_mock.call_count == 1
+    assert pipeline_mock.call_args.kwargs == {
+        "is_transaction": False,
+        "raise_on_error": False,
+        "is_read_only": False,
+    }
+    assert get_pipe_commands(pipeline_mock, 0) == [("GET", "first"), ("GET", "second")]
+
+
+async def test_execute_command_error():
+    """
+    Tests the execute function when a command fails. The execute function should raise
+    an InternalServerError for the failing command and return the other results
+    """
+
+    # Creates the command batcher with a failing command
+    pipeline_mock = AsyncMock(return_value=[ResponseError("WRONGTYPE"), "second-value"])
+    batcher = CommandBatcher("test-batcher", pipeline_mock, window_seconds=0.001, max_size=10)
+
+    # Executes two commands concurrently
+    results = await gather(
+        batcher.execute("GET", "first"), batcher.execute("GET", "second"), return_exceptions=True
+    )
+
+    # Checks whether only the failing command raised an error
+    assert isinstance(results[0], InternalServerError)
+    assert isinstance(results[0].__cause__, ResponseError)
+    assert results[1] == "second-value"
+
+
+async def test_execute_read_only():
+    """
+    Tests the execute function when read-only commands are executed. The execute function
+    should batch the read-only commands apart from the other commands so they reach a replica
+    """
+
+    # Creates the command batcher whose pipeline returns a value for each route
+    pipeline_mock = AsyncMock(side_effect=lambda *_, is_read_only, **__: [is_read_only])
+    batcher = CommandBatcher("test-batcher", pipeline_mock, window_seconds=0.001, max_size=10)
+
+    # Executes a read-only command and another command concurrently
+    results = await gather(
+        batcher.execute("GET", "first", is_read_only=True), batcher.execute("SET", "second", 1)
+    )
+
+    # Checks whether each command was sent in the pipeline of its route
+    assert results == [True, False]
+    assert pipeline_mock.call_count == 2
+
+
+async def test_execute_max_size():
+    """
+    Tests the execute function when the batch is full. The execute function
+    should send the full batch without waiting for the batching window
+    """
+
+    # Creates the command batcher with a batching window that never elapses
+    pipeline_mock = AsyncMock(side_effect=[["first-value", "second-value"], ["third-value"]])
+    batcher = CommandBatcher("test-batcher", pipeline_mock, window_seconds=60, max_size=2)
+
+    # Executes a full batch of commands
+    results = await gather(batcher.execute("GET", "first"), batcher.execute("GET", "second"))
+
+    # Checks whether the full batch was sent without waiting
+    assert results == ["first-value", "second-value"]
+    assert batcher._flush_handles[False] is None
+
+    # Checks whether flushing sends the commands waiting in the next batch
+    third = ensure_future(batcher.execute("GET", "third"))
+    await sleep(0)
+    await batcher.flush()
+    assert await third == "third-value"
+    assert get_pipe_commands(pipeline_mock, 1) == [("GET", "third")]
+
+
+async def test_execute_pipeline_error():
+    """
+    Tests the execute function when the pipeline fails. The execute
+    function should raise the error to every caller in the batch
+    """
+
+    # Creates the command batcher with a failing pipeline
+    pipeline_mock = AsyncMock(side_effect=InternalServerError())
+    batcher = CommandBatcher("test-batcher", pipeline_mock, window_seconds=0.001, max_size=10)
+
+    # Checks whether every caller received the error
+    with raises(InternalServerError):
+        await gather(batcher.execute("GET", "first"), batcher.execute("GET", "second"))
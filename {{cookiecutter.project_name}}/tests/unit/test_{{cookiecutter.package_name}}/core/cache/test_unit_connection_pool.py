@@ -0,0 +1,131 @@
+from asyncio import Event, create_task, sleep
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest import raises
+from redis.exceptions import ConnectionError
+
+from {{cookiecutter.package_name}}.core.cache import connection_pool
+from {{cookiecutter.package_name}}.core.cache.connection_pool import (
+    ClusterConnectionLimiter,
+    InstrumentedConnectionPool,
+    InstrumentedSentinelConnectionPool,
+)
+
+
+async def test_get_connection(mocker):
+    """
+    Tests the get_connection function for completion. The get_connection
+    function should check out a connection and record the checkout wait
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(connection_pool, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Creates the connection pool with connections that are never opened
+    pool = InstrumentedConnectionPool("test-get-connection", max_connections=1, timeout=0.01)
+    mocker.patch.object(pool, "ensure_connection", AsyncMock())
+
+    # Checks whether the connection was checked out and the wait was recorded
+    connection = await pool.get_connection()
+    assert connection in pool._in_use_connections
+    assert observe_pool_checkout_mock.call_args.args[0] == "test-get-connection"
+    assert len(observe_pool_checkout_mock.call_args.args) == 2
+
+
+async def test_get_connection_timeout(mocker):
+    """
+    Tests the get_connection function when the pool is full. The get_connection function
+    should raise a ConnectionError and record that the checkout timed out
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(connection_pool, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Creates the connection pool and checks out its only connection
+    pool = InstrumentedConnectionPool("test-get-connection", max_connections=1, timeout=0.01)
+    mocker.patch.object(pool, "ensure_connection", AsyncMock())
+    await pool.get_connection()
+
+    # Checks whether the checkout timed out waiting on the full pool
+    with raises(ConnectionError):
+        await pool.get_connection()
+    assert observe_pool_checkout_mock.call_args.args[2] is True
+
+
+async def test_checkout(mocker):
+    """
+    Tests the checkout function for completion. The checkout function should hold a
+    slot within the context and make other pipelines wait until it is released
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(connection_pool, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Function that holds the only slot until it is released
+    limiter = ClusterConnectionLimiter("test-checkout", max_connections=1, timeout_seconds=1)
+    release = Event()
+
+    async def hold_slot():
+        async with limiter.checkout():
+            await release.wait()
+
+    # Checks whether the next checkout waited until the slot was released
+    holder = create_task(hold_slot())
+    await sleep(0)
+    assert limiter._in_use == 1
+    release.set()
+    async with limiter.checkout():
+        assert limiter._in_use == 1
+    await holder
+    assert limiter._in_use == 0
+    assert observe_pool_checkout_mock.call_count == 2
+
+
+async def test_checkout_timeout(mocker):
+    """
+    Tests the checkout function when every slot is held. The checkout function
+    should raise a ConnectionError and record that the checkout timed out
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(connection_pool, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Checks whether the checkout timed out waiting on the held slot
+    limiter = ClusterConnectionLimiter("test-checkout", max_connections=1, timeout_seconds=0.01)
+    async with limiter.checkout():
+        with raises(ConnectionError):
+            async with limiter.checkout():
+                pass
+    assert observe_pool_checkout_mock.call_args.args[2] is True
+
+
+async def test_sentinel_get_connection(mocker):
+    """
+    Tests the get_connection function of the sentinel connection pool when the pool is
+    full. The get_connection function should raise a ConnectionError once it times out
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates the sentinel connection pool and checks out its only connection
+    pool = InstrumentedSentinelConnectionPool(
+        "test-service", MagicMock(), display_name="test-sentinel", max_connections=1, timeout=0.01
+    )
+    mocker.patch.object(pool, "ensure_connection", AsyncMock())
+    await pool.get_connection()
+
+    # Checks whether the checkout timed out waiting on the full pool
+    with raises(ConnectionError):
+        await pool.get_connection()
@@ -1,4 +1,32 @@
-from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext, get_fast_api_context
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import (
+    EntityCache,
+    FastApiContext,
+    RetryBudget,
+    get_fast_api_context,
+)
+
+
+def test_entity_cache():
+    """
+    Tests the EntityCache class for completion. The EntityCache class
+    should get, set, and clear the cached table rows without any errors
+    """
+
+    # Creates an entity cache and caches rows with a simple and a composite primary key
+    entity_cache = EntityCache()
+    entity_cache.set(int, 1, "first-row")
+    entity_cache.set(int, {"id": 2, "version": 1}, "second-row")
+
+    # Checks whether the rows were cached correctly
+    assert entity_cache.get(int, 1) == "first-row"
+    assert entity_cache.get(int, {"version": 1, "id": 2}) == "second-row"
+    assert entity_cache.get(str, 1) is None
+    assert len(entity_cache) == 2
+
+    # Checks whether the rows were cleared correctly
+    entity_cache.clear()
+    assert entity_cache.get(int, 1) is None
+    assert len(entity_cache) == 0
 
 
 def test_get_fast_api_context():
@@ -28,3 +56,76 @@ def test_set_correlation_id_var():
     # Checks whether the fast-api-context variables were reset correctly
     fast_api_context.reset()
     assert fast_api_context.correlation_id_var is None
+
+
+def test_set_entity_cache_var():
+    """
+    Tests the FastApiContext class when the entity cache should be gotten, set, and reset.
+    The FastApiContext class should handle the entity cache operations without any errors
+    """
+
+    # Creates a fast-api-context instance and sets an entity cache
+    fast_api_context = FastApiContext()
+    entity_cache = EntityCache()
+    fast_api_context.entity_cache_var = entity_cache
+
+    # Checks whether the entity cache was get and set correctly
+    assert fast_api_context.entity_cache_var == entity_cache
+
+    # Checks whether the fast-api-context variables were reset correctly
+    fast_api_context.reset()
+    assert fast_api_context.entity_cache_var is None
+
+
+def test_set_primary_pins_var():
+    """
+    Tests the FastApiContext class when the primary pins should be gotten, set, and reset.
+    The FastApiContext class should handle the primary pins operations without any errors
+    """
+
+    # Creates a fast-api-context instance and sets the primary pins
+    fast_api_context = FastApiContext()
+    primary_pins = {"test-row-operations"}
+    fast_api_context.primary_pins_var = primary_pins
+
+    # Checks whether the primary pins were get and set correctly
+    assert fast_api_context.primary_pins_var == primary_pins
+
+    # Checks whether the fast-api-context variables were reset correctly
+    fast_api_context.reset()
+    assert fast_api_context.primary_pins_var is None
+
+
+def test_set_retry_budget_var():
+    """
+    Tests the FastApiContext class when the retry budget should be gotten, set, and reset.
+    The FastApiContext class should handle the retry budget operations without any errors
+    """
+
+    # Creates a fast-api-context instance and sets a retry budget
+    fast_api_context = FastApiContext()
+    retry_budget = RetryBudget(retries=1)
+    fast_api_context.retry_budget_var = retry_budget
+
+    # Checks whether the retry budget was get and set correctly
+    assert fast_api_context.retry_budget_var == retry_budget
+
+    # Checks whether the fast-api-context variables were reset correctly
+    fast_api_context.reset()
+    assert fast_api_context.retry_budget_var is None
+
+
+def test_spend_retry_budget():
+    """
+    Tests the RetryBudget spend function for completion. The spend function
+    should spend retries until the retry budget is exhausted
+    """
+
+    # Creates a retry budget with two retries
+    retry_budget = RetryBudget(retries=2)
+
+    # Checks whether the retries were spent until the budget was exhausted
+    assert retry_budget.spend()
+    assert retry_budget.spend()
+    assert not retry_budget.spend()
+    assert retry_budget.remaining == 0
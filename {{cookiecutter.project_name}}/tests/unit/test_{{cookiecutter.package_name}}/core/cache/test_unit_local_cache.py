@@ -0,0 +1,190 @@
+from sys import getsizeof
+
+from prometheus_client import REGISTRY
+
+from {{cookiecutter.package_name}}.core.cache import local_cache
+from {{cookiecutter.package_name}}.core.cache.local_cache import LocalCache, get_deep_size
+
+
+def test_clear():
+    """
+    Tests the clear function for completion. The clear function
+    should remove every entry and release their bytes
+    """
+
+    # Creates a local cache with two entries
+    cache = LocalCache("test-clear", max_bytes=1024, ttl_seconds=60)
+    cache.set("first", "value")
+    cache.set("second", "value")
+
+    # Checks whether every entry was removed
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_delete():
+    """
+    Tests the delete function for completion. The delete function
+    should remove the given keys and release their bytes
+    """
+
+    # Creates a local cache with two entries
+    cache = LocalCache("test-delete", max_bytes=1024, ttl_seconds=60)
+    cache.set("first", "value")
+    cache.set("second", "value")
+
+    # Checks whether only the given key was removed
+    cache.delete(["first", "missing"])
+    assert cache.get("first") is None
+    assert cache.get("second") == "value"
+    assert cache.size == getsizeof("second") + getsizeof("value")
+
+
+def test_get_expired(mocker):
+    """
+    Tests the get function when the entry has expired. The get
+    function should remove the entry and treat it as missing
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a local cache with an entry
+    mocker.patch.object(local_cache, "monotonic", return_value=100.0)
+    cache = LocalCache("test-get-expired", max_bytes=1024, ttl_seconds=10)
+    cache.set("key", "value")
+
+    # Checks whether the expired entry was removed
+    mocker.patch.object(local_cache, "monotonic", return_value=110.0)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_hit_ratio():
+    """
+    Tests the hit_ratio property for completion. The hit_ratio property
+    should get the share of reads that were served from the cache
+    """
+
+    # Creates a local cache and reads a cached and a missing key
+    cache = LocalCache("test-hit-ratio", max_bytes=1024, ttl_seconds=60)
+    assert cache.hit_ratio == 0.0
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("key")
+    cache.get("missing")
+
+    # Checks whether the hit ratio was calculated and reported correctly
+    assert cache.hit_ratio == 2 / 3
+    assert REGISTRY.get_sample_value("local_cache_hit_ratio", {"name": "test-hit-ratio"}) == 2 / 3
+
+
+def test_get_deep_size():
+    """
+    Tests the get_deep_size function for completion. The get_deep_size function should
+    count the nested items of a value and count objects referenced twice only once
+    """
+
+    # Checks whether the nested items were counted
+    item = "value" * 100
+    assert get_deep_size([item]) == getsizeof([item]) + getsizeof(item)
+    item_size = getsizeof("key") + getsizeof(item)
+    assert get_deep_size({"key": item}) == getsizeof({"key": item}) + item_size
+
+    # Checks whether an item referenced twice was counted once
+    assert get_deep_size([item, item]) == getsizeof([item, item]) + getsizeof(item)
+
+
+def test_set():
+    """
+    Tests the set function for completion. The set function should
+    cache the value and record the hits and misses of the cache
+    """
+
+    # Creates a local cache and caches a value
+    cache = LocalCache("test-set", max_bytes=1024, ttl_seconds=60)
+    cache.set("key", "value")
+
+    # Checks whether the value was cached correctly
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.size == getsizeof("key") + getsizeof("value")
+
+    # Checks whether the hits and misses were recorded
+    assert local_cache.LOCAL_CACHE_HITS.labels("test-set")._value.get() == 1
+    assert local_cache.LOCAL_CACHE_MISSES.labels("test-set")._value.get() == 1
+
+
+def test_set_evicts_least_recently_used():
+    """
+    Tests the set function when the cache is full. The set function should
+    evict the least recently used entries until the new value fits
+    """
+
+    # Creates a local cache that fits two entries
+    entry_size = getsizeof("a") + getsizeof("value")
+    cache = LocalCache("test-set-evict", max_bytes=entry_size * 2, ttl_seconds=60)
+    cache.set("a", "value")
+    cache.set("b", "value")
+
+    # Marks the first entry as the most recently used and caches a third entry
+    cache.get("a")
+    cache.set("c", "value")
+
+    # Checks whether the least recently used entry was evicted
+    assert cache.get("a") == "value"
+    assert cache.get("b") is None
+    assert cache.get("c") == "value"
+    assert local_cache.LOCAL_CACHE_EVICTIONS.labels("test-set-evict")._value.get() == 1
+
+
+def test_set_too_large():
+    """
+    Tests the set function when the value is larger than the byte
+    limit. The set function should not cache the value
+    """
+
+    # Creates a small local cache and caches a large value
+    cache = LocalCache("test-set-too-large", max_bytes=16, ttl_seconds=60)
+    cache.set("key", "value" * 100)
+
+    # Checks whether the value was not cached
+    assert cache.get("key") is None
+    assert cache.size == 0
+
+
+def test_set_too_large_nested():
+    """
+    Tests the set function when the nested items of the value are larger than
+    the byte limit. The set function should not cache the value
+    """
+
+    # Creates a small local cache and caches a list holding a large value
+    cache = LocalCache("test-set-too-large-nested", max_bytes=256, ttl_seconds=60)
+    cache.set("key", ["value" * 100])
+
+    # Checks whether the value was not cached
+    assert cache.get("key") is None
+    assert cache.size == 0
+
+
+def test_set_ttl_capped(mocker):
+    """
+    Tests the set function when a TTL is given. The set function should
+    use the given TTL without exceeding the TTL of the cache
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a local cache and caches values with a shorter and a longer TTL
+    mocker.patch.object(local_cache, "monotonic", return_value=100.0)
+    cache = LocalCache("test-set-ttl", max_bytes=1024, ttl_seconds=10)
+    cache.set("short", "value", ttl_seconds=5)
+    cache.set("long", "value", ttl_seconds=60)
+
+    # Checks whether the short TTL was used and the long TTL was capped
+    mocker.patch.object(local_cache, "monotonic", return_value=106.0)
+    assert cache.get("short") is None
+    assert cache.get("long") == "value"
+    mocker.patch.object(local_cache, "monotonic", return_value=110.0)
+    assert cache.get("long") is None
@@ -0,0 +1,128 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest import raises
+from redis.exceptions import ResponseError
+
+from {{cookiecutter.package_name}}.core.cache.pipeline_builder import CommandHandle, PipelineBuilder
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def get_pipe_commands(pipeline_mock: AsyncMock, call_index: int) -> list:
+    """
+    Function that gets the commands a chunk
+    added to the mocked redis pipeline
+
+    :param pipeline_mock: The mocked redis-manager pipeline function
+    :param call_index: The index of the chunk
+
+    :return: The arguments of each command in the chunk
+    """
+    pipe_mock = MagicMock()
+    pipeline_mock.call_args_list[call_index].args[0](pipe_mock)
+    return [call.args for call in pipe_mock.execute_command.call_args_list]
+
+
+def test_command_handle_not_executed():
+    """
+    Tests the result property when the command has not been executed.
+    The result property should raise an InternalServerError
+    """
+
+    # Checks whether the correct error was raised
+    handle = CommandHandle(("GET", "key"))
+    assert not handle.is_resolved
+    with raises(InternalServerError):
+        assert handle.result
+
+
+async def test_execute():
+    """
+    Tests the execute function for completion. The execute function should send the queued
+    commands in chunks and resolve each handle with the result of its own command
+    """
+
+    # Creates the pipeline builder and queues the commands
+    pipeline_mock = AsyncMock(side_effect=[[True, 1], [2]])
+    builder = PipelineBuilder(pipeline_mock, is_transaction=False, chunk_size=2, concurrency=1)
+    set_handle = builder.set("first", "value", ttl_seconds=30)
+    hset_handle = builder.hset("second", {"field": "value"})
+    delete_handle = builder.delete("first", "second")
+    assert len(builder) == 3
+
+    # Invokes the execute function
+    await builder.execute()
+
+    # Checks whether the commands were sent in chunks
+    assert pipeline_mock.call_count == 2
+    assert pipeline_mock.call_args.kwargs == {"is_transaction": False, "raise_on_error": False}
+    assert get_pipe_commands(pipeline_mock, 0) == [
+        ("SET", "first", "value", "EX", 30),
+        ("HSET", "second", "field", "value"),
+    ]
+    assert get_pipe_commands(pipeline_mock, 1) == [("DEL", "first", "second")]
+
+    # Checks whether each handle was resolved with its own result
+    assert set_handle.result is True
+    assert hset_handle.result == 1
+    assert delete_handle.result == 2
+    assert len(builder) == 0
+
+
+async def test_execute_chunk_error():
+    """
+    Tests the execute function when a chunk fails. The execute function should resolve the
+    handles of the failed chunk with the error and raise it after the other chunks finish
+    """
+
+    # Creates the pipeline builder with a failing first chunk
+    pipeline_mock = AsyncMock(side_effect=[InternalServerError(), ["value"]])
+    builder = PipelineBuilder(pipeline_mock, is_transaction=False, chunk_size=1, concurrency=2)
+    first_handle = builder.get("first")
+    second_handle = builder.get("second")
+
+    # Checks whether the error was raised after every chunk finished
+    with raises(InternalServerError):
+        await builder.execute()
+    with raises(InternalServerError):
+        assert first_handle.result
+    assert second_handle.result == "value"
+
+
+async def test_execute_command_error():
+    """
+    Tests the execute function when a command fails. The execute function should
+    resolve the handle of the failing command with an InternalServerError
+    """
+
+    # Creates the pipeline builder with a failing command
+    pipeline_mock = AsyncMock(return_value=[ResponseError("WRONGTYPE"), True])
+    builder = PipelineBuilder(pipeline_mock, is_transaction=False, chunk_size=10, concurrency=1)
+    failing_handle = builder.command("INCR", "first")
+    expire_handle = builder.expire("second", 30)
+
+    # Checks whether only the failing command raised an error
+    await builder.execute()
+    with raises(InternalServerError) as exc_info:
+        assert failing_handle.result
+    assert isinstance(exc_info.value.__cause__, ResponseError)
+    assert expire_handle.result is True
+
+
+async def test_execute_transaction():
+    """
+    Tests the execute function when the pipeline is a transaction. The execute function
+    should send every command in a single pipeline regardless of the chunk size
+    """
+
+    # Creates the transactional pipeline builder and queues the commands
+    pipeline_mock = AsyncMock(return_value=["first-value", "second-value"])
+    builder = PipelineBuilder(pipeline_mock, is_transaction=True, chunk_size=1, concurrency=1)
+    first_handle = builder.get("first")
+    second_handle = builder.get("second")
+
+    # Checks whether the commands were sent in a single transaction
+    await builder.execute()
+    assert pipeline_mock.call_count == 1
+    assert pipeline_mock.call_args.kwargs["is_transaction"] is True
+    assert first_handle.result == "first-value"
+    assert second_handle.result == "second-value"
@@ -0,0 +1,44 @@
+from prometheus_client import REGISTRY
+from redis.asyncio.connection import BlockingConnectionPool
+
+from {{cookiecutter.package_name}}.core.cache.pool_metrics import instrument_pool, observe_pool_checkout
+
+
+def test_instrument_pool():
+    """
+    Tests the instrument_pool function for completion. The instrument_pool
+    function should report the connection usage of the connection pool
+    """
+
+    # Creates a connection pool with a checked out and an idle connection
+    pool = BlockingConnectionPool(max_connections=4)
+    pool._in_use_connections.add(pool.make_connection())
+    pool._available_connections.append(pool.make_connection())
+
+    # Instruments the connection pool
+    instrument_pool(pool, "test-pool")
+
+    # Checks whether the connection pool metrics were reported correctly
+    labels = {"redis": "test-pool"}
+    assert REGISTRY.get_sample_value("redis_pool_max_connections", labels) == 4
+    assert REGISTRY.get_sample_value("redis_pool_in_use_connections", labels) == 1
+    assert REGISTRY.get_sample_value("redis_pool_idle_connections", labels) == 1
+    pool._in_use_connections.clear()
+    assert REGISTRY.get_sample_value("redis_pool_in_use_connections", labels) == 0
+
+
+def test_observe_pool_checkout():
+    """
+    Tests the observe_pool_checkout function for completion. The observe_pool_checkout
+    function should record the checkout wait time and count checkout timeouts
+    """
+
+    # Records a successful checkout and a timed out checkout
+    observe_pool_checkout("test-checkout", 0.5)
+    observe_pool_checkout("test-checkout", 5, is_timeout=True)
+
+    # Checks whether the checkout metrics were recorded correctly
+    labels = {"redis": "test-checkout"}
+    assert REGISTRY.get_sample_value("redis_pool_wait_seconds_count", labels) == 2
+    assert REGISTRY.get_sample_value("redis_pool_wait_seconds_sum", labels) == 5.5
+    assert REGISTRY.get_sample_value("redis_pool_wait_timeouts_total", labels) == 1
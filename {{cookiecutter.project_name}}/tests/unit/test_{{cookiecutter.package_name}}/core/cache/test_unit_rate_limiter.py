@@ -0,0 +1,185 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import NoScriptError, ResponseError
+
+from {{cookiecutter.package_name}}.core.cache import rate_limiter
+from {{cookiecutter.package_name}}.core.cache.local_cache import LocalCache
+from {{cookiecutter.package_name}}.core.cache.rate_limiter import RateLimiter, RateLimitRule, get_rate_limit_rule
+from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, TooManyRequestsError
+
+
+def create_rate_limiter(name: str, *results: object) -> RateLimiter:
+    """
+    Function that creates a rate limiter of ten requests per minute whose
+    redis-manager pipeline returns the given token bucket script results
+
+    :param name: The name of the in-process lease cache
+    :param results: The results of the token bucket script
+
+    :return: The rate-limiter instance
+    """
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    iterator = iter(results)
+    redis_manager_mock.pipeline = AsyncMock(side_effect=lambda *_, **__: next(iterator))
+    lease_cache = LocalCache(name, max_bytes=4096, ttl_seconds=60)
+    route_rules = {"/api/v1/health": None, "/api/v1/auth": RateLimitRule(2, 60)}
+    return RateLimiter(redis_manager_mock, RateLimitRule(10, 60), route_rules, lease_cache, 0.5)
+
+
+async def test_acquire_no_script():
+    """
+    Tests the _acquire function when redis has not cached the script. The _acquire function
+    should run the script by its hash and then send the whole script
+    """
+
+    # Creates a rate limiter whose script is not cached by redis
+    limiter = create_rate_limiter("test-acquire-no-script", NoScriptError(), [5, 0])
+    pipeline_mock = limiter._redis_manager.pipeline
+
+    # Checks whether the whole script was sent after the hash was not found
+    assert await limiter._acquire("test-key", RateLimitRule(10, 60), 5) == (5, 0)
+    pipe_mock = MagicMock()
+    pipeline_mock.call_args_list[0].args[0](pipe_mock)
+    pipeline_mock.call_args_list[1].args[0](pipe_mock)
+    assert pipe_mock.evalsha.call_args.args[:3] == (rate_limiter._TOKEN_BUCKET_SHA, 1, "test-key")
+    assert pipe_mock.eval.call_args.args[:3] == (rate_limiter._TOKEN_BUCKET_SCRIPT, 1, "test-key")
+    assert pipe_mock.eval.call_args.args[3:] == (10, 10 / 60000, 5)
+
+
+async def test_acquire_script_error():
+    """
+    Tests the _acquire function when the script fails. The
+    _acquire function should raise an InternalServerError
+    """
+
+    # Creates a rate limiter whose script fails
+    limiter = create_rate_limiter("test-acquire-script-error", ResponseError())
+
+    # Checks whether the error of the script was raised
+    with pytest.raises(InternalServerError):
+        await limiter._acquire("test-key", RateLimitRule(10, 60), 5)
+
+
+def test_get_rate_limit_rule():
+    """
+    Tests the get_rate_limit_rule function for completion. The get_rate_limit_rule
+    function should parse the requests and period of the rule
+    """
+
+    # Checks whether the rule was parsed correctly
+    rule = get_rate_limit_rule("100/60")
+    assert rule.requests == 100
+    assert rule.period_seconds == 60.0
+
+    # Checks whether unlimited routes do not get a rule
+    assert get_rate_limit_rule("unlimited") is None
+
+
+def test_get_rate_limit_rule_invalid():
+    """
+    Tests the get_rate_limit_rule function when the rule is invalid. The
+    get_rate_limit_rule function should raise an InternalServerError
+    """
+
+    # Checks whether malformed and empty rules raise an error
+    for spec in ["100", "one/60", "0/60", "100/0"]:
+        with pytest.raises(InternalServerError):
+            get_rate_limit_rule(spec)
+
+
+def test_get_rule():
+    """
+    Tests the get_rule function for completion. The get_rule function should get the rule
+    of the longest matching route prefix, falling back to the default rule
+    """
+
+    # Creates a rate limiter with route rules
+    limiter = create_rate_limiter("test-get-rule")
+
+    # Checks whether the rules of the routes were matched correctly
+    assert limiter.get_rule("/api/v1/auth/login")[0] == "/api/v1/auth"
+    assert limiter.get_rule("/api/v1/health") == ("/api/v1/health", None)
+
+    # Checks whether a sibling path sharing the characters of a route was not matched
+    assert limiter.get_rule("/api/v1/authors")[0] == "default"
+    route, rule = limiter.get_rule("/api/v1/users")
+    assert route == "default"
+    assert rule.requests == 10
+
+
+async def test_hit_failed_open():
+    """
+    Tests the hit function when redis fails. The hit function
+    should let the request through without raising an error
+    """
+
+    # Creates a rate limiter whose redis instance fails
+    limiter = create_rate_limiter("test-hit-failed-open")
+    limiter._redis_manager.pipeline.side_effect = InternalServerError()
+
+    # Checks whether the request was allowed
+    await limiter.hit("/api/v1/users", "test-client")
+    assert rate_limiter.RATE_LIMIT_DECISIONS.labels("default", "failed_open")._value.get() >= 1
+
+
+async def test_hit_lease():
+    """
+    Tests the hit function when tokens are leased. The hit function should consume the
+    leased tokens in-process before taking another lease from redis
+    """
+
+    # Creates a rate limiter that leases five tokens at a time
+    limiter = create_rate_limiter("test-hit-lease", [5, 0], [5, 0])
+    pipeline_mock = limiter._redis_manager.pipeline
+
+    # Checks whether the leased tokens were consumed without reaching redis
+    for _ in range(5):
+        await limiter.hit("/api/v1/users", "test-client")
+    assert pipeline_mock.await_count == 1
+    assert pipeline_mock.call_args.kwargs["is_transaction"] is False
+
+    # Checks whether another lease was taken once the leased tokens were consumed
+    await limiter.hit("/api/v1/users", "test-client")
+    assert pipeline_mock.await_count == 2
+
+
+async def test_hit_rejected(mocker):
+    """
+    Tests the hit function when the bucket is empty. The hit function should raise a
+    TooManyRequestsError and reject the client in-process until the bucket refills
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a rate limiter whose bucket is empty
+    mocker.patch.object(rate_limiter, "monotonic", return_value=100.0)
+    limiter = create_rate_limiter("test-hit-rejected", [0, 2500])
+    pipeline_mock = limiter._redis_manager.pipeline
+
+    # Checks whether the client was rejected with the seconds until the bucket refills
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await limiter.hit("/api/v1/users", "test-client")
+    assert exc_info.value.headers == {"retry-after": "3"}
+
+    # Checks whether the client was rejected again without reaching redis
+    mocker.patch.object(rate_limiter, "monotonic", return_value=101.0)
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await limiter.hit("/api/v1/users", "test-client")
+    assert exc_info.value.headers == {"retry-after": "2"}
+    assert pipeline_mock.await_count == 1
+
+
+async def test_hit_unlimited():
+    """
+    Tests the hit function when the route is not limited. The
+    hit function should let the request through without redis
+    """
+
+    # Creates a rate limiter with an unlimited route
+    limiter = create_rate_limiter("test-hit-unlimited")
+
+    # Checks whether the request was allowed without reaching redis
+    await limiter.hit("/api/v1/health", "test-client")
+    assert not limiter._redis_manager.pipeline.called
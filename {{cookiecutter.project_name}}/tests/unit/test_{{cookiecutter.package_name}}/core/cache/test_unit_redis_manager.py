@@ -1,14 +1,47 @@
+from datetime import datetime
 from inspect import unwrap
 from unittest.mock import AsyncMock, MagicMock
 
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 from pytest import raises
 from redis.asyncio.client import Pipeline, Redis
+from redis.asyncio.cluster import RedisCluster
+from redis.client import NEVER_DECODE
+from redis.cluster import LoadBalancingStrategy
 
 from {{cookiecutter.package_name}}.core.cache import redis_manager
+from {{cookiecutter.package_name}}.core.cache.client_cache import ClientCache
+from {{cookiecutter.package_name}}.core.cache.codecs import Codec, CodecRegistry
+from {{cookiecutter.package_name}}.core.cache.command_batcher import CommandBatcher
+from {{cookiecutter.package_name}}.core.cache.connection_pool import (
+    ClusterConnectionLimiter,
+    InstrumentedSentinelConnectionPool,
+)
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker, is_transient_redis_error
 from {{cookiecutter.package_name}}.core.settings import Settings
-from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
+
+
+class ExampleModel(BaseModel):
+    name: str
+    created_at: datetime
+
+
+def create_codec_redis_manager(payload: bytes | None) -> MagicMock:
+    """
+    Function that creates a mocked redis-manager instance
+    that stores values with the json codec
+
+    :param payload: The encoded payload returned when reading a key
+
+    :return: The mocked redis-manager instance
+    """
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._codecs = CodecRegistry(Codec("json"), {"pickled": Codec("pickle")})
+    redis_manager_mock._get_payload = AsyncMock(return_value=payload)
+    redis_manager_mock.pipeline = AsyncMock()
+    return redis_manager_mock
 
 
 def test_connect(mocker):
@@ -19,32 +52,271 @@ def test_connect(mocker):
     :param mocker: Fixture to mock specific functions for testing
     """
 
+    # Mocks the redis-manager class
+    redis_mock = MagicMock(spec_set=Redis)
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._display_name = "test-name"
+    redis_manager_mock._create_standalone.return_value = redis_mock
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_MODE = "standalone"
+    settings_mock.IS_API_REDIS_COMMAND_BATCHING_ENABLED = False
+    settings_mock.IS_API_REDIS_CLIENT_CACHE_ENABLED = False
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Checks whether the connection function runs without any errors
+    RedisManager.connect(self=redis_manager_mock)
+    assert redis_manager_mock._operation == redis_mock
+    assert not redis_manager_mock._create_cluster.called
+    assert not redis_manager_mock._create_sentinel.called
+
+
+def test_connect_client_cache(mocker):
+    """
+    Tests the connect function when client-side caching and command batching are enabled. The
+    connect function should create the command batcher and create and start the client-side cache
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
     # Mocks and overrides the redis class
     redis_mock = MagicMock(spec_set=Redis)
-    redis_mock.return_value = redis_mock
+    redis_mock.from_pool.return_value = redis_mock
     mocker.patch.object(redis_manager, "Redis", redis_mock)
+    mocker.patch.object(redis_manager, "InstrumentedConnectionPool", MagicMock())
+
+    # Mocks and overrides the client-cache class
+    client_cache_mock = MagicMock(spec_set=ClientCache)
+    client_cache_mock.return_value = client_cache_mock
+    mocker.patch.object(redis_manager, "ClientCache", client_cache_mock)
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_MODE = "standalone"
+    settings_mock.API_REDIS_DECODE_RESPONSES = True
+    settings_mock.API_REDIS_MAX_CONNECTIONS = 10
+    settings_mock.API_REDIS_POOL_TIMEOUT_SECONDS = 2.0
+    settings_mock.API_REDIS_SOCKET_TIMEOUT_SECONDS = 3.0
+    settings_mock.API_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = 4.0
+    settings_mock.API_REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+    settings_mock.IS_API_REDIS_SOCKET_KEEPALIVE = True
+    settings_mock.IS_API_REDIS_COMMAND_BATCHING_ENABLED = True
+    settings_mock.API_REDIS_COMMAND_BATCH_WINDOW_SECONDS = 0.002
+    settings_mock.API_REDIS_COMMAND_BATCH_MAX_SIZE = 100
+    settings_mock.API_REDIS_CODEC = "json"
+    settings_mock.API_REDIS_CODEC_COMPRESSION_THRESHOLD_BYTES = 1024
+    settings_mock.API_REDIS_NAMESPACE_CODECS = {}
+    settings_mock.IS_API_REDIS_CLIENT_CACHE_ENABLED = True
+    settings_mock.API_REDIS_CLIENT_CACHE_MAX_BYTES = 1024
+    settings_mock.API_REDIS_CLIENT_CACHE_TTL_SECONDS = 60.0
+    settings_mock.API_REDIS_CLIENT_CACHE_PREFIXES = ["config:"]
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Invokes the connect function
+    redis_manager_instance = RedisManager(
+        display_name="test-client-cache",
+        description="test-description",
+        host=SecretStr("test-host"),
+        port=SecretStr("1234"),
+        password=SecretStr("test-password"),
+    )
+    redis_manager_instance.connect()
+
+    # Checks whether the command batcher was created
+    assert isinstance(redis_manager_instance.command_batcher, CommandBatcher)
+
+    # Checks whether the client-side cache was created and started
+    assert redis_manager_instance.client_cache == client_cache_mock
+    assert client_cache_mock.call_args.args[0] == redis_mock
+    assert client_cache_mock.call_args.args[2] == ["config:"]
+    assert client_cache_mock.start.called
+
+
+def test_connect_cluster(mocker):
+    """
+    Tests the connect function when redis runs as a cluster. The connect function should create
+    the redis-cluster instance and its limiter without creating the unsupported client-side cache
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
 
     # Mocks the redis-manager class
+    redis_cluster_mock = MagicMock(spec_set=RedisCluster)
     redis_manager_mock = MagicMock(spec=RedisManager)
-    redis_manager_mock._host = SecretStr("test-host")
-    redis_manager_mock._port = SecretStr("1234")
-    redis_manager_mock._password = SecretStr("test-password")
     redis_manager_mock._display_name = "test-name"
+    redis_manager_mock._client_cache = None
+    redis_manager_mock._create_cluster.return_value = redis_cluster_mock
 
     # Mock and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_REDIS_DECODE_RESPONSES = True
+    settings_mock.API_REDIS_MODE = "cluster"
+    settings_mock.API_REDIS_MAX_CONNECTIONS = 10
+    settings_mock.API_REDIS_POOL_TIMEOUT_SECONDS = 2.0
+    settings_mock.IS_API_REDIS_COMMAND_BATCHING_ENABLED = False
+    settings_mock.IS_API_REDIS_CLIENT_CACHE_ENABLED = True
     mocker.patch.object(redis_manager, "settings", settings_mock)
 
-    # Checks whether the connection function runs without any errors
+    # Checks whether the redis-cluster instance was created without a client-side cache
     RedisManager.connect(self=redis_manager_mock)
-    assert redis_manager_mock._operation == redis_mock
-    assert redis_mock.called
-    assert redis_mock.call_args.kwargs == {
+    assert redis_manager_mock._operation == redis_cluster_mock
+    assert isinstance(redis_manager_mock._cluster_limiter, ClusterConnectionLimiter)
+    assert redis_manager_mock._client_cache is None
+
+
+def test_connect_sentinel(mocker):
+    """
+    Tests the connect function when redis is discovered through sentinel. The
+    connect function should create the primary and replica redis instances
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the redis-manager class
+    primary_mock = MagicMock(spec_set=Redis)
+    replica_mock = MagicMock(spec_set=Redis)
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._display_name = "test-name"
+    redis_manager_mock._create_sentinel.return_value = (primary_mock, replica_mock)
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_MODE = "sentinel"
+    settings_mock.IS_API_REDIS_COMMAND_BATCHING_ENABLED = False
+    settings_mock.IS_API_REDIS_CLIENT_CACHE_ENABLED = False
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Checks whether the primary and replica redis instances were created
+    RedisManager.connect(self=redis_manager_mock)
+    assert redis_manager_mock._operation == primary_mock
+    assert redis_manager_mock._read_operation == replica_mock
+
+
+def create_connection_redis_manager(mocker) -> MagicMock:
+    """
+    Function that creates a mocked redis-manager instance and overrides
+    the settings used to create the redis instances of each redis mode
+
+    :param mocker: Fixture to mock specific functions for testing
+
+    :return: The mocked redis-manager instance
+    """
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_MAX_CONNECTIONS = 10
+    settings_mock.API_REDIS_POOL_TIMEOUT_SECONDS = 2.0
+    settings_mock.API_REDIS_SOCKET_TIMEOUT_SECONDS = 3.0
+    settings_mock.API_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = 4.0
+    settings_mock.API_REDIS_SENTINEL_NODES = ["first-sentinel:26379", "second-sentinel:26380"]
+    settings_mock.API_REDIS_SENTINEL_SERVICE_NAME = "test-service"
+    settings_mock.API_REDIS_SENTINEL_PASSWORD = SecretStr("")
+    settings_mock.IS_API_REDIS_READ_FROM_REPLICAS = True
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._host = SecretStr("test-host")
+    redis_manager_mock._port = SecretStr("1234")
+    redis_manager_mock._display_name = "test-name"
+    redis_manager_mock._get_connection_kwargs.return_value = {"password": "test-password"}
+    redis_manager_mock._get_address = RedisManager._get_address
+    return redis_manager_mock
+
+
+def test_create_cluster(mocker):
+    """
+    Tests the _create_cluster function for completion. The _create_cluster function should
+    create the redis-cluster instance with reads spread across the replicas
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the redis-cluster class
+    redis_cluster_mock = MagicMock()
+    mocker.patch.object(redis_manager, "RedisCluster", redis_cluster_mock)
+
+    # Checks whether the redis-cluster instance was created correctly
+    redis_manager_mock = create_connection_redis_manager(mocker)
+    redis_cluster = RedisManager._create_cluster(self=redis_manager_mock)
+    assert redis_cluster == redis_cluster_mock.return_value
+    assert redis_cluster_mock.call_args.kwargs == {
+        "host": "test-host",
+        "port": 1234,
+        "max_connections": 10,
+        "load_balancing_strategy": LoadBalancingStrategy.ROUND_ROBIN_REPLICAS,
+        "password": "test-password",
+    }
+
+
+def test_create_sentinel(mocker):
+    """
+    Tests the _create_sentinel function for completion. The _create_sentinel function should
+    discover the primary and replica redis instances through the sentinel nodes
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the sentinel class
+    sentinel_mock = MagicMock()
+    mocker.patch.object(redis_manager, "Sentinel", sentinel_mock)
+
+    # Invokes the _create_sentinel function
+    redis_manager_mock = create_connection_redis_manager(mocker)
+    primary, replica = RedisManager._create_sentinel(self=redis_manager_mock)
+
+    # Checks whether the sentinel instance was created from the sentinel nodes
+    sentinel_nodes = [("first-sentinel", 26379), ("second-sentinel", 26380)]
+    assert sentinel_mock.call_args.args[0] == sentinel_nodes
+    assert sentinel_mock.call_args.kwargs["sentinel_kwargs"]["password"] is None
+    assert sentinel_mock.call_args.kwargs["max_connections"] == 10
+
+    # Checks whether the primary and replica redis instances were created
+    assert primary == sentinel_mock.return_value.master_for.return_value
+    assert replica == sentinel_mock.return_value.slave_for.return_value
+    assert sentinel_mock.return_value.master_for.call_args.args == ("test-service",)
+
+    # Checks whether the primary and replica instances were backed by bounded connection pools
+    master_for_kwargs = sentinel_mock.return_value.master_for.call_args.kwargs
+    slave_for_kwargs = sentinel_mock.return_value.slave_for.call_args.kwargs
+    assert master_for_kwargs == {
+        "connection_pool_class": InstrumentedSentinelConnectionPool,
+        "display_name": "test-name",
+        "timeout": 2.0,
+    }
+    assert slave_for_kwargs["display_name"] == "test-name Replicas"
+
+
+def test_create_standalone(mocker):
+    """
+    Tests the _create_standalone function for completion. The _create_standalone
+    function should create the redis instance backed by a bounded connection pool
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the redis class
+    redis_mock = MagicMock(spec_set=Redis)
+    mocker.patch.object(redis_manager, "Redis", redis_mock)
+
+    # Mocks and overrides the connection pool class
+    pool_mock = MagicMock()
+    mocker.patch.object(redis_manager, "InstrumentedConnectionPool", pool_mock)
+
+    # Checks whether the redis instance was created from the connection pool
+    redis_manager_mock = create_connection_redis_manager(mocker)
+    redis_instance = RedisManager._create_standalone(self=redis_manager_mock)
+    assert redis_instance == redis_mock.from_pool.return_value
+    assert redis_mock.from_pool.call_args.args == (pool_mock.return_value,)
+
+    # Checks whether the bounded connection pool was created correctly
+    assert pool_mock.call_args.args == ("test-name",)
+    assert pool_mock.call_args.kwargs == {
+        "max_connections": 10,
+        "timeout": 2.0,
         "host": "test-host",
         "port": 1234,
         "password": "test-password",
-        "decode_responses": True,
     }
 
 
@@ -62,9 +334,177 @@ async def test_disconnect():
     redis_manager_mock = MagicMock(spec=RedisManager)
     redis_manager_mock._display_name = "test-name"
     redis_manager_mock._operation = redis_mock
+    redis_manager_mock._read_operation = None
+    redis_manager_mock._client_cache = MagicMock(spec_set=ClientCache)
+    redis_manager_mock._client_cache.stop = AsyncMock()
+    redis_manager_mock._command_batcher = MagicMock(spec_set=CommandBatcher)
+    redis_manager_mock._command_batcher.flush = AsyncMock()
 
     await RedisManager.disconnect(self=redis_manager_mock)
     assert redis_mock.close.called
+    assert redis_manager_mock._client_cache.stop.called
+    assert redis_manager_mock._command_batcher.flush.called
+
+
+async def test_execute_command():
+    """
+    Tests the execute_command function for completion. The execute_command
+    function should execute the command on its own in a pipeline
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._command_batcher = None
+    redis_manager_mock.pipeline = AsyncMock(return_value="test-value")
+
+    # Checks whether the command was executed on its own
+    result = await RedisManager.execute_command(redis_manager_mock, "GET", "test-key")
+    assert result == "test-value"
+    assert redis_manager_mock.pipeline.call_args.kwargs == {
+        "is_transaction": False,
+        "is_scalar": True,
+        "is_read_only": False,
+    }
+
+    # Checks whether the command was added to the pipeline
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args.args[0](pipe_mock)
+    assert pipe_mock.execute_command.call_args.args == ("GET", "test-key")
+
+
+async def test_execute_command_batched():
+    """
+    Tests the execute_command function when command batching is enabled. The
+    execute_command function should queue the command in the current batch
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._command_batcher = MagicMock(spec_set=CommandBatcher)
+    redis_manager_mock._command_batcher.execute = AsyncMock(return_value="test-value")
+
+    # Checks whether the command was queued in the current batch
+    result = await RedisManager.execute_command(
+        redis_manager_mock, "GET", "test-key", is_read_only=True
+    )
+    assert result == "test-value"
+    assert redis_manager_mock._command_batcher.execute.call_args.args == ("GET", "test-key")
+    assert redis_manager_mock._command_batcher.execute.call_args.kwargs == {"is_read_only": True}
+    assert not redis_manager_mock.pipeline.called
+
+
+async def test_get():
+    """
+    Tests the get function for completion. The get function should read the value
+    from redis once and then serve it from the client-side cache
+    """
+
+    # Mocks the client-cache class
+    client_cache_mock = MagicMock(spec_set=ClientCache)
+    client_cache_mock.get.side_effect = [None, "test-value"]
+    client_cache_mock.generation = 3
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._client_cache = client_cache_mock
+    redis_manager_mock.execute_command = AsyncMock(return_value="test-value")
+
+    # Checks whether the value was read from redis and cached
+    assert await RedisManager.get(self=redis_manager_mock, key="test-key") == "test-value"
+    assert client_cache_mock.set.call_args.args == ("test-key", "test-value", 3)
+    assert redis_manager_mock.execute_command.call_args.kwargs == {"is_read_only": False}
+
+    # Checks whether the value was served from the client-side cache
+    assert await RedisManager.get(self=redis_manager_mock, key="test-key") == "test-value"
+    assert redis_manager_mock.execute_command.call_count == 1
+
+
+async def test_get_no_client_cache():
+    """
+    Tests the get function when client-side caching is disabled.
+    The get function should read the value from redis
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._client_cache = None
+    redis_manager_mock.execute_command = AsyncMock(return_value="test-value")
+
+    # Checks whether the value was read from redis
+    assert await RedisManager.get(self=redis_manager_mock, key="test-key") == "test-value"
+    assert redis_manager_mock.execute_command.call_args.args == ("GET", "test-key")
+    assert redis_manager_mock.execute_command.call_args.kwargs == {"is_read_only": True}
+
+
+def test_get_codecs(mocker):
+    """
+    Tests the _get_codecs function for completion. The _get_codecs function should
+    create the default codec and the codec of each key namespace from the settings
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_CODEC = "json"
+    settings_mock.API_REDIS_CODEC_COMPRESSION_THRESHOLD_BYTES = 1024
+    settings_mock.API_REDIS_NAMESPACE_CODECS = {"session": "pickle"}
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Checks whether each key got the codec of its namespace
+    registry = RedisManager._get_codecs()
+    assert registry.get_codec("session:1").serializer == "pickle"
+    assert registry.get_codec("user:1").serializer == "json"
+
+
+async def test_get_model():
+    """
+    Tests the get_model function for completion. The get_model function should
+    decode the stored payload into the pydantic model
+    """
+
+    # Mocks the redis-manager class with a stored model
+    model = ExampleModel(name="test", created_at=datetime(2024, 1, 1))
+    payload = Codec("json").encode_model(model)
+    redis_manager_mock = create_codec_redis_manager(payload)
+
+    # Checks whether the model was decoded correctly
+    assert await RedisManager.get_model(redis_manager_mock, "user:1", ExampleModel) == model
+    redis_manager_mock._get_payload.return_value = None
+    assert await RedisManager.get_model(redis_manager_mock, "user:1", ExampleModel) is None
+
+
+async def test_get_payload():
+    """
+    Tests the _get_payload function for completion. The _get_payload
+    function should read the payload without decoding the response
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.pipeline = AsyncMock(return_value=b"payload")
+
+    # Checks whether the payload was read without decoding the response
+    assert await RedisManager._get_payload(redis_manager_mock, "test-key") == b"payload"
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args.args[0](pipe_mock)
+    assert pipe_mock.execute_command.call_args.args == ("GET", "test-key")
+    assert NEVER_DECODE in pipe_mock.execute_command.call_args.kwargs
+
+
+async def test_get_value():
+    """
+    Tests the get_value function for completion. The get_value function should
+    decode the stored payload with the codec of the namespace of its key
+    """
+
+    # Mocks the redis-manager class with a stored value
+    redis_manager_mock = create_codec_redis_manager(Codec("pickle").encode({1, 2}))
+
+    # Checks whether the value was decoded with the codec of its namespace
+    assert await RedisManager.get_value(redis_manager_mock, "pickled:1") == {1, 2}
+    redis_manager_mock._get_payload.return_value = None
+    assert await RedisManager.get_value(redis_manager_mock, "pickled:1") is None
 
 
 def test_get_description():
@@ -129,6 +569,8 @@ def test_init():
     assert redis_manager_instance._port == SecretStr("test-port")
     assert redis_manager_instance._password == SecretStr("test-password")
     assert redis_manager_instance._operation is None
+    assert not redis_manager_instance.is_cluster
+    assert redis_manager_instance.circuit_breaker.name == "test-display-name"
 
 
 def test_get_operation():
@@ -175,6 +617,31 @@ def test_get_operation_no_operation():
         assert redis_manager_instance.operation
 
 
+def test_pipeline_builder(mocker):
+    """
+    Tests the pipeline_builder function for completion. The pipeline_builder function
+    should create a pipeline builder that executes chunks through the pipeline function
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mock and overrides the settings class
+    settings_mock = MagicMock(spec=Settings)
+    settings_mock.API_REDIS_PIPELINE_CHUNK_SIZE = 10
+    settings_mock.API_REDIS_PIPELINE_CONCURRENCY = 2
+    mocker.patch.object(redis_manager, "settings", settings_mock)
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+
+    # Checks whether the pipeline builder was created correctly
+    builder = RedisManager.pipeline_builder(self=redis_manager_mock, is_transaction=True)
+    assert builder._pipeline == redis_manager_mock.pipeline
+    assert builder._is_transaction is True
+    assert builder._chunk_size == 10
+    assert builder._concurrency == 2
+
+
 async def test_pipeline():
     """
     Tests the RedisManager pipeline function for completion. The RedisManager
@@ -192,6 +659,10 @@ async def test_pipeline():
     # Mocks the redis-manager class
     redis_manager_mock = MagicMock(spec=RedisManager)
     redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = None
+    redis_manager_mock._circuit_breaker = CircuitBreaker(
+        "test-redis-pipeline", is_transient_redis_error
+    )
 
     # Mocks the pipe_ops function
     pipe_ops_mock = MagicMock()
@@ -205,7 +676,42 @@ async def test_pipeline():
     assert operation_mock.pipeline.call_args.args[0] is True
     assert pipe_ops_mock.called
     assert pipe_ops_mock.call_args.args[0] == pipe_mock
-    assert pipe_mock.execute.called
+    assert pipe_mock.execute.call_args.args == (True,)
+
+
+async def test_pipeline_read_only():
+    """
+    Tests the RedisManager pipeline function when the commands only read. The RedisManager
+    pipeline function should execute the commands on the replica redis instance
+    """
+
+    # Mocks the pipeline class
+    pipe_mock = AsyncMock(spec_set=Pipeline)
+    pipe_mock.execute.return_value = ["result"]
+
+    # Mocks the primary and replica redis classes
+    operation_mock = MagicMock(spec_set=Redis)
+    read_operation_mock = MagicMock(spec_set=Redis)
+    read_operation_mock.pipeline.return_value.__aenter__.return_value = pipe_mock
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = None
+    redis_manager_mock._read_operation = read_operation_mock
+    redis_manager_mock._circuit_breaker = CircuitBreaker(
+        "test-redis-pipeline-read-only", is_transient_redis_error
+    )
+
+    # Invokes the redis-manager pipeline function
+    result = await unwrap(RedisManager.pipeline)(
+        self=redis_manager_mock, pipe_ops=MagicMock(), is_scalar=True, is_read_only=True
+    )
+
+    # Checks whether the commands were executed on the replica redis instance
+    assert result == "result"
+    assert read_operation_mock.pipeline.called
+    assert not operation_mock.pipeline.called
 
 
 async def test_pipeline_scalar():
@@ -225,6 +731,10 @@ async def test_pipeline_scalar():
     # Mocks the redis-manager class
     redis_manager_mock = MagicMock(spec=RedisManager)
     redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = None
+    redis_manager_mock._circuit_breaker = CircuitBreaker(
+        "test-redis-pipeline-scalar", is_transient_redis_error
+    )
 
     # Mocks the pipe_ops function
     pipe_ops_mock = MagicMock()
@@ -259,6 +769,10 @@ async def test_pipeline_error():
     # Mocks the redis-manager class
     redis_manager_mock = MagicMock(spec=RedisManager)
     redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = None
+    redis_manager_mock._circuit_breaker = CircuitBreaker(
+        "test-redis-pipeline-error", is_transient_redis_error
+    )
 
     # Mocks the pipe_ops function
     pipe_ops_mock = MagicMock(side_effect=InternalServerError())
@@ -274,6 +788,60 @@ async def test_pipeline_error():
     assert pipe_ops_mock.call_args.args[0] == pipe_mock
 
 
+async def test_pipeline_cluster():
+    """
+    Tests the RedisManager pipeline function when redis is a cluster. The RedisManager
+    pipeline function should hold a slot of the cluster limiter while the pipeline executes
+    """
+
+    # Mocks the pipeline class that checks whether a slot is held while it executes
+    cluster_limiter = ClusterConnectionLimiter("test-pipeline-cluster", 1, 0.01)
+    pipe_mock = AsyncMock(spec_set=Pipeline)
+    pipe_mock.execute.side_effect = lambda *_: [cluster_limiter._in_use]
+
+    # Mocks the redis-cluster class
+    operation_mock = MagicMock(spec_set=RedisCluster)
+    operation_mock.pipeline.return_value.__aenter__.return_value = pipe_mock
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = cluster_limiter
+    redis_manager_mock._circuit_breaker = CircuitBreaker(
+        "test-redis-pipeline-cluster", is_transient_redis_error
+    )
+
+    # Checks whether the slot was held while executing and released afterwards
+    result = await unwrap(RedisManager.pipeline)(self=redis_manager_mock, pipe_ops=MagicMock())
+    assert result == [1]
+    assert cluster_limiter._in_use == 0
+
+
+async def test_pipeline_circuit_open():
+    """
+    Tests the RedisManager pipeline function when the circuit breaker is open. The
+    RedisManager pipeline function should raise a ServiceUnavailableError without a call
+    """
+
+    # Mocks the redis class
+    operation_mock = MagicMock(spec_set=Redis)
+
+    # Mocks the circuit-breaker class that rejects every call
+    circuit_breaker_mock = MagicMock(spec=CircuitBreaker)
+    circuit_breaker_mock.protect.return_value.__aenter__.side_effect = ServiceUnavailableError()
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock._operation = operation_mock
+    redis_manager_mock._cluster_limiter = None
+    redis_manager_mock._circuit_breaker = circuit_breaker_mock
+
+    # Checks whether the correct error was raised without calling redis
+    with raises(ServiceUnavailableError):
+        await unwrap(RedisManager.pipeline)(self=redis_manager_mock, pipe_ops=MagicMock())
+    assert not operation_mock.pipeline.called
+
+
 async def test_pipeline_no_operation():
     """
     Tests the RedisManager pipeline function for completion. The RedisManager
@@ -290,3 +858,38 @@ async def test_pipeline_no_operation():
     # Checks whether the correct error was raised
     with raises(InternalServerError):
         await unwrap(RedisManager.pipeline)(self=redis_manager_mock, pipe_ops=pipe_ops_mock)
+
+
+async def test_set_model():
+    """
+    Tests the set_model function for completion. The set_model function should
+    store the pydantic model encoded with the codec of the namespace of its key
+    """
+
+    # Invokes the set_model function
+    model = ExampleModel(name="test", created_at=datetime(2024, 1, 1))
+    redis_manager_mock = create_codec_redis_manager(None)
+    await RedisManager.set_model(redis_manager_mock, "user:1", model, ttl_seconds=30)
+
+    # Checks whether the encoded model was stored
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args.args[0](pipe_mock)
+    assert pipe_mock.set.call_args.args == ("user:1", Codec("json").encode_model(model))
+    assert pipe_mock.set.call_args.kwargs == {"ex": 30}
+
+
+async def test_set_value():
+    """
+    Tests the set_value function for completion. The set_value function should
+    store the value encoded with the codec of the namespace of its key
+    """
+
+    # Invokes the set_value function
+    redis_manager_mock = create_codec_redis_manager(None)
+    await RedisManager.set_value(redis_manager_mock, "pickled:1", {1, 2})
+
+    # Checks whether the encoded value was stored
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args.args[0](pipe_mock)
+    assert pipe_mock.set.call_args.args == ("pickled:1", Codec("pickle").encode({1, 2}))
+    assert pipe_mock.set.call_args.kwargs == {"ex": None}
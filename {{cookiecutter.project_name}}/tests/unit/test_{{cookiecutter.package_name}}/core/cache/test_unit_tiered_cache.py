@@ -0,0 +1,232 @@
+from asyncio import sleep
+from json import dumps
+from unittest.mock import AsyncMock, MagicMock
+
+from {{cookiecutter.package_name}}.core.cache import tiered_cache
+from {{cookiecutter.package_name}}.core.cache.local_cache import LocalCache
+from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+
+
+def create_tiered_cache(pipeline_mock: AsyncMock, is_cluster: bool = False) -> TieredCache:
+    """
+    Function that creates a tiered cache in front
+    of a mocked redis-manager instance
+
+    :param pipeline_mock: The mocked redis pipeline function
+    :param is_cluster: Whether the mocked redis instance is a redis cluster
+
+    :return: The tiered cache instance
+    """
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = is_cluster
+    redis_manager_mock.pipeline = pipeline_mock
+    local_cache = LocalCache("test-tiered-cache", max_bytes=1024, ttl_seconds=60)
+    return TieredCache(redis_manager_mock, local_cache, "test-channel")
+
+
+async def test_delete():
+    """
+    Tests the delete function for completion. The delete function should delete the keys
+    from redis and the in-process cache and publish their invalidation
+    """
+
+    # Creates the tiered cache with a locally cached value
+    pipeline_mock = AsyncMock()
+    cache = create_tiered_cache(pipeline_mock)
+    cache.local_cache.set("key", "value")
+
+    # Invokes the delete function
+    await cache.delete(["key"])
+
+    # Checks whether the key was deleted and its invalidation published
+    pipe_mock = MagicMock()
+    pipeline_mock.call_args.args[0](pipe_mock)
+    assert pipe_mock.delete.call_args.args == ("key",)
+    assert pipe_mock.publish.call_args.args[0] == "test-channel"
+    assert cache.local_cache.get("key") is None
+
+
+async def test_delete_no_keys():
+    """
+    Tests the delete function when no keys are given.
+    The delete function should not call redis
+    """
+
+    # Invokes the delete function without any keys
+    pipeline_mock = AsyncMock()
+    cache = create_tiered_cache(pipeline_mock)
+    await cache.delete([])
+
+    # Checks whether redis was not called
+    assert not pipeline_mock.called
+
+
+async def test_get():
+    """
+    Tests the get function when the value is not cached locally. The get
+    function should get the value from redis and cache it locally
+    """
+
+    # Creates the tiered cache
+    pipeline_mock = AsyncMock(return_value="value")
+    cache = create_tiered_cache(pipeline_mock)
+
+    # Checks whether the value was read from redis once and then from the in-process cache
+    assert await cache.get("key") == "value"
+    assert await cache.get("key") == "value"
+    assert pipeline_mock.call_count == 1
+
+
+async def test_get_invalidated_while_reading():
+    """
+    Tests the get function when an invalidation arrives while the value is read
+    from redis. The get function should not cache the value locally
+    """
+
+    # Creates the tiered cache
+    cache = create_tiered_cache(AsyncMock())
+
+    # Mocks a redis read that is invalidated before it returns
+    async def pipeline_mock(*_, **__):
+        cache._handle_message({"type": "message", "data": dumps({"origin": "other", "keys": []})})
+        return "value"
+
+    # Checks whether the value was returned without being cached locally
+    cache._redis_manager.pipeline = pipeline_mock
+    assert await cache.get("key") == "value"
+    assert cache.local_cache.get("key") is None
+
+
+async def test_handle_message():
+    """
+    Tests the _handle_message function for completion. The _handle_message function should
+    remove the keys invalidated by other workers and ignore its own invalidations
+    """
+
+    # Creates the tiered cache with locally cached values
+    cache = create_tiered_cache(AsyncMock())
+    cache.local_cache.set("first", "value")
+    cache.local_cache.set("second", "value")
+
+    # Handles an invalidation from this worker and from another worker
+    cache._handle_message({"type": "message", "data": cache._get_message(["first"])})
+    cache._handle_message({"type": "message", "data": dumps({"origin": "x", "keys": ["second"]})})
+
+    # Checks whether only the invalidation of the other worker was applied
+    assert cache.local_cache.get("first") == "value"
+    assert cache.local_cache.get("second") is None
+
+
+async def test_handle_message_subscribe():
+    """
+    Tests the _handle_message function when the worker subscribes. The
+    _handle_message function should clear the in-process cache
+    """
+
+    # Creates the tiered cache with a locally cached value
+    cache = create_tiered_cache(AsyncMock())
+    cache.local_cache.set("key", "value")
+
+    # Checks whether the in-process cache was cleared
+    cache._handle_message({"type": "subscribe", "data": 1})
+    assert len(cache.local_cache) == 0
+
+
+async def test_listen_lost(mocker):
+    """
+    Tests the _listen function when the subscription is lost. The _listen function
+    should clear the in-process cache and subscribe again after a backoff
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the sleep function
+    sleep_mock = AsyncMock(side_effect=[None, RuntimeError("stop")])
+    mocker.patch.object(tiered_cache, "sleep", sleep_mock)
+
+    # Creates the tiered cache with a locally cached value and a failing subscription
+    cache = create_tiered_cache(AsyncMock())
+    cache._redis_manager.operation.pubsub.side_effect = ConnectionError()
+    cache.local_cache.set("key", "value")
+
+    # Checks whether the listener cleared the cache and subscribed again
+    try:
+        await cache._listen()
+    except RuntimeError:
+        pass
+    assert len(cache.local_cache) == 0
+    assert cache._redis_manager.operation.pubsub.call_count == 2
+
+
+async def test_set():
+    """
+    Tests the set function for completion. The set function should set the value in redis,
+    remove the previous value from the in-process cache and publish the invalidation of the key
+    """
+
+    # Creates the tiered cache with a previous value cached locally
+    pipeline_mock = AsyncMock()
+    cache = create_tiered_cache(pipeline_mock)
+    cache.local_cache.set("key", "previous-value")
+
+    # Invokes the set function
+    await cache.set("key", "value", ttl_seconds=30)
+
+    # Checks whether the value was set and its invalidation published
+    pipe_mock = MagicMock()
+    pipeline_mock.call_args.args[0](pipe_mock)
+    assert pipe_mock.set.call_args.args == ("key", "value")
+    assert pipe_mock.set.call_args.kwargs == {"ex": 30}
+    assert pipe_mock.publish.call_args.args[0] == "test-channel"
+    assert cache.local_cache.get("key") is None
+
+
+async def test_set_cluster():
+    """
+    Tests the set function when redis is a cluster. The set function should set the value
+    without a transaction and publish the invalidation of the key once the value is set
+    """
+
+    # Creates the tiered cache in front of a redis cluster
+    pipeline_mock = AsyncMock()
+    cache = create_tiered_cache(pipeline_mock, is_cluster=True)
+
+    # Invokes the set function
+    await cache.set("key", "value", ttl_seconds=30)
+
+    # Checks whether the value was set before its invalidation was published
+    set_pipe_mock = MagicMock()
+    publish_pipe_mock = MagicMock()
+    set_call, publish_call = pipeline_mock.call_args_list
+    set_call.args[0](set_pipe_mock)
+    publish_call.args[0](publish_pipe_mock)
+    assert set_pipe_mock.set.call_args.args == ("key", "value")
+    assert not set_pipe_mock.publish.called
+    assert publish_pipe_mock.publish.call_args.args[0] == "test-channel"
+    assert set_call.kwargs == publish_call.kwargs == {"is_transaction": False}
+
+
+async def test_start_stop(mocker):
+    """
+    Tests the start and stop functions for completion. The start function should
+    start the listener and the stop function should cancel it
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the _listen function
+    async def listen_mock(_):
+        await sleep(60)
+
+    mocker.patch.object(TieredCache, "_listen", listen_mock)
+
+    # Starts the listener
+    cache = create_tiered_cache(AsyncMock())
+    await cache.start()
+    listener = cache._listener
+
+    # Checks whether the listener was stopped
+    await cache.stop()
+    assert listener.cancelled()
+    assert cache._listener is None
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+from pytest import raises
+from sqlalchemy import Result
+
+from {{cookiecutter.package_name}}.core.database import row_operations
+from {{cookiecutter.package_name}}.core.database.row_operations import ColumnResults
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def _get_column_results(rows: list) -> ColumnResults:
+    """
+    Function that creates a column-results instance
+    from a result of the given rows
+
+    :param rows: The rows of the result
+
+    :return: The column-results instance
+    """
+    result_mock = MagicMock(spec_set=Result)
+    result_mock.keys.return_value = ["id", "name"]
+    result_mock.all.return_value = rows
+    return ColumnResults(result_mock)
+
+
+def test_arrays(mocker):
+    """
+    Tests the arrays function for completion. The arrays function
+    should convert each column into a numpy array
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the numpy module
+    numpy_mock = MagicMock()
+    numpy_mock.asarray.side_effect = lambda values: ("array", values)
+    mocker.patch.object(row_operations, "numpy", numpy_mock)
+
+    # Checks whether each column was converted into a numpy array
+    column_results = _get_column_results([(1, "one"), (2, "two")])
+    arrays = column_results.arrays()
+    assert arrays == {"id": ("array", [1, 2]), "name": ("array", ["one", "two"])}
+
+
+def test_arrays_no_numpy(mocker):
+    """
+    Tests the arrays function when numpy is not installed.
+    The arrays function should raise an InternalServerError
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the numpy module as not installed
+    mocker.patch.object(row_operations, "numpy", None)
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        _get_column_results([(1, "one")]).arrays()
+
+
+def test_columns():
+    """
+    Tests the columns function for completion. The columns function should
+    return a column-oriented dictionary of each column name and its values
+    """
+
+    # Checks whether the rows were transposed into columns
+    column_results = _get_column_results([(1, "one"), (2, "two")])
+    assert column_results.keys == ["id", "name"]
+    assert column_results.columns() == {"id": [1, 2], "name": ["one", "two"]}
+
+
+def test_columns_empty():
+    """
+    Tests the columns function when no rows are retrieved. The
+    columns function should return an empty list for each column
+    """
+
+    # Checks whether each column was empty
+    column_results = _get_column_results([])
+    assert column_results.columns() == {"id": [], "name": []}
+
+
+def test_tuples():
+    """
+    Tests the tuples function for completion. The tuples function
+    should return each row as a tuple of its column values
+    """
+
+    # Checks whether the rows were retrieved as tuples
+    column_results = _get_column_results([(1, "one"), (2, "two")])
+    assert column_results.tuples() == [(1, "one"), (2, "two")]
@@ -19,16 +19,18 @@ def test_init():
 
     # Define and instantiates the database-connection class
     db_connection = DatabaseConnection(
-        display_name="test-display-name",
+        display_name="test-display-name-init",
         db_uri=SecretStr("test-db-uri"),
     )
 
     # Checks whether the database-connection class correctly instantiated
-    assert db_connection._display_name == "test-display-name"
+    assert db_connection._display_name == "test-display-name-init"
     assert db_connection._db_uri == SecretStr("test-db-uri")
+    assert db_connection._is_cloud_sql is False
     assert db_connection._connector is None
     assert db_connection._engine is None
     assert db_connection._session_maker is None
+    assert db_connection.circuit_breaker.name == "test-display-name-init"
 
 
 async def test_engine(mocker):
@@ -41,24 +43,26 @@ async def test_engine(mocker):
 
     # Mock and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_DB_TYPE = "native"
     settings_mock.IS_ECHO_SQLALCHEMY_LOGS = False
     settings_mock.PROJECT_NAME = "project-name"
     settings_mock.SQLALCHEMY_MAX_OVERFLOW = 2
     settings_mock.SQLALCHEMY_POOL_SIZE = 1
     settings_mock.SQLALCHEMY_POOL_TIMEOUT = 10
+    settings_mock.SQLALCHEMY_QUERY_CACHE_SIZE = 500
+    settings_mock.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE = 100
     mocker.patch.object(connection, "settings", settings_mock)
 
     # Mocks and overrides the create_async_engine function
     async_engine_mock = MagicMock(spec_set=AsyncEngine)
     mocker.patch.object(connection, "create_async_engine", return_value=async_engine_mock)
 
-    # Overrides the async sessionmaker function
+    # Overrides the async sessionmaker and instrument_queries functions
     mocker.patch.object(connection, "async_sessionmaker", MagicMock())
+    mocker.patch.object(connection, "instrument_queries", MagicMock())
 
     # Creates a db-connection instance
     db_connection = DatabaseConnection(
-        display_name="test-display-name", db_uri=SecretStr("test-db-uri")
+        display_name="test-display-name-engine", db_uri=SecretStr("test-db-uri")
     )
     await db_connection.connect()
 
@@ -75,7 +79,7 @@ def test_engine_before_connect():
 
     # Creates a db-connection instance
     db_connection = DatabaseConnection(
-        display_name="test-display-name", db_uri=SecretStr("test-db-uri")
+        display_name="test-display-name-engine-before-connect", db_uri=SecretStr("test-db-uri")
     )
 
     # Checks whether the correct error was raised
@@ -93,12 +97,13 @@ async def test_get_session_maker(mocker):
 
     # Mock and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_DB_TYPE = "native"
     settings_mock.IS_ECHO_SQLALCHEMY_LOGS = False
     settings_mock.PROJECT_NAME = "project-name"
     settings_mock.SQLALCHEMY_MAX_OVERFLOW = 2
     settings_mock.SQLALCHEMY_POOL_SIZE = 1
     settings_mock.SQLALCHEMY_POOL_TIMEOUT = 10
+    settings_mock.SQLALCHEMY_QUERY_CACHE_SIZE = 500
+    settings_mock.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE = 100
     mocker.patch.object(connection, "settings", settings_mock)
 
     # Mocks and overrides the create_async_engine function
@@ -109,9 +114,12 @@ async def test_get_session_maker(mocker):
     session_maker_mock = MagicMock(spec_set=async_sessionmaker[AsyncSession])
     mocker.patch.object(connection, "async_sessionmaker", return_value=session_maker_mock)
 
+    # Overrides the instrument_queries function
+    mocker.patch.object(connection, "instrument_queries", MagicMock())
+
     # Creates a db-connection instance
     db_connection = DatabaseConnection(
-        display_name="test-display-name", db_uri=SecretStr("test-db-uri")
+        display_name="test-display-name-get-session-maker", db_uri=SecretStr("test-db-uri")
     )
     await db_connection.connect()
 
@@ -128,7 +136,8 @@ def test_get_session_maker_before_connect():
 
     # Creates a db-connection instance
     db_connection = DatabaseConnection(
-        display_name="test-display-name", db_uri=SecretStr("test-db-uri")
+        display_name="test-display-name-get-session-maker-before-connect",
+        db_uri=SecretStr("test-db-uri"),
     )
 
     # Checks whether the correct error was raised
@@ -146,12 +155,13 @@ async def test_connect(mocker):
 
     # Mock and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_DB_TYPE = "native"
     settings_mock.IS_ECHO_SQLALCHEMY_LOGS = False
     settings_mock.PROJECT_NAME = "project-name"
     settings_mock.SQLALCHEMY_MAX_OVERFLOW = 2
     settings_mock.SQLALCHEMY_POOL_SIZE = 1
     settings_mock.SQLALCHEMY_POOL_TIMEOUT = 10
+    settings_mock.SQLALCHEMY_QUERY_CACHE_SIZE = 500
+    settings_mock.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE = 100
     mocker.patch.object(connection, "settings", settings_mock)
 
     # Mock and overrides the create_async_connector function
@@ -169,10 +179,18 @@ async def test_connect(mocker):
     async_sessionmaker_mock.return_value = async_sessionmaker_mock
     mocker.patch.object(connection, "async_sessionmaker", async_sessionmaker_mock)
 
+    # Mocks and overrides the instrument_pool and instrument_queries functions
+    instrument_pool_mock = MagicMock()
+    mocker.patch.object(connection, "instrument_pool", instrument_pool_mock)
+    instrument_queries_mock = MagicMock()
+    mocker.patch.object(connection, "instrument_queries", instrument_queries_mock)
+
     # Mocks the database-connection class
     database_connection_mock = MagicMock(spec=DatabaseConnection)
     database_connection_mock._display_name = "display-name"
     database_connection_mock._db_uri = SecretStr("db-uri")
+    database_connection_mock._circuit_breaker = "circuit-breaker"
+    database_connection_mock._is_cloud_sql = False
 
     # Invokes the connect function
     await DatabaseConnection.connect(self=database_connection_mock)
@@ -190,11 +208,20 @@ async def test_connect(mocker):
         "pool_size": 1,
         "max_overflow": 2,
         "echo": False,
-        "connect_args": {"server_settings": {"application_name": "project-name"}},
+        "query_cache_size": 500,
+        "connect_args": {
+            "prepared_statement_cache_size": 100,
+            "server_settings": {"application_name": "project-name"},
+        },
     }
     assert async_sessionmaker_mock.called
+    instrument_pool_mock.assert_called_once_with(create_async_engine_mock, "display-name")
+    instrument_queries_mock.assert_called_once_with(create_async_engine_mock, "display-name")
     assert async_sessionmaker_mock.call_args.args[0] == create_async_engine_mock
-    assert async_sessionmaker_mock.call_args.kwargs == {"expire_on_commit": False}
+    assert async_sessionmaker_mock.call_args.kwargs == {
+        "expire_on_commit": False,
+        "info": {"display_name": "display-name", "circuit_breaker": "circuit-breaker"},
+    }
 
 
 async def test_connect_cloud(mocker):
@@ -208,12 +235,13 @@ async def test_connect_cloud(mocker):
     # Mock and overrides the settings class
     settings_mock = MagicMock(spec=Settings)
     settings_mock.API_DB_DRIVER = SecretStr("driver")
-    settings_mock.API_DB_TYPE = "cloud"
     settings_mock.IS_ECHO_SQLALCHEMY_LOGS = False
     settings_mock.PROJECT_NAME = "project-name"
     settings_mock.SQLALCHEMY_MAX_OVERFLOW = 2
     settings_mock.SQLALCHEMY_POOL_SIZE = 1
     settings_mock.SQLALCHEMY_POOL_TIMEOUT = 10
+    settings_mock.SQLALCHEMY_QUERY_CACHE_SIZE = 500
+    settings_mock.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE = 100
     mocker.patch.object(connection, "settings", settings_mock)
 
     # Mock and overrides the create_async_connector function
@@ -231,10 +259,18 @@ async def test_connect_cloud(mocker):
     async_sessionmaker_mock.return_value = async_sessionmaker_mock
     mocker.patch.object(connection, "async_sessionmaker", async_sessionmaker_mock)
 
+    # Mocks and overrides the instrument_pool and instrument_queries functions
+    instrument_pool_mock = MagicMock()
+    mocker.patch.object(connection, "instrument_pool", instrument_pool_mock)
+    instrument_queries_mock = MagicMock()
+    mocker.patch.object(connection, "instrument_queries", instrument_queries_mock)
+
     # Mocks the database-connection class
     database_connection_mock = MagicMock(spec=DatabaseConnection)
     database_connection_mock._display_name = "display-name"
     database_connection_mock._db_uri = SecretStr("db-uri")
+    database_connection_mock._circuit_breaker = "circuit-breaker"
+    database_connection_mock._is_cloud_sql = True
 
     # Invokes the connect function
     await DatabaseConnection.connect(self=database_connection_mock)
@@ -253,28 +289,32 @@ async def test_connect_cloud(mocker):
         "pool_size": 1,
         "max_overflow": 2,
         "echo": False,
-        "connect_args": {"server_settings": {"application_name": "project-name"}},
+        "query_cache_size": 500,
+        "connect_args": {
+            "prepared_statement_cache_size": 100,
+            "server_settings": {"application_name": "project-name"},
+        },
     }
     assert async_sessionmaker_mock.called
+    instrument_pool_mock.assert_called_once_with(create_async_engine_mock, "display-name")
+    instrument_queries_mock.assert_called_once_with(create_async_engine_mock, "display-name")
     assert async_sessionmaker_mock.call_args.args[0] == create_async_engine_mock
-    assert async_sessionmaker_mock.call_args.kwargs == {"expire_on_commit": False}
+    assert async_sessionmaker_mock.call_args.kwargs == {
+        "expire_on_commit": False,
+        "info": {"display_name": "display-name", "circuit_breaker": "circuit-breaker"},
+    }
 
 
-async def test_disconnect(mocker):
+async def test_disconnect():
     """
     Tests the disconnect function for completion. The disconnect
     function should run without any errors
-
-    :param mocker: Fixture to mock specific functions for testing
     """
-    # Mock and overrides the settings class
-    settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_DB_TYPE = "native"
-    mocker.patch.object(connection, "settings", settings_mock)
 
     # Mocks the db-connection class
     db_connection_mock = MagicMock(spec=DatabaseConnection)
     db_connection_mock._display_name = ""
+    db_connection_mock._is_cloud_sql = False
     db_connection_mock._engine = MagicMock(spec_set=AsyncEngine)
 
     # Invokes the database-connection disconnect function
@@ -284,23 +324,17 @@ async def test_disconnect(mocker):
     assert db_connection_mock._engine.dispose.call_count == 1
 
 
-async def test_disconnect_cloud(mocker):
+async def test_disconnect_cloud():
     """
-    Tests the disconnect function for completion. The disconnect
-    function should run without any errors
-
-    :param mocker: Fixture to mock specific functions for testing
+    Tests the disconnect function when a Cloud SQL connection is made.
+    The disconnect function should close the Cloud SQL connector
     """
 
-    # Mock and overrides the settings class
-    settings_mock = MagicMock(spec=Settings)
-    settings_mock.API_DB_TYPE = "cloud"
-    mocker.patch.object(connection, "settings", settings_mock)
-
     # Mocks the db-connection class
     db_connection_mock = MagicMock(spec=DatabaseConnection)
     db_connection_mock._connector = MagicMock(spec_set=Connector)
     db_connection_mock._display_name = "display-name"
+    db_connection_mock._is_cloud_sql = True
     db_connection_mock._engine = MagicMock(spec_set=AsyncEngine)
 
     # Invokes the database-connection disconnect function
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from pydantic import SecretStr
 from sqlalchemy.orm import sessionmaker
@@ -9,6 +9,58 @@ from {{cookiecutter.package_name}}.core.database.manager import DatabaseManager
 from {{cookiecutter.package_name}}.core.database.row_operations import DatabaseRowOperations
 
 
+async def test_connect():
+    """
+    Tests the connect function for completion. The connect function should
+    connect to the database and each of its read replicas
+    """
+
+    # Creates the db-manager instance with mocked database-connections
+    db_manager = DatabaseManager(
+        display_name="test-display-name",
+        description="test-description",
+        db_uri=SecretStr("test-db-uri"),
+        replica_db_uris=[SecretStr("test-replica-db-uri")],
+    )
+    db_manager._connection = MagicMock(spec_set=DatabaseConnection)
+    db_manager._connection.connect = AsyncMock()
+    db_manager._replica_connections = [MagicMock(spec_set=DatabaseConnection)]
+    db_manager._replica_connections[0].connect = AsyncMock()
+
+    # Invokes the connect function
+    await db_manager.connect()
+
+    # Checks whether every database-connection was connected
+    assert db_manager._connection.connect.called
+    assert db_manager._replica_connections[0].connect.called
+
+
+async def test_disconnect():
+    """
+    Tests the disconnect function for completion. The disconnect function should
+    disconnect from the database and each of its read replicas
+    """
+
+    # Creates the db-manager instance with mocked database-connections
+    db_manager = DatabaseManager(
+        display_name="test-display-name",
+        description="test-description",
+        db_uri=SecretStr("test-db-uri"),
+        replica_db_uris=[SecretStr("test-replica-db-uri")],
+    )
+    db_manager._connection = MagicMock(spec_set=DatabaseConnection)
+    db_manager._connection.disconnect = AsyncMock()
+    db_manager._replica_connections = [MagicMock(spec_set=DatabaseConnection)]
+    db_manager._replica_connections[0].disconnect = AsyncMock()
+
+    # Invokes the disconnect function
+    await db_manager.disconnect()
+
+    # Checks whether every database-connection was disconnected
+    assert db_manager._connection.disconnect.called
+    assert db_manager._replica_connections[0].disconnect.called
+
+
 def test_get_connection():
     """
     Tests the connection property for completion. The connection property
@@ -63,6 +115,48 @@ def test_get_display_name():
     assert display_name == "test-name"
 
 
+def test_get_replica_connections():
+    """
+    Tests the replica_connections property for completion. The replica_connections
+    property should return a DatabaseConnection instance for each read replica
+    """
+
+    # Creates the db_manager instance
+    db_manager = DatabaseManager(
+        display_name="test-name",
+        description="test-description",
+        db_uri=SecretStr("test-db-uri"),
+        replica_db_uris=[SecretStr("test-replica-db-uri")],
+    )
+
+    # Checks whether the read replica database-connections were retrieved correctly
+    replica_connections = db_manager.replica_connections
+    assert len(replica_connections) == 1
+    assert replica_connections[0]._display_name == "test-name Replica 1"
+    assert replica_connections[0]._db_uri == SecretStr("test-replica-db-uri")
+
+
+def test_init_cloud_sql():
+    """
+    Tests the DatabaseManager init function when a Cloud SQL connection is made. The
+    DatabaseManager init function should only connect the primary database to the
+    Cloud SQL instance while the read replicas connect natively to their uris
+    """
+
+    # Define and instantiates the database-manager class
+    db_manager = DatabaseManager(
+        display_name="test-display-name",
+        description="test-description",
+        db_uri=SecretStr("test-db-uri"),
+        replica_db_uris=[SecretStr("test-replica-db-uri")],
+        is_cloud_sql=True,
+    )
+
+    # Checks whether only the primary database connects to the Cloud SQL instance
+    assert db_manager.connection._is_cloud_sql is True
+    assert db_manager.replica_connections[0]._is_cloud_sql is False
+
+
 def test_get_row_operations(mocker):
     """
     Tests the row_operations property for completion. The row_operations property
@@ -77,7 +171,8 @@ def test_get_row_operations(mocker):
 
     # Mocks and overrides the database-row-operations class
     database_row_operations_mock = MagicMock(spec_set=DatabaseRowOperations)
-    mocker.patch.object(manager, "DatabaseRowOperations", return_value=database_row_operations_mock)
+    database_row_operations_class_mock = MagicMock(return_value=database_row_operations_mock)
+    mocker.patch.object(manager, "DatabaseRowOperations", database_row_operations_class_mock)
 
     # Creates the db_manager instance
     db_manager = DatabaseManager(
@@ -92,6 +187,11 @@ def test_get_row_operations(mocker):
     db_row_operations_again = db_manager.row_operations
     assert db_row_operations == database_row_operations_mock
     assert db_row_operations_again == database_row_operations_mock
+    assert database_row_operations_class_mock.call_count == 1
+    assert database_row_operations_class_mock.call_args.args == (
+        database_connection_mock.session_maker,
+        [],
+    )
 
 
 def test_init():
@@ -111,3 +211,5 @@ def test_init():
     assert db_manager._display_name == "test-display-name"
     assert db_manager._description == "test-description"
     assert db_manager._db_uri == SecretStr("test-db-uri")
+    assert db_manager._replica_db_uris == []
+    assert db_manager._replica_connections == []
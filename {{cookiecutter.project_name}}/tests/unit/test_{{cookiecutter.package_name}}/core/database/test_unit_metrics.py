@@ -0,0 +1,245 @@
+from unittest.mock import MagicMock
+
+from prometheus_client import REGISTRY
+from pytest import raises
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from {{cookiecutter.package_name}}.core.database import metrics
+from {{cookiecutter.package_name}}.core.database.metrics import (
+    get_statement_fingerprint,
+    instrument_pool,
+    instrument_queries,
+    observe_pool_checkout,
+    observe_query,
+)
+
+
+def test_get_statement_fingerprint():
+    """
+    Tests the get_statement_fingerprint function for completion. The get_statement_fingerprint
+    function should give every variation of the same statement the same fingerprint
+    """
+
+    # Fingerprints variations of the same statement
+    fingerprint, normalized_statement = get_statement_fingerprint(
+        "SELECT * FROM users WHERE id IN ($1, $2, $3) AND name = 'bob'  LIMIT 10"
+    )
+    other_fingerprint, _ = get_statement_fingerprint(
+        "SELECT * FROM users WHERE id IN ($1) AND name = 'alice' LIMIT 20"
+    )
+
+    # Checks whether the statements were normalized to the same fingerprint
+    assert normalized_statement == "SELECT * FROM users WHERE id IN (?) AND name = ? LIMIT ?"
+    assert fingerprint == other_fingerprint
+    assert fingerprint != get_statement_fingerprint("SELECT * FROM users")[0]
+
+
+def test_get_statement_fingerprint_cast():
+    """
+    Tests the get_statement_fingerprint function when a statement casts a parameter.
+    The get_statement_fingerprint function should keep the cast type of the parameter
+    """
+
+    # Checks whether the cast type was kept
+    _, normalized_statement = get_statement_fingerprint("SELECT $1::VARCHAR")
+    assert normalized_statement == "SELECT ?::VARCHAR"
+
+
+def test_get_statement_fingerprint_insert_many_values():
+    """
+    Tests the get_statement_fingerprint function when statements insert batches of rows or
+    compare against cast IN lists. The get_statement_fingerprint function should give every
+    batch size the same fingerprint
+    """
+
+    # Fingerprints the batches of an executemany insert
+    fingerprint, normalized_statement = get_statement_fingerprint(
+        "INSERT INTO users (id, name) VALUES ($1::INTEGER, $2::VARCHAR), ($3::INTEGER, DEFAULT)"
+    )
+    other_fingerprint, _ = get_statement_fingerprint(
+        "INSERT INTO users (id, name) VALUES ($1::INTEGER, $2::VARCHAR), ($3::INTEGER, $4::VARCHAR)"
+        ", ($5::INTEGER, $6::VARCHAR)"
+    )
+
+    # Checks whether the rows of the batches were collapsed into a single fingerprint
+    assert normalized_statement == "INSERT INTO users (id, name) VALUES (?::INTEGER, ?::VARCHAR)"
+    assert fingerprint == other_fingerprint
+
+    # Checks whether cast IN lists of different lengths were collapsed
+    in_list_fingerprint, _ = get_statement_fingerprint("SELECT 1 WHERE id IN ($1::INTEGER)")
+    other_in_list_fingerprint, _ = get_statement_fingerprint(
+        "SELECT 1 WHERE id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER)"
+    )
+    assert in_list_fingerprint == other_in_list_fingerprint
+
+
+def test_instrument_pool(mocker):
+    """
+    Tests the instrument_pool function for completion. The instrument_pool function
+    should report the connection pool usage and the age of checked out connections
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings
+    settings_mock = MagicMock()
+    settings_mock.SQLALCHEMY_POOL_SIZE = 2
+    settings_mock.SQLALCHEMY_MAX_OVERFLOW = 2
+    mocker.patch.object(metrics, "settings", settings_mock)
+
+    # Mocks the async engine with a queue pool
+    engine_mock = MagicMock()
+    engine_mock.sync_engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2)
+
+    # Instruments the connection pool and checks out a connection
+    instrument_pool(engine_mock, "test-pool")
+    connection = engine_mock.sync_engine.connect()
+
+    # Checks whether the connection pool metrics were reported correctly
+    labels = {"database": "test-pool"}
+    assert REGISTRY.get_sample_value("db_pool_size", labels) == 2
+    assert REGISTRY.get_sample_value("db_pool_checked_out_connections", labels) == 1
+    assert REGISTRY.get_sample_value("db_pool_overflow_connections", labels) == 0
+    assert REGISTRY.get_sample_value("db_pool_saturation_ratio", labels) == 0.25
+    assert REGISTRY.get_sample_value("db_pool_connection_age_seconds_count", labels) == 1
+    connection.close()
+    assert REGISTRY.get_sample_value("db_pool_checked_out_connections", labels) == 0
+
+
+def test_instrument_pool_not_queue_pool():
+    """
+    Tests the instrument_pool function when the engine does not use a queue
+    pool. The instrument_pool function should not report any metrics
+    """
+
+    # Mocks the async engine with a null pool
+    engine_mock = MagicMock()
+    engine_mock.sync_engine = create_engine("sqlite://", poolclass=NullPool)
+
+    # Checks whether no connection pool metrics were reported
+    instrument_pool(engine_mock, "test-null-pool")
+    labels = {"database": "test-null-pool"}
+    assert REGISTRY.get_sample_value("db_pool_size", labels) is None
+
+
+def test_instrument_queries(mocker):
+    """
+    Tests the instrument_queries function for completion. The instrument_queries
+    function should record the latency of every statement the engine executes
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_query function
+    observe_query_mock = MagicMock()
+    mocker.patch.object(metrics, "observe_query", observe_query_mock)
+
+    # Mocks the async engine
+    engine_mock = MagicMock()
+    engine_mock.sync_engine = create_engine("sqlite://")
+
+    # Instruments the engine and executes a statement
+    instrument_queries(engine_mock, "test-queries")
+    with engine_mock.sync_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+        # Checks whether the statement latency was recorded correctly
+        assert observe_query_mock.call_args.args[:2] == ("test-queries", "SELECT 1")
+        assert connection.info["query_start_times"] == []
+
+
+def test_instrument_queries_error(mocker):
+    """
+    Tests the instrument_queries function when a statement fails. The instrument_queries
+    function should discard the start time of the failed statement
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_query function
+    observe_query_mock = MagicMock()
+    mocker.patch.object(metrics, "observe_query", observe_query_mock)
+
+    # Mocks the async engine
+    engine_mock = MagicMock()
+    engine_mock.sync_engine = create_engine("sqlite://")
+
+    # Instruments the engine and executes a failing statement
+    instrument_queries(engine_mock, "test-queries-error")
+    with engine_mock.sync_engine.connect() as connection:
+        with raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+        # Checks whether the start time of the failed statement was discarded
+        assert connection.info["query_start_times"] == []
+        assert not observe_query_mock.called
+
+
+def test_observe_pool_checkout():
+    """
+    Tests the observe_pool_checkout function for completion. The observe_pool_checkout
+    function should record the checkout wait time and count checkout timeouts
+    """
+
+    # Records a successful checkout and a timed out checkout
+    observe_pool_checkout("test-checkout", 0.5)
+    observe_pool_checkout("test-checkout", 10, is_timeout=True)
+
+    # Checks whether the checkout metrics were recorded correctly
+    labels = {"database": "test-checkout"}
+    assert REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count", labels) == 2
+    assert REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_sum", labels) == 10.5
+    assert REGISTRY.get_sample_value("db_pool_checkout_timeouts_total", labels) == 1
+
+
+def test_observe_query(mocker):
+    """
+    Tests the observe_query function for completion. The observe_query function
+    should record the statement latency without logging a slow query
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings and logger
+    settings_mock = MagicMock()
+    settings_mock.API_DB_SLOW_QUERY_THRESHOLD_MS = 500
+    mocker.patch.object(metrics, "settings", settings_mock)
+    logger_mock = MagicMock()
+    mocker.patch.object(metrics, "logger", logger_mock)
+
+    # Records the latency of a fast statement
+    observe_query("test-observe", "SELECT 1", 0.1)
+
+    # Checks whether the latency was recorded without logging a slow query
+    fingerprint, _ = get_statement_fingerprint("SELECT 1")
+    labels = {"database": "test-observe", "fingerprint": fingerprint}
+    assert REGISTRY.get_sample_value("db_query_duration_seconds_count", labels) == 1
+    assert not logger_mock.warning.called
+
+
+def test_observe_query_slow(mocker):
+    """
+    Tests the observe_query function when a statement exceeds the slow-query
+    threshold. The observe_query function should log the slow query
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings and logger
+    settings_mock = MagicMock()
+    settings_mock.API_DB_SLOW_QUERY_THRESHOLD_MS = 500
+    mocker.patch.object(metrics, "settings", settings_mock)
+    logger_mock = MagicMock()
+    mocker.patch.object(metrics, "logger", logger_mock)
+
+    # Records the latency of a slow statement
+    observe_query("test-observe-slow", "SELECT * FROM users WHERE id = $1", 1.5)
+
+    # Checks whether the slow query was logged correctly
+    assert logger_mock.warning.called
+    assert logger_mock.warning.call_args.kwargs["extra"]["duration_ms"] == 1500
+    assert logger_mock.warning.call_args.kwargs["extra"]["statement"] == (
+        "SELECT * FROM users WHERE id = ?"
+    )
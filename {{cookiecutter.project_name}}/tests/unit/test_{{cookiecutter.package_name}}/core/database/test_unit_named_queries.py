@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+from pytest import raises
+from sqlalchemy import Select
+
+from {{cookiecutter.package_name}}.core.database.named_queries import NamedQueries, get_named_queries
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def test_get():
+    """
+    Tests the get function for completion. The get function
+    should return the statement registered with the given name
+    """
+
+    # Registers a statement
+    statement_mock = MagicMock(spec_set=Select)
+    named_queries = NamedQueries()
+    registered_statement = named_queries.register("test-query", statement_mock)
+
+    # Checks whether the registered statement was retrieved correctly
+    assert registered_statement == statement_mock
+    assert named_queries.get("test-query") == statement_mock
+
+
+def test_get_not_registered():
+    """
+    Tests the get function when no statement is registered with the
+    given name. The get function should raise an InternalServerError
+    """
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        NamedQueries().get("test-query")
+
+
+def test_get_named_queries():
+    """
+    Tests the get_named_queries function for completion. The get_named_queries
+    function should return the same named-queries instance
+    """
+
+    # Checks whether the named-queries instance was retrieved correctly
+    named_queries = get_named_queries()
+    assert isinstance(named_queries, NamedQueries)
+    assert named_queries == get_named_queries()
+
+
+def test_init():
+    """
+    Tests the NamedQueries init function for completion. The NamedQueries init
+    function should instantiate a NamedQueries instance without any errors
+    """
+
+    # Checks whether the named-queries class was instantiated correctly
+    named_queries = NamedQueries()
+    assert named_queries._statements == {}
+
+
+def test_register_duplicate():
+    """
+    Tests the register function when a statement is already registered with
+    the given name. The register function should raise an InternalServerError
+    """
+
+    # Registers a statement
+    named_queries = NamedQueries()
+    named_queries.register("test-query", MagicMock(spec_set=Select))
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        named_queries.register("test-query", MagicMock(spec_set=Select))
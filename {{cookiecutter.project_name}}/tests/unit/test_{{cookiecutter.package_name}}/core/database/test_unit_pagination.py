@@ -0,0 +1,167 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, IntEnum, StrEnum
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from pytest import raises
+from sqlalchemy import Row, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+
+from {{cookiecutter.package_name}}.core.database.pagination import (
+    Page,
+    create_page,
+    decode_cursor,
+    encode_cursor,
+    get_page_statement,
+)
+from {{cookiecutter.package_name}}.core.database.tables import BaseTable
+from {{cookiecutter.package_name}}.exceptions import BadRequestError, InternalServerError
+
+
+class PageTable(BaseTable):
+    """
+    Table used to test keyset pagination
+    """
+
+    __tablename__ = "test_page_table"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_on: Mapped[datetime] = mapped_column()
+
+
+def test_create_page():
+    """
+    Tests the create_page function for completion. The create_page function should
+    create a page of rows with the cursor of the next page from the last row
+    """
+
+    # Creates a page from one more row than the page size
+    created_on = datetime(2024, 1, 1)
+    rows = [PageTable(id=1, created_on=created_on), PageTable(id=2, created_on=created_on)]
+    page = create_page(rows, [PageTable.created_on, PageTable.id], size=1)
+
+    # Checks whether the page was created correctly
+    assert isinstance(page, Page)
+    assert page.rows == rows[:1]
+    assert decode_cursor(page.next_cursor, 2) == [created_on, 1]
+
+
+def test_create_page_last_page():
+    """
+    Tests the create_page function when no extra row was selected. The
+    create_page function should create the last page without a cursor
+    """
+
+    # Creates a page from result rows that fill the page size
+    row_mock = MagicMock(spec=Row)
+    page = create_page([row_mock], [PageTable.id], size=1)
+
+    # Checks whether the last page was created correctly
+    assert page.rows == [row_mock]
+    assert page.next_cursor is None
+
+
+def test_decode_cursor_invalid():
+    """
+    Tests the decode_cursor function when the cursor is malformed.
+    The decode_cursor function should raise a BadRequestError
+    """
+
+    # Checks whether the correct errors were raised
+    with raises(BadRequestError):
+        decode_cursor("not-a-cursor", 1)
+    with raises(BadRequestError):
+        decode_cursor(encode_cursor([1, 2]), 1)
+
+
+def test_encode_cursor():
+    """
+    Tests the encode_cursor function for completion. The encode_cursor function
+    should encode key values into a cursor that decodes back to the same values
+    """
+
+    # Encodes key values of each supported type
+    values = [True, 1, 1.5, "name", Decimal("1.10"), datetime(2024, 1, 1, 12), UUID(int=1)]
+    cursor = encode_cursor(values)
+
+    # Checks whether the cursor decoded back to the same values
+    assert "=" not in cursor
+    assert decode_cursor(cursor, len(values)) == values
+
+
+def test_encode_cursor_subclass():
+    """
+    Tests the encode_cursor function when the key values are subclasses of the supported types.
+    The encode_cursor function should encode them by their closest supported type
+    """
+
+    # Creates key values that are subclasses of the supported types
+    class Status(StrEnum):
+        ACTIVE = "active"
+
+    class Priority(IntEnum):
+        HIGH = 1
+
+    class Amount(Decimal):
+        pass
+
+    # Checks whether the cursor decoded back to the values of the supported types
+    cursor = encode_cursor([Status.ACTIVE, Priority.HIGH, Amount("1.10")])
+    assert decode_cursor(cursor, 3) == ["active", 1, Decimal("1.10")]
+
+
+def test_encode_cursor_unsupported():
+    """
+    Tests the encode_cursor function when a key value type is not supported.
+    The encode_cursor function should raise an InternalServerError
+    """
+
+    # Creates a key value whose type is not supported
+    class Color(Enum):
+        RED = object()
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        encode_cursor([Color.RED])
+
+
+def test_get_page_statement():
+    """
+    Tests the get_page_statement function for completion. The get_page_statement function
+    should order the statement by the keys and seek to the rows after the cursor
+    """
+
+    # Gets the page statement of the page after a cursor
+    cursor = encode_cursor([datetime(2024, 1, 1), 1])
+    statement = get_page_statement(
+        select(PageTable).order_by(PageTable.id.desc()),
+        [PageTable.created_on, PageTable.id],
+        cursor,
+        size=10,
+    )
+
+    # Checks whether the statement was created correctly
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "WHERE (test_page_table.created_on, test_page_table.id) > (" in sql
+    assert "ORDER BY test_page_table.created_on ASC, test_page_table.id ASC" in sql
+    assert statement._limit == 11
+
+
+def test_get_page_statement_descending():
+    """
+    Tests the get_page_statement function when the rows are ordered in descending order.
+    The get_page_statement function should seek to the rows before the cursor
+    """
+
+    # Gets the page statement of the first page and the page after a cursor
+    first_statement = get_page_statement(select(PageTable), [PageTable.id], None, 5, True)
+    statement = get_page_statement(select(PageTable), [PageTable.id], encode_cursor([9]), 5, True)
+
+    # Checks whether the statements were created correctly
+    first_sql = str(first_statement.compile(dialect=postgresql.dialect()))
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "WHERE" not in first_sql
+    assert "ORDER BY test_page_table.id DESC" in first_sql
+    assert "WHERE (test_page_table.id) < (" in sql
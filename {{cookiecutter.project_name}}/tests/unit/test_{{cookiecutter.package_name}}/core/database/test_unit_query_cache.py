@@ -0,0 +1,326 @@
+import pickle
+from base64 import b64decode, b64encode
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import Column, Integer, MetaData, Table, bindparam, select, text, update
+from sqlalchemy.dialects import postgresql
+
+from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.database.query_cache import ALL_TAG, QueryCache, get_statement_tags
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
+
+# Creates the tables used to test the query cache
+metadata = MetaData()
+user_table = Table("user", metadata, Column("id", Integer, primary_key=True))
+order_table = Table("order", metadata, Column("user_id", Integer))
+
+
+def test_get_statement_tags():
+    """
+    Tests the get_statement_tags function for completion. The get_statement_tags function
+    should get the names of every table within the statement including its joins
+    """
+
+    # Creates a select statement that joins two tables
+    statement = select(user_table).join(order_table, user_table.c.id == order_table.c.user_id)
+
+    # Checks whether the table names were gotten correctly
+    assert get_statement_tags(statement) == {"user", "order"}
+    assert get_statement_tags(update(user_table).values(id=1)) == {"user"}
+    assert get_statement_tags(user_table) == {"user"}
+
+
+def test_get_statement_tags_text():
+    """
+    Tests the get_statement_tags function when the statement has no tables. The
+    get_statement_tags function should get the tag shared by every query result
+    """
+
+    # Checks whether the shared tag was gotten correctly
+    assert get_statement_tags(text("SELECT * FROM user")) == {ALL_TAG}
+
+
+def test_get_key():
+    """
+    Tests the get_key function for completion. The get_key function should get the same key
+    for equal statements and a different key when the bound parameters differ, while the
+    statement structure is only compiled once
+    """
+
+    # Creates the query cache
+    query_cache = QueryCache(MagicMock(spec=RedisManager), "test-db", postgresql.dialect())
+
+    # Gets the keys of the statements
+    first_key = query_cache.get_key(select(user_table).where(user_table.c.id == 1))
+    second_key = query_cache.get_key(select(user_table).where(user_table.c.id == 1))
+    third_key = query_cache.get_key(select(user_table).where(user_table.c.id == 2))
+
+    # Checks whether the keys were gotten correctly
+    assert first_key.startswith("query:test-db:")
+    assert first_key == second_key
+    assert first_key != third_key
+    assert len(query_cache._compiled_statements) == 1
+
+
+def test_get_key_execution():
+    """
+    Tests the get_key function when the statement is executed differently. The get_key function
+    should get a different key when the execution parameters or options or the scalar filter differ
+    """
+
+    # Creates the query cache and a statement with a parameter bound at execution
+    query_cache = QueryCache(MagicMock(spec=RedisManager), "test-db", postgresql.dialect())
+    statement = select(user_table).where(user_table.c.id == bindparam("user_id"))
+
+    # Gets the keys of the statement executed with different parameters and options
+    first_key = query_cache.get_key(statement, params={"user_id": 1})
+    second_key = query_cache.get_key(statement, params={"user_id": 2})
+    options_key = query_cache.get_key(
+        statement, params={"user_id": 1}, execution_options={"schema_translate_map": {None: "a"}}
+    )
+    statement_options_key = query_cache.get_key(
+        statement.execution_options(schema_translate_map={None: "a"}), params={"user_id": 1}
+    )
+    row_key = query_cache.get_key(statement, is_scalar=False, params={"user_id": 1})
+
+    # Checks whether the keys were gotten correctly
+    assert first_key == query_cache.get_key(statement, params={"user_id": 1})
+    assert len({first_key, second_key, options_key, row_key}) == 4
+    assert options_key == statement_options_key
+
+
+async def test_get():
+    """
+    Tests the get function for completion. The get function
+    should get and deserialize the cached query result
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(return_value=b64encode(pickle.dumps([1, 2])).decode())
+
+    # Checks whether the cached query result was gotten correctly
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    assert await query_cache.get("test-key") == [1, 2]
+
+
+async def test_get_error():
+    """
+    Tests the get function when redis cannot be reached. The get
+    function should return None so the query falls back to the database
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(side_effect=ServiceUnavailableError())
+
+    # Checks whether None was returned
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    assert await query_cache.get("test-key") is None
+
+
+async def test_get_miss():
+    """
+    Tests the get function when the query result is not cached.
+    The get function should return None
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(return_value=None)
+
+    # Checks whether None was returned
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    assert await query_cache.get("test-key") is None
+
+
+async def test_invalidate():
+    """
+    Tests the invalidate function for completion. The invalidate function should
+    delete the cached query results of the tags along with the tag sets
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(side_effect=[[["test-key"]], [1]])
+
+    # Invokes the invalidate function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.invalidate(["user"])
+
+    # Checks whether the tag set members were gotten correctly
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args_list[0].args[0](pipe_mock)
+    assert pipe_mock.zrange.call_args.args == ("query-tag:test-db:user", 0, -1)
+
+    # Checks whether the cached query results and tag sets were deleted correctly
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args_list[1].args[0](pipe_mock)
+    delete_args = [call.args for call in pipe_mock.delete.call_args_list]
+    assert delete_args == [("test-key",), ("query-tag:test-db:user",)]
+    assert redis_manager_mock.pipeline.call_args_list[1].kwargs == {"is_transaction": True}
+
+
+async def test_invalidate_cluster():
+    """
+    Tests the invalidate function when redis is a cluster. The invalidate function should
+    delete each key on its own without a transaction across the slots of the keys
+    """
+
+    # Mocks the redis-manager class of a redis cluster
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = True
+    redis_manager_mock.pipeline = AsyncMock(side_effect=[[["test-key"]], [1, 1]])
+
+    # Invokes the invalidate function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.invalidate(["user"])
+
+    # Checks whether the keys were deleted without a transaction
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args_list[1].args[0](pipe_mock)
+    assert pipe_mock.delete.call_count == 2
+    assert redis_manager_mock.pipeline.call_args_list[1].kwargs == {"is_transaction": False}
+
+
+async def test_invalidate_all():
+    """
+    Tests the invalidate function when the shared tag is given. The invalidate
+    function should only read the tag set shared by every query result
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(side_effect=[[[]], [0]])
+
+    # Invokes the invalidate function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.invalidate(["user", ALL_TAG])
+
+    # Checks whether only the shared tag set was read
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args_list[0].args[0](pipe_mock)
+    assert pipe_mock.zrange.call_count == 1
+    assert pipe_mock.zrange.call_args.args[0] == f"query-tag:test-db:{ALL_TAG}"
+
+
+async def test_invalidate_error():
+    """
+    Tests the invalidate function when redis cannot be reached. The
+    invalidate function should log the error without raising it
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(side_effect=InternalServerError())
+
+    # Invokes the invalidate function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.invalidate(["user"])
+
+    # Checks whether the invalidation was attempted
+    assert redis_manager_mock.pipeline.called
+
+
+async def test_invalidate_no_tags():
+    """
+    Tests the invalidate function when no tags are given. The
+    invalidate function should not call redis
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock()
+
+    # Invokes the invalidate function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.invalidate([])
+
+    # Checks whether redis was not called
+    assert not redis_manager_mock.pipeline.called
+
+
+async def test_set():
+    """
+    Tests the set function for completion. The set function should cache the
+    query result and add its key to the tag set of each of its tags
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock()
+
+    # Invokes the set function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.set("test-key", [1, 2], ["user"], ttl_seconds=30)
+
+    # Invokes the pipeline operations
+    pipe_mock = MagicMock()
+    redis_manager_mock.pipeline.call_args.args[0](pipe_mock)
+
+    # Checks whether the query result was cached correctly
+    value = pipe_mock.set.call_args.args[1]
+    assert pipe_mock.set.call_args.args[0] == "test-key"
+    assert pipe_mock.set.call_args.kwargs == {"ex": 30}
+    assert pickle.loads(b64decode(value)) == [1, 2]
+
+    # Checks whether the key was added to the tag sets correctly
+    tag_keys = {call.args[0] for call in pipe_mock.zadd.call_args_list}
+    assert tag_keys == {"query-tag:test-db:user", f"query-tag:test-db:{ALL_TAG}"}
+    assert pipe_mock.zremrangebyscore.call_count == 2
+
+
+async def test_set_cluster():
+    """
+    Tests the set function when redis is a cluster. The set function should add the key to the
+    tag sets before caching the query result, without a transaction across the slots of the keys
+    """
+
+    # Mocks the redis-manager class of a redis cluster
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = True
+    redis_manager_mock.pipeline = AsyncMock()
+
+    # Invokes the set function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.set("test-key", [1, 2], ["user"], ttl_seconds=30)
+
+    # Checks whether the key was added to the tag sets first
+    tag_pipe_mock = MagicMock()
+    tag_call, set_call = redis_manager_mock.pipeline.call_args_list
+    tag_call.args[0](tag_pipe_mock)
+    assert tag_pipe_mock.zadd.call_count == 2
+    assert not tag_pipe_mock.set.called
+
+    # Checks whether the query result was cached afterwards without a transaction
+    set_pipe_mock = MagicMock()
+    set_call.args[0](set_pipe_mock)
+    assert set_pipe_mock.set.call_args.args[0] == "test-key"
+    assert tag_call.kwargs == set_call.kwargs == {"is_transaction": False}
+
+
+async def test_set_error():
+    """
+    Tests the set function when redis cannot be reached. The
+    set function should log the error without raising it
+    """
+
+    # Mocks the redis-manager class
+    redis_manager_mock = MagicMock(spec=RedisManager)
+    redis_manager_mock.is_cluster = False
+    redis_manager_mock.pipeline = AsyncMock(side_effect=ServiceUnavailableError())
+
+    # Invokes the set function
+    query_cache = QueryCache(redis_manager_mock, "test-db", postgresql.dialect())
+    await query_cache.set("test-key", [1, 2], ["user"])
+
+    # Checks whether caching was attempted
+    assert redis_manager_mock.pipeline.called
@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest import raises
+
+from {{cookiecutter.package_name}}.core.database.manager import DatabaseManager
+from {{cookiecutter.package_name}}.core.database.registry import DatabaseRegistry
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def test_add_duplicate():
+    """
+    Tests the add function when a database-manager is already registered with
+    the given name. The add function should raise an InternalServerError
+    """
+
+    # Registers a database-manager
+    db_registry = DatabaseRegistry()
+    db_registry.add("test-db", MagicMock(spec_set=DatabaseManager))
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        db_registry.add("test-db", MagicMock(spec_set=DatabaseManager))
+
+
+async def test_connect():
+    """
+    Tests the connect function for completion. The connect
+    function should connect every registered database
+    """
+
+    # Registers the database-managers
+    db_manager_one_mock = MagicMock(spec_set=DatabaseManager)
+    db_manager_one_mock.connect = AsyncMock()
+    db_manager_two_mock = MagicMock(spec_set=DatabaseManager)
+    db_manager_two_mock.connect = AsyncMock()
+    db_registry = DatabaseRegistry()
+    db_registry.add("test-db-one", db_manager_one_mock)
+    db_registry.add("test-db-two", db_manager_two_mock)
+
+    # Invokes the connect function
+    await db_registry.connect()
+
+    # Checks whether every database was connected
+    assert db_manager_one_mock.connect.called
+    assert db_manager_two_mock.connect.called
+
+
+async def test_disconnect():
+    """
+    Tests the disconnect function for completion. The disconnect
+    function should disconnect every registered database
+    """
+
+    # Registers the database-managers
+    db_manager_one_mock = MagicMock(spec_set=DatabaseManager)
+    db_manager_one_mock.disconnect = AsyncMock()
+    db_manager_two_mock = MagicMock(spec_set=DatabaseManager)
+    db_manager_two_mock.disconnect = AsyncMock()
+    db_registry = DatabaseRegistry()
+    db_registry.add("test-db-one", db_manager_one_mock)
+    db_registry.add("test-db-two", db_manager_two_mock)
+
+    # Invokes the disconnect function
+    await db_registry.disconnect()
+
+    # Checks whether every database was disconnected
+    assert db_manager_one_mock.disconnect.called
+    assert db_manager_two_mock.disconnect.called
+
+
+def test_get():
+    """
+    Tests the get function for completion. The get function should
+    return the database-manager registered with the given name
+    """
+
+    # Registers a database-manager
+    db_manager_mock = MagicMock(spec_set=DatabaseManager)
+    db_registry = DatabaseRegistry()
+    db_registry.add("test-db", db_manager_mock)
+
+    # Checks whether the registered database-manager was retrieved correctly
+    assert db_registry.get("test-db") == db_manager_mock
+    assert db_registry.names == ["test-db"]
+
+
+def test_get_not_registered():
+    """
+    Tests the get function when no database-manager is registered with
+    the given name. The get function should raise an InternalServerError
+    """
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        DatabaseRegistry().get("test-db")
+
+
+def test_init():
+    """
+    Tests the DatabaseRegistry init function for completion. The DatabaseRegistry init
+    function should instantiate a DatabaseRegistry instance without any errors
+    """
+
+    # Checks whether the database-registry class was instantiated correctly
+    db_registry = DatabaseRegistry()
+    assert db_registry._db_managers == {}
+    assert db_registry.names == []
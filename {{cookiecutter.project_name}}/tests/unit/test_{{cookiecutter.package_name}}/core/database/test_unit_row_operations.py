@@ -1,23 +1,92 @@
 from asyncio import CancelledError
+from contextvars import ContextVar
 from inspect import unwrap
 from typing import List
 from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
 from pytest import raises
-from sqlalchemy import Select
-from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession, async_sessionmaker
+from sqlalchemy import Result, Select, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
 
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import EntityCache, FastApiContext
 from {{cookiecutter.package_name}}.core.database import row_operations
+from {{cookiecutter.package_name}}.core.database.query_cache import QueryCache
 from {{cookiecutter.package_name}}.core.database.row_operations import (
+    ColumnResults,
     DatabaseRowOperations,
     RowResult,
     RowResults,
     _enforce_base_type,
+    _enforce_rows_base_type,
+    _get_instance_type,
 )
-from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.core.database.tables import BaseTable
+from {{cookiecutter.package_name}}.core.database.tables.table_base import StampMixin
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
 from tests.mocks import async_error_mock
 
 
+class UpsertTable(BaseTable):
+    """
+    Table used to test creating upsert statements
+    """
+
+    __tablename__ = "test_upsert_table"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+class StampedUpsertTable(BaseTable, StampMixin):
+    """
+    Stamped table used to test creating upsert statements
+    """
+
+    __tablename__ = "test_stamped_upsert_table"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+def test_enforce_base_type(mocker):
+    """
+    Tests the _enforce_base_type function for completion. The _enforce_base_type function
+    should allow row data that matches the origin type of a generic return-type
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings
+    settings_mock = MagicMock()
+    settings_mock.IS_API_DB_ENFORCE_RETURN_TYPE = True
+    mocker.patch.object(row_operations, "settings", settings_mock)
+
+    # Checks whether the row data was allowed
+    _enforce_base_type(row_data=[1], return_type=List[int])
+
+
+def test_enforce_base_type_disabled(mocker):
+    """
+    Tests the _enforce_base_type function when return-type enforcement is disabled.
+    The _enforce_base_type function should not check the row data
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings
+    settings_mock = MagicMock()
+    settings_mock.IS_API_DB_ENFORCE_RETURN_TYPE = False
+    mocker.patch.object(row_operations, "settings", settings_mock)
+
+    # Checks whether the mismatched row data was allowed
+    _enforce_base_type(row_data={}, return_type=List)
+
+
 def test_enforce_base_type_not_same():
     """
     Tests the _enforce_base_type function when the row-data type does not match the given
@@ -29,6 +98,58 @@ def test_enforce_base_type_not_same():
         _enforce_base_type(row_data={}, return_type=List)
 
 
+def test_enforce_rows_base_type(mocker):
+    """
+    Tests the _enforce_rows_base_type function when strict enforcement is disabled.
+    The _enforce_rows_base_type function should only check the first row
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings
+    settings_mock = MagicMock()
+    settings_mock.IS_API_DB_ENFORCE_RETURN_TYPE = True
+    settings_mock.IS_API_DB_STRICT_RETURN_TYPE = False
+    mocker.patch.object(row_operations, "settings", settings_mock)
+
+    # Checks whether only the first row was checked
+    _enforce_rows_base_type(rows=["one", 2], return_type=str)
+    _enforce_rows_base_type(rows=[], return_type=str)
+    with raises(InternalServerError):
+        _enforce_rows_base_type(rows=[1, "two"], return_type=str)
+
+
+def test_enforce_rows_base_type_strict(mocker):
+    """
+    Tests the _enforce_rows_base_type function when strict enforcement is enabled.
+    The _enforce_rows_base_type function should check every row
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the settings
+    settings_mock = MagicMock()
+    settings_mock.IS_API_DB_ENFORCE_RETURN_TYPE = True
+    settings_mock.IS_API_DB_STRICT_RETURN_TYPE = True
+    mocker.patch.object(row_operations, "settings", settings_mock)
+
+    # Checks whether every row was checked
+    _enforce_rows_base_type(rows=["one", "two"], return_type=str)
+    with raises(InternalServerError):
+        _enforce_rows_base_type(rows=["one", 2], return_type=str)
+
+
+def test_get_instance_type():
+    """
+    Tests the _get_instance_type function for completion. The _get_instance_type
+    function should get the origin type of generic return-types
+    """
+
+    # Checks whether the instance types were retrieved correctly
+    assert _get_instance_type(str) is str
+    assert _get_instance_type(List[int]) is list
+
+
 async def test_add_row():
     """
     Tests the add_row function for completion. The add_row function
@@ -38,180 +159,1240 @@ async def test_add_row():
     # Mocks the async-session class
     async_session_mock = AsyncMock(spec_set=AsyncSession)
 
-    # Mocks the _commit_session function
-    commit_session_mock = AsyncMock()
+    # Mocks the _persist_session function
+    commit_session_mock = AsyncMock()
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._persist_session = commit_session_mock
+
+    # Invokes the add_row function
+    await unwrap(DatabaseRowOperations.add_row)(self=database_row_operations_mock, table=None)
+
+    # Checks whether the required methods were called correctly
+    assert async_session_mock.add.called
+    assert commit_session_mock.called
+
+
+async def test_add_rows():
+    """
+    Tests the add_rows function for completion. The add_rows function
+    should call the required methods without any errors
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the _persist_session function
+    commit_session_mock = AsyncMock()
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._persist_session = commit_session_mock
+
+    # Invokes the add_rows function
+    await unwrap(DatabaseRowOperations.add_rows)(self=database_row_operations_mock, tables=[None])
+
+    # Checks whether the required methods were called correctly
+    assert async_session_mock.add_all.called
+    assert commit_session_mock.called
+
+
+async def test_bulk_insert(mocker):
+    """
+    Tests the bulk_insert function for completion. The bulk_insert function should
+    execute a batched insert per chunk and persist the session once
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the insert function
+    insert_mock = MagicMock()
+    mocker.patch.object(row_operations, "insert", insert_mock)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._persist_session = AsyncMock()
+
+    # Invokes the bulk_insert function with a generator of rows
+    rows = ({"id": index} for index in range(5))
+    row_count = await DatabaseRowOperations.bulk_insert(
+        self=database_row_operations_mock, table=MagicMock(), rows=rows, chunk_size=2
+    )
+
+    # Checks whether the rows were inserted in chunks
+    assert row_count == 5
+    assert async_session_mock.execute.call_count == 3
+    assert async_session_mock.execute.call_args_list[0].args[1] == [{"id": 0}, {"id": 1}]
+    assert async_session_mock.execute.call_args_list[2].args[1] == [{"id": 4}]
+    assert database_row_operations_mock._persist_session.call_count == 1
+
+
+async def test_bulk_insert_copy():
+    """
+    Tests the bulk_insert function when the copy protocol is used. The
+    bulk_insert function should copy the rows per chunk
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._persist_session = AsyncMock()
+    database_row_operations_mock._copy_rows = AsyncMock()
+
+    # Invokes the bulk_insert function
+    row_count = await DatabaseRowOperations.bulk_insert(
+        self=database_row_operations_mock,
+        table=MagicMock(),
+        rows=[{"id": 1}, {"id": 2}],
+        chunk_size=1,
+        is_copy=True,
+    )
+
+    # Checks whether the rows were copied in chunks
+    assert row_count == 2
+    assert database_row_operations_mock._copy_rows.call_count == 2
+    assert not async_session_mock.execute.called
+
+
+async def test_bulk_insert_error():
+    """
+    Tests the bulk_insert function when an error occurs. The
+    bulk_insert function should raise an InternalServerError
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.execute = async_error_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await DatabaseRowOperations.bulk_insert(
+            self=database_row_operations_mock, table=MagicMock(), rows=[{"id": 1}]
+        )
+
+
+async def test_checkout_connection(mocker):
+    """
+    Tests the _checkout_connection function for completion. The _checkout_connection
+    function should check out a connection and record the checkout wait time
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(row_operations, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {"display_name": "display-name"}
+
+    # Checks whether the connection was checked out and the wait time was recorded
+    await DatabaseRowOperations._checkout_connection(async_session_mock)
+    assert async_session_mock.connection.awaited
+    assert observe_pool_checkout_mock.call_args.args[0] == "display-name"
+    assert len(observe_pool_checkout_mock.call_args.args) == 2
+
+
+async def test_checkout_connection_timeout(mocker):
+    """
+    Tests the _checkout_connection function when the connection pool times out.
+    The _checkout_connection function should record the timeout and raise an error
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_pool_checkout function
+    observe_pool_checkout_mock = MagicMock()
+    mocker.patch.object(row_operations, "observe_pool_checkout", observe_pool_checkout_mock)
+
+    # Mocks the async-session class with a connection that times out
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {"display_name": "display-name"}
+    async_session_mock.connection.side_effect = TimeoutError("pool timeout")
+
+    # Checks whether the timeout was recorded and an error was raised
+    with raises(InternalServerError):
+        await DatabaseRowOperations._checkout_connection(async_session_mock)
+    assert observe_pool_checkout_mock.call_args.args[2] is True
+
+
+async def test_commit_session(mocker):
+    """
+    Tests the _commit_session function for completion. The _commit_session
+    function should call the required methods without any errors
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the observe_query function
+    observe_query_mock = MagicMock()
+    mocker.patch.object(row_operations, "observe_query", observe_query_mock)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {"display_name": "display-name"}
+
+    # Invokes the _commit_session function
+    await DatabaseRowOperations._commit_session(async_session_mock)
+
+    # Checks whether the required methods were called correctly
+    assert async_session_mock.flush.called
+    assert async_session_mock.commit.called
+    assert observe_query_mock.call_args.args[:2] == ("display-name", "COMMIT")
+
+
+async def test_commit_session_error():
+    """
+    Tests the _commit_session function when an error occurs. The
+    _commit_session function should raise an InternalServerError
+    """
+
+    # Mocks the async-session class
+    async_session_mock = MagicMock(spec_set=AsyncSession)
+    async_session_mock.flush = async_error_mock
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await DatabaseRowOperations._commit_session(async_session_mock)
+
+
+async def test_copy_rows():
+    """
+    Tests the _copy_rows function for completion. The _copy_rows function should start the
+    transaction and copy the rows using the asyncpg connection bound to the session
+    """
+
+    # Mocks the asyncpg connection
+    driver_connection_mock = AsyncMock()
+    raw_connection_mock = MagicMock()
+    raw_connection_mock.driver_connection = driver_connection_mock
+
+    # Mocks the async-connection class
+    async_connection_mock = AsyncMock()
+    async_connection_mock.dialect = MagicMock(driver="asyncpg")
+    async_connection_mock.get_raw_connection.return_value = raw_connection_mock
+
+    # Records the order in which the transaction is started and the rows are copied
+    calls_mock = MagicMock()
+    calls_mock.attach_mock(async_connection_mock.exec_driver_sql, "begin")
+    calls_mock.attach_mock(driver_connection_mock.copy_records_to_table, "copy")
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.connection.return_value = async_connection_mock
+
+    # Mocks the table class
+    table_mock = MagicMock()
+    table_mock.__table__ = MagicMock()
+    table_mock.__table__.name = "test_table"
+    table_mock.__table__.schema = "public"
+    table_mock.__table__.c = {"id": MagicMock(), "name": MagicMock()}
+    table_mock.__table__.c["id"].name = "id"
+    table_mock.__table__.c["name"].name = "name"
+
+    # Invokes the _copy_rows function
+    rows = [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
+    await DatabaseRowOperations._copy_rows(async_session_mock, table_mock, rows)
+
+    # Checks whether the transaction was started before the rows were copied
+    assert async_connection_mock.exec_driver_sql.call_args.args == ("SELECT 1",)
+    assert [call[0] for call in calls_mock.mock_calls] == ["begin", "copy"]
+
+    # Checks whether the rows were copied correctly
+    copy_mock = driver_connection_mock.copy_records_to_table
+    assert copy_mock.called
+    assert copy_mock.call_args.args[0] == "test_table"
+    assert copy_mock.call_args.kwargs == {
+        "records": [(1, "one"), (2, "two")],
+        "columns": ["id", "name"],
+        "schema_name": "public",
+    }
+
+
+async def test_copy_rows_not_asyncpg(mocker):
+    """
+    Tests the _copy_rows function when the asyncpg driver is not used. The
+    _copy_rows function should fall back to a batched executemany insert
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the insert function
+    mocker.patch.object(row_operations, "insert", MagicMock())
+
+    # Mocks the async-connection class
+    async_connection_mock = AsyncMock()
+    async_connection_mock.dialect = MagicMock(driver="psycopg")
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.connection.return_value = async_connection_mock
+
+    # Invokes the _copy_rows function
+    await DatabaseRowOperations._copy_rows(async_session_mock, MagicMock(), [{"id": 1}])
+
+    # Checks whether the rows were inserted using executemany
+    assert async_session_mock.execute.called
+    assert async_session_mock.execute.call_args.args[1] == [{"id": 1}]
+    assert not async_connection_mock.get_raw_connection.called
+
+
+async def test_execute_batch():
+    """
+    Tests the execute_batch function for completion. The execute_batch function
+    should execute every statement in one session and persist the session once
+    """
+
+    # Mocks the select classes
+    first_statement_mock = MagicMock(spec_set=Select)
+    second_statement_mock = MagicMock(spec_set=Select)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the _persist_session function
+    persist_session_mock = AsyncMock()
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda: session_maker_mock
+    database_row_operations_mock._persist_session = persist_session_mock
+
+    # Invokes the execute_batch function
+    results = await unwrap(DatabaseRowOperations.execute_batch)(
+        self=database_row_operations_mock,
+        statements=[first_statement_mock, second_statement_mock],
+    )
+
+    # Checks whether the required methods were called correctly
+    assert async_session_mock.execute.call_count == 2
+    assert persist_session_mock.call_count == 1
+
+    # Checks whether the required parameters were passed correctly
+    assert async_session_mock.execute.call_args_list[0].args[0] == first_statement_mock
+    assert async_session_mock.execute.call_args_list[1].args[0] == second_statement_mock
+    assert persist_session_mock.call_args.args[0] == async_session_mock
+
+    # Checks whether a result was returned for each statement
+    assert len(results) == 2
+
+
+async def test_execute_batch_error():
+    """
+    Tests the execute_batch function when an error occurs. The execute_batch
+    function should raise an InternalServerError without persisting the session
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.execute = async_error_mock
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the _persist_session function
+    persist_session_mock = AsyncMock()
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda: session_maker_mock
+    database_row_operations_mock._persist_session = persist_session_mock
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await unwrap(DatabaseRowOperations.execute_batch)(
+            self=database_row_operations_mock, statements=[MagicMock()]
+        )
+
+    # Checks whether the session was not persisted
+    assert not persist_session_mock.called
+
+
+async def test_execute_query():
+    """
+    Tests the _execute_query function for completion. The _execute_query
+    function should call the required methods without any errors
+    """
+
+    # Mocks the select class
+    statement_mock = MagicMock(spec_set=Select)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the _persist_session function
+    commit_session_mock = AsyncMock()
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._persist_session = commit_session_mock
+
+    # Invokes the _execute_query function
+    await DatabaseRowOperations._execute_query(
+        self=database_row_operations_mock, statement=statement_mock, is_commit=True
+    )
+
+    # Checks whether the required methods were called correctly
+    assert async_session_mock.execute.called
+    assert commit_session_mock.called
+
+    # Checks whether the required parameters were passed correctly
+    assert async_session_mock.execute.call_args.args[0] == statement_mock
+    assert commit_session_mock.call_args.args[0] == async_session_mock
+
+
+async def test_execute_query_primary():
+    """
+    Tests the _execute_query function when the primary database is queried. The
+    _execute_query function should not get a read-only session from a read replica
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = MagicMock(return_value=session_maker_mock)
+
+    # Invokes the _execute_query function
+    await DatabaseRowOperations._execute_query(
+        self=database_row_operations_mock,
+        statement=select(UpsertTable),
+        is_commit=False,
+        is_primary=True,
+    )
+
+    # Checks whether the session was not read-only
+    assert database_row_operations_mock._get_session.call_args.kwargs == {"is_read": False}
+    assert async_session_mock.execute.called
+
+
+async def test_execute_query_error():
+    """
+    Tests the _execute_query function when an error occurs. The
+    _execute_query function should raise an InternalServerError
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.execute = async_error_mock
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await DatabaseRowOperations._execute_query(
+            self=database_row_operations_mock, statement=MagicMock(), is_commit=False
+        )
+
+
+async def test_get_row(mocker):
+    """
+    Tests the get_row function for completion. The get_row function should get the
+    row by its primary key and cache it for the rest of the request
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a fast-api-context instance with an entity cache
+    fast_api_context = FastApiContext()
+    fast_api_context.entity_cache_var = EntityCache()
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
+
+    # Mocks the async-session class
+    row = UpsertTable(id=1, name="test")
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.get.return_value = row
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._unit_of_work_var = ContextVar("test", default=None)
+
+    # Invokes the get_row function twice
+    get_row = unwrap(DatabaseRowOperations.get_row)
+    first_row = await get_row(self=database_row_operations_mock, table=UpsertTable, primary_key=1)
+    second_row = await get_row(self=database_row_operations_mock, table=UpsertTable, primary_key=1)
+
+    # Checks whether the row was only queried once
+    assert first_row == row
+    assert second_row == row
+    assert async_session_mock.get.call_count == 1
+    assert async_session_mock.get.call_args.args == (UpsertTable, 1)
+
+
+async def test_get_row_error(mocker):
+    """
+    Tests the get_row function when an error occurs. The
+    get_row function should raise an InternalServerError
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a fast-api-context instance with an entity cache
+    fast_api_context = FastApiContext()
+    fast_api_context.entity_cache_var = EntityCache()
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.get = async_error_mock
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._unit_of_work_var = ContextVar("test", default=None)
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await unwrap(DatabaseRowOperations.get_row)(
+            self=database_row_operations_mock, table=UpsertTable, primary_key=1
+        )
+
+    # Checks whether nothing was cached
+    assert len(fast_api_context.entity_cache_var) == 0
+
+
+async def test_get_row_no_entity_cache(mocker):
+    """
+    Tests the get_row function when the current context has no entity cache. The
+    get_row function should query the row every time it is called
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the get_fast_api_context function with a context without an entity cache
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=FastApiContext())
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.get.return_value = UpsertTable(id=1, name="test")
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._unit_of_work_var = ContextVar("test", default=None)
+
+    # Invokes the get_row function twice
+    get_row = unwrap(DatabaseRowOperations.get_row)
+    await get_row(self=database_row_operations_mock, table=UpsertTable, primary_key=1)
+    await get_row(self=database_row_operations_mock, table=UpsertTable, primary_key=1)
+
+    # Checks whether the row was queried each time
+    assert async_session_mock.get.call_count == 2
+
+
+async def test_get_row_kwargs(mocker):
+    """
+    Tests the get_row function when kwargs are given. The get_row function should query
+    the row every time so the row lock and options are applied, without caching the row
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a fast-api-context instance with an entity cache of the row
+    fast_api_context = FastApiContext()
+    fast_api_context.entity_cache_var = EntityCache()
+    fast_api_context.entity_cache_var.set(UpsertTable, 1, UpsertTable(id=1, name="cached"))
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
+
+    # Mocks the async-session class
+    row = UpsertTable(id=1, name="test")
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.get.return_value = row
+
+    # Mocks the async_sessionmaker aenter function
+    async def aenter_mock(_):
+        return async_session_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__ = aenter_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._unit_of_work_var = ContextVar("test", default=None)
+
+    # Invokes the get_row function with a row lock
+    locked_row = await unwrap(DatabaseRowOperations.get_row)(
+        self=database_row_operations_mock, table=UpsertTable, primary_key=1, with_for_update=True
+    )
+
+    # Checks whether the row was queried with the row lock instead of read from the cache
+    assert locked_row == row
+    assert async_session_mock.get.call_args.kwargs == {"with_for_update": True}
+    assert fast_api_context.entity_cache_var.get(UpsertTable, 1).name == "cached"
+
+
+async def test_get_row_unit_of_work(mocker):
+    """
+    Tests the get_row function when a unit-of-work is active. The get_row function should
+    load the row into the unit-of-work session instead of returning the cached row
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates a fast-api-context instance with an entity cache of the row
+    fast_api_context = FastApiContext()
+    fast_api_context.entity_cache_var = EntityCache()
+    fast_api_context.entity_cache_var.set(UpsertTable, 1, UpsertTable(id=1, name="cached"))
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
+
+    # Mocks the async-session class
+    row = UpsertTable(id=1, name="test")
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {}
+    async_session_mock.get.return_value = row
+
+    # Creates the database-row-operations instance with an active unit-of-work
+    database_row_operations = DatabaseRowOperations(session_maker=MagicMock())
+    database_row_operations._unit_of_work_var.set(async_session_mock)
+
+    # Invokes the get_row function within the unit-of-work
+    session_row = await unwrap(DatabaseRowOperations.get_row)(
+        self=database_row_operations, table=UpsertTable, primary_key=1
+    )
+
+    # Checks whether the row was loaded by the unit-of-work session
+    assert session_row == row
+    assert async_session_mock.get.call_args.args == (UpsertTable, 1)
+
+
+async def test_get_session(mocker):
+    """
+    Tests the _get_session function when no unit-of-work is active. The
+    _get_session function should yield a new session from the sessionmaker
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the _checkout_connection function
+    checkout_connection_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_checkout_connection", checkout_connection_mock)
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.return_value = session_maker_mock
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Creates the database-row-operations instance
+    database_row_operations = DatabaseRowOperations(session_maker=session_maker_mock)
+
+    # Checks whether a new session was yielded
+    async with database_row_operations._get_session() as session:
+        assert session == async_session_mock
+    assert session_maker_mock.called
+    checkout_connection_mock.assert_awaited_once_with(async_session_mock)
+
+
+async def test_get_session_read(mocker):
+    """
+    Tests the _get_session function when a read-only session is requested. The _get_session
+    function should yield a new session from the read sessionmaker
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the _checkout_connection function
+    mocker.patch.object(DatabaseRowOperations, "_checkout_connection", AsyncMock())
+
+    # Mocks the async-session class
+    replica_session_mock = AsyncMock(spec=AsyncSession)
+    replica_session_mock.info = {}
+
+    # Mocks the async_sessionmaker classes
+    session_maker_mock = MagicMock()
+    replica_session_maker_mock = MagicMock()
+    replica_session_maker_mock.return_value = replica_session_maker_mock
+    replica_session_maker_mock.__aenter__.return_value = replica_session_mock
+
+    # Creates the database-row-operations instance with a read replica
+    database_row_operations = DatabaseRowOperations(
+        session_maker=session_maker_mock, replica_session_makers=[replica_session_maker_mock]
+    )
+
+    # Checks whether a read replica session was yielded
+    async with database_row_operations._get_session(is_read=True) as session:
+        assert session == replica_session_mock
+    assert not session_maker_mock.called
+
+
+def test_get_read_session_maker():
+    """
+    Tests the _get_read_session_maker function for completion. The _get_read_session_maker
+    function should cycle through the read replicas in a round-robin order
+    """
+
+    # Creates the database-row-operations instance with read replicas
+    database_row_operations = DatabaseRowOperations(
+        session_maker="primary", replica_session_makers=["replica-one", "replica-two"]
+    )
+
+    # Checks whether the read replicas were retrieved in a round-robin order
+    assert database_row_operations._get_read_session_maker() == "replica-one"
+    assert database_row_operations._get_read_session_maker() == "replica-two"
+    assert database_row_operations._get_read_session_maker() == "replica-one"
+
+
+def test_get_read_session_maker_no_replicas():
+    """
+    Tests the _get_read_session_maker function when no read replicas exist. The
+    _get_read_session_maker function should return the primary sessionmaker
+    """
+
+    # Checks whether the primary sessionmaker was retrieved
+    database_row_operations = DatabaseRowOperations(session_maker="primary")
+    assert database_row_operations._get_read_session_maker() == "primary"
+
+
+def test_get_read_session_maker_pinned(mocker):
+    """
+    Tests the _get_read_session_maker function when the request has persisted a write.
+    The _get_read_session_maker function should return the primary sessionmaker
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Creates the database-row-operations instance pinned to the primary database
+    database_row_operations = DatabaseRowOperations(
+        session_maker="primary", replica_session_makers=["replica-one"]
+    )
+    fast_api_context = FastApiContext()
+    fast_api_context.primary_pins_var = {database_row_operations}
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
+
+    # Checks whether the primary sessionmaker was retrieved
+    assert database_row_operations._get_read_session_maker() == "primary"
+
+
+async def test_get_session_unit_of_work():
+    """
+    Tests the _get_session function when a unit-of-work is active. The _get_session
+    function should yield the session bound to the unit-of-work
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+
+    # Creates the database-row-operations instance with an active unit-of-work
+    database_row_operations = DatabaseRowOperations(session_maker=session_maker_mock)
+    database_row_operations._unit_of_work_var.set(async_session_mock)
+
+    # Checks whether the unit-of-work session was yielded
+    async with database_row_operations._get_session() as session:
+        assert session == async_session_mock
+    assert not session_maker_mock.called
+
+
+def test_get_upsert_statement():
+    """
+    Tests the _get_upsert_statement function for completion. The _get_upsert_statement function
+    should create a single upsert statement that updates every non-conflict column
+    """
+
+    # Invokes the _get_upsert_statement function
+    rows = [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
+    statement = DatabaseRowOperations._get_upsert_statement(UpsertTable, rows, ["id"], None)
+
+    # Checks whether the upsert statement was created correctly
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.count("INSERT INTO test_upsert_table") == 1
+    assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name" in sql
+
+
+def test_get_upsert_statement_do_nothing():
+    """
+    Tests the _get_upsert_statement function when no columns are updated. The
+    _get_upsert_statement function should create an upsert statement that does nothing
+    """
+
+    # Invokes the _get_upsert_statement function
+    rows = [{"id": 1, "name": "one"}]
+    statement = DatabaseRowOperations._get_upsert_statement(UpsertTable, rows, ["id"], [])
+
+    # Checks whether the upsert statement was created correctly
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO NOTHING" in sql
+
+
+def test_get_upsert_statement_stamped():
+    """
+    Tests the _get_upsert_statement function when the table uses the StampMixin. The
+    _get_upsert_statement function should keep the creation metadata and stamp the update
+    """
+
+    # Invokes the _get_upsert_statement function
+    rows = [{"id": 1, "name": "one", "created_by": UUID(int=1)}]
+    statement = DatabaseRowOperations._get_upsert_statement(
+        StampedUpsertTable, rows, ["id"], ["name", "created_by"]
+    )
+
+    # Checks whether the upsert statement was created correctly
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    update_sql = sql.split("DO UPDATE SET")[1]
+    assert "name = excluded.name" in update_sql
+    assert "updated_by = excluded.created_by" in update_sql
+    assert "updated_on = " in update_sql
+    assert "created_by = " not in update_sql
+
+
+async def test_invalidate_query_cache():
+    """
+    Tests the _invalidate_query_cache function for completion. The _invalidate_query_cache
+    function should invalidate the names of the tables that were written to
+    """
+
+    # Mocks the query-cache class
+    query_cache_mock = MagicMock(spec=QueryCache)
+
+    # Invokes the _invalidate_query_cache function with a statement and a table row
+    database_row_operations = DatabaseRowOperations(MagicMock(), query_cache=query_cache_mock)
+    await database_row_operations._invalidate_query_cache(
+        [select(UpsertTable), StampedUpsertTable(id=1, name="test")]
+    )
+
+    # Checks whether the table names were invalidated correctly
+    assert query_cache_mock.invalidate.call_args.args == (
+        {"test_upsert_table", "test_stamped_upsert_table"},
+    )
+
+
+async def test_invalidate_query_cache_unit_of_work(mocker):
+    """
+    Tests the _invalidate_query_cache function when a unit-of-work is active. The
+    _invalidate_query_cache function should invalidate the table names once it commits
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.return_value = session_maker_mock
+    session_maker_mock.__aenter__.return_value = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks and overrides the _commit_session function
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", AsyncMock())
+
+    # Mocks the query-cache class
+    query_cache_mock = MagicMock(spec=QueryCache)
+
+    # Invokes the _invalidate_query_cache function within a unit-of-work
+    database_row_operations = DatabaseRowOperations(
+        session_maker_mock, query_cache=query_cache_mock
+    )
+    async with database_row_operations.unit_of_work():
+        await database_row_operations._invalidate_query_cache([UpsertTable])
+        assert not query_cache_mock.invalidate.called
+
+    # Checks whether the table names were invalidated once the unit-of-work committed
+    assert query_cache_mock.invalidate.call_args.args == ({"test_upsert_table"},)
+
+
+def test_init():
+    """
+    Tests the DatabaseRowOperations init function for completion. The DatabaseRowOperations init
+    function should instantiate a DatabaseRowOperations instance without any errors
+    """
+
+    # Mocks and overrides the async_sessionmaker function
+    session_maker_mock = MagicMock(spec_set=async_sessionmaker[AsyncSession])
+
+    # Define and instantiates the DatabaseRowOperations class
+    db_connection = DatabaseRowOperations(session_maker=session_maker_mock)
+
+    # Checks whether the database-row-operations class was instantiated correctly
+    assert db_connection._session_maker == session_maker_mock
+    assert db_connection._replica_session_makers == []
+    assert db_connection._unit_of_work_var.get() is None
+
+
+async def test_persist_session(mocker):
+    """
+    Tests the _persist_session function when no unit-of-work is active.
+    The _persist_session function should commit the session
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks and overrides the _commit_session function
+    commit_session_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", commit_session_mock)
+
+    # Invokes the _persist_session function
+    database_row_operations = DatabaseRowOperations(session_maker=MagicMock())
+    await database_row_operations._persist_session(async_session_mock)
+
+    # Checks whether the session was committed
+    assert commit_session_mock.called
+    assert commit_session_mock.call_args.args[0] == async_session_mock
+
 
-    # Mocks the async_sessionmaker aenter function
-    async def aenter_mock(_):
-        return async_session_mock
+async def test_persist_session_entity_cache(mocker):
+    """
+    Tests the _persist_session function when the request has cached rows. The
+    _persist_session function should clear the entity cache of the request
 
-    # Mocks the async_sessionmaker class
-    session_maker_mock = MagicMock()
-    session_maker_mock.__aenter__ = aenter_mock
+    :param mocker: Fixture to mock specific functions for testing
+    """
 
-    # Mocks the database-row-operations class
-    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = lambda: session_maker_mock
-    database_row_operations_mock._commit_session = commit_session_mock
+    # Creates a fast-api-context instance with a cached row
+    fast_api_context = FastApiContext()
+    fast_api_context.entity_cache_var = EntityCache()
+    fast_api_context.entity_cache_var.set(UpsertTable, 1, UpsertTable(id=1, name="test"))
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
 
-    # Invokes the add_row function
-    await unwrap(DatabaseRowOperations.add_row)(self=database_row_operations_mock, table=None)
+    # Mocks and overrides the _commit_session function
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", AsyncMock())
 
-    # Checks whether the required methods were called correctly
-    assert async_session_mock.add.called
-    assert commit_session_mock.called
+    # Invokes the _persist_session function
+    database_row_operations = DatabaseRowOperations(session_maker=MagicMock())
+    await database_row_operations._persist_session(AsyncMock(spec_set=AsyncSession))
 
+    # Checks whether the entity cache was cleared
+    assert len(fast_api_context.entity_cache_var) == 0
 
-async def test_add_rows():
+
+async def test_persist_session_replicas(mocker):
     """
-    Tests the add_rows function for completion. The add_rows function
-    should call the required methods without any errors
+    Tests the _persist_session function when read replicas exist. The _persist_session
+    function should pin the rest of the request to the primary database
+
+    :param mocker: Fixture to mock specific functions for testing
     """
 
-    # Mocks the async-session class
-    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    # Creates a fast-api-context instance of a request
+    fast_api_context = FastApiContext()
+    fast_api_context.primary_pins_var = set()
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=fast_api_context)
 
-    # Mocks the _commit_session function
-    commit_session_mock = AsyncMock()
+    # Mocks and overrides the _commit_session function
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", AsyncMock())
 
-    # Mocks the async_sessionmaker aenter function
-    async def aenter_mock(_):
-        return async_session_mock
+    # Invokes the _persist_session function
+    database_row_operations = DatabaseRowOperations(
+        session_maker=MagicMock(), replica_session_makers=[MagicMock()]
+    )
+    await database_row_operations._persist_session(AsyncMock(spec_set=AsyncSession))
 
-    # Mocks the async_sessionmaker class
-    session_maker_mock = MagicMock()
-    session_maker_mock.__aenter__ = aenter_mock
+    # Checks whether the request was pinned to the primary database
+    assert fast_api_context.primary_pins_var == {database_row_operations}
+    session_maker = database_row_operations._get_read_session_maker()
+    assert session_maker is database_row_operations._session_maker
 
-    # Mocks the database-row-operations class
-    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = lambda: session_maker_mock
-    database_row_operations_mock._commit_session = commit_session_mock
 
-    # Invokes the add_rows function
-    await unwrap(DatabaseRowOperations.add_rows)(self=database_row_operations_mock, tables=[None])
+async def test_persist_session_replicas_no_request(mocker):
+    """
+    Tests the _persist_session function when read replicas exist outside of a request. The
+    _persist_session function should not pin the later reads to the primary database
 
-    # Checks whether the required methods were called correctly
-    assert async_session_mock.add_all.called
-    assert commit_session_mock.called
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Overrides the get_fast_api_context function with a context outside of a request
+    mocker.patch.object(row_operations, "get_fast_api_context", return_value=FastApiContext())
+
+    # Mocks and overrides the _commit_session function
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", AsyncMock())
+
+    # Invokes the _persist_session function
+    replica_session_maker_mock = MagicMock()
+    database_row_operations = DatabaseRowOperations(
+        session_maker=MagicMock(), replica_session_makers=[replica_session_maker_mock]
+    )
+    await database_row_operations._persist_session(AsyncMock(spec_set=AsyncSession))
+
+    # Checks whether the later reads still go to the read replica
+    assert database_row_operations._get_read_session_maker() is replica_session_maker_mock
 
 
-async def test_commit_session():
+async def test_persist_session_unit_of_work(mocker):
     """
-    Tests the _commit_session function for completion. The _commit_session
-    function should call the required methods without any errors
+    Tests the _persist_session function when a unit-of-work is active. The
+    _persist_session function should flush the session without committing it
+
+    :param mocker: Fixture to mock specific functions for testing
     """
 
     # Mocks the async-session class
     async_session_mock = AsyncMock(spec_set=AsyncSession)
 
-    # Invokes the _commit_session function
-    await DatabaseRowOperations._commit_session(async_session_mock)
+    # Mocks and overrides the _commit_session function
+    commit_session_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", commit_session_mock)
 
-    # Checks whether the required methods were called correctly
+    # Invokes the _persist_session function with an active unit-of-work
+    database_row_operations = DatabaseRowOperations(session_maker=MagicMock())
+    database_row_operations._unit_of_work_var.set(async_session_mock)
+    await database_row_operations._persist_session(async_session_mock)
+
+    # Checks whether the session was only flushed
     assert async_session_mock.flush.called
-    assert async_session_mock.commit.called
+    assert not async_session_mock.commit.called
+    assert not commit_session_mock.called
 
 
-async def test_commit_session_error():
+async def test_persist_session_unit_of_work_error():
     """
-    Tests the _commit_session function when an error occurs. The
-    _commit_session function should raise an InternalServerError
+    Tests the _persist_session function when the unit-of-work flush fails.
+    The _persist_session function should raise an InternalServerError
     """
 
     # Mocks the async-session class
     async_session_mock = MagicMock(spec_set=AsyncSession)
     async_session_mock.flush = async_error_mock
 
+    # Creates the database-row-operations instance with an active unit-of-work
+    database_row_operations = DatabaseRowOperations(session_maker=MagicMock())
+    database_row_operations._unit_of_work_var.set(async_session_mock)
+
     # Checks whether the correct error was raised
     with raises(InternalServerError):
-        await DatabaseRowOperations._commit_session(async_session_mock)
+        await database_row_operations._persist_session(async_session_mock)
 
 
-async def test_execute_query():
+async def test_protect_session():
     """
-    Tests the _execute_query function for completion. The _execute_query
-    function should call the required methods without any errors
+    Tests the _protect_session function for completion. The _protect_session function
+    should protect the row operation with the circuit breaker of the session database
     """
 
-    # Mocks the select class
-    statement_mock = MagicMock(spec_set=Select)
+    # Mocks the circuit-breaker class that rejects every call
+    circuit_breaker_mock = MagicMock(spec=CircuitBreaker)
+    circuit_breaker_mock.protect.return_value.__aenter__.side_effect = ServiceUnavailableError()
 
     # Mocks the async-session class
-    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {"circuit_breaker": circuit_breaker_mock}
 
-    # Mocks the async_sessionmaker aenter function
-    async def aenter_mock(_):
-        return async_session_mock
+    # Checks whether the circuit breaker rejected the row operation
+    with raises(ServiceUnavailableError):
+        async with DatabaseRowOperations._protect_session(async_session_mock):
+            pass
+    assert circuit_breaker_mock.protect.called
+
+
+async def test_protect_session_no_circuit_breaker():
+    """
+    Tests the _protect_session function when the session has no circuit breaker.
+    The _protect_session function should yield without any protection
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec=AsyncSession)
+    async_session_mock.info = {}
+
+    # Checks whether the row operation was allowed
+    async with DatabaseRowOperations._protect_session(async_session_mock):
+        pass
+
+
+async def test_query_columns():
+    """
+    Tests the query_columns function for completion. The query_columns function should
+    execute the statement on the session connection and return the column results
+    """
+
+    # Mocks the result class
+    result_mock = MagicMock(spec_set=Result)
+    result_mock.keys.return_value = ["id"]
+    result_mock.all.return_value = [(1,)]
+
+    # Mocks the async-connection and async-session classes
+    async_connection_mock = AsyncMock(spec_set=AsyncConnection)
+    async_connection_mock.execute.return_value = result_mock
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.connection.return_value = async_connection_mock
 
     # Mocks the async_sessionmaker class
     session_maker_mock = MagicMock()
-    session_maker_mock.__aenter__ = aenter_mock
-
-    # Mocks the _commit_session function
-    commit_session_mock = AsyncMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
 
     # Mocks the database-row-operations class
     database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = lambda: session_maker_mock
-    database_row_operations_mock._commit_session = commit_session_mock
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
 
-    # Invokes the _execute_query function
-    await DatabaseRowOperations._execute_query(
-        self=database_row_operations_mock, statement=statement_mock, is_commit=True
+    # Invokes the query_columns function
+    statement_mock = MagicMock(spec_set=Select)
+    column_results = await unwrap(DatabaseRowOperations.query_columns)(
+        self=database_row_operations_mock, statement=statement_mock
     )
 
-    # Checks whether the required methods were called correctly
-    assert async_session_mock.execute.called
-    assert commit_session_mock.called
-
-    # Checks whether the required parameters were passed correctly
-    assert async_session_mock.execute.call_args.args[0] == statement_mock
-    assert commit_session_mock.call_args.args[0] == async_session_mock
+    # Checks whether the statement was executed on the session connection
+    assert isinstance(column_results, ColumnResults)
+    assert column_results.tuples() == [(1,)]
+    assert async_connection_mock.execute.call_args.args[0] == statement_mock
 
 
-async def test_execute_query_error():
+async def test_query_columns_error():
     """
-    Tests the _execute_query function when an error occurs. The
-    _execute_query function should raise an InternalServerError
+    Tests the query_columns function when an error occurs. The
+    query_columns function should raise an InternalServerError
     """
 
-    # Mocks the async-session class
-    async_session_mock = AsyncMock(spec_set=AsyncSession)
-    async_session_mock.execute = async_error_mock
-
-    # Mocks the async_sessionmaker aenter function
-    async def aenter_mock(_):
-        return async_session_mock
-
     # Mocks the async_sessionmaker class
     session_maker_mock = MagicMock()
-    session_maker_mock.__aenter__ = aenter_mock
+    session_maker_mock.__aenter__ = async_error_mock
 
     # Mocks the database-row-operations class
     database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = lambda: session_maker_mock
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
 
     # Checks whether the correct error was raised
     with raises(InternalServerError):
-        await DatabaseRowOperations._execute_query(
-            self=database_row_operations_mock, statement=MagicMock(), is_commit=False
+        await unwrap(DatabaseRowOperations.query_columns)(
+            self=database_row_operations_mock, statement=MagicMock(spec_set=Select)
         )
 
 
-def test_init():
+async def test_query_page():
     """
-    Tests the DatabaseRowOperations init function for completion. The DatabaseRowOperations init
-    function should instantiate a DatabaseRowOperations instance without any errors
+    Tests the query_page function for completion. The query_page function
+    should query the page statement and create a page from its rows
     """
 
-    # Mocks and overrides the async_sessionmaker function
-    session_maker_mock = MagicMock(spec_set=async_sessionmaker[AsyncSession])
+    # Mocks the row-results class
+    row_results_mock = MagicMock(spec=RowResults)
+    row_results_mock.all.return_value = [
+        UpsertTable(id=1, name="one"),
+        UpsertTable(id=2, name="two"),
+    ]
 
-    # Define and instantiates the DatabaseRowOperations class
-    db_connection = DatabaseRowOperations(session_maker=session_maker_mock)
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock.query_rows = AsyncMock(return_value=row_results_mock)
 
-    # Checks whether the database-row-operations class was instantiated correctly
-    assert db_connection._session_maker == session_maker_mock
+    # Invokes the query_page function
+    page = await DatabaseRowOperations.query_page(
+        self=database_row_operations_mock,
+        return_type=UpsertTable,
+        statement=select(UpsertTable),
+        keys=[UpsertTable.id],
+        size=1,
+    )
+
+    # Checks whether the page was queried correctly
+    page_statement = database_row_operations_mock.query_rows.call_args.args[0]
+    assert page_statement._limit == 2
+    assert row_results_mock.all.call_args.args[0] == UpsertTable
+    assert [row.id for row in page.rows] == [1]
+    assert page.next_cursor is not None
 
 
 async def test_query_row(mocker):
@@ -288,10 +1469,96 @@ async def test_query_rows(mocker):
     assert row_results_mock.called
 
     # Checks whether the required parameters were passed correctly
-    assert execute_query_mock.call_args.args == (statement_mock, False)
+    assert execute_query_mock.call_args.args == (statement_mock, False, False)
     assert row_results_mock.call_args.args == (execute_query_mock, True)
 
 
+async def test_query_rows_cached():
+    """
+    Tests the query_rows_cached function when the rows are not cached. The
+    query_rows_cached function should query the rows and cache them
+    """
+
+    # Mocks the query-cache class
+    query_cache_mock = MagicMock(spec=QueryCache)
+    query_cache_mock.get_key.return_value = "test-key"
+    query_cache_mock.get.return_value = None
+
+    # Mocks the row-results class
+    row_results_mock = MagicMock(spec_set=RowResults)
+    row_results_mock.all.return_value = ["test-row"]
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._query_cache = query_cache_mock
+    database_row_operations_mock.query_rows = AsyncMock(return_value=row_results_mock)
+
+    # Invokes the query_rows_cached function
+    statement = select(UpsertTable)
+    rows = await DatabaseRowOperations.query_rows_cached(
+        self=database_row_operations_mock, return_type=UpsertTable, statement=statement
+    )
+
+    # Checks whether the rows were queried and cached correctly
+    assert rows == ["test-row"]
+    assert database_row_operations_mock.query_rows.call_args.args == (statement,)
+    assert database_row_operations_mock.query_rows.call_args.kwargs["is_primary"] is True
+    assert query_cache_mock.get_key.call_args.args == (statement, True)
+    assert query_cache_mock.set.call_args.args == (
+        "test-key",
+        ["test-row"],
+        {"test_upsert_table"},
+        None,
+    )
+
+
+async def test_query_rows_cached_hit():
+    """
+    Tests the query_rows_cached function when the rows are cached. The
+    query_rows_cached function should return the cached rows without querying
+    """
+
+    # Mocks the query-cache class
+    query_cache_mock = MagicMock(spec=QueryCache)
+    query_cache_mock.get.return_value = ["test-row"]
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._query_cache = query_cache_mock
+
+    # Invokes the query_rows_cached function
+    rows = await DatabaseRowOperations.query_rows_cached(
+        self=database_row_operations_mock, return_type=UpsertTable, statement=select(UpsertTable)
+    )
+
+    # Checks whether the cached rows were returned without querying
+    assert rows == ["test-row"]
+    assert not database_row_operations_mock.query_rows.called
+    assert not query_cache_mock.set.called
+
+
+async def test_query_rows_cached_no_query_cache():
+    """
+    Tests the query_rows_cached function when no query cache exists.
+    The query_rows_cached function should query the rows
+    """
+
+    # Mocks the row-results class
+    row_results_mock = MagicMock(spec_set=RowResults)
+    row_results_mock.all.return_value = ["test-row"]
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._query_cache = None
+    database_row_operations_mock.query_rows = AsyncMock(return_value=row_results_mock)
+
+    # Checks whether the rows were queried
+    rows = await DatabaseRowOperations.query_rows_cached(
+        self=database_row_operations_mock, return_type=UpsertTable, statement=select(UpsertTable)
+    )
+    assert rows == ["test-row"]
+
+
 async def test_start_stream():
     """
     Tests the _start_stream function for completion. The _start_stream function
@@ -365,9 +1632,9 @@ async def test_stream_rows(mocker):
     :param mocker: Fixture to mock specific functions for testing
     """
 
-    # Mocks and overrides the _enforce_base_type_mock function
-    enforce_base_type_mock = MagicMock()
-    mocker.patch.object(row_operations, "_enforce_base_type", enforce_base_type_mock)
+    # Mocks and overrides the _enforce_rows_base_type function
+    enforce_rows_base_type_mock = MagicMock()
+    mocker.patch.object(row_operations, "_enforce_rows_base_type", enforce_rows_base_type_mock)
 
     # Mocks the async-session class
     async_session_mock = AsyncMock(spec_set=AsyncSession)
@@ -389,7 +1656,7 @@ async def test_stream_rows(mocker):
 
     # Mocks the database-row-operations class
     database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = session_maker_mock
+    database_row_operations_mock._get_session = session_maker_mock
     database_row_operations_mock._start_stream = start_stream_mock
 
     # Mocks the select class
@@ -410,11 +1677,12 @@ async def test_stream_rows(mocker):
     assert start_stream_mock.call_args.args[0] == async_session_mock
     assert start_stream_mock.call_args.args[1] == statement_mock
     assert start_stream_mock.call_args.args[2] is True
+    assert start_stream_mock.call_args.kwargs == {"execution_options": {"yield_per": 1}}
     assert partitions_mock.called
     assert partitions_mock.call_args.args[0] == 1
-    assert enforce_base_type_mock.called
-    assert enforce_base_type_mock.call_args.args[0] == "test-value-one"
-    assert enforce_base_type_mock.call_args.args[1] == str
+    assert enforce_rows_base_type_mock.called
+    assert enforce_rows_base_type_mock.call_args.args[0] == ["test-value-one"]
+    assert enforce_rows_base_type_mock.call_args.args[1] == str
 
 
 async def test_stream_rows_canceled(mocker):
@@ -425,12 +1693,12 @@ async def test_stream_rows_canceled(mocker):
     :param mocker: Fixture to mock specific functions for testing
     """
 
-    # Mocks and overrides the _enforce_base_type_mock function
-    enforce_base_type_mock = MagicMock()
-    mocker.patch.object(row_operations, "_enforce_base_type", enforce_base_type_mock)
+    # Mocks and overrides the _enforce_rows_base_type function
+    enforce_rows_base_type_mock = MagicMock()
+    mocker.patch.object(row_operations, "_enforce_rows_base_type", enforce_rows_base_type_mock)
 
     # Function that raises an async canceled error
-    def raise_canceled_error():
+    def raise_canceled_error(**_):
         raise CancelledError()
 
     # Mocks the async_sessionmaker class
@@ -447,7 +1715,7 @@ async def test_stream_rows_canceled(mocker):
 
     # Mocks the database-row-operations class
     database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
-    database_row_operations_mock._session_maker = session_maker_mock
+    database_row_operations_mock._get_session = session_maker_mock
     database_row_operations_mock._start_stream = start_stream_mock
 
     # Mocks the select class
@@ -466,4 +1734,168 @@ async def test_stream_rows_canceled(mocker):
     assert session_maker_mock.called
     assert not start_stream_mock.called
     assert not fetch_many_mock.called
-    assert not enforce_base_type_mock.called
+    assert not enforce_rows_base_type_mock.called
+
+
+async def test_unit_of_work(mocker):
+    """
+    Tests the unit_of_work function for completion. The unit_of_work function should bind a
+    single session to the context, share it when nested, and commit it once on exit
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.return_value = session_maker_mock
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks and overrides the _commit_session function
+    commit_session_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", commit_session_mock)
+
+    # Invokes the unit_of_work function with a nested unit-of-work
+    database_row_operations = DatabaseRowOperations(session_maker=session_maker_mock)
+    async with database_row_operations.unit_of_work() as session:
+        async with database_row_operations.unit_of_work() as nested_session:
+            assert nested_session == session
+        assert database_row_operations._unit_of_work_var.get() == async_session_mock
+
+    # Checks whether the session was committed once and unbound
+    assert session == async_session_mock
+    assert session_maker_mock.call_count == 1
+    assert commit_session_mock.call_count == 1
+    assert database_row_operations._unit_of_work_var.get() is None
+
+
+async def test_unit_of_work_error(mocker):
+    """
+    Tests the unit_of_work function when an error occurs within the context. The
+    unit_of_work function should not commit the session and re-raise the error
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.return_value = session_maker_mock
+    session_maker_mock.__aenter__.return_value = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks and overrides the _commit_session function
+    commit_session_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", commit_session_mock)
+
+    # Checks whether the correct error was raised
+    database_row_operations = DatabaseRowOperations(session_maker=session_maker_mock)
+    with raises(InternalServerError):
+        async with database_row_operations.unit_of_work():
+            raise InternalServerError()
+
+    # Checks whether the session was not committed and unbound
+    assert not commit_session_mock.called
+    assert database_row_operations._unit_of_work_var.get() is None
+
+
+async def test_run_unit_of_work(mocker):
+    """
+    Tests the run_unit_of_work function when a statement fails with a transient error. The
+    run_unit_of_work function should not retry the statement on its own within the aborted
+    transaction, and should retry the whole unit-of-work instead
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the sleep between retries
+    mocker.patch("asyncio.sleep", AsyncMock())
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.return_value = session_maker_mock
+    session_maker_mock.__aenter__.return_value = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks and overrides the _persist_session and _commit_session functions
+    persist_session_mock = AsyncMock(side_effect=[ConnectionResetError(), None])
+    commit_session_mock = AsyncMock()
+    mocker.patch.object(DatabaseRowOperations, "_persist_session", persist_session_mock)
+    mocker.patch.object(DatabaseRowOperations, "_commit_session", commit_session_mock)
+
+    # Function that adds a row within the unit-of-work
+    async def work(_: AsyncSession) -> str:
+        await database_row_operations.add_row(table=None)
+        return "test-result"
+
+    # Invokes the run_unit_of_work function
+    database_row_operations = DatabaseRowOperations(session_maker=session_maker_mock)
+    assert await database_row_operations.run_unit_of_work(work) == "test-result"
+
+    # Checks whether the whole unit-of-work was retried and committed once
+    assert persist_session_mock.await_count == 2
+    assert session_maker_mock.call_count == 2
+    assert commit_session_mock.await_count == 1
+    assert database_row_operations._unit_of_work_var.get() is None
+
+
+async def test_upsert_rows():
+    """
+    Tests the upsert_rows function for completion. The upsert_rows function should
+    execute a single upsert statement per chunk and persist the session once
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+    database_row_operations_mock._get_upsert_statement = MagicMock()
+    database_row_operations_mock._persist_session = AsyncMock()
+
+    # Invokes the upsert_rows function
+    row_count = await DatabaseRowOperations.upsert_rows(
+        self=database_row_operations_mock,
+        table=UpsertTable,
+        rows=[{"id": 1, "name": "one"}, {"id": 2, "name": "two"}, {"id": 3, "name": "three"}],
+        conflict_columns=["id"],
+        chunk_size=2,
+    )
+
+    # Checks whether an upsert statement was executed per chunk
+    assert row_count == 3
+    assert async_session_mock.execute.call_count == 2
+    assert database_row_operations_mock._get_upsert_statement.call_count == 2
+    assert database_row_operations_mock._persist_session.call_count == 1
+
+
+async def test_upsert_rows_error():
+    """
+    Tests the upsert_rows function when an error occurs. The
+    upsert_rows function should raise an InternalServerError
+    """
+
+    # Mocks the async-session class
+    async_session_mock = AsyncMock(spec_set=AsyncSession)
+    async_session_mock.execute = async_error_mock
+
+    # Mocks the async_sessionmaker class
+    session_maker_mock = MagicMock()
+    session_maker_mock.__aenter__.return_value = async_session_mock
+
+    # Mocks the database-row-operations class
+    database_row_operations_mock = MagicMock(spec=DatabaseRowOperations)
+    database_row_operations_mock._get_session = lambda **_: session_maker_mock
+
+    # Checks whether the correct error was raised
+    with raises(InternalServerError):
+        await DatabaseRowOperations.upsert_rows(
+            self=database_row_operations_mock,
+            table=UpsertTable,
+            rows=[{"id": 1, "name": "one"}],
+            conflict_columns=["id"],
+        )
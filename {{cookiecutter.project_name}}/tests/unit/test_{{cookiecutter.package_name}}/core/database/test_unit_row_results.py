@@ -14,9 +14,9 @@ def test_all(mocker):
     :param mocker: Fixture to mock specific functions for testing
     """
 
-    # Mocks and overrides the _enforce_base_type_mock function
-    enforce_base_type_mock = MagicMock()
-    mocker.patch.object(row_operations, "_enforce_base_type", enforce_base_type_mock)
+    # Mocks and overrides the _enforce_rows_base_type function
+    enforce_rows_base_type_mock = MagicMock()
+    mocker.patch.object(row_operations, "_enforce_rows_base_type", enforce_rows_base_type_mock)
 
     # Mocks the row class
     row_mock = MagicMock(Row)
@@ -35,9 +35,9 @@ def test_all(mocker):
     # Checks whether the required methods were called correctly
     assert rows == [row_mock]
     assert result_mock.all.called
-    assert enforce_base_type_mock.called
-    assert enforce_base_type_mock.call_args.args[0] == row_mock
-    assert enforce_base_type_mock.call_args.args[1] == str
+    assert enforce_rows_base_type_mock.called
+    assert enforce_rows_base_type_mock.call_args.args[0] == [row_mock]
+    assert enforce_rows_base_type_mock.call_args.args[1] == str
 
 
 def test_fetch(mocker):
@@ -46,9 +46,9 @@ def test_fetch(mocker):
     should call the required methods without any errors
     """
 
-    # Mocks and overrides the _enforce_base_type_mock function
-    enforce_base_type_mock = MagicMock()
-    mocker.patch.object(row_operations, "_enforce_base_type", enforce_base_type_mock)
+    # Mocks and overrides the _enforce_rows_base_type function
+    enforce_rows_base_type_mock = MagicMock()
+    mocker.patch.object(row_operations, "_enforce_rows_base_type", enforce_rows_base_type_mock)
 
     # Mocks the row class
     row_mock = MagicMock(Row)
@@ -67,9 +67,9 @@ def test_fetch(mocker):
     # Checks whether the required methods were called correctly
     assert rows == [row_mock]
     assert result_mock.fetchmany.called
-    assert enforce_base_type_mock.called
-    assert enforce_base_type_mock.call_args.args[0] == row_mock
-    assert enforce_base_type_mock.call_args.args[1] == str
+    assert enforce_rows_base_type_mock.called
+    assert enforce_rows_base_type_mock.call_args.args[0] == [row_mock]
+    assert enforce_rows_base_type_mock.call_args.args[1] == str
 
 
 def test_init():
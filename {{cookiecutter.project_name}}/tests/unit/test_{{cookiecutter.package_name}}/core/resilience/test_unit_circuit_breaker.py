@@ -0,0 +1,237 @@
+from unittest.mock import MagicMock
+
+from pytest import raises
+
+from {{cookiecutter.package_name}}.core.resilience import circuit_breaker
+from {{cookiecutter.package_name}}.core.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breakers,
+)
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
+
+
+def _mock_settings(mocker, reset_seconds: float = 30):
+    """
+    Function that mocks and overrides the
+    circuit breaker settings
+
+    :param mocker: Fixture to mock specific functions for testing
+    :param reset_seconds: The seconds to wait before probing an open circuit
+    """
+    settings_mock = MagicMock()
+    settings_mock.API_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+    settings_mock.API_CIRCUIT_BREAKER_RESET_SECONDS = reset_seconds
+    mocker.patch.object(circuit_breaker, "settings", settings_mock)
+
+
+async def _fail(breaker: CircuitBreaker, exc: Exception):
+    """
+    Function that makes a call through the
+    circuit breaker that raises the given error
+
+    :param breaker: The circuit breaker to call through
+    :param exc: The error raised by the call
+    """
+    with raises(type(exc)):
+        async with breaker.protect():
+            raise exc
+
+
+def test_get_circuit_breakers():
+    """
+    Tests the get_circuit_breakers function for completion. The get_circuit_breakers
+    function should return every circuit breaker that has been created
+    """
+
+    # Checks whether the created circuit breaker was retrieved
+    breaker = CircuitBreaker("test-registered", lambda _: True)
+    assert breaker in get_circuit_breakers()
+
+
+def test_init():
+    """
+    Tests the CircuitBreaker init function for completion. The CircuitBreaker
+    init function should instantiate a closed circuit breaker
+    """
+
+    # Checks whether the circuit breaker was instantiated correctly
+    breaker = CircuitBreaker("test-init", lambda _: True)
+    assert breaker.name == "test-init"
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_init_duplicate_name():
+    """
+    Tests the CircuitBreaker init function when the name is already used. The CircuitBreaker
+    init function should raise an InternalServerError instead of replacing the registered one
+    """
+
+    # Checks whether the circuit breaker with the same name was rejected
+    breaker = CircuitBreaker("test-duplicate-name", lambda _: True)
+    with raises(InternalServerError):
+        CircuitBreaker("test-duplicate-name", lambda _: True)
+    assert breaker in get_circuit_breakers()
+
+
+async def test_protect(mocker):
+    """
+    Tests the protect function for completion. The protect function should
+    allow calls and reset the failure count after a successful call
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and makes a failed call followed by a successful call
+    _mock_settings(mocker)
+    breaker = CircuitBreaker("test-protect", lambda _: True)
+    await _fail(breaker, ConnectionError())
+    async with breaker.protect():
+        pass
+
+    # Checks whether the failure count was reset and the circuit stayed closed
+    await _fail(breaker, ConnectionError())
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_protect_not_failure(mocker):
+    """
+    Tests the protect function when the call raises an error that is not a dependency failure.
+    The protect function should raise the error without counting it as a failure or a success
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and makes calls that raise errors that are not failures
+    _mock_settings(mocker)
+    breaker = CircuitBreaker("test-not-failure", lambda exc: isinstance(exc, ConnectionError))
+    await _fail(breaker, ValueError())
+    await _fail(breaker, ValueError())
+    assert breaker.state == CircuitState.CLOSED
+
+    # Checks whether the error did not reset the failure count
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ValueError())
+    await _fail(breaker, ConnectionError())
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_protect_open(mocker):
+    """
+    Tests the protect function when the failure threshold is reached. The protect
+    function should open the circuit and reject calls without attempting them
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and fails enough calls to open the circuit
+    _mock_settings(mocker)
+    breaker = CircuitBreaker("test-open", lambda _: True)
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ConnectionError())
+
+    # Checks whether the circuit opened and rejects calls
+    assert breaker.state == CircuitState.OPEN
+    call_mock = MagicMock()
+    with raises(ServiceUnavailableError):
+        async with breaker.protect():
+            call_mock()
+    assert not call_mock.called
+
+
+async def test_protect_half_open(mocker):
+    """
+    Tests the protect function when the reset timeout of an open circuit has passed. The
+    protect function should allow a single probe call and close the circuit when it succeeds
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and opens the circuit
+    _mock_settings(mocker, reset_seconds=0)
+    breaker = CircuitBreaker("test-half-open", lambda _: True)
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ConnectionError())
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Checks whether only a single probe call was allowed
+    async with breaker.protect():
+        with raises(ServiceUnavailableError):
+            async with breaker.protect():
+                pass
+
+    # Checks whether the successful probe closed the circuit
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_protect_half_open_failure(mocker):
+    """
+    Tests the protect function when the probe call of a half-open circuit
+    fails. The protect function should open the circuit again
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and opens the circuit
+    _mock_settings(mocker, reset_seconds=0)
+    breaker = CircuitBreaker("test-half-open-failure", lambda _: True)
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ConnectionError())
+
+    # Fails the probe call and moves the reset timeout into the future
+    await _fail(breaker, ConnectionError())
+    _mock_settings(mocker, reset_seconds=30)
+
+    # Checks whether the failed probe opened the circuit again
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_protect_half_open_not_failure(mocker):
+    """
+    Tests the protect function when the probe call of a half-open circuit raises an error
+    that is not a dependency failure. The protect function should keep the circuit half-open
+    and allow another probe call
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and opens the circuit
+    _mock_settings(mocker, reset_seconds=0)
+    breaker = CircuitBreaker("test-half-open-not-failure", lambda exc: isinstance(exc, OSError))
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ConnectionError())
+
+    # Checks whether the probe did not close the circuit
+    await _fail(breaker, ValueError())
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Checks whether another probe call was allowed
+    async with breaker.protect():
+        pass
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_protect_late_result(mocker):
+    """
+    Tests the protect function when calls that started while the circuit was closed finish
+    after it opened. The protect function should ignore their successes and failures
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks the settings and starts a call on each outcome before the circuit opens
+    _mock_settings(mocker)
+    breaker = CircuitBreaker("test-late-result", lambda _: True)
+    late_success = breaker.protect()
+    late_failure = breaker.protect()
+    await late_success.__aenter__()
+    await late_failure.__aenter__()
+    await _fail(breaker, ConnectionError())
+    await _fail(breaker, ConnectionError())
+    opened_at = breaker._opened_at
+
+    # Checks whether the late results neither closed the circuit nor extended its reset timeout
+    await late_success.__aexit__(None, None, None)
+    await late_failure.__aexit__(ConnectionError, ConnectionError(), None)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker._opened_at == opened_at
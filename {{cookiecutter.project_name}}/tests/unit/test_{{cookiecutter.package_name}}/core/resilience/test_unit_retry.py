@@ -0,0 +1,167 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from asyncpg.exceptions import SerializationError
+from pytest import raises
+from redis import exceptions as redis_exceptions
+from sqlalchemy.exc import DBAPIError, ProgrammingError
+
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext, RetryBudget
+from {{cookiecutter.package_name}}.core.resilience import retry
+from {{cookiecutter.package_name}}.core.resilience.retry import (
+    is_transient_db_error,
+    is_transient_redis_error,
+    retry_policy,
+)
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+
+
+def _get_wrapped_error(exc: Exception) -> InternalServerError:
+    """
+    Function that wraps the given error in an InternalServerError
+    the same way the row and redis operations do
+
+    :param exc: The error to wrap
+
+    :return: The InternalServerError caused by the given error
+    """
+    try:
+        raise InternalServerError() from exc
+    except InternalServerError as wrapped_exc:
+        return wrapped_exc
+
+
+def test_is_transient_db_error():
+    """
+    Tests the is_transient_db_error function for completion. The is_transient_db_error
+    function should classify connection errors, serialization failures and deadlocks as transient
+    """
+
+    # Creates transient database errors
+    serialization_error = SerializationError("could not serialize access")
+    deadlock_error = DBAPIError("SELECT 1", {}, MagicMock(sqlstate="40P01"))
+    invalidated_error = DBAPIError("SELECT 1", {}, Exception(), connection_invalidated=True)
+
+    # Checks whether the errors were classified as transient
+    assert is_transient_db_error(_get_wrapped_error(serialization_error))
+    assert is_transient_db_error(_get_wrapped_error(deadlock_error))
+    assert is_transient_db_error(_get_wrapped_error(invalidated_error))
+    assert is_transient_db_error(_get_wrapped_error(ConnectionResetError()))
+    assert is_transient_db_error(DBAPIError("SELECT 1", {}, MagicMock(sqlstate="08006")))
+
+
+def test_is_transient_db_error_permanent():
+    """
+    Tests the is_transient_db_error function when the error is permanent. The
+    is_transient_db_error function should not classify the errors as transient
+    """
+
+    # Creates permanent database errors
+    syntax_error = ProgrammingError("SELEC 1", {}, MagicMock(sqlstate="42601"))
+
+    # Checks whether the errors were not classified as transient
+    assert not is_transient_db_error(_get_wrapped_error(syntax_error))
+    assert not is_transient_db_error(InternalServerError())
+    assert not is_transient_db_error(ValueError())
+
+
+def test_is_transient_redis_error():
+    """
+    Tests the is_transient_redis_error function for completion. The is_transient_redis_error
+    function should classify connection errors, timeouts and failovers as transient
+    """
+
+    # Checks whether the errors were classified as transient
+    assert is_transient_redis_error(_get_wrapped_error(redis_exceptions.ConnectionError()))
+    assert is_transient_redis_error(_get_wrapped_error(redis_exceptions.TimeoutError()))
+    assert is_transient_redis_error(_get_wrapped_error(redis_exceptions.ReadOnlyError()))
+    assert is_transient_redis_error(_get_wrapped_error(redis_exceptions.WatchError()))
+
+
+def test_is_transient_redis_error_permanent():
+    """
+    Tests the is_transient_redis_error function when the error is permanent. The
+    is_transient_redis_error function should not classify the errors as transient
+    """
+
+    # Checks whether the errors were not classified as transient
+    assert not is_transient_redis_error(_get_wrapped_error(redis_exceptions.ResponseError()))
+    assert not is_transient_redis_error(redis_exceptions.AuthenticationError())
+    assert not is_transient_redis_error(InternalServerError())
+
+
+async def test_retry_policy(mocker):
+    """
+    Tests the retry_policy function for completion. The retry_policy function
+    should retry transient errors until the operation succeeds
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the sleep between retries
+    mocker.patch("asyncio.sleep", AsyncMock())
+
+    # Mocks an operation that fails with a transient error before succeeding
+    operation_mock = AsyncMock(side_effect=[ConnectionResetError(), "result"])
+    retried_operation = retry_policy(is_transient_db_error, attempts=3)(operation_mock)
+
+    # Checks whether the operation was retried until it succeeded
+    assert await retried_operation() == "result"
+    assert operation_mock.await_count == 2
+
+
+async def test_retry_policy_budget_exhausted(mocker):
+    """
+    Tests the retry_policy function when the request retry budget is exhausted.
+    The retry_policy function should stop retrying and raise the last error
+
+    :param mocker: Fixture to mock specific functions for testing
+    """
+
+    # Mocks and overrides the sleep between retries
+    mocker.patch("asyncio.sleep", AsyncMock())
+
+    # Mocks and overrides the fast-api-context with a retry budget of one retry
+    fast_api_context = FastApiContext()
+    fast_api_context.retry_budget_var = RetryBudget(retries=1)
+    mocker.patch.object(retry, "get_fast_api_context", return_value=fast_api_context)
+
+    # Mocks an operation that always fails with a transient error
+    operation_mock = AsyncMock(side_effect=ConnectionResetError())
+    retried_operation = retry_policy(is_transient_db_error, attempts=5)(operation_mock)
+
+    # Checks whether the operation stopped retrying once the budget was exhausted
+    with raises(ConnectionResetError):
+        await retried_operation()
+    assert operation_mock.await_count == 2
+
+
+async def test_retry_policy_permanent_error():
+    """
+    Tests the retry_policy function when the operation raises a permanent error.
+    The retry_policy function should raise the error without retrying
+    """
+
+    # Mocks an operation that fails with a permanent error
+    operation_mock = AsyncMock(side_effect=InternalServerError())
+    retried_operation = retry_policy(is_transient_db_error, attempts=3)(operation_mock)
+
+    # Checks whether the error was raised without retrying
+    with raises(InternalServerError):
+        await retried_operation()
+    assert operation_mock.await_count == 1
+
+
+async def test_retry_policy_suspended():
+    """
+    Tests the retry_policy function when retries are suspended. The retry_policy
+    function should raise the transient error without retrying
+    """
+
+    # Mocks an operation that fails with a transient error while retries are suspended
+    operation_mock = AsyncMock(side_effect=ConnectionResetError())
+    retried_operation = retry_policy(is_transient_db_error, 3, lambda _: True)(operation_mock)
+
+    # Checks whether the error was raised without retrying
+    with raises(ConnectionResetError):
+        await retried_operation()
+    assert operation_mock.await_count == 1
@@ -3,6 +3,8 @@ from {{cookiecutter.package_name}}.exceptions import (
     ForbiddenError,
     InternalServerError,
     NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     UnauthenticatedError,
     ValidationError,
 )
@@ -68,6 +70,33 @@ def test_not_found_error():
     assert internal_server_error.detail == error_message
 
 
+def test_service_unavailable_error():
+    """
+    Tests the ServiceUnavailableError class for completion. The ServiceUnavailableError
+    class should instantiate without any errors
+    """
+
+    # Creates the test error message
+    error_message = "Test service-unavailable-error message"
+
+    # Checks whether the service-unavailable-error class was instantiated correctly
+    service_unavailable_error = ServiceUnavailableError(error_message)
+    assert service_unavailable_error.status_code == 503
+    assert service_unavailable_error.detail == error_message
+
+
+def test_too_many_requests_error():
+    """
+    Tests the TooManyRequestsError class for completion. The TooManyRequestsError class
+    should instantiate with the retry-after header without any errors
+    """
+
+    # Checks whether the too-many-requests-error class was instantiated correctly
+    too_many_requests_error = TooManyRequestsError(5)
+    assert too_many_requests_error.status_code == 429
+    assert too_many_requests_error.headers == {"retry-after": "5"}
+
+
 def test_unauthenticated_error():
     """
     Tests the UnauthenticatedError class for completion. The UnauthenticatedError class
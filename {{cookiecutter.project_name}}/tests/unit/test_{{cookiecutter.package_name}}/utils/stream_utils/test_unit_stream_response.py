@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Mapped, mapped_column
+
+from {{cookiecutter.package_name}}.core.database.tables import BaseTable
+from {{cookiecutter.package_name}}.utils.stream_utils import stream_csv_response, stream_ndjson_response
+
+
+class StreamTable(BaseTable):
+    """
+    Table used to test streaming rows
+    """
+
+    __tablename__ = "test_stream_table"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+class StreamModel(BaseModel):
+    """
+    Model used to test streaming rows
+    """
+
+    id: int
+    created_on: datetime
+
+
+async def _get_partitions(*partitions: Sequence[Any]) -> AsyncIterator[Sequence[Any]]:
+    """
+    Function that yields the given partitions
+    the same way stream_rows does
+
+    :param partitions: The partitions of rows to yield
+
+    :return: An async iterator over the partitions
+    """
+    for partition in partitions:
+        yield partition
+
+
+async def _get_body(partitions: AsyncIterator[bytes]) -> List[bytes]:
+    """
+    Function that reads each chunk of a streaming response body
+
+    :param partitions: The body iterator of the streaming response
+
+    :return: The chunks of the streaming response body
+    """
+    return [chunk async for chunk in partitions]
+
+
+async def test_stream_csv_response():
+    """
+    Tests the stream_csv_response function for completion. The stream_csv_response function
+    should stream each partition as a csv chunk with the header written once
+    """
+
+    # Streams two partitions of ORM table rows
+    response = stream_csv_response(
+        _get_partitions([StreamTable(id=1, name="one")], [StreamTable(id=2, name="two")]),
+        filename="rows.csv",
+    )
+
+    # Checks whether each partition was streamed as a csv chunk
+    chunks = await _get_body(response.body_iterator)
+    assert chunks == [b"id,name\r\n1,one\r\n", b"2,two\r\n"]
+    assert response.media_type == "text/csv"
+    assert response.headers["content-disposition"] == 'attachment; filename="rows.csv"'
+
+
+async def test_stream_csv_response_columns():
+    """
+    Tests the stream_csv_response function when columns are given. The stream_csv_response
+    function should only write the given columns in their given order
+    """
+
+    # Streams a partition of dictionary rows with the given columns
+    response = stream_csv_response(
+        _get_partitions([{"id": 1, "name": "one", "ignored": True}]), columns=["name", "id"]
+    )
+
+    # Checks whether only the given columns were written
+    chunks = await _get_body(response.body_iterator)
+    assert chunks == [b"name,id\r\none,1\r\n"]
+
+
+async def test_stream_ndjson_response():
+    """
+    Tests the stream_ndjson_response function for completion. The stream_ndjson_response
+    function should stream each partition as a newline delimited json chunk
+    """
+
+    # Streams partitions of pydantic model and scalar rows
+    created_on = datetime(2024, 1, 1)
+    response = stream_ndjson_response(
+        _get_partitions([StreamModel(id=1, created_on=created_on)], ["value"])
+    )
+
+    # Checks whether each partition was streamed as a newline delimited json chunk
+    chunks = await _get_body(response.body_iterator)
+    assert chunks == [b'{"id": 1, "created_on": "2024-01-01T00:00:00"}\n', b'{"value": "value"}\n']
+    assert response.media_type == "application/x-ndjson"
+    assert "content-disposition" not in response.headers
+
+
+async def test_stream_ndjson_response_serialize():
+    """
+    Tests the stream_ndjson_response function when a serializer is given. The
+    stream_ndjson_response function should serialize each row with the serializer
+    """
+
+    # Streams a partition of ORM table rows with a serializer
+    response = stream_ndjson_response(
+        _get_partitions([StreamTable(id=1, name="one")]), serialize=lambda row: {"n": row.name}
+    )
+
+    # Checks whether the rows were serialized with the serializer
+    chunks = await _get_body(response.body_iterator)
+    assert chunks == [b'{"n": "one"}\n']
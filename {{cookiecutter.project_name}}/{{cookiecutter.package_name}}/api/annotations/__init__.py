@@ -1 +1,8 @@
-from .annotations import DepDatabaseManager, DepRedisManager, DepRequestMetadata
+from .annotations import (
+    DepDatabase,
+    DepDatabaseManager,
+    DepDatabaseRegistry,
+    DepRedisCache,
+    DepRedisManager,
+    DepRequestMetadata,
+)
@@ -1,14 +1,33 @@
-from typing import Annotated, Tuple
+from typing import Annotated, Any, Tuple
 
 from fastapi import Depends
 
-from {{cookiecutter.package_name}}.api.dependencies.cache import get_redis_manager
-from {{cookiecutter.package_name}}.api.dependencies.database import get_db_manager
+from {{cookiecutter.package_name}}.api.dependencies.cache import get_redis_cache, get_redis_manager
+from {{cookiecutter.package_name}}.api.dependencies.database import (
+    get_db_manager,
+    get_db_registry,
+    get_named_db_manager,
+)
 from {{cookiecutter.package_name}}.api.dependencies.middleware import get_request_metadata
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
-from {{cookiecutter.package_name}}.core.database import DatabaseManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+from {{cookiecutter.package_name}}.core.database import DatabaseManager, DatabaseRegistry
 
 # Annotates all dependencies used in routes
 DepDatabaseManager = Annotated[DatabaseManager, Depends(get_db_manager)]
+DepDatabaseRegistry = Annotated[DatabaseRegistry, Depends(get_db_registry)]
+DepRedisCache = Annotated[TieredCache, Depends(get_redis_cache)]
 DepRedisManager = Annotated[RedisManager, Depends(get_redis_manager)]
 DepRequestMetadata = Annotated[Tuple[str, str, str], Depends(get_request_metadata)]
+
+
+def DepDatabase(name: str) -> Any:
+    """
+    Function that annotates the dependency of a
+    named database from the database registry
+
+    :param name: The name of the database in the database registry
+
+    :return: The annotated named database manager dependency
+    """
+    return Annotated[DatabaseManager, Depends(get_named_db_manager(name))]
@@ -1 +1 @@
-from .dep_redis import get_redis_manager
+from .dep_redis import get_redis_cache, get_redis_manager
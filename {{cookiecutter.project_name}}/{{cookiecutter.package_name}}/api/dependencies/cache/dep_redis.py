@@ -1,6 +1,21 @@
 from fastapi import Request
 
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+
+
+def get_redis_cache(request: Request) -> TieredCache:
+    """
+    Dependency function that gets the tiered cache
+    instance with an in-process cache in front of redis
+
+    :param request: The incoming http request sent from a client
+
+    :return: The tiered cache instance
+    """
+
+    # Returns the tiered cache instance
+    return request.app.state.redis_cache
 
 
 def get_redis_manager(request: Request) -> RedisManager:
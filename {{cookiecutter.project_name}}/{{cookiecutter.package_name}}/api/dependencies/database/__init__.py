@@ -1 +1 @@
-from .dep_database import get_db_manager
+from .dep_database import get_db_manager, get_db_registry, get_named_db_manager
@@ -1,6 +1,8 @@
+from typing import Callable
+
 from fastapi import Request
 
-from {{cookiecutter.package_name}}.core.database import DatabaseManager
+from {{cookiecutter.package_name}}.core.database import DatabaseManager, DatabaseRegistry
 
 
 def get_db_manager(request: Request) -> DatabaseManager:
@@ -15,3 +17,43 @@ def get_db_manager(request: Request) -> DatabaseManager:
 
     # Returns the database manager instance
     return request.app.state.db_manager
+
+
+def get_db_registry(request: Request) -> DatabaseRegistry:
+    """
+    Dependency function that gets the
+    database registry instance
+
+    :param request: The incoming http request sent from a client
+
+    :return: The database registry instance
+    """
+
+    # Returns the database registry instance
+    return request.app.state.db_registry
+
+
+def get_named_db_manager(name: str) -> Callable[[Request], DatabaseManager]:
+    """
+    Function that creates a dependency function that gets
+    a database manager instance from the database registry
+
+    :param name: The name of the database in the database registry
+
+    :return: The dependency function that gets the named database manager instance
+    """
+
+    # Creates the dependency function
+    def get_db_manager_by_name(request: Request) -> DatabaseManager:
+        """
+        Dependency function that gets the named
+        database manager instance
+
+        :param request: The incoming http request sent from a client
+
+        :return: The named database manager instance
+        """
+        return get_db_registry(request).get(name)
+
+    # Returns the dependency function
+    return get_db_manager_by_name
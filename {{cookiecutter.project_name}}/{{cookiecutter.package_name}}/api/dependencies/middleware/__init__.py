@@ -1,4 +1,5 @@
 from .dep_middleware import (
+    get_client_key,
     get_request_metadata,
     get_response_size,
     set_correlation_id,
@@ -1,11 +1,46 @@
+from hmac import compare_digest
+from typing import Iterable
 from uuid import uuid4
 
 from fastapi import Request, Response
+from pydantic import SecretStr
 
 from {{cookiecutter.package_name}}.api.resources.rsrc_middleware import RequestMetadataModel
 from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext
 
 
+def get_client_key(request: Request, header: str, api_keys: Iterable[SecretStr]) -> str:
+    """
+    Dependency function that gets the key identifying the client of the request used to rate
+    limit its requests. The client is identified by the user authenticated by an authentication
+    middleware, then by the api key of the header only when it is a known api key, and otherwise
+    by its address, so a client cannot get a fresh rate limit by changing an unverified header
+
+    :param request: The incoming http request sent from a client
+    :param header: The header identifying the client (exp. "x-api-key")
+    :param api_keys: The api keys trusted to identify a client through the header
+
+    :return: The client key
+    """
+
+    # Gets the client key from the authenticated user when one exists
+    if "user" in request.scope and request.user.is_authenticated:
+        return f"user:{request.user.display_name}"
+
+    # Gets the client key from the header when it holds a known api key, comparing
+    # the header against every known api key in constant time
+    api_key = request.headers.get(header, "")
+    is_known = [
+        compare_digest(api_key.encode(), key.get_secret_value().encode()) for key in api_keys
+    ]
+    if api_key and any(is_known):
+        return f"key:{api_key}"
+
+    # Gets the client key from the address of the client
+    host = request.client.host if request.client is not None else "unknown"
+    return f"host:{host}"
+
+
 def get_response_size(response: Response) -> int:
     """
     Dependency function that gets the
@@ -1,8 +1,51 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class DependencyHealthModel(BaseModel):
+    """
+    Model for describing the properties of a response that determines
+    the health of a dependency of the {{cookiecutter.friendly_name}} worker
+    """
+
+    # Config that makes all attributes immutable
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., title="Name", description="The name of the dependency", alias="name")
+
+    state: str = Field(
+        ...,
+        title="State",
+        description="The state of the dependency circuit breaker (closed, half_open, or open)",
+        alias="state",
+    )
+
+
+class DependenciesHealthModel(BaseModel):
+    """
+    Model for describing the properties of a response that determines
+    the health of the dependencies of the {{cookiecutter.friendly_name}} worker
+    """
+
+    # Config that makes all attributes immutable
+    model_config = ConfigDict(frozen=True)
+
+    status: str = Field(
+        ...,
+        title="Status",
+        description="Whether every dependency is healthy or the worker is degraded",
+        alias="status",
+    )
+
+    dependencies: List[DependencyHealthModel] = Field(
+        ...,
+        title="Dependencies",
+        description="The health of each {{cookiecutter.friendly_name}} worker dependency",
+        alias="dependencies",
+    )
+
+
 class HealthModel(BaseModel):
     """
     Model for describing the properties of a response that
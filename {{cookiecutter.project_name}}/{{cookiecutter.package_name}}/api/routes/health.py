@@ -1,6 +1,12 @@
-from fastapi import APIRouter
-
-from {{cookiecutter.package_name}}.api.resources.rsrc_health import HealthModel, SettingsModel
+from fastapi import APIRouter, Response, status
+
+from {{cookiecutter.package_name}}.api.resources.rsrc_health import (
+    DependenciesHealthModel,
+    DependencyHealthModel,
+    HealthModel,
+    SettingsModel,
+)
+from {{cookiecutter.package_name}}.core.resilience import CircuitState, get_circuit_breakers
 from {{cookiecutter.package_name}}.core.settings import settings
 
 # Creates the sub API router instance
@@ -17,6 +23,32 @@ async def get_health_check_endpoint() -> HealthModel:
     return HealthModel(status="healthy", version=settings.PROJECT_VERSION)
 
 
+@router.get("/dependencies", response_model=DependenciesHealthModel)
+async def get_health_dependencies_endpoint(response: Response) -> DependenciesHealthModel:
+    """
+    Endpoint that checks the health of the {{cookiecutter.friendly_name}} server dependencies. The
+    response status is 503 while the circuit breaker of any dependency is not closed
+    """
+
+    # Gets the state of each dependency circuit breaker
+    dependencies = [
+        DependencyHealthModel(name=circuit_breaker.name, state=circuit_breaker.state.name.lower())
+        for circuit_breaker in get_circuit_breakers()
+    ]
+
+    # Sets the status to degraded when any dependency is unavailable
+    is_healthy = all(
+        dependency.state == CircuitState.CLOSED.name.lower() for dependency in dependencies
+    )
+    if not is_healthy:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    # Returns the {{cookiecutter.friendly_name}} server dependencies health to the client
+    return DependenciesHealthModel(
+        status="healthy" if is_healthy else "degraded", dependencies=dependencies
+    )
+
+
 @router.get("/settings", response_model=SettingsModel)
 async def get_health_settings_endpoint() -> SettingsModel:
     """
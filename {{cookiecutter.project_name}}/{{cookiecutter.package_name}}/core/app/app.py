@@ -4,18 +4,28 @@ from typing import Any, Callable, Type, cast
 
 from fastapi import FastAPI, Request, Response
 from prometheus_fastapi_instrumentator import Instrumentator
+from starlette.background import BackgroundTask, BackgroundTasks
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 
 from {{cookiecutter.package_name}}.api.dependencies.middleware import (
+    get_client_key,
     get_request_metadata,
     get_response_size,
     set_correlation_id,
     set_response_headers,
 )
-from {{cookiecutter.package_name}}.core.cache.fast_api_context import FastApiContext, get_fast_api_context
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import (
+    EntityCache,
+    FastApiContext,
+    RetryBudget,
+    get_fast_api_context,
+)
+from {{cookiecutter.package_name}}.core.cache.local_cache import LocalCache
+from {{cookiecutter.package_name}}.core.cache.rate_limiter import RateLimiter, get_rate_limit_rule
 from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
-from {{cookiecutter.package_name}}.core.database import DatabaseManager
+from {{cookiecutter.package_name}}.core.cache.tiered_cache import TieredCache
+from {{cookiecutter.package_name}}.core.database import DatabaseManager, DatabaseRegistry, QueryCache
 from {{cookiecutter.package_name}}.core.open_api import get_open_api_instance
 from {{cookiecutter.package_name}}.core.settings import settings
 from {{cookiecutter.package_name}}.services.logger import get_api_logger
@@ -85,17 +95,29 @@ async def setup_app_state(app: FastAPI):
     fast_api_context = get_fast_api_context()
     app.state.fast_api_context = fast_api_context
 
+    # Adds the database registry instance into the app state
+    db_registry = DatabaseRegistry()
+    app.state.db_registry = db_registry
+
     # Adds the database manager instance into the app state when it is enabled
     if settings.IS_API_DB_ENABLED:
         db_manager = DatabaseManager(
             settings.API_DB_DISPLAY_NAME,
             settings.API_DB_DESCRIPTION,
             settings.API_DB_CONN_URI,
+            settings.API_DB_REPLICA_CONN_URIS,
+            settings.API_DB_TYPE == "cloud",
         )
+        db_registry.add(settings.API_DB_NAME, db_manager)
         app.state.db_manager = db_manager
 
-        # Connects to the database
-        await db_manager.connection.connect()
+    # Adds the additional named database manager instances into the database registry, which
+    # always connect natively since only the primary database is served by the Cloud SQL instance
+    for name, db_uri in settings.API_DB_NAMED_CONN_URIS.items():
+        db_registry.add(name, DatabaseManager(name, f"The {name} database", db_uri))
+
+    # Concurrently connects to every database and their read replicas
+    await db_registry.connect()
 
     # Adds the redis instance into the app state when it is enabled
     if settings.IS_API_REDIS_ENABLED:
@@ -111,6 +133,51 @@ async def setup_app_state(app: FastAPI):
         # Connects to the redis instance
         redis_manager.connect()
 
+        # Adds the in-process cache in front of the redis instance when it is enabled
+        if settings.IS_API_REDIS_LOCAL_CACHE_ENABLED:
+            local_cache = LocalCache(
+                settings.API_REDIS_DISPLAY_NAME,
+                settings.API_REDIS_LOCAL_CACHE_MAX_BYTES,
+                settings.API_REDIS_LOCAL_CACHE_TTL_SECONDS,
+            )
+            redis_cache = TieredCache(
+                redis_manager, local_cache, settings.API_REDIS_INVALIDATION_CHANNEL
+            )
+            app.state.redis_cache = redis_cache
+            await redis_cache.start()
+
+        # Adds the rate limiter of the client requests into the app state when it is enabled
+        if settings.IS_API_RATE_LIMIT_ENABLED:
+            lease_cache = LocalCache(
+                "rate-limit",
+                settings.API_RATE_LIMIT_LEASE_MAX_BYTES,
+                settings.API_RATE_LIMIT_LEASE_SECONDS,
+            )
+
+            # Exempts the health and metrics routes polled by the infrastructure
+            route_rules = {
+                f"{settings.API_PREFIX}/v1/health": None,
+                f"{settings.API_PREFIX}/metrics": None,
+                **{
+                    route: get_rate_limit_rule(spec)
+                    for route, spec in settings.API_RATE_LIMIT_ROUTES.items()
+                },
+            }
+            app.state.rate_limiter = RateLimiter(
+                redis_manager,
+                get_rate_limit_rule(settings.API_RATE_LIMIT_DEFAULT),
+                route_rules,
+                lease_cache,
+                settings.API_RATE_LIMIT_LEASE_RATIO,
+            )
+
+        # Caches the query results of every database in the redis instance when it is enabled
+        if settings.IS_API_QUERY_CACHE_ENABLED:
+            for name in db_registry.names:
+                db_manager = db_registry.get(name)
+                dialect = db_manager.connection.engine.dialect
+                db_manager.row_operations.query_cache = QueryCache(redis_manager, name, dialect)
+
 
 async def deconstruct_app_state(app: FastAPI):
     """
@@ -124,10 +191,14 @@ async def deconstruct_app_state(app: FastAPI):
     fast_api_context: FastApiContext = app.state.fast_api_context
     fast_api_context.reset()
 
-    # Disconnects the database connection pool when it is enabled
-    if settings.IS_API_DB_ENABLED:
-        db_manager: DatabaseManager = app.state.db_manager
-        await db_manager.connection.disconnect()
+    # Concurrently disconnects the connection pool of every database
+    db_registry: DatabaseRegistry = app.state.db_registry
+    await db_registry.disconnect()
+
+    # Stops listening for the in-process cache invalidations when it is enabled
+    if settings.IS_API_REDIS_ENABLED and settings.IS_API_REDIS_LOCAL_CACHE_ENABLED:
+        redis_cache: TieredCache = app.state.redis_cache
+        await redis_cache.stop()
 
     # Disconnects the redis instance when it is enabled
     if settings.IS_API_REDIS_ENABLED:
@@ -159,6 +230,15 @@ async def handle_request(app: FastAPI, request: Request, call_next: Callable) ->
     # Sets the request URL for blocking certain requests from being logged
     fast_api_context.request_url_var = request_metadata.url
 
+    # Sets the budget limiting how many times the request operations can be retried
+    fast_api_context.retry_budget_var = RetryBudget(settings.API_RETRY_BUDGET)
+
+    # Sets the cache of the table rows loaded by primary key during the request
+    fast_api_context.entity_cache_var = EntityCache()
+
+    # Sets the row operations whose reads are pinned to the primary database by a write
+    fast_api_context.primary_pins_var = set()
+
     # Logs that the request has started
     start_extra = {
         "method": request_metadata.method,
@@ -167,6 +247,14 @@ async def handle_request(app: FastAPI, request: Request, call_next: Callable) ->
     }
     logger.info("Starting Request", extra=start_extra)
 
+    # Sheds the request before it is handled when the client exceeded the rate limit of the route
+    if settings.IS_API_REDIS_ENABLED and settings.IS_API_RATE_LIMIT_ENABLED:
+        rate_limiter: RateLimiter = app.state.rate_limiter
+        client_key = get_client_key(
+            request, settings.API_RATE_LIMIT_CLIENT_HEADER, settings.API_RATE_LIMIT_CLIENT_KEYS
+        )
+        await rate_limiter.hit(request.url.path, client_key)
+
     # Handles the request and gets the response
     start_time = time()
     response: Response = await call_next(request)
@@ -188,8 +276,14 @@ async def handle_request(app: FastAPI, request: Request, call_next: Callable) ->
     }
     logger.info("Finished Request", extra=finish_extra)
 
+    # Resets the context variables once the response body is sent, since a streamed body is only
+    # produced after the response is returned from the middleware, after any endpoint task
+    background_tasks = [response.background] if response.background is not None else []
+    response.background = BackgroundTasks(
+        [*background_tasks, BackgroundTask(fast_api_context.reset)]
+    )
+
     # Returns the response
-    fast_api_context.reset()
     return response
 
 
@@ -12,6 +12,8 @@ from {{cookiecutter.package_name}}.exceptions import (
     ForbiddenError,
     InternalServerError,
     NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     UnauthenticatedError,
     ValidationError,
 )
@@ -117,6 +119,26 @@ class {{cookiecutter.class_name}}Base(BaseApplication, ABC):
         logger.error(message)
         return JSONResponse(status_code=exc.status_code, content={"message": message})
 
+    @staticmethod
+    @_app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_error_handler(_, exc: ServiceUnavailableError) -> JSONResponse:
+
+        # Sends the service-unavailable-error response
+        message = f"Service Unavailable Error: {exc.detail}"
+        logger.error(message)
+        return JSONResponse(status_code=exc.status_code, content={"message": message})
+
+    @staticmethod
+    @_app.exception_handler(TooManyRequestsError)
+    async def too_many_requests_error_handler(_, exc: TooManyRequestsError) -> JSONResponse:
+
+        # Sends the too-many-requests-error response
+        message = f"Too Many Requests Error: {exc.detail}"
+        logger.warning(message)
+        return JSONResponse(
+            status_code=exc.status_code, content={"message": message}, headers=exc.headers
+        )
+
     @staticmethod
     @_app.exception_handler(UnauthenticatedError)
     async def unauthenticated_error_handler(_, exc: UnauthenticatedError) -> JSONResponse:
@@ -0,0 +1,198 @@
+from asyncio import CancelledError, Task, ensure_future, sleep
+from typing import Any, List, Sequence
+
+from redis.asyncio.client import Redis
+from redis.asyncio.connection import AbstractConnection
+
+from {{cookiecutter.package_name}}.core.settings import settings
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+from .local_cache import LocalCache
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.client_cache")
+
+# The channel that redis publishes the invalidated keys of tracked prefixes to
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+
+class ClientCache:
+    def __init__(self, operation: Redis, local_cache: LocalCache, prefixes: Sequence[str]):
+        """
+        Class that caches redis reads in the memory of the current worker using server-assisted
+        client-side caching. Key tracking is enabled in broadcasting mode for the given prefixes
+        and redirected to a connection subscribed to the invalidation channel, so redis itself
+        reports every change to a tracked key. Values are only cached while the invalidations are
+        being received, and the cache is cleared whenever tracking is lost or established again
+
+        :param operation: The redis instance whose connection pool creates the tracking connections
+        :param local_cache: The in-process cache holding the tracked values
+        :param prefixes: The key prefixes to track, an empty sequence tracks every key
+        """
+
+        # Creates the given fields
+        self._operation = operation
+        self._local_cache = local_cache
+        self._prefixes = tuple(prefixes)
+
+        # Initializes the class-created variables
+        self._generation = 0
+        self._is_tracking = False
+        self._listener: Task | None = None
+
+    @property
+    def generation(self) -> int:
+        """
+        Property that gets the number of invalidations received. Values read from redis
+        are only cached when the generation did not change while they were being read
+
+        :return: The invalidation generation
+        """
+        return self._generation
+
+    @property
+    def is_tracking(self) -> bool:
+        """
+        Property that gets whether redis is
+        currently reporting invalidations
+
+        :return: Whether the keys are being tracked
+        """
+        return self._is_tracking
+
+    def start(self):
+        """
+        Function that starts tracking the keys
+        and listening for their invalidations
+        """
+        if self._listener is None:
+            self._listener = ensure_future(self._listen())
+
+    async def stop(self):
+        """
+        Function that stops tracking the keys
+        and listening for their invalidations
+        """
+
+        # Cancels the listener and waits for it to finish
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except CancelledError:
+            pass
+        self._listener = None
+
+    def get(self, key: str) -> Any | None:
+        """
+        Function that gets a value
+        from the in-process cache
+
+        :param key: The key of the value
+
+        :return: The cached value or None when it is not cached
+        """
+        return self._local_cache.get(key)
+
+    def set(self, key: str, value: Any, generation: int):
+        """
+        Function that caches a value read from redis. The value is only cached when its key is
+        tracked, tracking is active, and no invalidation arrived since the value was read
+
+        :param key: The key of the value
+        :param value: The value read from redis
+        :param generation: The invalidation generation from before the value was read
+        """
+
+        # Checks whether the value can be cached without becoming stale
+        if value is None or not self._is_tracking or generation != self._generation:
+            return
+        if self._prefixes and not key.startswith(self._prefixes):
+            return
+
+        # Caches the value
+        self._local_cache.set(key, value)
+
+    def _invalidate(self, keys: List[str | bytes] | None):
+        """
+        Function that removes the invalidated keys from the in-process
+        cache. Redis sends no keys when the database is flushed
+
+        :param keys: The invalidated keys or None when every key was invalidated
+        """
+        self._generation = self._generation + 1
+        if keys is None:
+            self._local_cache.clear()
+        else:
+            self._local_cache.delete(
+                key.decode() if isinstance(key, bytes) else key for key in keys
+            )
+
+    async def _track(self, listener: AbstractConnection, tracker: AbstractConnection):
+        """
+        Function that subscribes the listener connection to the invalidation channel and enables
+        key tracking on the tracker connection with its invalidations redirected to the listener
+
+        :param listener: The connection that receives the invalidations
+        :param tracker: The connection that keeps key tracking enabled
+        """
+
+        # Subscribes the listener connection to the invalidation channel
+        await listener.send_command("CLIENT", "ID")
+        client_id = await listener.read_response()
+        await listener.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await listener.read_response()
+
+        # Enables key tracking in broadcasting mode for the prefixes
+        prefixes = [argument for prefix in self._prefixes for argument in ("PREFIX", prefix)]
+        await tracker.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefixes
+        )
+        await tracker.read_response()
+
+        # Starts caching values from a clean in-process cache
+        self._invalidate(None)
+        self._is_tracking = True
+
+    async def _listen(self):
+        """
+        Function that tracks the keys and handles their invalidations until it is cancelled. The
+        tracker connection is pinged whenever no invalidation arrives so that losing it is
+        detected. When tracking is lost the in-process cache is cleared and tracking is enabled
+        again after a backoff
+        """
+        while True:
+            # Creates dedicated connections that are never returned to the connection pool
+            connection_pool = self._operation.connection_pool
+            listener = connection_pool.make_connection()
+            tracker = connection_pool.make_connection()
+
+            # Attempts to track the keys and handle their invalidations
+            try:
+                await listener.connect()
+                await tracker.connect()
+                await self._track(listener, tracker)
+                while True:
+                    response = await listener.read_response(
+                        timeout=settings.API_REDIS_CLIENT_CACHE_PING_SECONDS
+                    )
+                    if response is None:
+                        await tracker.send_command("PING")
+                        await tracker.read_response()
+                    elif response[0] in ("message", b"message"):
+                        self._invalidate(response[2])
+            except CancelledError:
+                raise
+            except Exception as exc:
+                message = "The redis client cache tracking was lost"
+                logger.warning(message)
+                logger.debug(message, exc_info=exc)
+            finally:
+                self._is_tracking = False
+                self._invalidate(None)
+                await listener.disconnect()
+                await tracker.disconnect()
+
+            # Waits before enabling tracking again
+            await sleep(settings.API_RETRY_MAX_BACKOFF_SECONDS)
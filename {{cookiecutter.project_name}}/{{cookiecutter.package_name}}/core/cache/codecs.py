@@ -0,0 +1,267 @@
+import json
+import pickle
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Imports orjson when the optional dependency is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imports msgpack when the optional dependency is installed
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Imports lz4 when the optional dependency is installed
+try:
+    import lz4.frame as lz4
+except ImportError:
+    lz4 = None
+
+# Imports zstd from the standard library when it is available
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.codecs")
+
+# Codec type-hinting
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# The header byte that marks how an encoded payload was compressed
+_HEADER_RAW = b"\x00"
+_HEADER_ZSTD = b"\x01"
+_HEADER_LZ4 = b"\x02"
+
+
+class Codec:
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: str | None = None,
+        compression_threshold_bytes: int = 1024,
+    ):
+        """
+        Class that serializes values stored in redis and compresses payloads larger than the
+        compression threshold. Every payload starts with a header byte recording whether and how
+        it was compressed, so payloads below the threshold are stored without being compressed.
+        An InternalServerError is raised when the optional package of the serializer or the
+        compression is not installed
+
+        :param serializer: The serializer of the values: [json|orjson|msgpack|pickle]
+        :param compression: The compression of large payloads: [zstd|lz4] or None to not compress
+        :param compression_threshold_bytes: The minimum payload size to compress
+        """
+
+        # Creates the given fields
+        self._serializer = serializer
+        self._compression = compression
+        self._compression_threshold_bytes = compression_threshold_bytes
+
+        # Initializes the class-created variables
+        self._dumps, self._loads = self._get_serializer(serializer)
+        self._compress, self._header = self._get_compressor(compression)
+
+    @property
+    def serializer(self) -> str:
+        """
+        Property that gets the name of
+        the serializer of the values
+
+        :return: The serializer name
+        """
+        return self._serializer
+
+    @property
+    def compression(self) -> str | None:
+        """
+        Property that gets the name of the
+        compression of large payloads
+
+        :return: The compression name or None when payloads are not compressed
+        """
+        return self._compression
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Function that serializes a value and compresses
+        it when it is larger than the compression threshold
+
+        :param value: The value to encode
+
+        :return: The encoded payload
+        """
+        return self._pack(self._dumps(value))
+
+    def decode(self, payload: bytes) -> Any:
+        """
+        Function that decompresses and deserializes a payload
+
+        :param payload: The encoded payload
+
+        :return: The decoded value
+        """
+        return self._loads(self._unpack(payload))
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        """
+        Function that encodes a pydantic model. Json serializers use the native json
+        serialization of pydantic while the other serializers encode the model fields
+
+        :param model: The pydantic model to encode
+
+        :return: The encoded payload
+        """
+        if self._serializer == "json":
+            return self._pack(model.model_dump_json().encode())
+        if self._serializer == "pickle":
+            return self.encode(model.model_dump())
+        return self.encode(model.model_dump(mode="json"))
+
+    def decode_model(self, payload: bytes, model: Type[ModelType]) -> ModelType:
+        """
+        Function that decodes a payload into a pydantic model
+
+        :param payload: The encoded payload
+        :param model: The pydantic model class to validate the payload with
+
+        :return: The decoded pydantic model
+        """
+        if self._serializer == "json":
+            return model.model_validate_json(self._unpack(payload))
+        return model.model_validate(self.decode(payload))
+
+    def _pack(self, data: bytes) -> bytes:
+        """
+        Function that compresses serialized data larger than the compression
+        threshold and prefixes it with the header byte of its compression
+
+        :param data: The serialized data
+
+        :return: The encoded payload
+        """
+        if self._compress is None or len(data) < self._compression_threshold_bytes:
+            return _HEADER_RAW + data
+        return self._header + self._compress(data)
+
+    @staticmethod
+    def _unpack(payload: bytes) -> bytes:
+        """
+        Function that decompresses an encoded payload using
+        the compression recorded in its header byte
+
+        :param payload: The encoded payload
+
+        :return: The serialized data
+        """
+
+        # Gets the compression header and the data of the payload
+        header, data = payload[:1], payload[1:]
+        if header == _HEADER_RAW:
+            return data
+
+        # Decompresses the data with the compression that compressed it
+        if header == _HEADER_ZSTD and zstd is not None:
+            return zstd.decompress(data)
+        if header == _HEADER_LZ4 and lz4 is not None:
+            return lz4.decompress(data)
+        logger.critical("The redis payload was compressed with an unavailable compression")
+        raise InternalServerError()
+
+    @staticmethod
+    def _get_serializer(serializer: str) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+        """
+        Function that gets the functions that serialize
+        and deserialize values with the given serializer
+
+        :param serializer: The name of the serializer
+
+        :return: The serialize and deserialize functions
+        """
+
+        # Gets the serializers that are always available
+        if serializer == "json":
+            return lambda value: json.dumps(value).encode(), json.loads
+        if serializer == "pickle":
+            return lambda value: pickle.dumps(value, protocol=5), pickle.loads
+
+        # Gets the serializers of the optional packages when they are installed
+        if serializer == "orjson" and orjson is not None:
+            return orjson.dumps, orjson.loads
+        if serializer == "msgpack" and msgpack is not None:
+            return msgpack.packb, msgpack.unpackb
+        message = f"The {serializer} redis serializer is unknown or its package is not installed"
+        logger.critical(message)
+        raise InternalServerError()
+
+    @staticmethod
+    def _get_compressor(compression: str | None) -> Tuple[Callable[[bytes], bytes] | None, bytes]:
+        """
+        Function that gets the function that compresses payloads
+        with the given compression and its header byte
+
+        :param compression: The name of the compression
+
+        :return: The compress function and the header byte of the compression
+        """
+
+        # Gets the compression of the available packages
+        if compression is None:
+            return None, _HEADER_RAW
+        if compression == "zstd" and zstd is not None:
+            return zstd.compress, _HEADER_ZSTD
+        if compression == "lz4" and lz4 is not None:
+            return lz4.compress, _HEADER_LZ4
+        message = f"The {compression} redis compression is unknown or its package is not installed"
+        logger.critical(message)
+        raise InternalServerError()
+
+
+class CodecRegistry:
+    def __init__(self, default_codec: Codec, namespace_codecs: Dict[str, Codec]):
+        """
+        Class that selects the codec of a redis key by its namespace, the part
+        of the key before the first colon, falling back to the default codec
+
+        :param default_codec: The codec of keys without a namespace codec
+        :param namespace_codecs: The codec of each key namespace
+        """
+
+        # Creates the given fields
+        self._default_codec = default_codec
+        self._namespace_codecs = namespace_codecs
+
+    def get_codec(self, key: str) -> Codec:
+        """
+        Function that gets the codec of a
+        redis key based on its namespace
+
+        :param key: The redis key
+
+        :return: The codec of the key
+        """
+        namespace = key.split(":", 1)[0]
+        return self._namespace_codecs.get(namespace, self._default_codec)
+
+
+def get_codec(spec: str, compression_threshold_bytes: int) -> Codec:
+    """
+    Function that creates a codec from its specification, the name of the serializer
+    optionally followed by a plus and the name of the compression (exp. "msgpack+zstd")
+
+    :param spec: The specification of the codec
+    :param compression_threshold_bytes: The minimum payload size to compress
+
+    :return: The codec instance
+    """
+    serializer, _, compression = spec.partition("+")
+    return Codec(serializer, compression or None, compression_threshold_bytes)
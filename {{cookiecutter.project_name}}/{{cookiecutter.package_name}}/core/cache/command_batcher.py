@@ -0,0 +1,149 @@
+from asyncio import Future, Task, TimerHandle, ensure_future, gather, get_running_loop
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from prometheus_client import Histogram
+from redis.client import Pipeline
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.command_batcher")
+
+# Command batch histograms exposed on the metrics endpoint
+REDIS_COMMAND_BATCH_SIZE = Histogram(
+    "redis_command_batch_size",
+    "The number of redis commands sent together in a single coalesced pipeline",
+    ["redis"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+
+class CommandBatcher:
+    def __init__(
+        self,
+        display_name: str,
+        pipeline: Callable[..., Awaitable[Any]],
+        window_seconds: float,
+        max_size: int,
+    ):
+        """
+        Class that coalesces the redis commands issued by concurrent coroutines. Commands are
+        collected until the batching window elapses or the batch is full and are then sent as a
+        single non-transactional pipeline, with each caller receiving the result of its own command.
+        Read-only commands are batched apart from the other commands so they can go to a replica
+
+        :param display_name: The name of the redis instance used to label the metrics
+        :param pipeline: The redis-manager pipeline function that executes the batches
+        :param window_seconds: The seconds to wait for more commands before sending a batch
+        :param max_size: The number of commands that sends a batch without waiting
+        """
+
+        # Creates the given fields
+        self._display_name = display_name
+        self._pipeline = pipeline
+        self._window_seconds = window_seconds
+        self._max_size = max_size
+
+        # Initializes the class-created variables
+        self._pending: Dict[bool, List[Tuple[Tuple[Any, ...], Future]]] = {False: [], True: []}
+        self._flush_handles: Dict[bool, TimerHandle | None] = {False: None, True: None}
+        self._flushes: Set[Task] = set()
+
+    async def execute(self, *args: Any, is_read_only: bool = False) -> Any:
+        """
+        Function that queues a redis command in the current batch
+        and waits for the batch to be sent
+
+        :param args: The redis command name followed by its arguments
+        :param is_read_only: Whether the command only reads and can be routed to a replica
+
+        :return: The result of the redis command
+        """
+
+        # Queues the command in the current batch of its route
+        loop = get_running_loop()
+        future = loop.create_future()
+        pending = self._pending[is_read_only]
+        pending.append((args, future))
+
+        # Sends the batch once it is full, otherwise once the batching window elapses
+        if len(pending) >= self._max_size:
+            self._send(is_read_only)
+        elif self._flush_handles[is_read_only] is None:
+            self._flush_handles[is_read_only] = loop.call_later(
+                self._window_seconds, self._send, is_read_only
+            )
+        return await future
+
+    async def flush(self):
+        """
+        Function that sends the current batches without waiting for
+        the batching window and waits for every sent batch to finish
+        """
+        self._send(False)
+        self._send(True)
+        await gather(*self._flushes, return_exceptions=True)
+
+    def _send(self, is_read_only: bool):
+        """
+        Function that starts sending the current
+        batch of commands of a route to redis
+
+        :param is_read_only: Whether the batch only holds read-only commands
+        """
+
+        # Cancels the batching window of the current batch
+        flush_handle = self._flush_handles[is_read_only]
+        if flush_handle is not None:
+            flush_handle.cancel()
+            self._flush_handles[is_read_only] = None
+
+        # Starts sending the current batch
+        commands, self._pending[is_read_only] = self._pending[is_read_only], []
+        if not commands:
+            return
+        flush = ensure_future(self._execute(commands, is_read_only))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _execute(self, commands: List[Tuple[Tuple[Any, ...], Future]], is_read_only: bool):
+        """
+        Function that sends a batch of commands as a single pipeline and resolves the future of
+        each command. A failing command only fails its own caller, while a failing pipeline
+        fails every caller in the batch
+
+        :param commands: The commands of the batch and the futures of their callers
+        :param is_read_only: Whether the batch only holds read-only commands
+        """
+
+        # Adds every command of the batch to the pipeline
+        def pipe_ops(pipe: Pipeline):
+            for args, _ in commands:
+                pipe.execute_command(*args)
+
+        # Attempts to send the batch to redis
+        REDIS_COMMAND_BATCH_SIZE.labels(self._display_name).observe(len(commands))
+        try:
+            results = await self._pipeline(
+                pipe_ops, is_transaction=False, raise_on_error=False, is_read_only=is_read_only
+            )
+        except Exception as exc:
+            for _, future in commands:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # Resolves the future of each command with its own result
+        for (args, future), result in zip(commands, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                message = "Redis batched command failed"
+                logger.critical(message, extra={"command": args[0]})
+                logger.debug(message, exc_info=result)
+                error = InternalServerError()
+                error.__cause__ = result
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -0,0 +1,114 @@
+from asyncio import Semaphore, timeout
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, AsyncIterator
+
+from redis.asyncio.connection import AbstractConnection, BlockingConnectionPool
+from redis.asyncio.sentinel import SentinelConnectionPool
+from redis.exceptions import ConnectionError
+
+from .pool_metrics import (
+    REDIS_POOL_IN_USE,
+    REDIS_POOL_MAX_CONNECTIONS,
+    instrument_pool,
+    observe_pool_checkout,
+)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    def __init__(self, display_name: str, **kwargs: Any):
+        """
+        Class that bounds the number of connections opened to a redis instance. Commands wait
+        for a free connection once the pool is full instead of opening new connections, and
+        give up with a ConnectionError when none is released before the pool timeout. The
+        pool usage and the checkout wait times are reported as prometheus metrics
+
+        :param display_name: The name of the redis instance used to label the metrics
+        :param kwargs: The arguments of the blocking connection pool and its connections
+        """
+        super().__init__(**kwargs)
+
+        # Creates the given fields
+        self._display_name = display_name
+
+        # Reports the connection pool usage
+        instrument_pool(self, display_name)
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        """
+        Function that checks out a connection from the pool, waiting until one is available,
+        and records how long the checkout waited and whether it timed out on the full pool
+
+        :return: The checked out connection
+        """
+
+        # Attempts to check out a connection from the connection pool
+        start_time = perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except Exception as exc:
+            is_timeout = isinstance(exc.__cause__, TimeoutError)
+            observe_pool_checkout(self._display_name, perf_counter() - start_time, is_timeout)
+            raise
+        observe_pool_checkout(self._display_name, perf_counter() - start_time)
+        return connection
+
+
+class InstrumentedSentinelConnectionPool(SentinelConnectionPool, InstrumentedConnectionPool):
+    """
+    Class that bounds the number of connections opened to the primary or the replicas discovered
+    through the sentinel nodes, in the same way as the instrumented connection pool. The pool
+    follows the primary and replicas through failovers
+    """
+
+
+class ClusterConnectionLimiter:
+    def __init__(self, display_name: str, max_connections: int, timeout_seconds: float):
+        """
+        Class that bounds the number of pipelines sent to a redis cluster at once. The cluster
+        client opens the connections of each node on its own and fails at once when a node has no
+        free connection, so pipelines wait for a free slot once the limit is reached instead, and
+        give up with a ConnectionError when none is released before the pool timeout. The slot
+        usage and the checkout wait times are reported as the connection pool metrics
+
+        :param display_name: The name of the redis instance used to label the metrics
+        :param max_connections: The maximum number of pipelines sent at once
+        :param timeout_seconds: The seconds to wait for a free slot
+        """
+
+        # Creates the given fields
+        self._display_name = display_name
+        self._timeout_seconds = timeout_seconds
+
+        # Initializes the class-created variables
+        self._semaphore = Semaphore(max_connections)
+        self._in_use = 0
+
+        # Reports the slot usage
+        REDIS_POOL_MAX_CONNECTIONS.labels(display_name).set(max_connections)
+        REDIS_POOL_IN_USE.labels(display_name).set_function(lambda: self._in_use)
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[None]:
+        """
+        Function that checks out a slot for the pipeline sent within the context, waiting
+        until one is available, and records how long the checkout waited
+        """
+
+        # Attempts to check out a slot before the pool timeout
+        start_time = perf_counter()
+        try:
+            async with timeout(self._timeout_seconds):
+                await self._semaphore.acquire()
+        except TimeoutError as exc:
+            observe_pool_checkout(self._display_name, perf_counter() - start_time, True)
+            raise ConnectionError("No connection available.") from exc
+        observe_pool_checkout(self._display_name, perf_counter() - start_time)
+
+        # Releases the slot once the pipeline finishes
+        self._in_use += 1
+        try:
+            yield
+        finally:
+            self._in_use -= 1
+            self._semaphore.release()
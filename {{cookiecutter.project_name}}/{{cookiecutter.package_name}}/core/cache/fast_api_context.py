@@ -1,4 +1,113 @@
 from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Set, Tuple
+
+
+class RetryBudget:
+    def __init__(self, retries: int):
+        """
+        Class that limits how many times the operations of a single request can be retried.
+        The budget is shared by every task spawned while handling the request so a failing
+        dependency cannot multiply the latency of the request with retries
+
+        :param retries: The number of retries the request is allowed
+        """
+        self._remaining = retries
+
+    @property
+    def remaining(self) -> int:
+        """
+        Property that gets the number of
+        retries the request has remaining
+
+        :return: The number of remaining retries
+        """
+        return self._remaining
+
+    def spend(self) -> bool:
+        """
+        Function that spends a single retry
+        from the budget when one remains
+
+        :return: Whether a retry was spent from the budget
+        """
+
+        # Checks whether the budget is exhausted
+        if self._remaining <= 0:
+            return False
+
+        # Spends a retry from the budget
+        self._remaining -= 1
+        return True
+
+
+class EntityCache:
+    def __init__(self):
+        """
+        Class that caches the table rows loaded by primary key for the length of a single request.
+        Rows that are loaded by the same primary key several times during a request are only
+        queried once. The cache is cleared whenever the request persists a write
+        """
+
+        # Initializes the class-created variables
+        self._rows: Dict[Tuple[type, Hashable], Any] = {}
+
+    def __len__(self) -> int:
+        """
+        Function that gets the number
+        of cached table rows
+
+        :return: The number of cached table rows
+        """
+        return len(self._rows)
+
+    @staticmethod
+    def _get_key(table: type, primary_key: Any) -> Tuple[type, Hashable]:
+        """
+        Function that gets the cache key of a table row from its table and primary key. Composite
+        primary keys given as a list or a dictionary are converted to a hashable tuple
+
+        :param table: The table class of the row
+        :param primary_key: The primary key of the row
+
+        :return: The cache key of the table row
+        """
+
+        # Converts composite primary keys to a hashable tuple
+        if isinstance(primary_key, dict):
+            primary_key = tuple(sorted(primary_key.items()))
+        elif isinstance(primary_key, list):
+            primary_key = tuple(primary_key)
+        return table, primary_key
+
+    def get(self, table: type, primary_key: Any) -> Any | None:
+        """
+        Function that gets a cached
+        table row by its primary key
+
+        :param table: The table class of the row
+        :param primary_key: The primary key of the row
+
+        :return: The cached table row or None when the row is not cached
+        """
+        return self._rows.get(self._get_key(table, primary_key))
+
+    def set(self, table: type, primary_key: Any, row: Any):
+        """
+        Function that caches a
+        table row by its primary key
+
+        :param table: The table class of the row
+        :param primary_key: The primary key of the row
+        :param row: The table row to cache
+        """
+        self._rows[self._get_key(table, primary_key)] = row
+
+    def clear(self):
+        """
+        Function that removes every
+        cached table row
+        """
+        self._rows.clear()
 
 
 class FastApiContext:
@@ -12,7 +121,10 @@ class FastApiContext:
 
         # Creates the context variables
         self._correlation_id_var = ContextVar("correlation_id")
+        self._entity_cache_var = ContextVar("entity_cache_var")
+        self._primary_pins_var = ContextVar("primary_pins_var")
         self._request_url_var = ContextVar("request_url_var")
+        self._retry_budget_var = ContextVar("retry_budget_var")
 
     @property
     def correlation_id_var(self) -> str | None:
@@ -25,6 +137,28 @@ class FastApiContext:
         correlation_id = self._correlation_id_var.get(None)
         return correlation_id
 
+    @property
+    def entity_cache_var(self) -> EntityCache | None:
+        """
+        Function that gets the thread safe
+        entity cache value
+
+        :return: The entity cache value
+        """
+        entity_cache = self._entity_cache_var.get(None)
+        return entity_cache
+
+    @property
+    def primary_pins_var(self) -> Set[Any] | None:
+        """
+        Function that gets the thread safe
+        primary pins value
+
+        :return: The primary pins value
+        """
+        primary_pins = self._primary_pins_var.get(None)
+        return primary_pins
+
     @property
     def request_url_var(self) -> str | None:
         """
@@ -36,6 +170,17 @@ class FastApiContext:
         request_url = self._request_url_var.get(None)
         return request_url
 
+    @property
+    def retry_budget_var(self) -> RetryBudget | None:
+        """
+        Function that gets the thread safe
+        retry budget value
+
+        :return: The retry budget value
+        """
+        retry_budget = self._retry_budget_var.get(None)
+        return retry_budget
+
     @correlation_id_var.setter
     def correlation_id_var(self, correlation_id: str):
         """
@@ -46,6 +191,26 @@ class FastApiContext:
         """
         self._correlation_id_var.set(correlation_id)
 
+    @entity_cache_var.setter
+    def entity_cache_var(self, entity_cache: EntityCache):
+        """
+        Function that sets the thread safe
+        entity cache value
+
+        :param entity_cache: The cache of the table rows loaded by primary key during the request
+        """
+        self._entity_cache_var.set(entity_cache)
+
+    @primary_pins_var.setter
+    def primary_pins_var(self, primary_pins: Set[Any]):
+        """
+        Function that sets the thread safe
+        primary pins value
+
+        :param primary_pins: The row operations pinned to their primary database by the request
+        """
+        self._primary_pins_var.set(primary_pins)
+
     @request_url_var.setter
     def request_url_var(self, request_url: str):
         """
@@ -56,13 +221,26 @@ class FastApiContext:
         """
         self._request_url_var.set(request_url)
 
+    @retry_budget_var.setter
+    def retry_budget_var(self, retry_budget: RetryBudget):
+        """
+        Function that sets the thread safe
+        retry budget value
+
+        :param retry_budget: The budget limiting how many times the request operations can retry
+        """
+        self._retry_budget_var.set(retry_budget)
+
     def reset(self):
         """
         Function that resets the context variables
         to their initial state
         """
         self._correlation_id_var.set(None)
+        self._entity_cache_var.set(None)
+        self._primary_pins_var.set(None)
         self._request_url_var.set(None)
+        self._retry_budget_var.set(None)
 
 
 # Creates the fast-api context instance
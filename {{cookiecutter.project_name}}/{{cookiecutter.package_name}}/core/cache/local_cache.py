@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from sys import getsizeof
+from time import monotonic
+from typing import Any, Iterable, Set, Tuple
+
+from prometheus_client import Counter, Gauge
+
+# Local cache metrics exposed on the metrics endpoint
+LOCAL_CACHE_HITS = Counter(
+    "local_cache_hits",
+    "The number of reads served from the in-process cache",
+    ["name"],
+)
+LOCAL_CACHE_MISSES = Counter(
+    "local_cache_misses",
+    "The number of reads that were not found in the in-process cache",
+    ["name"],
+)
+LOCAL_CACHE_EVICTIONS = Counter(
+    "local_cache_evictions",
+    "The number of least recently used entries evicted to stay within the byte limit",
+    ["name"],
+)
+LOCAL_CACHE_BYTES = Gauge(
+    "local_cache_bytes",
+    "The approximate number of bytes held by the in-process cache",
+    ["name"],
+)
+LOCAL_CACHE_HIT_RATIO = Gauge(
+    "local_cache_hit_ratio",
+    "The share of reads served from the in-process cache since the worker started",
+    ["name"],
+)
+
+
+class LocalCache:
+    def __init__(self, name: str, max_bytes: int, ttl_seconds: float):
+        """
+        Class that caches values in the memory of the current worker. Entries expire after their
+        TTL and the least recently used entries are evicted once the approximate size of the
+        cached keys and values, including their nested items, exceeds the byte limit. The cache
+        is not shared across workers, so it must be invalidated whenever its source changes
+
+        :param name: The name of the cache used to label its metrics
+        :param max_bytes: The approximate number of bytes the cache may hold
+        :param ttl_seconds: The default number of seconds until an entry expires
+        """
+
+        # Creates the given fields
+        self._name = name
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+
+        # Initializes the class-created variables
+        self._entries: OrderedDict[str, Tuple[Any, int, float]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+        # Reports the hit ratio of the cache whenever the metrics are collected
+        LOCAL_CACHE_HIT_RATIO.labels(name).set_function(lambda: self.hit_ratio)
+
+    def __len__(self) -> int:
+        """
+        Function that gets the number
+        of cached entries
+
+        :return: The number of cached entries
+        """
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Property that gets the approximate number
+        of bytes held by the cache
+
+        :return: The number of bytes held by the cache
+        """
+        return self._size
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Property that gets the share of reads that were
+        served from the cache since it was created
+
+        :return: The hit ratio between 0 and 1
+        """
+        reads = self._hits + self._misses
+        return self._hits / reads if reads else 0.0
+
+    def get(self, key: str) -> Any | None:
+        """
+        Function that gets a cached value and marks it as the most recently used.
+        Expired entries are removed and treated as missing
+
+        :param key: The key of the cached value
+
+        :return: The cached value or None when it is not cached
+        """
+
+        # Checks whether the key is cached and has not expired
+        entry = self._entries.get(key)
+        if entry is None or entry[2] <= monotonic():
+            if entry is not None:
+                self._remove(key)
+            self._misses = self._misses + 1
+            LOCAL_CACHE_MISSES.labels(self._name).inc()
+            return None
+
+        # Marks the entry as the most recently used and gets its value
+        self._entries.move_to_end(key)
+        self._hits = self._hits + 1
+        LOCAL_CACHE_HITS.labels(self._name).inc()
+        return entry[0]
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None):
+        """
+        Function that caches a value and evicts the least recently used entries until the cache
+        is within its byte limit. Values larger than the byte limit are not cached
+
+        :param key: The key of the value
+        :param value: The value to cache
+        :param ttl_seconds: The seconds until the entry expires, capped at the cache TTL
+        """
+
+        # Removes the previous entry of the key
+        self._remove(key)
+
+        # Checks whether the value fits in the cache
+        size = getsizeof(key) + get_deep_size(value)
+        if size > self._max_bytes:
+            return
+
+        # Evicts the least recently used entries until the value fits in the cache
+        while self._size + size > self._max_bytes:
+            evicted_key = next(iter(self._entries))
+            self._remove(evicted_key)
+            LOCAL_CACHE_EVICTIONS.labels(self._name).inc()
+
+        # Caches the value
+        ttl_seconds = min(ttl_seconds, self._ttl_seconds) if ttl_seconds else self._ttl_seconds
+        expires_at = monotonic() + ttl_seconds
+        self._entries[key] = (value, size, expires_at)
+        self._size = self._size + size
+        LOCAL_CACHE_BYTES.labels(self._name).set(self._size)
+
+    def delete(self, keys: Iterable[str]):
+        """
+        Function that removes
+        the given keys
+
+        :param keys: The keys to remove
+        """
+        for key in keys:
+            self._remove(key)
+
+    def clear(self):
+        """
+        Function that removes
+        every cached entry
+        """
+        self._entries.clear()
+        self._size = 0
+        LOCAL_CACHE_BYTES.labels(self._name).set(0)
+
+    def _remove(self, key: str):
+        """
+        Function that removes a key and releases
+        the bytes held by its entry
+
+        :param key: The key to remove
+        """
+
+        # Removes the entry when the key is cached
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size = self._size - entry[1]
+            LOCAL_CACHE_BYTES.labels(self._name).set(self._size)
+
+
+def get_deep_size(value: Any, seen: Set[int] | None = None) -> int:
+    """
+    Function that gets the approximate number of bytes held by a value. Unlike getsizeof, which
+    only counts the container itself, the items of lists, tuples, sets and dicts and the
+    attributes of objects are counted as well, and objects referenced twice are counted once
+
+    :param value: The value to measure
+    :param seen: The ids of the objects that were already counted
+
+    :return: The approximate number of bytes held by the value
+    """
+
+    # Checks whether the object was already counted
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    # Counts the value along with its items or attributes
+    size = getsizeof(value)
+    if isinstance(value, dict):
+        items = [*value.keys(), *value.values()]
+        size = size + sum(get_deep_size(item, seen) for item in items)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size = size + sum(get_deep_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size = size + get_deep_size(vars(value), seen)
+    return size
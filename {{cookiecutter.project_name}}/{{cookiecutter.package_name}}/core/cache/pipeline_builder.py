@@ -0,0 +1,262 @@
+from asyncio import Semaphore, gather
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Tuple, TypeVar
+
+from redis.client import Pipeline
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.pipeline_builder")
+
+# Generic type of the result of a queued command
+ResultType = TypeVar("ResultType")
+
+
+class CommandHandle(Generic[ResultType]):
+    def __init__(self, args: Tuple[Any, ...]):
+        """
+        Class that holds the result of a command queued in a
+        pipeline builder once the pipeline has been executed
+
+        :param args: The redis command name followed by its arguments
+        """
+
+        # Creates the given fields
+        self._args = args
+
+        # Initializes the class-created variables
+        self._is_resolved = False
+        self._result: Any = None
+        self._error: Exception | None = None
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        """
+        Property that gets the redis command
+        name followed by its arguments
+
+        :return: The arguments of the command
+        """
+        return self._args
+
+    @property
+    def is_resolved(self) -> bool:
+        """
+        Property that gets whether the
+        command has been executed
+
+        :return: Whether the command has been executed
+        """
+        return self._is_resolved
+
+    @property
+    def result(self) -> ResultType:
+        """
+        Property that gets the result of the command. An InternalServerError
+        is raised when the command failed or has not been executed yet
+
+        :return: The result of the command
+        """
+
+        # Checks whether the command has been executed
+        if not self._is_resolved:
+            logger.critical("The command has not been executed, was the execute function called?")
+            raise InternalServerError()
+
+        # Raises the error of the command when it failed
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _set_result(self, result: Any):
+        """
+        Function that resolves the handle
+        with the result of the command
+
+        :param result: The result of the command
+        """
+        self._is_resolved = True
+        self._result = result
+
+    def _set_error(self, error: Exception):
+        """
+        Function that resolves the handle with
+        the error raised by the command
+
+        :param error: The error raised by the command
+        """
+        self._is_resolved = True
+        self._error = error
+
+
+class PipelineBuilder:
+    def __init__(
+        self,
+        pipeline: Callable[..., Awaitable[Any]],
+        is_transaction: bool,
+        chunk_size: int,
+        concurrency: int,
+    ):
+        """
+        Class that queues redis commands and returns a handle for each of them that is resolved
+        with its own result once the pipeline is executed. Non-transactional pipelines are split
+        into chunks that are sent with limited concurrency, so the commands and replies of a very
+        large pipeline are never buffered by redis all at once. Transactions are always sent as a
+        single pipeline since splitting them would break their atomicity
+
+        :param pipeline: The redis-manager pipeline function that executes the chunks
+        :param is_transaction: Whether all commands should be executed atomically
+        :param chunk_size: The number of commands sent in each pipeline
+        :param concurrency: The number of pipelines that can be sent at the same time
+        """
+
+        # Creates the given fields
+        self._pipeline = pipeline
+        self._is_transaction = is_transaction
+        self._chunk_size = max(chunk_size, 1)
+        self._concurrency = max(concurrency, 1)
+
+        # Initializes the class-created variables
+        self._handles: List[CommandHandle] = []
+
+    def __len__(self) -> int:
+        """
+        Function that gets the number of commands
+        queued in the pipeline builder
+
+        :return: The number of queued commands
+        """
+        return len(self._handles)
+
+    def command(self, *args: Any) -> CommandHandle[Any]:
+        """
+        Function that queues a redis command
+
+        :param args: The redis command name followed by its arguments
+
+        :return: The handle resolved with the result of the command
+        """
+        handle: CommandHandle[Any] = CommandHandle(args)
+        self._handles.append(handle)
+        return handle
+
+    def get(self, key: str) -> CommandHandle[Any | None]:
+        """
+        Function that queues getting the value of a key
+
+        :param key: The key of the value
+
+        :return: The handle resolved with the value or None when the key does not exist
+        """
+        return self.command("GET", key)
+
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> CommandHandle[bool]:
+        """
+        Function that queues setting the value of a key
+
+        :param key: The key of the value
+        :param value: The value to set
+        :param ttl_seconds: The seconds until the key expires
+
+        :return: The handle resolved with whether the value was set
+        """
+        if ttl_seconds is None:
+            return self.command("SET", key, value)
+        return self.command("SET", key, value, "EX", ttl_seconds)
+
+    def delete(self, *keys: str) -> CommandHandle[int]:
+        """
+        Function that queues deleting keys
+
+        :param keys: The keys to delete
+
+        :return: The handle resolved with the number of deleted keys
+        """
+        return self.command("DEL", *keys)
+
+    def hset(self, key: str, mapping: Dict[str, Any]) -> CommandHandle[int]:
+        """
+        Function that queues setting the fields of a hash
+
+        :param key: The key of the hash
+        :param mapping: The fields and values to set
+
+        :return: The handle resolved with the number of fields that were added
+        """
+        return self.command("HSET", key, *[item for pair in mapping.items() for item in pair])
+
+    def expire(self, key: str, ttl_seconds: int) -> CommandHandle[bool]:
+        """
+        Function that queues setting the expiry of a key
+
+        :param key: The key to expire
+        :param ttl_seconds: The seconds until the key expires
+
+        :return: The handle resolved with whether the expiry was set
+        """
+        return self.command("EXPIRE", key, ttl_seconds)
+
+    async def execute(self):
+        """
+        Function that executes the queued commands and resolves their handles. When a chunk
+        fails its handles are resolved with the error, and the error is raised once every
+        other chunk has finished
+        """
+
+        # Takes the queued commands and splits them into chunks
+        handles, self._handles = self._handles, []
+        if not handles:
+            return
+        chunk_size = len(handles) if self._is_transaction else self._chunk_size
+        chunks = [
+            handles[index : index + chunk_size] for index in range(0, len(handles), chunk_size)
+        ]
+
+        # Sends the chunks with limited concurrency
+        semaphore = Semaphore(self._concurrency)
+        results = await gather(
+            *[self._execute_chunk(chunk, semaphore) for chunk in chunks], return_exceptions=True
+        )
+
+        # Raises the error of the first chunk that failed
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _execute_chunk(self, handles: List[CommandHandle], semaphore: Semaphore):
+        """
+        Function that sends a chunk of commands as a single
+        pipeline and resolves the handle of each command
+
+        :param handles: The handles of the commands in the chunk
+        :param semaphore: The semaphore limiting how many chunks are sent at the same time
+        """
+
+        # Adds every command of the chunk to the pipeline
+        def pipe_ops(pipe: Pipeline):
+            for handle in handles:
+                pipe.execute_command(*handle.args)
+
+        # Attempts to send the chunk to redis
+        async with semaphore:
+            try:
+                results = await self._pipeline(
+                    pipe_ops, is_transaction=self._is_transaction, raise_on_error=False
+                )
+            except Exception as exc:
+                for handle in handles:
+                    handle._set_error(exc)
+                raise
+
+        # Resolves the handle of each command with its own result
+        for handle, result in zip(handles, results):
+            if isinstance(result, Exception):
+                message = "Redis pipeline command failed"
+                logger.critical(message, extra={"command": handle.args[0]})
+                logger.debug(message, exc_info=result)
+                error = InternalServerError()
+                error.__cause__ = result
+                handle._set_error(error)
+            else:
+                handle._set_result(result)
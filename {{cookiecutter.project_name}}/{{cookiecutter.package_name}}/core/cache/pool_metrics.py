@@ -0,0 +1,60 @@
+from prometheus_client import Counter, Gauge, Histogram
+from redis.asyncio.connection import ConnectionPool
+
+# Connection pool gauges exposed on the metrics endpoint
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections",
+    "The maximum number of connections the redis connection pool can open",
+    ["redis"],
+)
+REDIS_POOL_IN_USE = Gauge(
+    "redis_pool_in_use_connections",
+    "The number of redis connections currently checked out of the connection pool",
+    ["redis"],
+)
+REDIS_POOL_IDLE = Gauge(
+    "redis_pool_idle_connections",
+    "The number of open redis connections currently idle in the connection pool",
+    ["redis"],
+)
+
+# Connection pool histograms and counters exposed on the metrics endpoint
+REDIS_POOL_WAIT_SECONDS = Histogram(
+    "redis_pool_wait_seconds",
+    "The number of seconds spent waiting to check out a redis connection",
+    ["redis"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REDIS_POOL_WAIT_TIMEOUTS = Counter(
+    "redis_pool_wait_timeouts",
+    "The number of redis connection checkouts that timed out waiting on the pool",
+    ["redis"],
+)
+
+
+def instrument_pool(pool: ConnectionPool, redis: str):
+    """
+    Function that reports the connection usage of the given redis connection pool
+    as prometheus metrics. Gauges are read from the pool whenever the metrics
+    endpoint is scraped
+
+    :param pool: The redis connection pool to instrument
+    :param redis: The name of the redis instance used to label the metrics
+    """
+    REDIS_POOL_MAX_CONNECTIONS.labels(redis).set(pool.max_connections)
+    REDIS_POOL_IN_USE.labels(redis).set_function(lambda: len(pool._in_use_connections))
+    REDIS_POOL_IDLE.labels(redis).set_function(lambda: len(pool._available_connections))
+
+
+def observe_pool_checkout(redis: str, wait_seconds: float, is_timeout: bool = False):
+    """
+    Function that records how long a command waited to check
+    out a connection from the redis connection pool
+
+    :param redis: The name of the redis instance used to label the metrics
+    :param wait_seconds: The number of seconds spent waiting for the connection
+    :param is_timeout: Whether the checkout timed out waiting on the pool
+    """
+    REDIS_POOL_WAIT_SECONDS.labels(redis).observe(wait_seconds)
+    if is_timeout:
+        REDIS_POOL_WAIT_TIMEOUTS.labels(redis).inc()
@@ -0,0 +1,267 @@
+from hashlib import blake2b, sha1
+from math import ceil
+from time import monotonic
+from typing import Dict, List, Tuple
+
+from prometheus_client import Counter
+from redis.exceptions import NoScriptError
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, TooManyRequestsError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+from .local_cache import LocalCache
+from .redis_manager import RedisManager
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.rate_limiter")
+
+# Rate limit metrics exposed on the metrics endpoint
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions",
+    "The number of rate limited requests by route and by how the decision was made",
+    ["route", "decision"],
+)
+
+# Lua script that atomically refills and takes tokens from the token bucket of a client. The
+# bucket refills continuously using the redis server clock, so every worker shares one clock.
+# The requested lease is granted when enough tokens are left, otherwise a single token is granted
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_ms = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_per_ms)
+local granted = 0
+if tokens >= requested then
+    granted = requested
+elseif tokens >= 1 then
+    granted = 1
+end
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / refill_per_ms) + 1000)
+local retry_after_ms = 0
+if granted == 0 then
+    retry_after_ms = math.ceil((1 - tokens) / refill_per_ms)
+end
+return {granted, retry_after_ms}
+"""
+_TOKEN_BUCKET_SHA = sha1(_TOKEN_BUCKET_SCRIPT.encode()).hexdigest()
+
+
+class RateLimitRule:
+    def __init__(self, requests: int, period_seconds: float):
+        """
+        Class that holds the number of requests a client can
+        send to a route within a period of seconds
+
+        :param requests: The number of requests allowed within the period
+        :param period_seconds: The seconds over which the requests are allowed
+        """
+
+        # Creates the given fields
+        self._requests = requests
+        self._period_seconds = period_seconds
+
+    @property
+    def requests(self) -> int:
+        """
+        Property that gets the number of
+        requests allowed within the period
+
+        :return: The number of requests
+        """
+        return self._requests
+
+    @property
+    def period_seconds(self) -> float:
+        """
+        Property that gets the seconds over
+        which the requests are allowed
+
+        :return: The period seconds
+        """
+        return self._period_seconds
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        redis_manager: RedisManager,
+        default_rule: RateLimitRule | None,
+        route_rules: Dict[str, RateLimitRule | None],
+        lease_cache: LocalCache,
+        lease_ratio: float,
+    ):
+        """
+        Class that limits the requests of each client with a token bucket stored in redis and
+        shared by every worker. Each bucket is updated by an atomic lua script, and a worker takes
+        a lease of several tokens at once which later requests of the client consume in-process,
+        so clearly under-limit clients rarely reach redis. Rejections are also remembered in-process
+        until the bucket refills, so abusive clients are shed without reaching redis either
+
+        :param redis_manager: The redis-manager instance that stores the token buckets
+        :param default_rule: The rule of routes without their own rule or None to not limit them
+        :param route_rules: The rule of each route path prefix or None to not limit the route
+        :param lease_cache: The in-process cache of the leased tokens and rejections
+        :param lease_ratio: The share of the requests of a rule leased to the worker at once
+        """
+
+        # Creates the given fields
+        self._redis_manager = redis_manager
+        self._default_rule = default_rule
+        self._lease_cache = lease_cache
+        self._lease_ratio = lease_ratio
+
+        # Initializes the class-created variables
+        self._route_rules: List[Tuple[str, RateLimitRule | None]] = sorted(
+            route_rules.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def get_rule(self, path: str) -> Tuple[str, RateLimitRule | None]:
+        """
+        Function that gets the rule of the route with the longest path prefix matching the path
+        on a path segment boundary, falling back to the default rule. A route therefore matches
+        its own path and the paths beneath it, but not a sibling path sharing its characters
+
+        :param path: The path of the request
+
+        :return: The matched route and its rule or None when the route is not limited
+        """
+        for route, rule in self._route_rules:
+            if path == route or path.startswith(route.rstrip("/") + "/"):
+                return route, rule
+        return "default", self._default_rule
+
+    async def hit(self, path: str, client_key: str):
+        """
+        Function that takes a token from the bucket of the client for the route of the path. A
+        TooManyRequestsError is raised when the bucket is empty, while a failing redis instance
+        lets the request through so an outage never takes down the routes it protects
+
+        :param path: The path of the request
+        :param client_key: The key identifying the client
+        """
+
+        # Checks whether the route is limited
+        route, rule = self.get_rule(path)
+        if rule is None:
+            return
+
+        # Consumes a token leased to the worker, while a lease without tokens left is a rejection
+        digest = blake2b(client_key.encode(), digest_size=16).hexdigest()
+        key = f"rate-limit:{route}:{digest}"
+        lease = self._lease_cache.get(key)
+        if lease is not None:
+            if lease[0] == 0:
+                RATE_LIMIT_DECISIONS.labels(route, "rejected_local").inc()
+                raise TooManyRequestsError(self._get_retry_after(lease[1] - monotonic()))
+            lease[0] -= 1
+            if lease[0] == 0:
+                self._lease_cache.delete([key])
+            RATE_LIMIT_DECISIONS.labels(route, "allowed_local").inc()
+            return
+
+        # Attempts to take a lease of tokens from the bucket stored in redis
+        lease_size = max(int(rule.requests * self._lease_ratio), 1)
+        try:
+            granted, retry_after_ms = await self._acquire(key, rule, lease_size)
+        except Exception as exc:
+            message = "Rate limit check failed, the request is allowed"
+            logger.warning(message)
+            logger.debug(message, exc_info=exc)
+            RATE_LIMIT_DECISIONS.labels(route, "failed_open").inc()
+            return
+
+        # Remembers the rejection until the bucket of the client refills
+        if granted == 0:
+            retry_after = retry_after_ms / 1000
+            self._lease_cache.set(key, [0, monotonic() + retry_after], ttl_seconds=retry_after)
+            RATE_LIMIT_DECISIONS.labels(route, "rejected").inc()
+            raise TooManyRequestsError(self._get_retry_after(retry_after))
+
+        # Keeps the tokens leased beyond the current request for the later requests of the client
+        if granted > 1:
+            self._lease_cache.set(key, [granted - 1, 0.0], ttl_seconds=rule.period_seconds)
+        RATE_LIMIT_DECISIONS.labels(route, "allowed").inc()
+
+    async def _acquire(self, key: str, rule: RateLimitRule, lease_size: int) -> Tuple[int, int]:
+        """
+        Function that runs the token bucket script by its hash, and sends the
+        whole script only when redis has not cached the script yet
+
+        :param key: The redis key of the bucket
+        :param rule: The rule of the bucket
+        :param lease_size: The number of tokens to lease
+
+        :return: The number of granted tokens and the milliseconds until a token is available
+        """
+        refill_per_ms = rule.requests / (rule.period_seconds * 1000)
+        args = (rule.requests, refill_per_ms, lease_size)
+
+        # Runs the script by its hash to avoid sending the script with every request
+        result = await self._redis_manager.pipeline(
+            lambda pipe: pipe.evalsha(_TOKEN_BUCKET_SHA, 1, key, *args),
+            is_transaction=False,
+            is_scalar=True,
+            raise_on_error=False,
+        )
+
+        # Sends the whole script when redis has not cached it yet
+        if isinstance(result, NoScriptError):
+            result = await self._redis_manager.pipeline(
+                lambda pipe: pipe.eval(_TOKEN_BUCKET_SCRIPT, 1, key, *args),
+                is_transaction=False,
+                is_scalar=True,
+            )
+        elif isinstance(result, Exception):
+            raise InternalServerError() from result
+        granted, retry_after_ms = result
+        return int(granted), int(retry_after_ms)
+
+    @staticmethod
+    def _get_retry_after(retry_after_seconds: float) -> int:
+        """
+        Function that rounds the seconds until a rejected client can
+        retry up to the whole seconds of the retry-after header
+
+        :param retry_after_seconds: The seconds until the client can retry
+
+        :return: The whole seconds until the client can retry
+        """
+        return max(ceil(retry_after_seconds), 1)
+
+
+def get_rate_limit_rule(spec: str) -> RateLimitRule | None:
+    """
+    Function that creates a rate limit rule from its specification, the number of requests
+    followed by a slash and the period in seconds (exp. "100/60"), or "unlimited"
+
+    :param spec: The specification of the rule
+
+    :return: The rate limit rule or None when the route is not limited
+    """
+
+    # Checks whether the route is not limited
+    if spec == "unlimited":
+        return None
+
+    # Attempts to parse the requests and period of the rule
+    try:
+        requests, _, period_seconds = spec.partition("/")
+        rule = RateLimitRule(int(requests), float(period_seconds))
+    except ValueError as exc:
+        message = f"The {spec} rate limit is not formatted as requests/seconds"
+        logger.critical(message)
+        logger.debug(message, exc_info=exc)
+        raise InternalServerError() from exc
+
+    # Checks whether the rule allows requests over a period of time
+    if rule.requests < 1 or rule.period_seconds <= 0:
+        logger.critical(f"The {spec} rate limit must allow requests over a positive period")
+        raise InternalServerError()
+    return rule
@@ -1,14 +1,29 @@
-from typing import Any, Callable
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Tuple, Type
 
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 from redis.asyncio.client import Redis
-from redis.client import Pipeline
-from tenacity import retry, stop_after_attempt, wait_fixed
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.sentinel import Sentinel
+from redis.client import NEVER_DECODE, Pipeline
+from redis.cluster import LoadBalancingStrategy
 
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker, is_transient_redis_error, retry_policy
 from {{cookiecutter.package_name}}.core.settings import settings
-from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
 from {{cookiecutter.package_name}}.services.logger import get_api_logger
 
+from .client_cache import ClientCache
+from .codecs import CodecRegistry, ModelType, get_codec
+from .command_batcher import CommandBatcher
+from .connection_pool import (
+    ClusterConnectionLimiter,
+    InstrumentedConnectionPool,
+    InstrumentedSentinelConnectionPool,
+)
+from .local_cache import LocalCache
+from .pipeline_builder import PipelineBuilder
+
 # Gets the {{cookiecutter.friendly_name}} server logger instance
 logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.redis_manager")
 
@@ -41,7 +56,13 @@ class RedisManager:
         self._password = password
 
         # Initializes class-created variables
-        self._operation: Redis | None = None
+        self._operation: Redis | RedisCluster | None = None
+        self._read_operation: Redis | None = None
+        self._cluster_limiter: ClusterConnectionLimiter | None = None
+        self._client_cache: ClientCache | None = None
+        self._command_batcher: CommandBatcher | None = None
+        self._circuit_breaker = CircuitBreaker(display_name, is_transient_redis_error)
+        self._codecs = self._get_codecs()
 
     @property
     def display_name(self) -> str:
@@ -64,7 +85,57 @@ class RedisManager:
         return self._description
 
     @property
-    def operation(self) -> Redis:
+    def circuit_breaker(self) -> CircuitBreaker:
+        """
+        Property that gets the circuit breaker that stops
+        calling the redis instance while it is unavailable
+
+        :return: The circuit breaker instance
+        """
+        return self._circuit_breaker
+
+    @property
+    def is_cluster(self) -> bool:
+        """
+        Property that gets whether the redis instance is a redis cluster whose
+        keys are spread across slots that a single transaction cannot span
+
+        :return: Whether the redis instance is a redis cluster
+        """
+        return self._cluster_limiter is not None
+
+    @property
+    def client_cache(self) -> ClientCache | None:
+        """
+        Property that gets the client-side cache of the redis
+        instance when client-side caching is enabled
+
+        :return: The client-cache instance
+        """
+        return self._client_cache
+
+    @property
+    def codecs(self) -> CodecRegistry:
+        """
+        Property that gets the registry that selects the
+        codec of each redis key by its namespace
+
+        :return: The codec-registry instance
+        """
+        return self._codecs
+
+    @property
+    def command_batcher(self) -> CommandBatcher | None:
+        """
+        Property that gets the batcher that coalesces concurrent
+        commands when command batching is enabled
+
+        :return: The command-batcher instance
+        """
+        return self._command_batcher
+
+    @property
+    def operation(self) -> Redis | RedisCluster:
         """
         Property that gets the redis instance
         for performing redis operations
@@ -86,13 +157,41 @@ class RedisManager:
         connection for handing redis operations
         """
 
-        # Initializes the redis instance for performing operations
-        self._operation = Redis(
-            host=self._host.get_secret_value(),
-            port=int(self._port.get_secret_value()),
-            password=self._password.get_secret_value(),
-            decode_responses=settings.API_REDIS_DECODE_RESPONSES,
-        )
+        # Creates the redis instances of the configured redis mode
+        if settings.API_REDIS_MODE == "cluster":
+            self._operation = self._create_cluster()
+            self._cluster_limiter = ClusterConnectionLimiter(
+                self._display_name,
+                settings.API_REDIS_MAX_CONNECTIONS,
+                settings.API_REDIS_POOL_TIMEOUT_SECONDS,
+            )
+        elif settings.API_REDIS_MODE == "sentinel":
+            self._operation, self._read_operation = self._create_sentinel()
+        else:
+            self._operation = self._create_standalone()
+
+        # Creates the batcher that coalesces concurrent commands when it is enabled
+        if settings.IS_API_REDIS_COMMAND_BATCHING_ENABLED:
+            self._command_batcher = CommandBatcher(
+                self._display_name,
+                self.pipeline,
+                settings.API_REDIS_COMMAND_BATCH_WINDOW_SECONDS,
+                settings.API_REDIS_COMMAND_BATCH_MAX_SIZE,
+            )
+
+        # Starts the client-side cache of the redis instance when it is enabled
+        if settings.IS_API_REDIS_CLIENT_CACHE_ENABLED and isinstance(self._operation, RedisCluster):
+            logger.warning("The redis client-side cache is not supported in cluster mode")
+        elif settings.IS_API_REDIS_CLIENT_CACHE_ENABLED:
+            local_cache = LocalCache(
+                f"{self._display_name} Client Cache",
+                settings.API_REDIS_CLIENT_CACHE_MAX_BYTES,
+                settings.API_REDIS_CLIENT_CACHE_TTL_SECONDS,
+            )
+            self._client_cache = ClientCache(
+                self._operation, local_cache, settings.API_REDIS_CLIENT_CACHE_PREFIXES
+            )
+            self._client_cache.start()
 
         # Logs that the provided redis instance has been connected successfully
         logger.info(f"Connected to the {self._display_name} instance")
@@ -103,17 +202,145 @@ class RedisManager:
         async redis instance
         """
 
-        # Disconnects the async redis instance
+        # Sends the commands still waiting in the current batch
+        if self._command_batcher is not None:
+            await self._command_batcher.flush()
+
+        # Stops the client-side cache of the redis instance
+        if self._client_cache is not None:
+            await self._client_cache.stop()
+
+        # Disconnects the async redis instances
+        if self._read_operation is not None:
+            await self._read_operation.close()
         if self._operation is not None:
             await self._operation.close()
             logger.info(f"Disconnected the {self._display_name} instance")
 
-    @retry(stop=stop_after_attempt(settings.API_REDIS_PIPELINE_RETRY_NUMBER), wait=wait_fixed(1))
+    async def get(self, key: str) -> Any | None:
+        """
+        Function that gets the value of a key. When client-side caching is enabled the value is
+        served from the memory of the current worker until redis reports that the key changed
+
+        :param key: The key of the value
+
+        :return: The value or None when the key does not exist
+        """
+
+        # Gets the value from the client-side cache
+        if self._client_cache is not None:
+            value = self._client_cache.get(key)
+            if value is not None:
+                return value
+
+        # Gets the value from redis and caches it on the client-side, reading from the primary
+        # when values are cached since a lagging replica could return a value already invalidated
+        generation = self._client_cache.generation if self._client_cache else 0
+        value = await self.execute_command("GET", key, is_read_only=self._client_cache is None)
+        if self._client_cache is not None:
+            self._client_cache.set(key, value, generation)
+        return value
+
+    async def get_value(self, key: str) -> Any | None:
+        """
+        Function that gets a value stored with the
+        codec of the namespace of its key
+
+        :param key: The key of the value
+
+        :return: The decoded value or None when the key does not exist
+        """
+        payload = await self._get_payload(key)
+        return None if payload is None else self._codecs.get_codec(key).decode(payload)
+
+    async def set_value(self, key: str, value: Any, ttl_seconds: int | None = None):
+        """
+        Function that stores a value encoded with
+        the codec of the namespace of its key
+
+        :param key: The key of the value
+        :param value: The value to store
+        :param ttl_seconds: The seconds until the key expires
+        """
+        payload = self._codecs.get_codec(key).encode(value)
+        await self.pipeline(
+            lambda pipe: pipe.set(key, payload, ex=ttl_seconds), is_transaction=False
+        )
+
+    async def get_model(self, key: str, model: Type[ModelType]) -> ModelType | None:
+        """
+        Function that gets a pydantic model stored with
+        the codec of the namespace of its key
+
+        :param key: The key of the model
+        :param model: The pydantic model class to validate the value with
+
+        :return: The decoded pydantic model or None when the key does not exist
+        """
+        payload = await self._get_payload(key)
+        return None if payload is None else self._codecs.get_codec(key).decode_model(payload, model)
+
+    async def set_model(self, key: str, value: BaseModel, ttl_seconds: int | None = None):
+        """
+        Function that stores a pydantic model encoded
+        with the codec of the namespace of its key
+
+        :param key: The key of the model
+        :param value: The pydantic model to store
+        :param ttl_seconds: The seconds until the key expires
+        """
+        payload = self._codecs.get_codec(key).encode_model(value)
+        await self.pipeline(
+            lambda pipe: pipe.set(key, payload, ex=ttl_seconds), is_transaction=False
+        )
+
+    async def execute_command(self, *args: Any, is_read_only: bool = False) -> Any:
+        """
+        Function that executes a single redis command. When command batching is enabled the
+        command is coalesced with the commands of concurrent coroutines and sent in one pipeline
+
+        :param args: The redis command name followed by its arguments
+        :param is_read_only: Whether the command only reads and can be routed to a replica
+
+        :return: The result of the redis command
+        """
+
+        # Queues the command in the current batch
+        if self._command_batcher is not None:
+            return await self._command_batcher.execute(*args, is_read_only=is_read_only)
+
+        # Executes the command on its own
+        return await self.pipeline(
+            lambda pipe: pipe.execute_command(*args),
+            is_transaction=False,
+            is_scalar=True,
+            is_read_only=is_read_only,
+        )
+
+    def pipeline_builder(self, is_transaction: bool = False) -> PipelineBuilder:
+        """
+        Function that creates a pipeline builder whose queued commands each return a handle
+        resolved after execution. Non-transactional pipelines are sent in bounded chunks
+
+        :param is_transaction: Whether all commands should be executed atomically
+
+        :return: The pipeline-builder instance
+        """
+        return PipelineBuilder(
+            self.pipeline,
+            is_transaction,
+            settings.API_REDIS_PIPELINE_CHUNK_SIZE,
+            settings.API_REDIS_PIPELINE_CONCURRENCY,
+        )
+
+    @retry_policy(is_transient_redis_error, settings.API_REDIS_PIPELINE_RETRY_NUMBER)
     async def pipeline(
         self,
         pipe_ops: Callable[[Pipeline], None],
         is_transaction: bool = True,
         is_scalar: bool = False,
+        raise_on_error: bool = True,
+        is_read_only: bool = False,
     ) -> Any:
         """
         Function that wraps the redis pipeline function in a try/catch to handle unexpected errors.
@@ -124,6 +351,8 @@ class RedisManager:
         :param pipe_ops: A function that contains redis operations to add to the pipeline
         :param is_transaction: Whether all commands should be executed atomically
         :param is_scalar: Whether the result returned is a scalar
+        :param raise_on_error: Whether a failing command raises instead of returning its error
+        :param is_read_only: Whether the commands only read and can be routed to a replica
         """
 
         # Checks whether the async redis instance exists
@@ -132,14 +361,161 @@ class RedisManager:
             logger.critical(message)
             raise InternalServerError()
 
+        # Routes read-only commands to the replica instance when reads are routed to replicas
+        operation = self._operation
+        if is_read_only and self._read_operation is not None:
+            operation = self._read_operation
+
+        # Bounds the pipelines sent at once when redis is a cluster
+        checkout = self._cluster_limiter.checkout() if self._cluster_limiter else nullcontext()
+
         # Attempts to execute redis-operations in the pipeline
         try:
-            async with self._operation.pipeline(is_transaction) as pipe:
-                pipe_ops(pipe)
-                result = await pipe.execute()
-                return result[0] if is_scalar else result
+            async with self._circuit_breaker.protect(), checkout:
+                async with operation.pipeline(is_transaction) as pipe:
+                    pipe_ops(pipe)
+                    result = await pipe.execute(raise_on_error)
+                    return result[0] if is_scalar else result
+        except ServiceUnavailableError:
+            raise
         except Exception as exc:
             message = "Redis pipeline execute failed"
             logger.critical(message)
             logger.debug(message, exc_info=exc)
-            raise InternalServerError()
+            raise InternalServerError() from exc
+
+    async def _get_payload(self, key: str) -> bytes | None:
+        """
+        Function that gets the encoded payload of a key as raw
+        bytes, even when redis responses are decoded to strings
+
+        :param key: The key of the payload
+
+        :return: The encoded payload or None when the key does not exist
+        """
+        return await self.pipeline(
+            lambda pipe: pipe.execute_command("GET", key, **{NEVER_DECODE: []}),
+            is_transaction=False,
+            is_scalar=True,
+            is_read_only=True,
+        )
+
+    def _create_standalone(self) -> Redis:
+        """
+        Function that creates the redis instance of a single redis node
+        backed by a bounded connection pool
+
+        :return: The redis instance
+        """
+
+        # Creates the bounded connection pool of the redis instance
+        connection_pool = InstrumentedConnectionPool(
+            self._display_name,
+            max_connections=settings.API_REDIS_MAX_CONNECTIONS,
+            timeout=settings.API_REDIS_POOL_TIMEOUT_SECONDS,
+            host=self._host.get_secret_value(),
+            port=int(self._port.get_secret_value()),
+            **self._get_connection_kwargs(),
+        )
+
+        # Creates the redis instance that owns the connection pool
+        return Redis.from_pool(connection_pool)
+
+    def _create_cluster(self) -> RedisCluster:
+        """
+        Function that creates the redis instance of a redis cluster discovered from the host
+        of the redis instance. Read commands are spread across the replicas of each shard
+        when reads are routed to replicas. Each node opens a bounded number of connections, and
+        the cluster limiter created on connect makes pipelines wait for a free connection
+
+        :return: The redis-cluster instance
+        """
+        is_read_from_replicas = settings.IS_API_REDIS_READ_FROM_REPLICAS
+        return RedisCluster(
+            host=self._host.get_secret_value(),
+            port=int(self._port.get_secret_value()),
+            max_connections=settings.API_REDIS_MAX_CONNECTIONS,
+            load_balancing_strategy=(
+                LoadBalancingStrategy.ROUND_ROBIN_REPLICAS if is_read_from_replicas else None
+            ),
+            **self._get_connection_kwargs(),
+        )
+
+    def _create_sentinel(self) -> Tuple[Redis, Redis | None]:
+        """
+        Function that creates the redis instances of the primary and, when reads are routed
+        to replicas, of the replicas discovered through the sentinel nodes. The instances
+        follow the primary and replicas through failovers and are backed by bounded connection
+        pools
+
+        :return: The primary redis instance and the replica redis instance
+        """
+
+        # Creates the sentinel instance that discovers the primary and replicas
+        sentinel_password = settings.API_REDIS_SENTINEL_PASSWORD.get_secret_value()
+        sentinel = Sentinel(
+            [self._get_address(node) for node in settings.API_REDIS_SENTINEL_NODES],
+            sentinel_kwargs={
+                "password": sentinel_password or None,
+                "socket_timeout": settings.API_REDIS_SOCKET_TIMEOUT_SECONDS,
+                "socket_connect_timeout": settings.API_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            },
+            max_connections=settings.API_REDIS_MAX_CONNECTIONS,
+            **self._get_connection_kwargs(),
+        )
+
+        # Creates the primary and replica redis instances
+        service_name = settings.API_REDIS_SENTINEL_SERVICE_NAME
+        pool_kwargs = {
+            "connection_pool_class": InstrumentedSentinelConnectionPool,
+            "timeout": settings.API_REDIS_POOL_TIMEOUT_SECONDS,
+        }
+        primary = sentinel.master_for(service_name, display_name=self._display_name, **pool_kwargs)
+        if not settings.IS_API_REDIS_READ_FROM_REPLICAS:
+            return primary, None
+        replica_name = f"{self._display_name} Replicas"
+        return primary, sentinel.slave_for(service_name, display_name=replica_name, **pool_kwargs)
+
+    def _get_connection_kwargs(self) -> Dict[str, Any]:
+        """
+        Function that gets the connection options shared
+        by the redis instances of every redis mode
+
+        :return: The connection options
+        """
+        return {
+            "password": self._password.get_secret_value(),
+            "decode_responses": settings.API_REDIS_DECODE_RESPONSES,
+            "socket_timeout": settings.API_REDIS_SOCKET_TIMEOUT_SECONDS,
+            "socket_connect_timeout": settings.API_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            "socket_keepalive": settings.IS_API_REDIS_SOCKET_KEEPALIVE,
+            "health_check_interval": settings.API_REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        }
+
+    @staticmethod
+    def _get_address(node: str) -> Tuple[str, int]:
+        """
+        Function that splits the address of a
+        redis node into its host and port
+
+        :param node: The address of the node (exp. "sentinel-host:26379")
+
+        :return: The host and port of the node
+        """
+        host, _, port = node.rpartition(":")
+        return host, int(port)
+
+    @staticmethod
+    def _get_codecs() -> CodecRegistry:
+        """
+        Function that creates the registry of the default
+        codec and the codec of each key namespace
+
+        :return: The codec-registry instance
+        """
+        threshold_bytes = settings.API_REDIS_CODEC_COMPRESSION_THRESHOLD_BYTES
+        namespace_codecs = {
+            namespace: get_codec(spec, threshold_bytes)
+            for namespace, spec in settings.API_REDIS_NAMESPACE_CODECS.items()
+        }
+        return CodecRegistry(get_codec(settings.API_REDIS_CODEC, threshold_bytes), namespace_codecs)
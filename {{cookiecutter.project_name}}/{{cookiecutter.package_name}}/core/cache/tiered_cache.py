@@ -0,0 +1,218 @@
+from asyncio import CancelledError, Task, ensure_future, sleep
+from json import dumps, loads
+from typing import Any, Callable, Dict, Iterable, List
+from uuid import uuid4
+
+from redis.client import Pipeline
+
+from {{cookiecutter.package_name}}.core.settings import settings
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+from .local_cache import LocalCache
+from .redis_manager import RedisManager
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.cache.tiered_cache")
+
+
+class TieredCache:
+    def __init__(self, redis_manager: RedisManager, local_cache: LocalCache, channel: str):
+        """
+        Class that reads values through an in-process cache in front of redis. Writes made through
+        the cache are published on a redis channel so that every other worker removes the written
+        keys from its in-process cache. When the subscription is lost, or the worker subscribes
+        again, the in-process cache is cleared since invalidations may have been missed
+
+        :param redis_manager: The redis-manager instance holding the shared values
+        :param local_cache: The in-process cache of the current worker
+        :param channel: The redis channel that invalidations are published on
+        """
+
+        # Creates the given fields
+        self._redis_manager = redis_manager
+        self._local_cache = local_cache
+        self._channel = channel
+
+        # Initializes the class-created variables
+        self._origin = uuid4().hex
+        self._generation = 0
+        self._listener: Task | None = None
+
+    @property
+    def local_cache(self) -> LocalCache:
+        """
+        Property that gets the in-process
+        cache of the current worker
+
+        :return: The local-cache instance
+        """
+        return self._local_cache
+
+    async def start(self):
+        """
+        Function that starts listening for the invalidations
+        published by the other workers
+        """
+        if self._listener is None:
+            self._listener = ensure_future(self._listen())
+
+    async def stop(self):
+        """
+        Function that stops listening for the invalidations
+        published by the other workers
+        """
+
+        # Cancels the listener and waits for it to finish
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except CancelledError:
+            pass
+        self._listener = None
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Function that gets a value from the in-process cache or from redis when it is not cached
+        locally. Values read from redis are only cached locally when no invalidation arrived while
+        they were being read, so a late response cannot overwrite a newer invalidation
+
+        :param key: The key of the value
+
+        :return: The value or None when the key does not exist
+        """
+
+        # Gets the value from the in-process cache
+        value = self._local_cache.get(key)
+        if value is not None:
+            return value
+
+        # Gets the value from redis and caches it locally
+        generation = self._generation
+        value = await self._redis_manager.pipeline(
+            lambda pipe: pipe.get(key), is_transaction=False, is_scalar=True
+        )
+        if value is not None and generation == self._generation:
+            self._local_cache.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None):
+        """
+        Function that sets a value in redis and publishes an invalidation of the key to the other
+        workers. The key is removed from the in-process cache rather than caching the given value,
+        so the next read caches the value in the same form redis returns it to every worker
+
+        :param key: The key of the value
+        :param value: The value to set
+        :param ttl_seconds: The seconds until the key expires in redis
+        """
+
+        # Sets the value and removes the previous value from the in-process cache
+        await self._write(lambda pipe: pipe.set(key, value, ex=ttl_seconds), [key])
+        self._local_cache.delete([key])
+
+    async def delete(self, keys: Iterable[str]):
+        """
+        Function that deletes keys from redis and from the in-process
+        cache and publishes their invalidation to the other workers
+
+        :param keys: The keys to delete
+        """
+
+        # Checks whether any keys were given
+        keys = list(keys)
+        if not keys:
+            return
+
+        # Adds the redis operations that delete each key on its own since the keys
+        # may be spread across the slots of a redis cluster
+        def write_ops(pipe: Pipeline):
+            for key in keys:
+                pipe.delete(key)
+
+        # Deletes the keys and removes them from the in-process cache
+        await self._write(write_ops, keys)
+        self._local_cache.delete(keys)
+
+    async def _write(self, write_ops: Callable[[Pipeline], None], keys: List[str]):
+        """
+        Function that writes keys to redis and publishes their invalidation to the other workers
+        within a single transaction. A redis cluster cannot run a transaction across the slots of
+        the keys, so the keys are written in a non-transactional pipeline and the invalidation is
+        published once the writes finish
+
+        :param write_ops: A function that adds the redis operations writing the keys
+        :param keys: The written keys
+        """
+        message = self._get_message(keys)
+
+        # Adds the redis operations that write the keys and publish the invalidation
+        def pipe_ops(pipe: Pipeline):
+            write_ops(pipe)
+            pipe.publish(self._channel, message)
+
+        # Writes the keys and publishes the invalidation in a single transaction
+        if not self._redis_manager.is_cluster:
+            await self._redis_manager.pipeline(pipe_ops)
+            return
+
+        # Writes the keys before publishing the invalidation
+        await self._redis_manager.pipeline(write_ops, is_transaction=False)
+        await self._redis_manager.pipeline(
+            lambda pipe: pipe.publish(self._channel, message), is_transaction=False
+        )
+
+    def _get_message(self, keys: Iterable[str]) -> str:
+        """
+        Function that creates the invalidation message
+        published to the other workers
+
+        :param keys: The invalidated keys
+
+        :return: The serialized invalidation message
+        """
+        return dumps({"origin": self._origin, "keys": list(keys)})
+
+    def _handle_message(self, message: Dict[str, Any]):
+        """
+        Function that handles a message received from the invalidation channel. Subscribing
+        clears the in-process cache and invalidations from other workers remove their keys
+
+        :param message: The message received from the redis subscription
+        """
+
+        # Clears the in-process cache since invalidations may have been missed before subscribing
+        if message["type"] == "subscribe":
+            self._generation = self._generation + 1
+            self._local_cache.clear()
+            return
+
+        # Removes the keys invalidated by the other workers
+        if message["type"] == "message":
+            data = loads(message["data"])
+            if data["origin"] != self._origin:
+                self._generation = self._generation + 1
+                self._local_cache.delete(data["keys"])
+
+    async def _listen(self):
+        """
+        Function that subscribes to the invalidation channel and handles its messages until it is
+        cancelled. When the subscription is lost the in-process cache is cleared and the listener
+        subscribes again after a backoff
+        """
+        while True:
+            try:
+                async with self._redis_manager.operation.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        self._handle_message(message)
+            except CancelledError:
+                raise
+            except Exception as exc:
+                message = "The cache invalidation subscription was lost"
+                logger.warning(message, extra={"channel": self._channel})
+                logger.debug(message, exc_info=exc)
+                self._generation = self._generation + 1
+                self._local_cache.clear()
+                await sleep(settings.API_RETRY_MAX_BACKOFF_SECONDS)
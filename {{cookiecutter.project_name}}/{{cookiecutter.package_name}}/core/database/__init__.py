@@ -1,4 +1,8 @@
 from .connection import DatabaseConnection
 from .manager import DatabaseManager
+from .named_queries import NamedQueries, get_named_queries
+from .pagination import Page
+from .query_cache import QueryCache
+from .registry import DatabaseRegistry
 from .row_operations import DatabaseRowOperations
 from .tables import BaseTable
@@ -9,32 +9,48 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker, is_transient_db_error
 from {{cookiecutter.package_name}}.core.settings import settings
 from {{cookiecutter.package_name}}.exceptions import InternalServerError
 from {{cookiecutter.package_name}}.services.logger import get_api_logger
 
+from .metrics import instrument_pool, instrument_queries
+
 # Gets the {{cookiecutter.friendly_name}} server logger instance
 logger = get_api_logger("{{cookiecutter.package_name}}.core.database.connection")
 
 
 class DatabaseConnection:
-    def __init__(self, display_name: str, db_uri: SecretStr):
+    def __init__(self, display_name: str, db_uri: SecretStr, is_cloud_sql: bool = False):
         """
         Class that opens a connection to a particular database
         and handles various aspects of the connection
 
         :param display_name: The name of the database to display to the client
         :param db_uri: The connection uri of the database
+        :param is_cloud_sql: Whether to connect to the Cloud SQL instance instead of the uri
         """
 
         # Creates the given fields
         self._display_name = display_name
         self._db_uri = db_uri
+        self._is_cloud_sql = is_cloud_sql
 
         # Initializes the class-created variables
         self._connector: Connector | None = None
         self._engine: AsyncEngine | None = None
         self._session_maker: async_sessionmaker[AsyncSession] | None = None
+        self._circuit_breaker = CircuitBreaker(display_name, is_transient_db_error)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """
+        Property that gets the circuit breaker that stops
+        calling the database while it is unavailable
+
+        :return: The circuit breaker instance
+        """
+        return self._circuit_breaker
 
     @property
     def engine(self) -> AsyncEngine:
@@ -84,9 +100,9 @@ class DatabaseConnection:
         # Gets the native database URI
         db_uri = self._db_uri.get_secret_value()
 
-        # Gets a Cloud SQL URI and creator When the database type is set to cloud
+        # Gets a Cloud SQL URI and creator when the connection is made to the Cloud SQL instance
         creator = None
-        if settings.API_DB_TYPE == "cloud":
+        if self._is_cloud_sql:
 
             # Gets the Cloud SQL database URI
             db_uri = f"{settings.API_DB_DRIVER.get_secret_value()}://"
@@ -104,11 +120,23 @@ class DatabaseConnection:
             pool_size=settings.SQLALCHEMY_POOL_SIZE,
             max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
             echo=settings.IS_ECHO_SQLALCHEMY_LOGS,
-            connect_args={"server_settings": {"application_name": f"{settings.PROJECT_NAME}"}},
+            query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
+            connect_args={
+                "prepared_statement_cache_size": settings.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE,
+                "server_settings": {"application_name": f"{settings.PROJECT_NAME}"},
+            },
         )
 
+        # Reports the connection pool usage and statement latency as prometheus metrics
+        instrument_pool(self._engine, self._display_name)
+        instrument_queries(self._engine, self._display_name)
+
         # Creates the async sessionmaker for creating database sessions
-        self._session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
+        self._session_maker = async_sessionmaker(
+            self._engine,
+            expire_on_commit=False,
+            info={"display_name": self._display_name, "circuit_breaker": self._circuit_breaker},
+        )
 
         # Logs that the database connection pool was successfully created
         logger.info(f"Created the {self._display_name} connection pool")
@@ -120,7 +148,7 @@ class DatabaseConnection:
         """
 
         # Disconnects the cloud connector when its used
-        if settings.API_DB_TYPE == "cloud" and self._connector:
+        if self._is_cloud_sql and self._connector:
             await self._connector.close_async()
 
         # Disconnects all active sessions and the connection pool
@@ -1,3 +1,6 @@
+from asyncio import gather
+from typing import List
+
 from pydantic import SecretStr
 
 from .connection import DatabaseConnection
@@ -5,7 +8,14 @@ from .row_operations import DatabaseRowOperations
 
 
 class DatabaseManager:
-    def __init__(self, display_name: str, description: str, db_uri: SecretStr):
+    def __init__(
+        self,
+        display_name: str,
+        description: str,
+        db_uri: SecretStr,
+        replica_db_uris: List[SecretStr] | None = None,
+        is_cloud_sql: bool = False,
+    ):
         """
         Class that handles various
         database operations
@@ -13,15 +23,22 @@ class DatabaseManager:
         :param display_name: The name of the database to display to the client
         :param description: A short description about the database
         :param db_uri: The connection uri of the database
+        :param replica_db_uris: The connection uris of the database read replicas
+        :param is_cloud_sql: Whether to connect to the Cloud SQL instance instead of the uri
         """
 
         # Creates the given fields
         self._display_name = display_name
         self._description = description
         self._db_uri = db_uri
+        self._replica_db_uris = replica_db_uris or []
 
         # Instantiates the database-manager classes
-        self._connection = DatabaseConnection(display_name, db_uri)
+        self._connection = DatabaseConnection(display_name, db_uri, is_cloud_sql)
+        self._replica_connections = [
+            DatabaseConnection(f"{display_name} Replica {index + 1}", replica_db_uri)
+            for index, replica_db_uri in enumerate(self._replica_db_uris)
+        ]
         self._row_operations: DatabaseRowOperations | None = None
 
     @property
@@ -34,6 +51,16 @@ class DatabaseManager:
         """
         return self._connection
 
+    @property
+    def replica_connections(self) -> List[DatabaseConnection]:
+        """
+        Property that gets the database-connection instances
+        of the database read replicas
+
+        :return: The read replica database-connection instances
+        """
+        return self._replica_connections
+
     @property
     def display_name(self) -> str:
         """
@@ -65,10 +92,29 @@ class DatabaseManager:
 
         # Creates a database-row-operations instance when it does not exist
         if not self._row_operations:
-            row_operations = DatabaseRowOperations(self._connection.session_maker)
+            row_operations = DatabaseRowOperations(
+                self._connection.session_maker,
+                [replica.session_maker for replica in self._replica_connections],
+            )
             self._row_operations = row_operations
             return row_operations
 
         # Returns a database-row-operations instance
         else:
             return self._row_operations
+
+    async def connect(self):
+        """
+        Function that concurrently connects to the
+        database and each of its read replicas
+        """
+        connections = [self._connection, *self._replica_connections]
+        await gather(*[connection.connect() for connection in connections])
+
+    async def disconnect(self):
+        """
+        Function that concurrently disconnects from
+        the database and each of its read replicas
+        """
+        connections = [self._connection, *self._replica_connections]
+        await gather(*[connection.disconnect() for connection in connections])
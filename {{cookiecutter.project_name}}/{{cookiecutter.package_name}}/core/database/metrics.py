@@ -0,0 +1,217 @@
+from functools import lru_cache
+from hashlib import blake2b
+from re import IGNORECASE, compile
+from time import perf_counter, time
+from typing import Any, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from {{cookiecutter.package_name}}.core.settings import settings
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.database.metrics")
+
+# Patterns of a normalized placeholder with its optional cast and of a row of values
+_PLACEHOLDER = r"\?(?:::\w+(?:\s+with(?:out)?\s+time\s+zone)?(?:\[\])*)?"
+_VALUE = rf"(?:{_PLACEHOLDER}|DEFAULT|NULL)"
+_ROW = rf"\(\s*{_VALUE}(?:\s*,\s*{_VALUE})*\s*\)"
+
+# Patterns used to normalize sql statements into fingerprints
+_IN_LIST_PATTERN = compile(rf"\bIN\s*\(\s*{_VALUE}(?:\s*,\s*{_VALUE})*\s*\)", IGNORECASE)
+_VALUES_PATTERN = compile(rf"\bVALUES\s*({_ROW})(?:\s*,\s*{_ROW})+", IGNORECASE)
+_NUMBER_PATTERN = compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_PATTERN = compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_STRING_PATTERN = compile(r"'(?:[^']|'')*'")
+_WHITESPACE_PATTERN = compile(r"\s+")
+
+# Connection pool gauges exposed on the metrics endpoint
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "The number of persistent connections the database connection pool holds",
+    ["database"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "The number of database connections currently checked out of the connection pool",
+    ["database"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "The number of temporary overflow database connections currently open",
+    ["database"],
+)
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation_ratio",
+    "The ratio of checked out database connections to the maximum connections allowed",
+    ["database"],
+)
+
+# Connection pool histograms and counters exposed on the metrics endpoint
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "The number of seconds spent waiting to check out a database connection",
+    ["database"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts",
+    "The number of database connection checkouts that timed out waiting on the pool",
+    ["database"],
+)
+DB_POOL_CONNECTION_AGE_SECONDS = Histogram(
+    "db_pool_connection_age_seconds",
+    "The age in seconds of database connections when they are checked out of the pool",
+    ["database"],
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 21600, 86400),
+)
+
+# Query histograms exposed on the metrics endpoint
+DB_QUERY_DURATION_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "The number of seconds spent executing a database statement",
+    ["database", "fingerprint"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+def instrument_pool(engine: AsyncEngine, database: str):
+    """
+    Function that reports the connection pool usage of the given engine as prometheus metrics.
+    Gauges are read from the pool whenever the metrics endpoint is scraped and the age of each
+    connection is recorded when it is checked out
+
+    :param engine: The async engine whose connection pool is instrumented
+    :param database: The name of the database used to label the metrics
+    """
+
+    # Checks whether the engine uses a queue pool that can be instrumented
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    # Reads the connection pool gauges when the metrics are scraped
+    max_connections = max(settings.SQLALCHEMY_POOL_SIZE + settings.SQLALCHEMY_MAX_OVERFLOW, 1)
+    DB_POOL_SIZE.labels(database).set_function(pool.size)
+    DB_POOL_CHECKED_OUT.labels(database).set_function(pool.checkedout)
+    DB_POOL_OVERFLOW.labels(database).set_function(lambda: max(pool.overflow(), 0))
+    DB_POOL_SATURATION.labels(database).set_function(lambda: pool.checkedout() / max_connections)
+
+    # Saves when each connection is created
+    def on_connect(_: Any, connection_record: ConnectionPoolEntry):
+        connection_record.info["created_at"] = time()
+
+    # Records the age of each connection when it is checked out
+    def on_checkout(_: Any, connection_record: ConnectionPoolEntry, __: Any):
+        created_at = connection_record.info.get("created_at")
+        if created_at is not None:
+            DB_POOL_CONNECTION_AGE_SECONDS.labels(database).observe(time() - created_at)
+
+    # Listens to the connection pool events
+    event.listen(pool, "connect", on_connect)
+    event.listen(pool, "checkout", on_checkout)
+
+
+def observe_pool_checkout(database: str, wait_seconds: float, is_timeout: bool = False):
+    """
+    Function that records how long a session waited to
+    check out a connection from the connection pool
+
+    :param database: The name of the database used to label the metrics
+    :param wait_seconds: The number of seconds spent waiting for the connection
+    :param is_timeout: Whether the checkout timed out waiting on the pool
+    """
+    DB_POOL_CHECKOUT_WAIT_SECONDS.labels(database).observe(wait_seconds)
+    if is_timeout:
+        DB_POOL_CHECKOUT_TIMEOUTS.labels(database).inc()
+
+
+def instrument_queries(engine: AsyncEngine, database: str):
+    """
+    Function that times every statement the given engine executes. The latency of each statement
+    is recorded under its fingerprint and statements slower than the configured threshold are
+    logged as slow queries
+
+    :param engine: The async engine whose statements are timed
+    :param database: The name of the database used to label the metrics
+    """
+
+    # Saves when each statement starts executing
+    def on_before_cursor_execute(connection: Connection, *_: Any):
+        connection.info.setdefault("query_start_times", []).append(perf_counter())
+
+    # Records how long each statement took to execute
+    def on_after_cursor_execute(
+        connection: Connection, _: Any, statement: str, __: Any, ___: ExecutionContext, ____: bool
+    ):
+        duration_seconds = perf_counter() - connection.info["query_start_times"].pop()
+        observe_query(database, statement, duration_seconds)
+
+    # Discards the start time of a statement that failed to execute
+    def on_handle_error(exception_context: ExceptionContext):
+        connection = exception_context.connection
+        query_start_times = connection.info.get("query_start_times") if connection else None
+        if query_start_times:
+            query_start_times.pop()
+
+    # Listens to the statement execution events
+    event.listen(engine.sync_engine, "before_cursor_execute", on_before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", on_after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", on_handle_error)
+
+
+def observe_query(database: str, statement: str, duration_seconds: float):
+    """
+    Function that records the latency of an executed statement under its
+    fingerprint and logs the statement when it exceeds the slow-query threshold
+
+    :param database: The name of the database used to label the metrics
+    :param statement: The sql statement that was executed
+    :param duration_seconds: The number of seconds the statement took to execute
+    """
+
+    # Records the latency of the statement
+    fingerprint, normalized_statement = get_statement_fingerprint(statement)
+    DB_QUERY_DURATION_SECONDS.labels(database, fingerprint).observe(duration_seconds)
+
+    # Logs the statement when it exceeds the slow-query threshold
+    duration_ms = duration_seconds * 1000
+    threshold_ms = settings.API_DB_SLOW_QUERY_THRESHOLD_MS
+    if 0 < threshold_ms <= duration_ms:
+        slow_query_extra = {
+            "database": database,
+            "fingerprint": fingerprint,
+            "duration_ms": round(duration_ms, 3),
+            "threshold_ms": threshold_ms,
+            "statement": normalized_statement,
+        }
+        logger.warning("Slow Query", extra=slow_query_extra)
+
+
+@lru_cache(maxsize=1024)
+def get_statement_fingerprint(statement: str) -> Tuple[str, str]:
+    """
+    Function that normalizes a sql statement by replacing its literals and bind parameters
+    with placeholders and collapsing IN lists and multi-row VALUES so every variation of the
+    same query, such as each batch size of an executemany insert, shares a single fingerprint
+
+    :param statement: The sql statement to fingerprint
+
+    :return: The statement fingerprint and the normalized statement
+    """
+
+    # Normalizes the literals and bind parameters of the statement
+    normalized_statement = _STRING_PATTERN.sub("?", statement)
+    normalized_statement = _PARAMETER_PATTERN.sub("?", normalized_statement)
+    normalized_statement = _NUMBER_PATTERN.sub("?", normalized_statement)
+    normalized_statement = _IN_LIST_PATTERN.sub("IN (?)", normalized_statement)
+    normalized_statement = _VALUES_PATTERN.sub(r"VALUES \1", normalized_statement)
+    normalized_statement = _WHITESPACE_PATTERN.sub(" ", normalized_statement).strip()
+
+    # Hashes the normalized statement into a short fingerprint
+    fingerprint = blake2b(normalized_statement.encode(), digest_size=6).hexdigest()
+    return fingerprint, normalized_statement
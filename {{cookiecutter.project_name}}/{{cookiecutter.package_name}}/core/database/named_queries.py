@@ -0,0 +1,78 @@
+from typing import Dict
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+from .row_operations import Statement
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.database.named_queries")
+
+
+class NamedQueries:
+    def __init__(self):
+        """
+        Class that registers query statements by name so that each statement is declared once and
+        reused for every execution. SQL-Alchemy caches the compiled form of a statement by its
+        cache key, which is memoized on the statement instance, so a reused statement is compiled
+        once per dialect and then only has its bound parameters sent. Registered statements should
+        use bindparam placeholders that are given through the params kwarg when executed
+        """
+
+        # Initializes the class-created variables
+        self._statements: Dict[str, Statement] = {}
+
+    def register(self, name: str, statement: Statement) -> Statement:
+        """
+        Function that registers a query statement by name. When a statement
+        is already registered with the given name an InternalServerError is raised
+
+        :param name: The unique name of the query statement
+        :param statement: The query statement to register
+
+        :return: The registered query statement
+        """
+
+        # Checks whether a statement is already registered with the given name
+        if name in self._statements:
+            message = f"A query statement named '{name}' is already registered"
+            logger.critical(message)
+            raise InternalServerError()
+
+        # Registers and returns the statement
+        self._statements[name] = statement
+        return statement
+
+    def get(self, name: str) -> Statement:
+        """
+        Function that gets a registered query statement by name. When no
+        statement is registered with the given name an InternalServerError is raised
+
+        :param name: The unique name of the query statement
+
+        :return: The registered query statement
+        """
+
+        # Checks whether a statement is registered with the given name
+        statement = self._statements.get(name)
+        if statement is None:
+            message = f"A query statement named '{name}' is not registered"
+            logger.critical(message)
+            raise InternalServerError()
+
+        # Returns the registered statement
+        return statement
+
+
+# Creates the named-queries instance
+_named_queries = NamedQueries()
+
+
+def get_named_queries() -> NamedQueries:
+    """
+    Function that gets the
+    named-queries instance
+
+    :return: The named-queries instance
+    """
+    return _named_queries
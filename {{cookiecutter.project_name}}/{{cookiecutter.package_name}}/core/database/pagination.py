@@ -0,0 +1,222 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from decimal import Decimal
+from json import dumps, loads
+from typing import Any, Callable, Dict, Generic, List, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Row, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from {{cookiecutter.package_name}}.exceptions import BadRequestError, InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.database.pagination")
+
+# Pagination type-hinting
+ReturnType = TypeVar("ReturnType")
+KeyColumn = InstrumentedAttribute[Any]
+
+# Functions that encode and decode each type of cursor value
+_CURSOR_ENCODERS: Dict[type, Tuple[str, Callable[[Any], Any]]] = {
+    bool: ("bool", lambda value: value),
+    int: ("int", lambda value: value),
+    float: ("float", lambda value: value),
+    str: ("str", lambda value: value),
+    Decimal: ("decimal", str),
+    datetime: ("datetime", datetime.isoformat),
+    date: ("date", date.isoformat),
+    UUID: ("uuid", str),
+}
+_CURSOR_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "decimal": Decimal,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "uuid": UUID,
+}
+
+
+class Page(Generic[ReturnType]):
+    def __init__(self, rows: List[ReturnType], next_cursor: str | None):
+        """
+        Class that holds a page of rows retrieved with keyset
+        pagination and the cursor of the page that follows it
+
+        :param rows: The rows of the page
+        :param next_cursor: The cursor of the next page or None when this is the last page
+        """
+
+        # Creates the given fields
+        self._rows = rows
+        self._next_cursor = next_cursor
+
+    @property
+    def rows(self) -> List[ReturnType]:
+        """
+        Property that gets the
+        rows of the page
+
+        :return: The rows of the page
+        """
+        return self._rows
+
+    @property
+    def next_cursor(self) -> str | None:
+        """
+        Property that gets the cursor of the next
+        page or None when this is the last page
+
+        :return: The cursor of the next page
+        """
+        return self._next_cursor
+
+
+def get_page_statement(
+    statement: Select,
+    keys: Sequence[KeyColumn],
+    cursor: str | None,
+    size: int,
+    is_descending: bool = False,
+) -> Select:
+    """
+    Function that gets the statement that selects a single page of rows. The rows are ordered by
+    the given keys and only rows after the cursor are selected so the database seeks directly to
+    the page using the index of the keys instead of scanning every skipped row like an offset.
+    One more row than the page size is selected to check whether a next page exists
+
+    :param statement: The select statement to paginate
+    :param keys: The non-nullable columns that uniquely order the rows such as (created_on, id)
+    :param cursor: The cursor of the page to select or None to select the first page
+    :param size: The number of rows in a page
+    :param is_descending: Whether the rows are ordered by the keys in descending order
+
+    :return: The select statement of the page
+    """
+
+    # Orders the statement by the keys
+    order_by = [key.desc() if is_descending else key.asc() for key in keys]
+    page_statement = statement.order_by(None).order_by(*order_by).limit(size + 1)
+
+    # Selects the rows after the cursor when one is given
+    if cursor is not None:
+        cursor_values = decode_cursor(cursor, len(keys))
+        key_tuple = tuple_(*keys)
+        cursor_tuple = tuple_(*cursor_values)
+        seek_clause = key_tuple < cursor_tuple if is_descending else key_tuple > cursor_tuple
+        page_statement = page_statement.where(seek_clause)
+
+    # Returns the select statement of the page
+    return page_statement
+
+
+def create_page(rows: List[ReturnType], keys: Sequence[KeyColumn], size: int) -> Page[ReturnType]:
+    """
+    Function that creates a page from the rows selected by the page statement.
+    The cursor of the next page is created from the keys of the last row
+
+    :param rows: The rows selected by the page statement
+    :param keys: The columns that uniquely order the rows
+    :param size: The number of rows in a page
+
+    :return: The page of rows
+    """
+
+    # Returns the last page when no extra row was selected
+    if len(rows) <= size:
+        return Page(rows, None)
+
+    # Returns the page with the cursor of the next page
+    page_rows = rows[:size]
+    last_row = page_rows[-1]
+    next_cursor = encode_cursor([_get_key_value(last_row, key) for key in keys])
+    return Page(page_rows, next_cursor)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Function that encodes the key values of a row into an opaque cursor.
+    The type of each value is kept so it can be decoded back exactly
+
+    :param values: The key values of the row
+
+    :return: The opaque cursor
+    """
+
+    # Encodes each value with its type
+    typed_values = []
+    for value in values:
+        type_name, encode = _get_cursor_encoder(type(value))
+        typed_values.append([type_name, encode(value)])
+
+    # Returns the url safe cursor
+    raw_cursor = dumps(typed_values, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw_cursor).decode().rstrip("=")
+
+
+def _get_cursor_encoder(value_type: type) -> Tuple[str, Callable[[Any], Any]]:
+    """
+    Function that gets the encoder of a cursor value type. Subclasses such as enums based on
+    str or int are encoded by the closest supported type in their method resolution order
+
+    :param value_type: The type of the cursor value
+
+    :return: The name of the encoded type and the function that encodes the value
+    """
+
+    # Gets the encoder of the closest supported type
+    for base_type in value_type.__mro__:
+        encoder = _CURSOR_ENCODERS.get(base_type)
+        if encoder is not None:
+            return encoder
+
+    # Raises an error when the key column type cannot be encoded into a cursor
+    logger.critical(f"The pagination cursor cannot hold key values of the {value_type} type")
+    raise InternalServerError()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Function that decodes an opaque cursor into the key values of a row.
+    When the cursor is malformed a BadRequestError is raised
+
+    :param cursor: The opaque cursor
+    :param size: The number of key values the cursor should hold
+
+    :return: The key values of the row
+    """
+
+    # Attempts to decode the key values from the cursor
+    try:
+        raw_cursor = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        typed_values = loads(raw_cursor)
+        values = [_CURSOR_DECODERS[type_name](value) for type_name, value in typed_values]
+    except Exception as exc:
+        message = "The pagination cursor is invalid"
+        logger.debug(message, exc_info=exc)
+        raise BadRequestError(message) from exc
+
+    # Checks whether the cursor holds a value for each key
+    if len(values) != size:
+        raise BadRequestError("The pagination cursor is invalid")
+    return values
+
+
+def _get_key_value(row: Any, key: KeyColumn) -> Any:
+    """
+    Function that gets the value of a key column from a row
+
+    :param row: An ORM table row or a result row
+    :param key: The key column
+
+    :return: The value of the key column
+    """
+
+    # Gets the key value from a result row or an ORM table row
+    if isinstance(row, Row):
+        return row._mapping[key]
+    return getattr(row, key.key)
@@ -0,0 +1,236 @@
+import pickle
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from hashlib import blake2b
+from time import time
+from typing import Any, Iterable, List, Set, Tuple
+
+from redis.client import Pipeline
+from sqlalchemy import Dialect, Executable, Table
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.util import find_tables
+
+from {{cookiecutter.package_name}}.core.cache.redis_manager import RedisManager
+from {{cookiecutter.package_name}}.core.settings import settings
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.database.query_cache")
+
+# The tag that every cached query result is added to
+ALL_TAG = "*"
+
+# The errors raised when redis cannot be reached
+_REDIS_ERRORS = (InternalServerError, ServiceUnavailableError)
+
+
+def get_statement_tags(statement: ClauseElement) -> Set[str]:
+    """
+    Function that gets the names of the tables a statement reads from or writes to, including
+    the tables of its joins and subqueries. Statements whose tables cannot be found such as
+    text statements are tagged with the tag shared by every cached query result
+
+    :param statement: The statement to get the table names of
+
+    :return: The table names of the statement
+    """
+
+    # Gets the names of the tables found within the statement
+    tables = find_tables(statement, include_crud=True)
+    tags = {table.name for table in tables if isinstance(table, Table)}
+    return tags or {ALL_TAG}
+
+
+class QueryCache:
+    def __init__(self, redis_manager: RedisManager, namespace: str, dialect: Dialect):
+        """
+        Class that caches query results in redis. Results are keyed on a fingerprint of the
+        compiled statement, its bound parameters and the options it is executed with, stored for
+        a limited time, and tagged with the names of the tables they were read from so that
+        writing to a table invalidates every result read from it. Results are pickled, so the
+        redis instance must only be writable by trusted clients
+
+        :param redis_manager: The redis-manager instance used to store the query results
+        :param namespace: The namespace that separates the query results of each database
+        :param dialect: The dialect of the database the statements are compiled with
+        """
+
+        # Creates the given fields
+        self._redis_manager = redis_manager
+        self._namespace = namespace
+        self._dialect = dialect
+
+        # Initializes the class-created variables
+        self._compiled_statements: OrderedDict[Any, str] = OrderedDict()
+
+    def get_key(self, statement: Executable, is_scalar: bool = True, **kwargs) -> str:
+        """
+        Function that gets the cache key of a statement from a fingerprint of its SQL compiled by
+        the dialect of the database, its bound parameters, and the parameters and execution options
+        it is executed with, since each of them changes the rows the statement returns
+
+        :param statement: The statement to get the cache key of
+        :param is_scalar: Whether the rows are filtered through a scalar
+        :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
+
+        :return: The cache key of the statement
+        """
+
+        # Gets the parameters and execution options the statement is executed with
+        compiled_statement, bound_values = self._get_compiled_statement(statement)
+        parameters = kwargs.get("params") or {}
+        execution_options = {
+            **statement.get_execution_options(),
+            **(kwargs.get("execution_options") or {}),
+        }
+
+        # Creates the fingerprint of the compiled statement and how it is executed
+        fingerprint = (
+            f"{compiled_statement}|{bound_values!r}|{sorted(parameters.items())!r}"
+            f"|{sorted(execution_options.items())!r}|{is_scalar}"
+        )
+        digest = blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+        return f"query:{self._namespace}:{digest}"
+
+    def _get_compiled_statement(self, statement: Executable) -> Tuple[str, List[Any]]:
+        """
+        Function that gets the SQL of a statement compiled by the dialect of the database along with
+        the values of its bound parameters. The SQL is memoized by the SQL-Alchemy cache key of the
+        statement, which leaves out the bound values, so each statement structure is compiled once.
+        Statements without a cache key are compiled every time
+
+        :param statement: The statement to compile
+
+        :return: The compiled SQL and the values of the bound parameters
+        """
+
+        # Compiles the statement when it cannot be cached
+        cache_key = statement._generate_cache_key()
+        if cache_key is None:
+            compiled = statement.compile(dialect=self._dialect)
+            return str(compiled), sorted(compiled.params.items())
+
+        # Gets the memoized SQL of the statement structure, compiling it when it is not memoized
+        compiled_statement = self._compiled_statements.get(cache_key.key)
+        if compiled_statement is None:
+            compiled_statement = str(statement.compile(dialect=self._dialect))
+            self._compiled_statements[cache_key.key] = compiled_statement
+            if len(self._compiled_statements) > settings.SQLALCHEMY_QUERY_CACHE_SIZE:
+                self._compiled_statements.popitem(last=False)
+        else:
+            self._compiled_statements.move_to_end(cache_key.key)
+
+        # Returns the SQL with the bound values in the order the cache key found them
+        return compiled_statement, [bind.effective_value for bind in cache_key.bindparams]
+
+    def _get_tag_key(self, tag: str) -> str:
+        """
+        Function that gets the key of the redis
+        set holding the cache keys of a tag
+
+        :param tag: The tag such as a table name
+
+        :return: The key of the tag set
+        """
+        return f"query-tag:{self._namespace}:{tag}"
+
+    async def get(self, key: str) -> List[Any] | None:
+        """
+        Function that gets a cached query result. When redis cannot be reached the
+        error is logged and None is returned so the query falls back to the database
+
+        :param key: The cache key of the query result
+
+        :return: The cached query result or None when it is not cached
+        """
+
+        # Attempts to get the cached query result
+        try:
+            value = await self._redis_manager.pipeline(
+                lambda pipe: pipe.get(key), is_transaction=False, is_scalar=True
+            )
+        except _REDIS_ERRORS:
+            logger.warning("The query cache could not be read", extra={"key": key})
+            return None
+
+        # Deserializes the cached query result
+        if value is None:
+            return None
+        return pickle.loads(b64decode(value))
+
+    async def set(
+        self, key: str, rows: List[Any], tags: Iterable[str], ttl_seconds: int | None = None
+    ):
+        """
+        Function that caches a query result and adds its cache key to the set of each of its
+        tags. When redis cannot be reached the error is logged and the result is not cached
+
+        :param key: The cache key of the query result
+        :param rows: The rows of the query result
+        :param tags: The tags of the query result such as the table names it was read from
+        :param ttl_seconds: The seconds until the query result expires
+        """
+
+        # Creates the serialized query result and the keys of its tag sets
+        ttl_seconds = ttl_seconds or settings.API_QUERY_CACHE_TTL_SECONDS
+        value = b64encode(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)).decode()
+        tag_keys = [self._get_tag_key(tag) for tag in {*tags, ALL_TAG}]
+        now = time()
+
+        # Adds the redis operations that add the cache key to the tag sets. Each tag set
+        # scores its cache keys by their expiry so that expired cache keys can be trimmed
+        def tag_ops(pipe: Pipeline):
+            for tag_key in tag_keys:
+                pipe.zadd(tag_key, {key: now + ttl_seconds})
+                pipe.zremrangebyscore(tag_key, "-inf", now)
+                pipe.expire(tag_key, ttl_seconds, gt=True)
+                pipe.expire(tag_key, ttl_seconds, nx=True)
+
+        # Adds the redis operations that tag and cache the query result
+        def pipe_ops(pipe: Pipeline):
+            tag_ops(pipe)
+            pipe.set(key, value, ex=ttl_seconds)
+
+        # Attempts to cache the query result in a single transaction, while a redis cluster cannot
+        # run a transaction across the slots of the keys so the cache key is added to the tag sets
+        # before the query result is cached, and a result is never cached without its tags
+        try:
+            if not self._redis_manager.is_cluster:
+                await self._redis_manager.pipeline(pipe_ops)
+            else:
+                await self._redis_manager.pipeline(tag_ops, is_transaction=False)
+                await self._redis_manager.pipeline(
+                    lambda pipe: pipe.set(key, value, ex=ttl_seconds), is_transaction=False
+                )
+        except _REDIS_ERRORS:
+            logger.warning("The query cache could not be written", extra={"key": key})
+
+    async def invalidate(self, tags: Iterable[str]):
+        """
+        Function that removes every cached query result of the given tags. When redis cannot be
+        reached the error is logged and the stale query results expire once their TTL passes
+
+        :param tags: The tags to invalidate such as the table names that were written to
+        """
+
+        # Creates the keys of the tag sets, invalidating everything when any table is unknown
+        tags = set(tags)
+        tag_keys = [self._get_tag_key(tag) for tag in ({ALL_TAG} if ALL_TAG in tags else tags)]
+        if not tag_keys:
+            return
+
+        # Attempts to remove the cached query results of the tags along with the tag sets, deleting
+        # each key on its own since the keys may be spread across the slots of a redis cluster
+        try:
+            tag_members = await self._redis_manager.pipeline(
+                lambda pipe: [pipe.zrange(tag_key, 0, -1) for tag_key in tag_keys],
+                is_transaction=False,
+            )
+            keys = {key for members in tag_members for key in members}
+            await self._redis_manager.pipeline(
+                lambda pipe: [pipe.delete(key) for key in [*keys, *tag_keys]],
+                is_transaction=not self._redis_manager.is_cluster,
+            )
+        except _REDIS_ERRORS:
+            logger.warning("The query cache could not be invalidated", extra={"tags": list(tags)})
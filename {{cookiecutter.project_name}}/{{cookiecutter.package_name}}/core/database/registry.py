@@ -0,0 +1,83 @@
+from asyncio import gather
+from typing import Dict, List
+
+from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+from .manager import DatabaseManager
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.database.registry")
+
+
+class DatabaseRegistry:
+    def __init__(self):
+        """
+        Class that manages multiple databases by name. Each registered
+        database-manager is connected and disconnected concurrently
+        """
+
+        # Initializes the class-created variables
+        self._db_managers: Dict[str, DatabaseManager] = {}
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Property that gets the names
+        of the registered databases
+
+        :return: The registered database names
+        """
+        return list(self._db_managers)
+
+    def add(self, name: str, db_manager: DatabaseManager):
+        """
+        Function that registers a database-manager by name. When a database-manager
+        is already registered with the given name an InternalServerError is raised
+
+        :param name: The unique name of the database
+        :param db_manager: The database-manager instance to register
+        """
+
+        # Checks whether a database-manager is already registered with the given name
+        if name in self._db_managers:
+            message = f"A database named '{name}' is already registered"
+            logger.critical(message)
+            raise InternalServerError()
+
+        # Registers the database-manager
+        self._db_managers[name] = db_manager
+
+    def get(self, name: str) -> DatabaseManager:
+        """
+        Function that gets a registered database-manager by name. When no database-manager
+        is registered with the given name an InternalServerError is raised
+
+        :param name: The unique name of the database
+
+        :return: The registered database-manager instance
+        """
+
+        # Checks whether a database-manager is registered with the given name
+        db_manager = self._db_managers.get(name)
+        if db_manager is None:
+            message = f"A database named '{name}' is not registered"
+            logger.critical(message)
+            raise InternalServerError()
+
+        # Returns the registered database-manager
+        return db_manager
+
+    async def connect(self):
+        """
+        Function that concurrently connects
+        every registered database
+        """
+        await gather(*[db_manager.connect() for db_manager in self._db_managers.values()])
+
+    async def disconnect(self):
+        """
+        Function that concurrently disconnects
+        every registered database
+        """
+        await gather(*[db_manager.disconnect() for db_manager in self._db_managers.values()])
@@ -1,14 +1,52 @@
 from asyncio import CancelledError
-from typing import Any, AsyncIterator, Callable, List, Sequence, Type, TypeVar, cast, get_origin
-
-from sqlalchemy import Delete, Result, Row, ScalarResult, Select, TextClause, Update
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import batched, cycle
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+    get_origin,
+)
+
+from sqlalchemy import Delete, Result, Row, ScalarResult, Select, TextClause, Update, insert
+from sqlalchemy.dialects.postgresql import Insert as PostgresInsert
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncResult, AsyncScalarResult, AsyncSession, async_sessionmaker
-from tenacity import retry, stop_after_attempt, wait_fixed
+from sqlalchemy.sql import ClauseElement
+from tenacity import RetryCallState
 
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import get_fast_api_context
+from {{cookiecutter.package_name}}.core.resilience import CircuitBreaker, is_transient_db_error, retry_policy
 from {{cookiecutter.package_name}}.core.settings import settings
-from {{cookiecutter.package_name}}.exceptions import InternalServerError
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
 from {{cookiecutter.package_name}}.services.logger import get_api_logger
 
+from .metrics import observe_pool_checkout, observe_query
+from .pagination import KeyColumn, Page, create_page, get_page_statement
+from .query_cache import QueryCache, get_statement_tags
+from .tables.table_base import StampMixin
+
+# Imports numpy when the optional dependency is installed
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Gets the {{cookiecutter.friendly_name}} server logger instance
 logger = get_api_logger("{{cookiecutter.package_name}}.core.database.row_operations")
 
@@ -18,6 +56,25 @@ ReturnType = TypeVar("ReturnType")
 Statement = Delete | Select | Update | TextClause
 
 
+def _is_unit_of_work_active(retry_state: RetryCallState) -> bool:
+    """
+    Function that checks whether the failed row operation ran within a unit-of-work. A failed
+    statement aborts the transaction of the unit-of-work, so the statement is not retried on
+    its own and the whole unit-of-work is retried at its boundary instead
+
+    :param retry_state: The state of the failed row operation
+
+    :return: Whether the row operation ran within a unit-of-work
+    """
+    return retry_state.args[0]._unit_of_work_var.get() is not None
+
+
+# Retries row operations that failed with a transient error outside of a unit-of-work
+retry_row_operation = retry_policy(
+    is_transient_db_error, settings.API_DB_QUERY_RETRY_NUMBER, _is_unit_of_work_active
+)
+
+
 class RowResult:
     def __init__(self, result: Result, is_scalar: bool):
         """
@@ -68,7 +125,7 @@ class RowResult:
             message = "A single row query came back empty or with multiple rows"
             logger.critical(message)
             logger.debug(message, exc_info=exc)
-            raise InternalServerError()
+            raise InternalServerError() from exc
 
 
 class RowResults:
@@ -98,8 +155,7 @@ class RowResults:
 
         # Returns a list of all the rows retrieved
         rows: List[ReturnType] = list(self._result.all())
-        if rows:
-            _enforce_base_type(rows[0], return_type)
+        _enforce_rows_base_type(rows, return_type)
         return rows
 
     def fetch(self, return_type: Type[ReturnType], size: int) -> List[ReturnType]:
@@ -115,8 +171,7 @@ class RowResults:
 
         # Returns a subset of all the rows retrieved
         rows: List[ReturnType] = list(self._result.fetchmany(size))
-        if rows:
-            _enforce_base_type(rows[0], return_type)
+        _enforce_rows_base_type(rows, return_type)
         return rows
 
     def unique(self, strategy: Callable[[Any], Any] | None = None) -> "RowResults":
@@ -135,17 +190,327 @@ class RowResults:
         return row_result
 
 
-class DatabaseRowOperations:
-    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+class ColumnResults:
+    def __init__(self, result: Result):
         """
-        Class that handles executing various
-        queries on a database table
+        Class that handles retrieving the plain column values of the rows from an executed query
+        result. The rows are read straight from the driver records without creating ORM entities
+        or tracking them in the identity map which makes large read-only results much cheaper
 
-        :param session_maker: An async sessionmaker instance
+        :param result: The executed query result
+        """
+
+        # Creates the given fields
+        self._keys: List[str] = list(result.keys())
+        self._rows: Sequence[Row[Any]] = result.all()
+
+    @property
+    def keys(self) -> List[str]:
+        """
+        Property that gets the
+        column names of the rows
+
+        :return: The column names
+        """
+        return self._keys
+
+    def tuples(self) -> List[Tuple[Any, ...]]:
+        """
+        Function that gets the rows
+        as tuples of column values
+
+        :return: A list of the row tuples
+        """
+        return [tuple(row) for row in self._rows]
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """
+        Function that gets the rows in a column-oriented
+        dictionary of each column name and its values
+
+        :return: A dictionary of each column name and its values
+        """
+
+        # Transposes the rows into columns
+        columns = zip(*self._rows) if self._rows else ([] for _ in self._keys)
+        return {key: list(values) for key, values in zip(self._keys, columns)}
+
+    def arrays(self) -> Dict[str, Any]:
+        """
+        Function that gets the rows in a column-oriented dictionary of each column name and its
+        numpy array. When numpy is not installed an InternalServerError is raised
+
+        :return: A dictionary of each column name and its numpy array
+        """
+
+        # Checks whether numpy is installed
+        if numpy is None:
+            message = "The numpy package must be installed to get columns as numpy arrays"
+            logger.critical(message)
+            raise InternalServerError()
+
+        # Returns each column as a numpy array
+        return {key: numpy.asarray(values) for key, values in self.columns().items()}
+
+
+class DatabaseRowOperations:
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        replica_session_makers: Sequence[async_sessionmaker[AsyncSession]] | None = None,
+        query_cache: QueryCache | None = None,
+    ):
+        """
+        Class that handles executing various queries on a database table. When read replica
+        session-makers are given, read-only queries are routed to the replicas in a round-robin
+        order until a write is persisted, after which the rest of the current request reads from
+        the primary database so that it can read its own writes. Outside of a request, reads that
+        must see earlier writes should run within a unit-of-work. When a query cache is given,
+        persisted writes invalidate the cached query results of the tables they wrote to
+
+        :param session_maker: An async sessionmaker instance of the primary database
+        :param replica_session_makers: The async sessionmaker instances of the read replicas
+        :param query_cache: The query-cache instance used to cache query results in redis
         """
 
         # Creates the given fields
         self._session_maker = session_maker
+        self._replica_session_makers = list(replica_session_makers or [])
+        self._query_cache = query_cache
+
+        # Initializes the class-created variables
+        self._replica_cycle = cycle(self._replica_session_makers)
+        self._unit_of_work_var: ContextVar[AsyncSession | None] = ContextVar(
+            f"unit_of_work_{id(self)}", default=None
+        )
+        self._unit_of_work_tags_var: ContextVar[Set[str] | None] = ContextVar(
+            f"unit_of_work_tags_{id(self)}", default=None
+        )
+
+    @property
+    def query_cache(self) -> QueryCache | None:
+        """
+        Property that gets the query-cache instance
+        used to cache query results in redis
+
+        :return: The query-cache instance
+        """
+        return self._query_cache
+
+    @query_cache.setter
+    def query_cache(self, query_cache: QueryCache | None):
+        """
+        Property that sets the query-cache instance
+        used to cache query results in redis
+
+        :param query_cache: The query-cache instance
+        """
+        self._query_cache = query_cache
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncSession]:
+        """
+        Function that binds a single session, and therefore a single pooled connection, to every
+        row operation executed within the context. Writes are flushed as they happen and committed
+        once when the context exits without an error. When a unit-of-work is already active, the
+        active session is joined and committed by the outermost context. The bound session must
+        not be shared across concurrently running tasks. Row operations within the context are not
+        retried on their own, so use run_unit_of_work to retry the whole unit-of-work instead
+
+        :return: The async session bound to the unit-of-work
+        """
+
+        # Joins the active unit-of-work when one exists
+        active_session = self._unit_of_work_var.get()
+        if active_session is not None:
+            yield active_session
+            return
+
+        # Binds a new session to the unit-of-work and commits it once all row operations finish
+        async with self._session_maker() as session:
+            token = self._unit_of_work_var.set(session)
+            tags_token = self._unit_of_work_tags_var.set(set())
+            try:
+                yield session
+                await self._commit_session(session)
+                if self._query_cache is not None:
+                    await self._query_cache.invalidate(self._unit_of_work_tags_var.get())
+            finally:
+                self._unit_of_work_var.reset(token)
+                self._unit_of_work_tags_var.reset(tags_token)
+                self._clear_entity_cache()
+
+    @retry_row_operation
+    async def run_unit_of_work(
+        self, work: Callable[[AsyncSession], Awaitable[ReturnType]]
+    ) -> ReturnType:
+        """
+        Function that runs the work within a unit-of-work and retries the whole unit-of-work when
+        it fails with a transient error, since a failed statement aborts the transaction and every
+        statement of the work must run again. When a unit-of-work is already active, the work joins
+        it and is retried by the outermost unit-of-work
+
+        :param work: An async function that runs the row operations given the bound session
+
+        :return: The result of the work
+        """
+
+        # Runs the work within a unit-of-work that is committed once the work finishes
+        async with self.unit_of_work() as session:
+            return await work(session)
+
+    @asynccontextmanager
+    async def _get_session(self, is_read: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Function that gets the session bound to the active unit-of-work or opens a new session
+        when no unit-of-work is active. New read-only sessions are opened on a read replica
+
+        :param is_read: Whether the session is only used for read-only queries
+
+        :return: An async session instance
+        """
+
+        # Yields the session bound to the active unit-of-work
+        session = self._unit_of_work_var.get()
+        if session is not None:
+            async with self._protect_session(session):
+                yield session
+            return
+
+        # Yields a new session that is closed once the row operation finishes
+        session_maker = self._get_read_session_maker() if is_read else self._session_maker
+        async with session_maker() as session:
+            async with self._protect_session(session):
+                await self._checkout_connection(session)
+                yield session
+
+    @staticmethod
+    @asynccontextmanager
+    async def _protect_session(session: AsyncSession) -> AsyncIterator[None]:
+        """
+        Function that protects the row operation made with the given session using the circuit
+        breaker of its database. While the database is unavailable the row operation fails fast
+        with a ServiceUnavailableError instead of waiting on the connection pool
+
+        :param session: The asynchronous session instance used for the row operation
+        """
+
+        # Yields without protection when the session has no circuit breaker
+        circuit_breaker: CircuitBreaker | None = session.info.get("circuit_breaker")
+        if circuit_breaker is None:
+            yield
+            return
+
+        # Yields within the protection of the circuit breaker
+        async with circuit_breaker.protect():
+            yield
+
+    @staticmethod
+    async def _checkout_connection(session: AsyncSession):
+        """
+        Function that checks out the connection of a new session from the connection pool and
+        records how long the checkout waited. When the connection cannot be checked out an
+        InternalServerError is raised
+
+        :param session: The asynchronous session instance to check out a connection for
+        """
+
+        # Attempts to check out a connection from the connection pool
+        display_name = session.info.get("display_name", "unknown")
+        start_time = perf_counter()
+        try:
+            await session.connection()
+            observe_pool_checkout(display_name, perf_counter() - start_time)
+        except Exception as exc:
+            is_timeout = isinstance(exc, PoolTimeoutError)
+            observe_pool_checkout(display_name, perf_counter() - start_time, is_timeout)
+            message = "The SQL-Alchemy session connection checkout failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    def _get_read_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Function that gets the sessionmaker used for read-only queries. The primary
+        sessionmaker is used when no read replicas exist or when the current request
+        has persisted a write
+
+        :return: An async sessionmaker instance
+        """
+
+        # Gets the primary sessionmaker when reads should not go to a read replica
+        primary_pins = get_fast_api_context().primary_pins_var
+        if not self._replica_session_makers or (primary_pins is not None and self in primary_pins):
+            return self._session_maker
+
+        # Gets the next read replica sessionmaker
+        return next(self._replica_cycle)
+
+    async def _persist_session(self, session: AsyncSession):
+        """
+        Function that persists the pending changes of the given session. Sessions bound to a
+        unit-of-work are only flushed since they are committed once the unit-of-work exits
+
+        :param session: The asynchronous session instance to persist
+        """
+
+        # Pins the rest of the request to the primary database to read its own writes
+        primary_pins = get_fast_api_context().primary_pins_var
+        if self._replica_session_makers and primary_pins is not None:
+            primary_pins.add(self)
+
+        # Clears the rows cached by the request since the write may have changed them
+        self._clear_entity_cache()
+
+        # Commits the session when it is not bound to a unit-of-work
+        if session is not self._unit_of_work_var.get():
+            await self._commit_session(session)
+            return
+
+        # Flushes the session bound to the unit-of-work
+        try:
+            await session.flush()
+        except Exception as exc:
+            message = "The SQL-Alchemy session flush failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    async def _invalidate_query_cache(self, writes: Iterable[ClauseElement | ORMTable]):
+        """
+        Function that invalidates the cached query results of the tables that were written to by
+        the given statements or table rows. Within a unit-of-work the table names are collected
+        and invalidated once the unit-of-work commits
+
+        :param writes: The persisted statements, table rows, or table classes
+        """
+
+        # Checks whether query results are cached
+        if self._query_cache is None:
+            return
+
+        # Collects the table names when a unit-of-work is active
+        statements = [getattr(write, "__table__", write) for write in writes]
+        tags = set().union(*map(get_statement_tags, statements))
+        unit_of_work_tags = self._unit_of_work_tags_var.get()
+        if unit_of_work_tags is not None:
+            unit_of_work_tags.update(tags)
+            return
+
+        # Invalidates the cached query results of the tables
+        await self._query_cache.invalidate(tags)
+
+    @staticmethod
+    def _clear_entity_cache():
+        """
+        Function that clears the table rows
+        cached by the current request
+        """
+
+        # Clears the entity cache when the current request has one
+        entity_cache = get_fast_api_context().entity_cache_var
+        if entity_cache is not None:
+            entity_cache.clear()
 
     @staticmethod
     async def _commit_session(session: AsyncSession):
@@ -156,17 +521,20 @@ class DatabaseRowOperations:
         :param session: The asynchronous session instance to commit
         """
 
-        # Attempts to commit the session
+        # Attempts to commit the session and records how long the commit took
         try:
             await session.flush()
+            start_time = perf_counter()
             await session.commit()
+            display_name = session.info.get("display_name", "unknown")
+            observe_query(display_name, "COMMIT", perf_counter() - start_time)
         except Exception as exc:
             message = "The SQL-Alchemy session commit failed"
             logger.critical(message)
             logger.debug(message, exc_info=exc)
-            raise InternalServerError()
+            raise InternalServerError() from exc
 
-    @retry(stop=stop_after_attempt(settings.API_DB_QUERY_RETRY_NUMBER), wait=wait_fixed(1))
+    @retry_row_operation
     async def add_row(self, table: ORMTable):
         """
         Function that adds a
@@ -176,11 +544,12 @@ class DatabaseRowOperations:
         """
 
         # Persists the new data to the table
-        async with self._session_maker() as session:
+        async with self._get_session() as session:
             session.add(table)
-            await self._commit_session(session)
+            await self._persist_session(session)
+            await self._invalidate_query_cache([table])
 
-    @retry(stop=stop_after_attempt(settings.API_DB_QUERY_RETRY_NUMBER), wait=wait_fixed(1))
+    @retry_row_operation
     async def add_rows(self, tables: List[ORMTable]):
         """
         Function that adds a list
@@ -190,11 +559,224 @@ class DatabaseRowOperations:
         """
 
         # Persists the new data to each of the tables
-        async with self._session_maker() as session:
+        async with self._get_session() as session:
             session.add_all(tables)
-            await self._commit_session(session)
+            await self._persist_session(session)
+            await self._invalidate_query_cache(tables)
+
+    async def bulk_insert(
+        self,
+        table: Type[ORMTable],
+        rows: Iterable[Dict[str, Any]],
+        chunk_size: int | None = None,
+        is_copy: bool = False,
+    ) -> int:
+        """
+        Function that inserts a large number of rows without going through the ORM unit-of-work.
+        The rows are consumed lazily in chunks so only a single chunk is held in memory at a time,
+        and every chunk is inserted within the same transaction. Chunks are sent as batched
+        executemany inserts, or through the postgres COPY protocol when is_copy is set and the
+        asyncpg driver is used. COPY does not apply python-side column defaults, so every
+        required column value must be given in the rows. Since the rows may be a one-time
+        iterable, the insert is not retried
+
+        :param table: The table class that the rows are inserted into
+        :param rows: The column-name to value mappings of each row to insert
+        :param chunk_size: The number of rows to send per chunk, defaults to API_DB_BULK_CHUNK_SIZE
+        :param is_copy: Whether the rows should be inserted using the postgres COPY protocol
+
+        :return: The number of rows inserted
+        """
+
+        # Attempts to insert the rows in chunks
+        try:
+            async with self._get_session() as session:
+                row_count = 0
+                for chunk in batched(rows, chunk_size or settings.API_DB_BULK_CHUNK_SIZE):
+                    if is_copy:
+                        await self._copy_rows(session, table, chunk)
+                    else:
+                        await session.execute(insert(table), list(chunk))
+                    row_count = row_count + len(chunk)
+                await self._persist_session(session)
+                await self._invalidate_query_cache([table])
+                return row_count
+        except ServiceUnavailableError:
+            raise
+        except Exception as exc:
+            message = "The SQL-Alchemy bulk insert failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    @staticmethod
+    async def _copy_rows(
+        session: AsyncSession, table: Type[ORMTable], rows: Sequence[Dict[str, Any]]
+    ):
+        """
+        Function that copies the given rows into the table using the asyncpg COPY protocol within
+        the transaction of the connection bound to the session. When the session is not using the
+        asyncpg driver the rows are inserted using a batched executemany insert instead
 
-    @retry(stop=stop_after_attempt(settings.API_DB_QUERY_RETRY_NUMBER), wait=wait_fixed(1))
+        :param session: An async session instance
+        :param table: The table class that the rows are copied into
+        :param rows: The column-name to value mappings of each row to copy
+        """
+
+        # Inserts the rows using executemany when the asyncpg driver is not used
+        connection = await session.connection()
+        if connection.dialect.driver != "asyncpg":
+            logger.warning("The COPY protocol requires asyncpg, falling back to executemany")
+            await session.execute(insert(table), list(rows))
+            return
+
+        # Gets the table columns that are being copied
+        table_schema = cast(Any, table).__table__
+        keys = list(rows[0].keys())
+        columns = [table_schema.c[key].name for key in keys]
+        records = [tuple(row[key] for key in keys) for row in rows]
+
+        # Starts the transaction of the driver connection, since the asyncpg adapter only begins it
+        # on the first statement and the COPY would otherwise commit each chunk on its own
+        await connection.exec_driver_sql("SELECT 1")
+
+        # Copies the rows into the table within the transaction of the session
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_schema.name, records=records, columns=columns, schema_name=table_schema.schema
+        )
+
+    async def upsert_rows(
+        self,
+        table: Type[ORMTable],
+        rows: Iterable[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Function that inserts the given rows or updates the existing rows that conflict with them.
+        Each chunk of rows is sent as a single postgres INSERT ... ON CONFLICT DO UPDATE statement
+        and every chunk is executed within the same transaction. A chunk must not contain two rows
+        with the same conflict column values. When the table uses the StampMixin, updated rows
+        keep their creation metadata, have their 'updated_on' column stamped, and take the
+        'created_by' value of the incoming row as their 'updated_by' value
+
+        :param table: The table class that the rows are upserted into
+        :param rows: The column-name to value mappings of each row to upsert
+        :param conflict_columns: The unique or primary key columns used to detect existing rows
+        :param update_columns: The columns updated on conflict, defaults to every other column
+        :param chunk_size: The number of rows to send per chunk, defaults to API_DB_BULK_CHUNK_SIZE
+
+        :return: The number of rows inserted or updated
+        """
+
+        # Attempts to upsert the rows in chunks
+        try:
+            async with self._get_session() as session:
+                row_count = 0
+                for chunk in batched(rows, chunk_size or settings.API_DB_BULK_CHUNK_SIZE):
+                    statement = self._get_upsert_statement(
+                        table, chunk, conflict_columns, update_columns
+                    )
+                    await session.execute(statement)
+                    row_count = row_count + len(chunk)
+                await self._persist_session(session)
+                await self._invalidate_query_cache([table])
+                return row_count
+        except ServiceUnavailableError:
+            raise
+        except Exception as exc:
+            message = "The SQL-Alchemy upsert failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    @staticmethod
+    def _get_upsert_statement(
+        table: Type[ORMTable],
+        rows: Sequence[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None,
+    ) -> PostgresInsert:
+        """
+        Function that creates the INSERT ... ON CONFLICT DO UPDATE
+        statement for a single chunk of rows
+
+        :param table: The table class that the rows are upserted into
+        :param rows: The column-name to value mappings of each row to upsert
+        :param conflict_columns: The unique or primary key columns used to detect existing rows
+        :param update_columns: The columns updated on conflict, defaults to every other column
+
+        :return: The postgres upsert statement
+        """
+
+        # Gets the columns that are updated when a row already exists
+        is_stamped = issubclass(table, StampMixin)
+        audit_columns = {"created_by", "created_on", "updated_by", "updated_on"}
+        if update_columns is None:
+            update_columns = [key for key in rows[0].keys() if key not in conflict_columns]
+        if is_stamped:
+            update_columns = [column for column in update_columns if column not in audit_columns]
+
+        # Creates the upsert statement
+        statement = postgres_insert(table).values(list(rows))
+        update_values: Dict[str, Any] = {
+            column: statement.excluded[column] for column in update_columns
+        }
+        if is_stamped:
+            update_values["updated_by"] = statement.excluded["created_by"]
+            update_values["updated_on"] = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        # Returns the upsert statement, ignoring conflicts when no columns are updated
+        if not update_values:
+            return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+        return statement.on_conflict_do_update(index_elements=conflict_columns, set_=update_values)
+
+    @retry_row_operation
+    async def get_row(self, table: Type[ORMTable], primary_key: Any, **kwargs) -> ORMTable | None:
+        """
+        Function that gets a database table row by its primary key. Rows are cached for the length
+        of the current request so that loading the same row again does not query the database
+        until the request persists a write. The cache is bypassed when kwargs such as a row lock
+        or loader options are given, and within a unit-of-work so the row is loaded into its session
+
+        :param table: The table class of the row such as User
+        :param primary_key: The primary key of the row or a tuple or dict of a composite key
+        :param kwargs: Any kwarg accepted in the :class:`AsyncSession` get function
+
+        :return: The table row or None when no row has the primary key
+        """
+
+        # Gets the entity cache of the request unless the row must be loaded by the session
+        entity_cache = get_fast_api_context().entity_cache_var
+        if kwargs or self._unit_of_work_var.get() is not None:
+            entity_cache = None
+
+        # Gets the row from the entity cache when it was already loaded by the request
+        if entity_cache is not None:
+            row = entity_cache.get(table, primary_key)
+            if row is not None:
+                return row
+
+        # Attempts to get the row by its primary key
+        try:
+            async with self._get_session(is_read=True) as session:
+                row = await session.get(table, primary_key, **kwargs)
+        except ServiceUnavailableError:
+            raise
+        except Exception as exc:
+            message = "The SQL-Alchemy primary key lookup failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+        # Caches the row for the rest of the request
+        if entity_cache is not None and row is not None:
+            entity_cache.set(table, primary_key, row)
+        return row
+
+    @retry_row_operation
     async def query_row(
         self, statement: Statement, is_commit: bool = False, is_scalar: bool = True, **kwargs
     ) -> RowResult:
@@ -217,9 +799,14 @@ class DatabaseRowOperations:
         row_result = RowResult(result, is_scalar)
         return row_result
 
-    @retry(stop=stop_after_attempt(settings.API_DB_QUERY_RETRY_NUMBER), wait=wait_fixed(1))
+    @retry_row_operation
     async def query_rows(
-        self, statement: Statement, is_commit: bool = False, is_scalar: bool = True, **kwargs
+        self,
+        statement: Statement,
+        is_commit: bool = False,
+        is_scalar: bool = True,
+        is_primary: bool = False,
+        **kwargs,
     ) -> RowResults:
         """
         Function that queries the database using the given statement. The given
@@ -228,18 +815,156 @@ class DatabaseRowOperations:
         :param statement: The query statement to execute
         :param is_commit: Whether the executed query statement should be committed
         :param is_scalar: Whether the object should be filtered through a scalar
+        :param is_primary: Whether to query the primary database instead of a read replica
         :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
 
         :return: A row-results instance
         """
 
         # Executes the query and gets the result
-        result = await self._execute_query(statement, is_commit, **kwargs)
+        result = await self._execute_query(statement, is_commit, is_primary, **kwargs)
 
         # Returns the row result
         row_results = RowResults(result, is_scalar)
         return row_results
 
+    async def query_rows_cached(
+        self,
+        return_type: Type[ReturnType],
+        statement: Select | TextClause,
+        is_scalar: bool = True,
+        tags: Iterable[str] | None = None,
+        ttl_seconds: int | None = None,
+        **kwargs,
+    ) -> List[ReturnType]:
+        """
+        Function that queries multiple rows through the query cache. Cached rows are returned
+        without querying the database, otherwise the rows are queried and cached until their TTL
+        passes or a write to one of the tables they were read from invalidates them. When no
+        query cache exists the rows are always queried
+
+        :param return_type: The return-type of the query
+        :param statement: The query statement to execute
+        :param is_scalar: Whether the object should be filtered through a scalar
+        :param tags: The tags of the rows, defaults to the names of the tables read from
+        :param ttl_seconds: The seconds until the rows expire, defaults to the cache TTL setting
+        :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
+
+        :return: The queried rows
+        """
+
+        # Queries the rows when query results are not cached
+        if self._query_cache is None:
+            row_results = await self.query_rows(statement, is_scalar=is_scalar, **kwargs)
+            return row_results.all(return_type)
+
+        # Gets the cached rows
+        key = self._query_cache.get_key(statement, is_scalar, **kwargs)
+        rows = await self._query_cache.get(key)
+        if rows is not None:
+            return rows
+
+        # Queries and caches the rows from the primary database, since a lagging read replica
+        # could otherwise cache rows a write has just invalidated until their TTL passes
+        row_results = await self.query_rows(
+            statement, is_scalar=is_scalar, is_primary=True, **kwargs
+        )
+        rows = row_results.all(return_type)
+        tags = get_statement_tags(statement) if tags is None else tags
+        await self._query_cache.set(key, rows, tags, ttl_seconds)
+        return rows
+
+    @retry_row_operation
+    async def execute_batch(self, statements: Sequence[Statement], **kwargs) -> List[Result]:
+        """
+        Function that executes the given statements in order within a single transaction on one
+        connection and commits them once. Either every statement is committed or none of them are
+
+        :param statements: The statements to execute such as an update followed by a delete
+        :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
+
+        :return: The result of each statement in the order they were given
+        """
+
+        # Attempts to execute the statements in a single transaction
+        try:
+            async with self._get_session() as session:
+                results = [await session.execute(statement, **kwargs) for statement in statements]
+                await self._persist_session(session)
+                await self._invalidate_query_cache(statements)
+                return results
+        except ServiceUnavailableError:
+            raise
+        except Exception as exc:
+            message = "The SQL-Alchemy batch execution failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    @retry_row_operation
+    async def query_columns(self, statement: Select | TextClause, **kwargs) -> ColumnResults:
+        """
+        Function that queries the plain column values of the rows selected by the given statement.
+        The statement is executed on the session connection so no ORM entities are created which
+        is much cheaper for large read-only results such as reports
+
+        :param statement: The query select statement to execute
+        :param kwargs: Any kwarg accepted in the :class:`AsyncConnection` execute function
+
+        :return: A column-results instance
+        """
+
+        # Attempts to execute the query on the session connection
+        try:
+            async with self._get_session(is_read=True) as session:
+                connection = await session.connection()
+                result = await connection.execute(statement, **kwargs)
+                return ColumnResults(result)
+        except ServiceUnavailableError:
+            raise
+        except Exception as exc:
+            message = "The SQL-Alchemy connection execution failed"
+            logger.critical(message)
+            logger.debug(message, exc_info=exc)
+            raise InternalServerError() from exc
+
+    async def query_page(
+        self,
+        return_type: Type[ReturnType],
+        statement: Select,
+        keys: Sequence[KeyColumn],
+        size: int,
+        cursor: str | None = None,
+        is_descending: bool = False,
+        is_scalar: bool = True,
+        **kwargs,
+    ) -> Page[ReturnType]:
+        """
+        Function that queries a single page of rows using keyset pagination. Unlike an offset,
+        the cost of a page does not grow with its depth because the database seeks directly to
+        the rows after the cursor using the index of the keys
+
+        :param return_type: The return-type of the query
+        :param statement: The query select statement to paginate
+        :param keys: The non-nullable columns that uniquely order the rows such as (created_on, id)
+        :param size: The number of rows in a page
+        :param cursor: The cursor of the page to query or None to query the first page
+        :param is_descending: Whether the rows are ordered by the keys in descending order
+        :param is_scalar: Whether the object should be filtered through a scalar
+        :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
+
+        :return: The page of rows and the cursor of the next page
+        """
+
+        # Queries the rows of the page
+        page_statement = get_page_statement(statement, keys, cursor, size, is_descending)
+        row_results = await self.query_rows(page_statement, is_scalar=is_scalar, **kwargs)
+        rows = row_results.all(return_type)
+
+        # Returns the page of rows
+        page = create_page(rows, keys, size)
+        return page
+
     async def stream_rows(
         self,
         return_type: Type[ReturnType],
@@ -262,24 +987,32 @@ class DatabaseRowOperations:
         :return: A chunk all the rows retrieved
         """
 
+        # Buffers a single batch of rows from the server-side cursor at a time
+        execution_options = {"yield_per": batch, **kwargs.pop("execution_options", {})}
+
         # Attempts to stream rows from the database
         try:
-            async with self._session_maker() as session:
-                stream_result = await self._start_stream(session, statement, is_scalar, **kwargs)
+            async with self._get_session(is_read=True) as session:
+                stream_result = await self._start_stream(
+                    session, statement, is_scalar, execution_options=execution_options, **kwargs
+                )
                 async for rows in stream_result.partitions(batch):
-                    _enforce_base_type(rows[0], return_type)
+                    _enforce_rows_base_type(rows, return_type)
                     yield rows
         except CancelledError:
             message = "A database stream was cancelled"
             logger.info(message)
 
-    async def _execute_query(self, statement: Statement, is_commit: bool, **kwargs) -> Result:
+    async def _execute_query(
+        self, statement: Statement, is_commit: bool, is_primary: bool = False, **kwargs
+    ) -> Result:
         """
         Function that executes the query and gets the result. When the
         query cannot be executed an InternalServerError is raised
 
         :param statement: The query statement to execute
         :param is_commit: Whether the executed query statement should be committed
+        :param is_primary: Whether to query the primary database instead of a read replica
         :param kwargs: Any kwarg accepted in the :class:`AsyncSession` execute function
 
         :return: The result from the database
@@ -287,18 +1020,21 @@ class DatabaseRowOperations:
 
         # Attempts to execute the query
         try:
-            async with self._session_maker() as session:
+            async with self._get_session(is_read=not (is_commit or is_primary)) as session:
                 result = await session.execute(statement, **kwargs)
                 if is_commit:
-                    await self._commit_session(session)
+                    await self._persist_session(session)
+                    await self._invalidate_query_cache([statement])
                 return result
+        except ServiceUnavailableError:
+            raise
         except Exception as exc:
             message = "The SQL-Alchemy session execution failed"
             logger.critical(message)
             logger.debug(message, exc_info=exc)
-            raise InternalServerError()
+            raise InternalServerError() from exc
 
-    @retry(stop=stop_after_attempt(settings.API_DB_QUERY_RETRY_NUMBER), wait=wait_fixed(1))
+    @retry_row_operation
     async def _start_stream(
         self, session: AsyncSession, statement: Select | TextClause, is_scalar: bool, **kwargs
     ) -> AsyncScalarResult[Any] | AsyncResult[Any]:
@@ -324,25 +1060,83 @@ class DatabaseRowOperations:
             message = "The SQL-Alchemy session streaming failed"
             logger.critical(message)
             logger.debug(message, exc_info=exc)
-            raise InternalServerError()
+            raise InternalServerError() from exc
 
 
 def _enforce_base_type(row_data: Any, return_type: Type[ReturnType]):
     """
     Function that checks whether the row data returned from the database matches the
-    given return-type. When the types do not match an InternalServerError is raised
+    given return-type. When the types do not match an InternalServerError is raised.
+    The check is skipped when return-type enforcement is disabled
 
     :param row_data: The data retrieved from the database
     :param return_type: The return-type of the query
     """
 
+    # Checks whether return-type enforcement is enabled
+    if not settings.IS_API_DB_ENFORCE_RETURN_TYPE:
+        return
+
     # Checks whether the row data returned from the database matches the given return-type
+    if not isinstance(row_data, _get_instance_type(return_type)):
+        _raise_base_type_error(row_data, return_type)
+
+
+def _enforce_rows_base_type(rows: Sequence[Any], return_type: Type[ReturnType]):
+    """
+    Function that checks whether the rows returned from the database match the given return-type.
+    Only the first row is checked unless strict return-type enforcement is enabled, in which case
+    every distinct row type is checked once. When the types do not match an InternalServerError is
+    raised. The check is skipped when return-type enforcement is disabled
+
+    :param rows: The rows retrieved from the database
+    :param return_type: The return-type of the query
+    """
+
+    # Checks whether return-type enforcement is enabled and rows were retrieved
+    if not settings.IS_API_DB_ENFORCE_RETURN_TYPE or not rows:
+        return
+
+    # Checks whether the first row matches the given return-type
+    instance_type = _get_instance_type(return_type)
+    if not settings.IS_API_DB_STRICT_RETURN_TYPE:
+        if not isinstance(rows[0], instance_type):
+            _raise_base_type_error(rows[0], return_type)
+        return
+
+    # Checks whether every distinct row type matches the given return-type
+    for row_type in set(map(type, rows)):
+        if not issubclass(row_type, instance_type):
+            row_data = next(row for row in rows if type(row) is row_type)
+            _raise_base_type_error(row_data, return_type)
+
+
+@lru_cache(maxsize=256)
+def _get_instance_type(return_type: Type[ReturnType]) -> Any:
+    """
+    Function that gets the type the rows are checked against for the given return-type.
+    Generic return-types are checked against their origin type such as list for List[int].
+    The type is cached so it is only computed once per return-type
+
+    :param return_type: The return-type of the query
+
+    :return: The type the rows are checked against
+    """
     origin_type = get_origin(return_type)
-    instance_type = return_type if not origin_type else origin_type
-    if not isinstance(row_data, cast(Any, instance_type)):
-        message = (
-            f"the given row with a type of '{type(row_data)}'"
-            f" is not an instance of the base type '{return_type}'"
-        )
-        logger.critical(message)
-        raise InternalServerError()
+    return cast(Any, return_type if not origin_type else origin_type)
+
+
+def _raise_base_type_error(row_data: Any, return_type: Type[ReturnType]):
+    """
+    Function that raises an InternalServerError when the row
+    data does not match the given return-type
+
+    :param row_data: The data retrieved from the database
+    :param return_type: The return-type of the query
+    """
+    message = (
+        f"the given row with a type of '{type(row_data)}'"
+        f" is not an instance of the base type '{return_type}'"
+    )
+    logger.critical(message)
+    raise InternalServerError()
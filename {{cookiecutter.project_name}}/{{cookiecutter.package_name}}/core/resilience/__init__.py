@@ -0,0 +1,2 @@
+from .circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breakers
+from .retry import is_transient_db_error, is_transient_redis_error, retry_policy
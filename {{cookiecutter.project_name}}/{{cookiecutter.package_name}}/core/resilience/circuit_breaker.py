@@ -0,0 +1,218 @@
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from time import monotonic
+from typing import AsyncIterator, Callable, List
+from weakref import WeakValueDictionary
+
+from prometheus_client import Counter, Gauge
+
+from {{cookiecutter.package_name}}.core.settings import settings
+from {{cookiecutter.package_name}}.exceptions import InternalServerError, ServiceUnavailableError
+from {{cookiecutter.package_name}}.services.logger import get_api_logger
+
+# Gets the {{cookiecutter.friendly_name}} server logger instance
+logger = get_api_logger("{{cookiecutter.package_name}}.core.resilience.circuit_breaker")
+
+# Circuit breaker metrics exposed on the metrics endpoint
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "The state of the circuit breaker where 0 is closed, 1 is half-open and 2 is open",
+    ["name"],
+)
+CIRCUIT_BREAKER_REJECTIONS = Counter(
+    "circuit_breaker_rejections",
+    "The number of calls rejected without being attempted because the circuit breaker was open",
+    ["name"],
+)
+
+
+class CircuitState(IntEnum):
+    """
+    Enum of the states a circuit breaker can be in
+    """
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, is_failure: Callable[[BaseException], bool]):
+        """
+        Class that stops calling a dependency after it fails repeatedly. While closed every call
+        is attempted, once the failure threshold is reached the circuit opens and calls fail fast.
+        After the reset timeout a single probe call is attempted in the half-open state which
+        closes the circuit when it succeeds or opens it again when it fails. Names must be unique
+        so the health of each dependency is reported separately
+
+        :param name: The name of the dependency the circuit breaker protects
+        :param is_failure: A function that checks whether an error counts as a dependency failure
+        """
+
+        # Checks whether another dependency already registered a circuit breaker with the name
+        if name in _circuit_breakers:
+            logger.critical(f"The {name} circuit breaker already exists, names must be unique")
+            raise InternalServerError()
+
+        # Creates the given fields
+        self._name = name
+        self._is_failure = is_failure
+
+        # Initializes the class-created variables
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._is_probing = False
+
+        # Registers the circuit breaker and reports its state
+        _circuit_breakers[name] = self
+        CIRCUIT_BREAKER_STATE.labels(name).set(self._state)
+
+    @property
+    def name(self) -> str:
+        """
+        Property that gets the name of the
+        dependency the circuit breaker protects
+
+        :return: The circuit breaker name
+        """
+        return self._name
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Property that gets the state of the circuit breaker. An open circuit
+        is reported as half-open once its reset timeout has passed
+
+        :return: The circuit breaker state
+        """
+
+        # Checks whether the open circuit can be probed
+        if self._state == CircuitState.OPEN and self._is_reset_timeout_passed():
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @asynccontextmanager
+    async def protect(self) -> AsyncIterator[None]:
+        """
+        Function that protects the dependency call made within the context. A ServiceUnavailableError
+        is raised without attempting the call while the circuit is open or while another call is
+        already probing the half-open circuit
+        """
+
+        # Checks whether the call can be attempted
+        self._before_call()
+
+        # Attempts the call and records its outcome, while errors that are not dependency
+        # failures neither count as failures nor as successes
+        is_probe = self._state == CircuitState.HALF_OPEN
+        try:
+            yield
+        except Exception as exc:
+            if self._is_failure(exc):
+                self._record_failure(is_probe)
+            raise
+        else:
+            self._record_success(is_probe)
+        finally:
+            if is_probe:
+                self._is_probing = False
+
+    def _before_call(self):
+        """
+        Function that checks whether a call can be attempted. When the
+        call cannot be attempted a ServiceUnavailableError is raised
+        """
+
+        # Moves the open circuit to half-open once the reset timeout has passed
+        if self._state == CircuitState.OPEN and self._is_reset_timeout_passed():
+            self._set_state(CircuitState.HALF_OPEN)
+
+        # Allows every call while the circuit is closed
+        if self._state == CircuitState.CLOSED:
+            return
+
+        # Allows a single probe call while the circuit is half-open
+        if self._state == CircuitState.HALF_OPEN and not self._is_probing:
+            self._is_probing = True
+            return
+
+        # Rejects the call while the circuit is open or being probed
+        CIRCUIT_BREAKER_REJECTIONS.labels(self._name).inc()
+        raise ServiceUnavailableError(f"The {self._name} is unavailable, please try again later")
+
+    def _record_failure(self, is_probe: bool):
+        """
+        Function that records a failed call and opens the circuit when the call was a probe or the
+        failure threshold is reached. Late failures of calls that started before the circuit left
+        the closed state are ignored so they do not extend the reset timeout
+
+        :param is_probe: Whether the call was the probe of the half-open circuit
+        """
+
+        # Opens the circuit again when the probe failed
+        if is_probe:
+            self._opened_at = monotonic()
+            logger.warning(f"Opened the {self._name} circuit breaker")
+            self._set_state(CircuitState.OPEN)
+            return
+
+        # Opens the closed circuit when the failure threshold is reached
+        if self._state != CircuitState.CLOSED:
+            return
+        self._failure_count += 1
+        if self._failure_count >= settings.API_CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            self._opened_at = monotonic()
+            logger.warning(f"Opened the {self._name} circuit breaker")
+            self._set_state(CircuitState.OPEN)
+
+    def _record_success(self, is_probe: bool):
+        """
+        Function that records a successful call and closes the circuit when the call was the
+        probe of the half-open circuit. Late successes of calls that started before the circuit
+        left the closed state are ignored so only the probe can close the circuit
+
+        :param is_probe: Whether the call was the probe of the half-open circuit
+        """
+
+        # Closes the circuit when the probe succeeded
+        if is_probe:
+            logger.info(f"Closed the {self._name} circuit breaker")
+            self._set_state(CircuitState.CLOSED)
+
+        # Resets the failure count of the closed circuit
+        if self._state == CircuitState.CLOSED:
+            self._failure_count = 0
+
+    def _is_reset_timeout_passed(self) -> bool:
+        """
+        Function that checks whether the open circuit
+        has waited long enough to be probed
+
+        :return: Whether the reset timeout has passed
+        """
+        return monotonic() - self._opened_at >= settings.API_CIRCUIT_BREAKER_RESET_SECONDS
+
+    def _set_state(self, state: CircuitState):
+        """
+        Function that sets the state of the
+        circuit breaker and reports it
+
+        :param state: The new circuit breaker state
+        """
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(self._name).set(state)
+
+
+# Creates the circuit breakers registry, which releases the name of a discarded circuit breaker
+_circuit_breakers: WeakValueDictionary[str, CircuitBreaker] = WeakValueDictionary()
+
+
+def get_circuit_breakers() -> List[CircuitBreaker]:
+    """
+    Function that gets every circuit
+    breaker that has been created
+
+    :return: The circuit breaker instances
+    """
+    return list(_circuit_breakers.values())
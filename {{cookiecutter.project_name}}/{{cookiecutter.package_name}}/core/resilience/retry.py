@@ -0,0 +1,175 @@
+from typing import Callable, Iterator
+
+from redis import exceptions as redis_exceptions
+from sqlalchemy.exc import DBAPIError
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_any,
+    wait_random_exponential,
+)
+
+from {{cookiecutter.package_name}}.core.cache.fast_api_context import get_fast_api_context
+from {{cookiecutter.package_name}}.core.settings import settings
+
+# Postgres sqlstate codes and classes that are safe to retry
+_TRANSIENT_SQLSTATES = {"40001", "40P01", "53300", "57P01", "57P02", "57P03"}
+_TRANSIENT_SQLSTATE_CLASSES = {"08"}
+
+# Redis errors that are safe to retry
+_TRANSIENT_REDIS_ERRORS = (
+    redis_exceptions.BusyLoadingError,
+    redis_exceptions.ClusterDownError,
+    redis_exceptions.ReadOnlyError,
+    redis_exceptions.TimeoutError,
+    redis_exceptions.TryAgainError,
+    redis_exceptions.WatchError,
+)
+_PERMANENT_REDIS_ERRORS = (
+    redis_exceptions.AuthenticationError,
+    redis_exceptions.AuthorizationError,
+)
+
+
+def _iterate_error_chain(exc: BaseException) -> Iterator[BaseException]:
+    """
+    Function that iterates over the given error and every error that caused it. Row operations
+    and redis operations wrap driver errors in an InternalServerError so the original error
+    is found through the error chain
+
+    :param exc: The error to iterate over
+
+    :return: An iterator over the error chain
+    """
+
+    # Iterates over the error chain without revisiting an error
+    seen_errors = set()
+    error: BaseException | None = exc
+    while error is not None and id(error) not in seen_errors:
+        seen_errors.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def is_transient_db_error(exc: BaseException) -> bool:
+    """
+    Function that checks whether a database error is transient and safe to retry. Connection
+    errors, serialization failures, deadlocks and server shutdowns are transient while errors
+    such as a malformed query or a constraint violation are not
+
+    :param exc: The error raised by the database operation
+
+    :return: Whether the error is transient
+    """
+
+    # Checks every error in the error chain
+    for error in _iterate_error_chain(exc):
+
+        # Checks whether the connection was invalidated
+        if isinstance(error, DBAPIError) and error.connection_invalidated:
+            return True
+
+        # Checks whether the connection was reset or timed out
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+
+        # Checks whether the postgres sqlstate of the error or its driver error is transient
+        sqlstate = getattr(error, "sqlstate", None) or getattr(
+            getattr(error, "orig", None), "sqlstate", None
+        )
+        if isinstance(sqlstate, str):
+            if sqlstate in _TRANSIENT_SQLSTATES or sqlstate[:2] in _TRANSIENT_SQLSTATE_CLASSES:
+                return True
+
+    # Returns that the error is not transient
+    return False
+
+
+def is_transient_redis_error(exc: BaseException) -> bool:
+    """
+    Function that checks whether a redis error is transient and safe to retry. Connection
+    errors, timeouts, failovers and aborted transactions are transient while errors such
+    as an invalid command or failed authentication are not
+
+    :param exc: The error raised by the redis operation
+
+    :return: Whether the error is transient
+    """
+
+    # Checks every error in the error chain
+    for error in _iterate_error_chain(exc):
+
+        # Checks whether the redis error is permanent
+        if isinstance(error, _PERMANENT_REDIS_ERRORS):
+            return False
+
+        # Checks whether the redis error is transient
+        if isinstance(error, _TRANSIENT_REDIS_ERRORS):
+            return True
+
+        # Checks whether the connection was reset or timed out
+        if isinstance(error, (redis_exceptions.ConnectionError, ConnectionError, TimeoutError)):
+            return True
+
+    # Returns that the error is not transient
+    return False
+
+
+def _is_retry_budget_exhausted(_: RetryCallState) -> bool:
+    """
+    Function that spends a retry from the budget of the current request. Operations
+    that run outside a request are not limited by a retry budget
+
+    :return: Whether the retry budget of the current request is exhausted
+    """
+
+    # Spends a retry from the retry budget when one exists
+    retry_budget = get_fast_api_context().retry_budget_var
+    if retry_budget is None:
+        return False
+    return not retry_budget.spend()
+
+
+def retry_policy(
+    is_transient: Callable[[BaseException], bool],
+    attempts: int,
+    is_suspended: Callable[[RetryCallState], bool] | None = None,
+) -> Callable:
+    """
+    Function that creates a retry decorator for asynchronous operations. Only transient errors
+    are retried, each retry waits a random exponential backoff so workers do not retry in sync,
+    and every retry is spent from the retry budget of the current request. The last error is
+    raised once the operation can no longer be retried
+
+    :param is_transient: A function that checks whether an error is transient
+    :param attempts: The maximum number of times the operation is attempted
+    :param is_suspended: A function that checks whether the failed call must not be retried
+
+    :return: The retry decorator
+    """
+    is_transient_error = retry_if_exception(is_transient)
+
+    def is_retryable(retry_state: RetryCallState) -> bool:
+        """
+        Function that checks whether the failed call
+        raised a transient error and can be retried
+
+        :param retry_state: The state of the failed call
+
+        :return: Whether the failed call can be retried
+        """
+        if is_suspended is not None and is_suspended(retry_state):
+            return False
+        return is_transient_error(retry_state)
+
+    return retry(
+        retry=is_retryable,
+        stop=stop_any(stop_after_attempt(attempts), _is_retry_budget_exhausted),
+        wait=wait_random_exponential(
+            multiplier=settings.API_RETRY_BACKOFF_SECONDS,
+            max=settings.API_RETRY_MAX_BACKOFF_SECONDS,
+        ),
+        reraise=True,
+    )
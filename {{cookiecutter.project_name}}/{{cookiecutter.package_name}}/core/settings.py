@@ -106,6 +106,21 @@ class Settings(BaseSettings):
     # The number of seconds to wait before giving up on getting a connection from the pool
     SQLALCHEMY_POOL_TIMEOUT: int = 30
 
+    # How many compiled query statements are cached by the engine
+    SQLALCHEMY_QUERY_CACHE_SIZE: int = 500
+
+    # How many server-side prepared statements asyncpg caches per connection
+    SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    # Exponential backoff and per-request budget for retrying transient errors
+    API_RETRY_BACKOFF_SECONDS: float = 0.05
+    API_RETRY_MAX_BACKOFF_SECONDS: float = 2.0
+    API_RETRY_BUDGET: int = 5
+
+    # Consecutive failures that open a circuit breaker and the seconds to wait before probing
+    API_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    API_CIRCUIT_BREAKER_RESET_SECONDS: float = 30.0
+
     # Recurring task period second specifications
     TASK_CLEANUP_PERIOD_SECONDS: int = 180  # three minutes
 
@@ -121,7 +136,70 @@ class Settings(BaseSettings):
     API_REDIS_PASSWORD: SecretStr = SecretStr("very-secure-password")
     API_REDIS_DECODE_RESPONSES: bool = True
 
+    # Redis mode, sentinel nodes (exp. ["sentinel-host:26379"]), and whether replicas serve reads
+    API_REDIS_MODE: Literal["standalone", "cluster", "sentinel"] = "standalone"
+    API_REDIS_SENTINEL_NODES: List[str] = field(default_factory=list)
+    API_REDIS_SENTINEL_SERVICE_NAME: str = "mymaster"
+    API_REDIS_SENTINEL_PASSWORD: SecretStr = SecretStr("")
+    IS_API_REDIS_READ_FROM_REPLICAS: bool = False
+
+    # Redis connection pool size, seconds to wait on the full pool, and connection socket options
+    API_REDIS_MAX_CONNECTIONS: int = 50
+    API_REDIS_POOL_TIMEOUT_SECONDS: float = 5.0
+    API_REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+    API_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    API_REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    IS_API_REDIS_SOCKET_KEEPALIVE: bool = True
+
+    # Coalesces concurrent redis commands into one pipeline per window or full batch
+    IS_API_REDIS_COMMAND_BATCHING_ENABLED: bool = False
+    API_REDIS_COMMAND_BATCH_WINDOW_SECONDS: float = 0.002
+    API_REDIS_COMMAND_BATCH_MAX_SIZE: int = 100
+
+    # Commands per sub-pipeline and sub-pipelines sent at once when executing a pipeline builder
+    API_REDIS_PIPELINE_CHUNK_SIZE: int = 1000
+    API_REDIS_PIPELINE_CONCURRENCY: int = 4
+
+    # Redis value codecs as serializer[+compression] by key namespace (exp. {"user": "msgpack+zstd"})
+    API_REDIS_CODEC: str = "json"
+    API_REDIS_CODEC_COMPRESSION_THRESHOLD_BYTES: int = 1024
+    API_REDIS_NAMESPACE_CODECS: Dict[str, str] = field(default_factory=dict)
+
+    # In-process cache in front of redis kept coherent across workers through pub/sub
+    IS_API_REDIS_LOCAL_CACHE_ENABLED: bool = False
+    API_REDIS_LOCAL_CACHE_MAX_BYTES: int = 67108864  # 64 MiB
+    API_REDIS_LOCAL_CACHE_TTL_SECONDS: float = 5.0
+    API_REDIS_INVALIDATION_CHANNEL: str = "cache-invalidation"
+
+    # Server-assisted client-side cache of redis reads invalidated through key tracking
+    IS_API_REDIS_CLIENT_CACHE_ENABLED: bool = False
+    API_REDIS_CLIENT_CACHE_MAX_BYTES: int = 16777216  # 16 MiB
+    API_REDIS_CLIENT_CACHE_TTL_SECONDS: float = 300.0
+    API_REDIS_CLIENT_CACHE_PING_SECONDS: float = 5.0
+    API_REDIS_CLIENT_CACHE_PREFIXES: List[str] = field(default_factory=list)
+
+    # Read-through cache of query results stored in redis
+    IS_API_QUERY_CACHE_ENABLED: bool = False
+    API_QUERY_CACHE_TTL_SECONDS: int = 60
+
+    # Redis rate limit of each client as requests/seconds, overridden by route path prefix
+    # (exp. {"/api/v1/auth": "10/60"}) where "unlimited" exempts the route
+    IS_API_RATE_LIMIT_ENABLED: bool = False
+    API_RATE_LIMIT_DEFAULT: str = "600/60"
+    API_RATE_LIMIT_ROUTES: Dict[str, str] = field(default_factory=dict)
+    API_RATE_LIMIT_CLIENT_HEADER: str = "x-api-key"
+
+    # Api keys trusted to identify a client through the client header, while clients
+    # sending any other header value are identified by their address
+    API_RATE_LIMIT_CLIENT_KEYS: List[SecretStr] = field(default_factory=list)
+
+    # Share of a rate limit leased in-process at once so under-limit clients skip redis
+    API_RATE_LIMIT_LEASE_RATIO: float = 0.05
+    API_RATE_LIMIT_LEASE_SECONDS: float = 1.0
+    API_RATE_LIMIT_LEASE_MAX_BYTES: int = 8388608  # 8 MiB
+
     # {{cookiecutter.friendly_name}} server database metadata
+    API_DB_NAME: str = "api"
     API_DB_DISPLAY_NAME: str = "{{cookiecutter.api_database_display_name}}"
     API_DB_DESCRIPTION: str = "{{cookiecutter.api_database_description}}"
 
@@ -133,6 +211,10 @@ class Settings(BaseSettings):
     # {{cookiecutter.friendly_name}} server database
     IS_API_DB_ENABLED: bool = False
     API_DB_QUERY_RETRY_NUMBER: int = 3
+    API_DB_BULK_CHUNK_SIZE: int = 5000
+    API_DB_SLOW_QUERY_THRESHOLD_MS: int = 500
+    IS_API_DB_ENFORCE_RETURN_TYPE: bool = True
+    IS_API_DB_STRICT_RETURN_TYPE: bool = False
     API_DB_TYPE: Literal["native", "cloud"] = "native"
     API_DB_DRIVER: SecretStr = SecretStr("postgresql+asyncpg")
     API_DB_HOST: SecretStr = SecretStr("127.0.0.1")
@@ -146,6 +228,13 @@ class Settings(BaseSettings):
     API_DB_PASSWORD_MIGRATIONS: SecretStr | None = None
     API_DB_CONN_URI_MIGRATIONS: SecretStr | None = None
 
+    # {{cookiecutter.friendly_name}} server database read replicas (exp. ["replica-host:5432"])
+    API_DB_REPLICA_HOSTS: List[str] = field(default_factory=list)
+    API_DB_REPLICA_CONN_URIS: List[SecretStr] = field(default_factory=list)
+
+    # Additional native databases by name (exp. {"analytics": "postgresql+asyncpg://..."})
+    API_DB_NAMED_CONN_URIS: Dict[str, SecretStr] = field(default_factory=dict)
+
     @field_validator("API_DB_CONN_URI", mode="before")
     def create_api_db_connection_string(cls, _, values: ValidationInfo) -> str:
         """
@@ -200,6 +289,39 @@ class Settings(BaseSettings):
             quote(api_db_password_migrations.get_secret_value()),
         )
 
+    @field_validator("API_DB_REPLICA_CONN_URIS", mode="before")
+    def create_api_db_replica_connection_strings(cls, _, values: ValidationInfo) -> List[str]:
+        """
+        Creates the api read replica connection strings based
+        on a combination of other environment settings. Read
+        replicas are only used with native database types
+
+        :param _: A parameter that is not used
+        :param values: All available environment values in the settings class
+
+        :return: A valid database connection string for each read replica host
+        """
+
+        # Checks whether read replicas can be used
+        data = values.data
+        if data.get("API_DB_TYPE") != "native":
+            return []
+
+        # Returns the api database read replica connection strings
+        replica_conn_uris = []
+        for replica_host in data.get("API_DB_REPLICA_HOSTS", []):
+            hostname, _, port = replica_host.partition(":")
+            replica_conn_uri = cls.create_db_uri(
+                data["API_DB_DRIVER"].get_secret_value(),
+                quote(hostname),
+                int(port or data["API_DB_PORT"].get_secret_value()),
+                quote(data["API_DB_DB"].get_secret_value()),
+                quote(data["API_DB_USER"].get_secret_value()),
+                quote(data["API_DB_PASSWORD"].get_secret_value()),
+            )
+            replica_conn_uris.append(replica_conn_uri)
+        return replica_conn_uris
+
     @classmethod
     def create_db_uri(
         cls, driver: str, hostname: str, port: int, database: str, username: str, password: str
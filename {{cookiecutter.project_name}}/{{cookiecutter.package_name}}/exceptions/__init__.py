@@ -3,6 +3,8 @@ from .http import (
     ForbiddenError,
     InternalServerError,
     NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     UnauthenticatedError,
     ValidationError,
 )
@@ -45,6 +45,37 @@ class NotFoundError(HTTPException):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=message)
 
 
+class ServiceUnavailableError(HTTPException):
+    def __init__(self, message: str = "A required service is unavailable, please try again later"):
+        """
+        Error class that is raised when a dependency the server
+        relies on is temporarily unable to handle requests
+
+        :param message: The message sent back to the client detailing the problem
+        """
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=message)
+
+
+class TooManyRequestsError(HTTPException):
+    def __init__(
+        self,
+        retry_after_seconds: int,
+        message: str = "Too many requests were sent, please try again later",
+    ):
+        """
+        Error class that is raised when a client has sent more
+        requests than the rate limit of a route allows
+
+        :param retry_after_seconds: The seconds until the client can send requests again
+        :param message: The message sent back to the client detailing the problem
+        """
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=message,
+            headers={"retry-after": str(retry_after_seconds)},
+        )
+
+
 class UnauthenticatedError(HTTPException):
     def __init__(self, message: str):
         """
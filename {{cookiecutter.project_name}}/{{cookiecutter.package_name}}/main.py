@@ -7,7 +7,7 @@ from starlette.responses import JSONResponse, RedirectResponse, Response
 
 from {{cookiecutter.package_name}}.core.app import {{cookiecutter.class_name}}Base, handle_request
 from {{cookiecutter.package_name}}.core.settings import settings
-from {{cookiecutter.package_name}}.exceptions import ForbiddenError, UnauthenticatedError
+from {{cookiecutter.package_name}}.exceptions import ForbiddenError, TooManyRequestsError, UnauthenticatedError
 from {{cookiecutter.package_name}}.services.logger import get_api_logger
 
 # Gets the {{cookiecutter.friendly_name}} server logger instance
@@ -40,6 +40,8 @@ class {{cookiecutter.class_name}}({{cookiecutter.class_name}}Base):
             return await {{cookiecutter.class_name}}.unauthenticated_error_handler(None, exc)
         except ForbiddenError as exc:
             return await {{cookiecutter.class_name}}.forbidden_error_handler(None, exc)
+        except TooManyRequestsError as exc:
+            return await {{cookiecutter.class_name}}.too_many_requests_error_handler(None, exc)
         except ValidationError as exc:
             message = f"Validation Error: {exc.errors()}"
             logger.error(message)
@@ -0,0 +1 @@
+from .stream_response import stream_csv_response, stream_ndjson_response
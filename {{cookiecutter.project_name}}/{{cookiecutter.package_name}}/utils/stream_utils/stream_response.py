@@ -0,0 +1,148 @@
+from csv import writer
+from functools import lru_cache
+from io import StringIO
+from json import dumps
+from typing import Any, AsyncIterator, Callable, Dict, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Row, inspect
+
+# Type of the function that serializes a single row into a dictionary
+RowSerializer = Callable[[Any], Dict[str, Any]]
+
+
+def stream_ndjson_response(
+    partitions: AsyncIterator[Sequence[Any]],
+    serialize: RowSerializer | None = None,
+    filename: str | None = None,
+) -> StreamingResponse:
+    """
+    Function that streams partitions of rows to the client as newline delimited json. Each
+    partition is serialized into a single chunk only when the client is ready to receive it
+    so at most one partition is held in memory no matter how many rows are streamed
+
+    :param partitions: The partitions of rows to stream such as those yielded by stream_rows
+    :param serialize: A function that serializes a row into a dictionary
+    :param filename: The name of the file the client should save the rows as
+
+    :return: The streaming response of newline delimited json rows
+    """
+
+    # Serializes each partition into newline delimited json
+    async def get_chunks() -> AsyncIterator[bytes]:
+        async for rows in partitions:
+            lines = [dumps(_get_row_data(row, serialize), default=str) for row in rows]
+            yield ("\n".join(lines) + "\n").encode()
+
+    # Returns the streaming response
+    headers = _get_headers(filename)
+    return StreamingResponse(get_chunks(), media_type="application/x-ndjson", headers=headers)
+
+
+def stream_csv_response(
+    partitions: AsyncIterator[Sequence[Any]],
+    columns: Sequence[str] | None = None,
+    serialize: RowSerializer | None = None,
+    filename: str | None = None,
+) -> StreamingResponse:
+    """
+    Function that streams partitions of rows to the client as csv. The header is written with
+    the first partition using the given columns or the columns of the first row. Each partition
+    is serialized into a single chunk only when the client is ready to receive it so at most one
+    partition is held in memory no matter how many rows are streamed
+
+    :param partitions: The partitions of rows to stream such as those yielded by stream_rows
+    :param columns: The columns to write for each row in their written order
+    :param serialize: A function that serializes a row into a dictionary
+    :param filename: The name of the file the client should save the rows as
+
+    :return: The streaming response of csv rows
+    """
+
+    # Serializes each partition into csv
+    async def get_chunks() -> AsyncIterator[bytes]:
+        header: Sequence[str] | None = columns
+        is_header_written = False
+        async for rows in partitions:
+
+            # Gets the data of each row and the header when no columns are given
+            row_data = [_get_row_data(row, serialize) for row in rows]
+            if header is None and row_data:
+                header = list(row_data[0].keys())
+            if header is None:
+                continue
+
+            # Writes the header with the first partition followed by the partition rows
+            buffer = StringIO()
+            csv_writer = writer(buffer)
+            if not is_header_written:
+                csv_writer.writerow(header)
+                is_header_written = True
+            csv_writer.writerows([data.get(column) for column in header] for data in row_data)
+            yield buffer.getvalue().encode()
+
+    # Returns the streaming response
+    headers = _get_headers(filename)
+    return StreamingResponse(get_chunks(), media_type="text/csv", headers=headers)
+
+
+def _get_row_data(row: Any, serialize: RowSerializer | None) -> Dict[str, Any]:
+    """
+    Function that serializes a row into a dictionary. ORM table rows, result rows, pydantic
+    models and dictionaries are serialized automatically while any other row is returned
+    under a single value key
+
+    :param row: The row to serialize
+    :param serialize: A function that serializes a row into a dictionary
+
+    :return: The serialized row
+    """
+
+    # Serializes the row using the given serializer
+    if serialize is not None:
+        return serialize(row)
+
+    # Serializes the row based on its type
+    if isinstance(row, dict):
+        return row
+    if isinstance(row, Row):
+        return row._asdict()
+    if isinstance(row, BaseModel):
+        return row.model_dump(mode="json")
+    column_keys = _get_column_keys(type(row))
+    if column_keys:
+        return {key: getattr(row, key) for key in column_keys}
+    return {"value": row}
+
+
+@lru_cache(maxsize=None)
+def _get_column_keys(row_type: type) -> Tuple[str, ...]:
+    """
+    Function that gets the column attribute keys of an ORM table class. The keys
+    are cached per class so the mapper is only inspected once per table
+
+    :param row_type: The class of the row
+
+    :return: The column attribute keys or an empty tuple when the class is not mapped
+    """
+
+    # Gets the column attribute keys of the mapped class
+    mapper = inspect(row_type, raiseerr=False)
+    if mapper is None:
+        return ()
+    return tuple(column_attr.key for column_attr in mapper.column_attrs)
+
+
+def _get_headers(filename: str | None) -> Dict[str, str] | None:
+    """
+    Function that gets the headers that tell the client
+    to save the streamed rows as the given file
+
+    :param filename: The name of the file the client should save the rows as
+
+    :return: The content-disposition headers or None when no filename is given
+    """
+    if filename is None:
+        return None
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}